@@ -6,4 +6,19 @@ import dmstudio.dmcommands
 import dmstudio.dmfiles
 import dmstudio.initialize
 import dmstudio.special
-import dmstudio.superprocess
\ No newline at end of file
+import dmstudio.superprocess
+import dmstudio.backends
+import dmstudio.batch
+import dmstudio.pipeline
+import dmstudio.cache
+import dmstudio.profiling
+import dmstudio.dmformat
+import dmstudio.project
+import dmstudio.dmio
+import dmstudio.retrieval
+import dmstudio.convert
+import dmstudio.drillholes
+import dmstudio.variogram
+import dmstudio.estimation
+import dmstudio.simulation
+import dmstudio.transform
\ No newline at end of file
@@ -0,0 +1,404 @@
+'''
+dmstudio.backends
+=================
+
+Command backends used by ``dmcommands.init`` and ``dmfiles.init`` to execute Datamine command strings. The
+backend is chosen when the command object is initialized:
+
+* ``com_backend`` executes commands in Studio through the COM ``ParseCommand`` method (default)
+* ``recording_backend`` captures the exact command strings with timestamps and optionally forwards them
+* ``emulator_backend`` executes a small subset of commands (COPY, EXTRA, SORTX, DELETE) in process against
+  tables stored in a local folder, for testing and benchmarking scripts without a Datamine license
+
+Usage:
+------
+
+>>> from dmstudio import dmcommands, backends
+>>> rec = backends.recording_backend()
+>>> dmc = dmcommands.init(backend=rec)
+>>> dmc.copy(in_i='fake_model', out_o='fake_model_copy', retrieval='AU>2.0')
+>>> rec.commands
+['copy  &in=fake_model &out=fake_model_copy{AU>2.0}']
+
+'''
+
+import os
+import re
+import time
+
+import dmstudio.initialize
+import dmstudio.retrieval
+
+# backend used by command objects initialized without a backend, None uses com_backend
+DEFAULT_BACKEND = None
+
+_TOKEN = re.compile(r"(?:[^\s'\"]|'[^']*'|\"[^\"]*\")+")
+
+
+def set_default(backend):
+    '''
+    set_default
+    -----------
+
+    Set the backend used by command objects which are initialized without a backend.
+
+    Parameters:
+    -----------
+
+    backend: backend object or None
+        backend to use by default. None restores the Studio COM backend.
+    '''
+
+    global DEFAULT_BACKEND
+    DEFAULT_BACKEND = backend
+
+
+def get_backend(version=None, backend=None):
+    '''
+    get_backend
+    -----------
+
+    Return the backend for a command object. Internal function used by ``dmcommands.init`` and ``dmfiles.init``.
+
+    Parameters:
+    -----------
+
+    version: str
+        optional datamine studio version used when a COM backend is created
+    backend: backend object
+        optional backend, overrides the default backend
+
+    Returns:
+    --------
+
+    backend object
+    '''
+
+    if backend is not None:
+        return backend
+    if DEFAULT_BACKEND is not None:
+        return DEFAULT_BACKEND
+
+    return com_backend(version);
+
+
+def parse_command(command):
+    '''
+    parse_command
+    -------------
+
+    Split a Datamine command string into its parts.
+
+    Parameters:
+    -----------
+
+    command: str
+        Datamine command string e.g. "copy &in=a &out=b @print=0{AU>2}"
+
+    Returns:
+    --------
+
+    dict with keys:
+        name: lower case command name
+        files: dict of file arguments (``&``) in command order
+        fields: dict of field arguments (``*``) in command order
+        params: dict of parameter arguments (``@``) in command order
+        retrieval: retrieval criteria without braces or None
+        arguments: list of the remaining tokens e.g. the quoted expressions of extra
+
+    Values containing spaces are quoted e.g. "@title='Grade tonnage'" and are returned with their quotes.
+    '''
+
+    retrieval = None
+    start = command.find('{')
+    if start >= 0:
+        end = command.find('}', start)
+        if end < 0:
+            end = len(command)
+        retrieval = command[start + 1:end].strip()
+        command = command[:start] + ' ' + command[end + 1:]
+
+    tokens = _TOKEN.findall(command)
+
+    parsed = {'name': tokens[0].lower() if tokens else '',
+              'files': {},
+              'fields': {},
+              'params': {},
+              'retrieval': retrieval,
+              'arguments': []}
+
+    kinds = {'&': 'files', '*': 'fields', '@': 'params'}
+
+    for token in tokens[1:]:
+        if token[0] in kinds and '=' in token:
+            key, value = token[1:].split('=', 1)
+            parsed[kinds[token[0]]][key.lower()] = value
+        else:
+            parsed['arguments'].append(token)
+
+    return parsed;
+
+
+def dm_path(name, path='.', extension='.dm'):
+    '''
+    dm_path
+    -------
+
+    Path of a Datamine file in a project folder. Names without an extension get ``extension`` appended.
+
+    Parameters:
+    -----------
+
+    name: str
+        Datamine file name as used in command strings
+    path: str
+        project folder
+    extension: str
+        extension added to names without an extension
+
+    Returns:
+    --------
+
+    str
+    '''
+
+    if os.path.splitext(name)[1] == '':
+        name += extension
+
+    return os.path.join(path, name);
+
+
+class com_backend(object):
+
+    '''
+    com_backend
+    -----------
+
+    Execute command strings in Studio with the COM ``ParseCommand`` method. The COM connection is shared through
+    ``dmstudio.initialize.connect`` and is only made when the first command is executed.
+
+    Parameters:
+    -----------
+
+    version: str
+        optional datamine studio version
+    '''
+
+    def __init__(self, version=None):
+
+        self.version = version
+
+    @property
+    def oScript(self):
+
+        return dmstudio.initialize.connect(self.version);
+
+    def run(self, command):
+
+        self.oScript.ParseCommand(command)
+
+    def filename(self, name):
+
+        return dm_path(name);
+
+
+class recording_backend(object):
+
+    '''
+    recording_backend
+    -----------------
+
+    Capture command strings instead of (or as well as) executing them.
+
+    Parameters:
+    -----------
+
+    backend: backend object
+        optional backend to forward each command to after it is recorded
+
+    Object Properties:
+    ------------------
+
+    recording_backend.records: list of dict
+        one dict per command with keys 'time' (seconds since the epoch), 'command' and 'elapsed' (seconds spent in
+        the forwarded backend, 0 when not forwarding)
+    recording_backend.commands: list of str
+        recorded command strings
+    '''
+
+    def __init__(self, backend=None):
+
+        self.backend = backend
+        self.records = []
+
+        # output files can only be located when forwarding to a backend that writes them
+        if hasattr(backend, 'filename'):
+            self.filename = backend.filename
+
+    @property
+    def oScript(self):
+
+        return getattr(self.backend, 'oScript', None);
+
+    @property
+    def commands(self):
+
+        return [record['command'] for record in self.records]
+
+    def run(self, command):
+
+        record = {'time': time.time(), 'command': command, 'elapsed': 0.}
+        self.records.append(record)
+
+        if self.backend is not None:
+            start = time.perf_counter()
+            self.backend.run(command)
+            record['elapsed'] = time.perf_counter() - start
+
+    def clear(self):
+
+        self.records = []
+
+    def save(self, filename):
+
+        '''
+        Write the recorded commands to a text file, one command per line.
+        '''
+
+        with open(filename, 'w') as f:
+            for command in self.commands:
+                f.write(command + "\n")
+
+
+class emulator_backend(object):
+
+    '''
+    emulator_backend
+    ----------------
+
+    Execute a supported subset of Datamine commands in process. Tables are read and written as ``.dm`` files in
+    ``path`` with ``dmstudio.dmio``, so the emulator works on the files of a Studio project.
+
+    Supported commands are COPY, EXTRA, SORTX and DELETE including simple retrieval criteria, and XRUN of macros
+    written by ``dmstudio.batch``. Any other command raises ``NotImplementedError``.
+
+    Parameters:
+    -----------
+
+    path: str
+        folder holding the emulated project files
+    '''
+
+    SUPPORTED = ['copy', 'delete', 'extra', 'sortx', 'xrun']
+
+    def __init__(self, path='.'):
+
+        self.path = path
+        self.oScript = None
+
+    def filename(self, name):
+
+        return dm_path(name, self.path);
+
+    def read(self, name):
+
+        import dmstudio.dmio
+
+        if not os.path.exists(self.filename(name)):
+            raise IOError("File " + name + " does not exist")
+
+        return dmstudio.dmio.read_dm(self.filename(name));
+
+    def write(self, name, df):
+
+        import dmstudio.dmio
+
+        dmstudio.dmio.write_dm(self.filename(name), df)
+
+    def run(self, command):
+
+        parsed = parse_command(command)
+
+        if parsed['name'] not in self.SUPPORTED:
+            raise NotImplementedError("Command " + parsed['name'] + " is not supported by the emulator")
+
+        getattr(self, '_' + parsed['name'])(parsed)
+
+    def _select(self, df, retrieval):
+
+        if retrieval is None:
+            return df;
+
+        return df[dmstudio.retrieval.mask(df, retrieval)].reset_index(drop=True);
+
+    def _copy(self, parsed):
+
+        df = self.read(parsed['files']['in'])
+        self.write(parsed['files']['out'], self._select(df, parsed['retrieval']))
+
+    def _delete(self, parsed):
+
+        filename = self.filename(parsed['files']['in'])
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    def _sortx(self, parsed):
+
+        df = self._select(self.read(parsed['files']['in']), parsed['retrieval'])
+        keys = [parsed['fields']['key' + str(i)].upper() for i in range(1, 11)
+                if 'key' + str(i) in parsed['fields']]
+        ascending = str(parsed['params'].get('order', 1)) != '2'
+        df = df.sort_values(keys, ascending=ascending, kind='mergesort').reset_index(drop=True)
+
+        if str(parsed['params'].get('keysfrst', 1)) == '1':
+            df = df[keys + [column for column in df.columns if column not in keys]]
+
+        self.write(parsed['files']['out'], df)
+
+    def _extra(self, parsed):
+
+        df = self._select(self.read(parsed['files']['in']), parsed['retrieval'])
+
+        for argument in parsed['arguments']:
+            expression = _unquote(argument).strip()
+            if expression.upper() == 'GO':
+                break
+            if expression:
+                _extra_assign(df, expression)
+
+        self.write(parsed['files']['out'], df)
+
+    def _xrun(self, parsed):
+
+        import dmstudio.batch
+
+        macro, name = parsed['arguments'][:2]
+        with open(macro) as f:
+            commands = dmstudio.batch.macro_commands(f.read(), name)
+
+        for command in commands:
+            self.run(command)
+
+
+def _unquote(text):
+
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1];
+
+    return text;
+
+
+def _extra_assign(df, expression):
+
+    '''
+    Apply one EXTRA assignment e.g. "AU2=AU*2" or "ROCK;A8='OX'" to ``df`` in place. Internal function.
+    '''
+
+    target, value = expression.split('=', 1)
+    name = target.split(';')[0].strip().upper()
+
+    value = value.strip()
+    if _unquote(value) != value:
+        df[name] = _unquote(value)
+    else:
+        df[name] = dmstudio.retrieval.evaluate(df, value)
@@ -0,0 +1,268 @@
+'''
+dmstudio.batch
+==============
+
+Batched submission of Datamine commands. Commands issued inside a ``dmcommands.init.batch()`` block are not sent to
+Studio one by one, instead they are written to a single macro which is executed with one ``xrun`` when the block
+exits.
+
+Usage:
+------
+
+>>> from dmstudio import dmcommands
+>>> dmc = dmcommands.init()
+>>> with dmc.batch() as b:
+...     dmc.copy(in_i='model', out_o='_1')
+...     dmc.extra(in_i='_1', out_o='model2', expression='AU2=AU*2')
+...     dmc.delete(in_i='_1')
+>>> [step['status'] for step in b.steps]
+['ok', 'ok', 'ok']
+
+'''
+
+import os
+import re
+import tempfile
+
+import dmstudio.backends
+
+# comma separated macro arguments, commas within quotes are part of the value
+_ARGUMENT = re.compile(r"(?:[^,'\"]|'[^']*'|\"[^\"]*\")+")
+
+
+def macro_text(commands, name='DMBATCH'):
+    '''
+    macro_text
+    ----------
+
+    Convert command strings as used by ``run_command`` to the text of a Datamine macro.
+
+    Parameters:
+    -----------
+
+    commands: list of str
+        Datamine command strings e.g. "copy &in=a &out=b{AU>2}"
+    name: str
+        macro name used by ``!START``
+
+    Returns:
+    --------
+
+    str
+    '''
+
+    lines = ["!START " + name]
+
+    for command in commands:
+        parsed = dmstudio.backends.parse_command(command)
+
+        arguments = ["&" + key.upper() + "(" + value + ")" for key, value in parsed['files'].items()]
+        arguments += ["*" + key.upper() + "(" + value + ")" for key, value in parsed['fields'].items()]
+        arguments += ["@" + key.upper() + "=" + value for key, value in parsed['params'].items()]
+
+        line = "!" + parsed['name'].upper() + " " + ",".join(arguments)
+        if parsed['retrieval'] is not None:
+            line += "{" + parsed['retrieval'] + "}"
+        lines.append(line.rstrip())
+
+        # remaining arguments such as extra expressions are the responses to the command prompts
+        for argument in parsed['arguments']:
+            lines.append(dmstudio.backends._unquote(argument))
+
+    lines.append("!END")
+
+    return "\n".join(lines) + "\n";
+
+
+def macro_commands(text, name=None):
+    '''
+    macro_commands
+    --------------
+
+    Convert the text of a Datamine macro written by ``macro_text`` back to command strings.
+
+    Parameters:
+    -----------
+
+    text: str
+        macro text
+    name: str
+        optional macro name, if given only the commands between ``!START name`` and ``!END`` are returned
+
+    Returns:
+    --------
+
+    list of str
+    '''
+
+    commands = []
+    active = name is None
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        keyword = line.split()[0].upper()
+        if keyword == '!START':
+            active = name is None or line.split()[1].upper() == name.upper()
+            continue
+        if keyword == '!END':
+            if name is not None and active:
+                break
+            continue
+        if not active:
+            continue
+
+        if line.startswith('!'):
+            retrieval = ''
+            if '{' in line:
+                line, retrieval = line[:line.index('{')], line[line.index('{'):]
+            parts = line[1:].split(None, 1)
+            command = parts[0].lower() + " "
+            if len(parts) > 1:
+                for argument in _ARGUMENT.findall(parts[1]):
+                    argument = argument.strip()
+                    if argument[0] in '&*' and argument.endswith(')'):
+                        key, value = argument[1:-1].split('(', 1)
+                        argument = argument[0] + key.lower() + "=" + value
+                    elif argument[0] == '@':
+                        key, value = argument[1:].split('=', 1)
+                        argument = "@" + key.lower() + "=" + value
+                    command += " " + argument
+            commands.append(command + retrieval)
+        elif commands:
+            commands[-1] += " '" + line + "'"
+
+    return commands;
+
+
+class command_batch(object):
+
+    '''
+    command_batch
+    -------------
+
+    Context manager returned by ``dmcommands.init.batch``. While the block is active the command strings generated by
+    the command object are collected. On exit they are written to a temporary macro and executed with a single
+    ``xrun``.
+
+    Parameters:
+    -----------
+
+    commands: dmcommands.init
+        command object to collect the commands of
+    macro_name: str
+        name of the macro
+    keep: bool
+        keep the macro file after it has been executed
+
+    Object Properties:
+    ------------------
+
+    command_batch.steps: list of dict
+        one dict per command with keys 'command' and 'status'. The status is 'ok' when the output files of the step
+        were written, or when the macro completed for a step without output files or with output files deleted
+        later in the batch. It is 'failed' when the output files were not written, 'unknown' when the ``xrun``
+        raised an error and the step can not be shown to have written its output files, 'submitted' when the
+        backend can not be checked for output files and 'not run' when the block raised an error before the macro
+        was executed.
+    command_batch.macro: str
+        file name of the macro
+    command_batch.error: Exception
+        error raised by the xrun, if any
+    '''
+
+    def __init__(self, commands, macro_name='DMBATCH', keep=False):
+
+        self.commands = commands
+        self.macro_name = macro_name
+        self.keep = keep
+        self.steps = []
+        self.macro = None
+        self.error = None
+
+    def add(self, command):
+
+        self.steps.append({'command': command, 'status': 'pending'})
+
+    def __enter__(self):
+
+        if getattr(self.commands, '_batch', None) is not None:
+            raise RuntimeError("A batch is already active for this command object")
+
+        self.commands._batch = self
+
+        return self;
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.commands._batch = None
+
+        if exc_type is not None or not self.steps:
+            for step in self.steps:
+                step['status'] = 'not run'
+            return False;
+
+        self.submit()
+
+        if self.error is not None:
+            raise self.error
+
+        return False;
+
+    def submit(self):
+
+        '''
+        Write the collected commands to a macro and execute it with ``xrun``.
+        '''
+
+        import dmstudio.dmcommands
+
+        backend = self.commands.backend
+        filename = getattr(backend, 'filename', None)
+
+        before = {}
+        if filename is not None:
+            for step in self.steps:
+                for name in dmstudio.dmcommands.command_files(step['command'])[1].values():
+                    before[name] = _mtime(filename(name))
+
+        handle, self.macro = tempfile.mkstemp(prefix='_dmbatch', suffix='.mac', dir='.')
+        with os.fdopen(handle, 'w') as f:
+            f.write(macro_text([step['command'] for step in self.steps], self.macro_name))
+
+        try:
+            self.commands.xrun(macro_i=self.macro, macro_name_p=self.macro_name)
+        except Exception as e:
+            self.error = e
+        finally:
+            if not self.keep:
+                os.remove(self.macro)
+
+        # temporary files deleted later in the batch can not be checked, after an error only the steps that wrote
+        # all their output files are known to have run
+        deleted = set()
+        for step in reversed(self.steps):
+            inputs, outputs = dmstudio.dmcommands.command_files(step['command'])
+            checked = [name for name in outputs.values() if name not in deleted]
+
+            if filename is None:
+                step['status'] = 'submitted' if self.error is None else 'unknown'
+            elif not all(_mtime(filename(name)) not in (None, before[name]) for name in checked):
+                step['status'] = 'failed'
+            elif self.error is None or (checked and len(checked) == len(outputs)):
+                step['status'] = 'ok'
+            else:
+                step['status'] = 'unknown'
+
+            if dmstudio.backends.parse_command(step['command'])['name'] == 'delete':
+                deleted.update(inputs.values())
+
+
+def _mtime(filename):
+
+    try:
+        return os.stat(filename).st_mtime_ns;
+    except OSError:
+        return None;
@@ -0,0 +1,214 @@
+'''
+dmstudio.cache
+==============
+
+Content-addressed cache for the results of deterministic Datamine commands. Commands such as STATS or VGRAM are pure
+functions of their input files and parameters. The ``result_cache`` backend keys each command on its normalized
+command string and the content hashes of its input files, stores the output files in a local cache folder and copies
+them back instead of re-running the command when the same key is seen again.
+
+The cache is limited in size, the least recently used results are evicted first.
+
+Usage:
+------
+
+>>> from dmstudio import dmcommands, cache
+>>> dmc = dmcommands.init()
+>>> dmc.backend = cache.result_cache(dmc.backend, path='.dmcache', max_size=2 ** 30)
+>>> dmc.stats(in_i='comps', out_o='au_stats', f1_f='AU')   # runs in Studio
+>>> dmc.stats(in_i='comps', out_o='au_stats2', f1_f='AU')  # restored from the cache
+
+'''
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import dmstudio.backends
+import dmstudio.batch
+import dmstudio.pipeline
+
+# commands whose outputs only depend on their input files and parameters
+DETERMINISTIC = ['declust', 'grton', 'stats', 'trivol', 'vgram']
+
+
+class result_cache(object):
+
+    '''
+    result_cache
+    ------------
+
+    Command backend which caches the output files of deterministic commands.
+
+    Parameters:
+    -----------
+
+    backend: backend object
+        optional backend executing the commands that are not cached, by default the default backend
+    path: str
+        cache folder
+    max_size: int
+        maximum size of the cached files in bytes
+    commands: list of str
+        names of the commands that are cached, by default ``DETERMINISTIC``
+
+    Object Properties:
+    ------------------
+
+    result_cache.hits: int
+        number of commands restored from the cache
+    result_cache.misses: int
+        number of cacheable commands that were executed
+    '''
+
+    def __init__(self, backend=None, path='.dmcache', max_size=2 ** 30, commands=None):
+
+        self.backend = dmstudio.backends.get_backend(backend=backend)
+        self.path = path
+        self.max_size = max_size
+        self.commands = [command.lower() for command in (commands or DETERMINISTIC)]
+        self.hits = 0
+        self.misses = 0
+
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+        self._index_file = os.path.join(path, 'index.json')
+        self._index = self._load()
+        self._hashes = dmstudio.pipeline.fingerprints(self._index['hashes'])
+
+    @property
+    def oScript(self):
+
+        return getattr(self.backend, 'oScript', None);
+
+    def filename(self, name):
+
+        if hasattr(self.backend, 'filename'):
+            return self.backend.filename(name);
+
+        return dmstudio.backends.dm_path(name);
+
+    def _load(self):
+
+        if os.path.exists(self._index_file):
+            with open(self._index_file) as f:
+                return json.load(f);
+
+        return {'entries': {}, 'hashes': {}};
+
+    def _save(self):
+
+        self._index['hashes'] = self._hashes.cache
+        temp = self._index_file + '.tmp'
+        with open(temp, 'w') as f:
+            json.dump(self._index, f, indent=1)
+        os.replace(temp, self._index_file)
+
+    def key(self, command):
+
+        '''
+        Cache key of a command: the command normalized to its name, argument names, parameters, retrieval and the
+        content hashes of the input files, or None if the command is not cacheable.
+        '''
+
+        import dmstudio.dmcommands
+
+        parsed = dmstudio.backends.parse_command(command)
+        if parsed['name'] not in self.commands:
+            return None;
+
+        inputs, outputs = dmstudio.dmcommands.command_files(command)
+        if not outputs:
+            return None;
+
+        hashes = {}
+        for arg, name in inputs.items():
+            hashes[arg] = self._hashes.get(self.filename(name))
+            if hashes[arg] is None:
+                return None;
+
+        normalized = {'name': parsed['name'],
+                      'inputs': hashes,
+                      'outputs': sorted(outputs),
+                      'fields': {key: value.upper() for key, value in parsed['fields'].items()},
+                      'params': parsed['params'],
+                      'retrieval': None if parsed['retrieval'] is None else ' '.join(parsed['retrieval'].split()),
+                      'arguments': parsed['arguments']}
+
+        return hashlib.sha1(json.dumps(normalized, sort_keys=True).encode('utf-8')).hexdigest();
+
+    def run(self, command):
+
+        import dmstudio.dmcommands
+
+        key = self.key(command)
+        if key is None:
+            self.backend.run(command)
+            return
+
+        outputs = dmstudio.dmcommands.command_files(command)[1]
+        entry = self._index['entries'].get(key)
+
+        if entry is not None and all(os.path.exists(os.path.join(self.path, key, arg)) for arg in outputs):
+            for arg, name in outputs.items():
+                shutil.copyfile(os.path.join(self.path, key, arg), self.filename(name))
+            entry['used'] = time.time()
+            self.hits += 1
+            self._save()
+            return
+
+        before = {name: dmstudio.batch._mtime(self.filename(name)) for name in outputs.values()}
+        self.backend.run(command)
+        self.misses += 1
+
+        # Studio does not raise when a command fails, only results with every output file rewritten are cached
+        folder = os.path.join(self.path, key)
+        if not all(dmstudio.batch._mtime(self.filename(name)) not in (None, before[name])
+                   for name in outputs.values()):
+            shutil.rmtree(folder, ignore_errors=True)
+            if self._index['entries'].pop(key, None) is not None:
+                self._save()
+            return
+
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        size = 0
+        for arg, name in outputs.items():
+            shutil.copyfile(self.filename(name), os.path.join(folder, arg))
+            size += os.path.getsize(self.filename(name))
+
+        self._index['entries'][key] = {'command': command, 'size': size, 'used': time.time()}
+        self._evict()
+        self._save()
+
+    @property
+    def size(self):
+
+        return sum(entry['size'] for entry in self._index['entries'].values());
+
+    def _evict(self):
+
+        entries = self._index['entries']
+        total = self.size
+
+        for key in sorted(entries, key=lambda k: entries[k]['used']):
+            if total <= self.max_size:
+                break
+            total -= entries[key]['size']
+            shutil.rmtree(os.path.join(self.path, key), ignore_errors=True)
+            del entries[key]
+
+    def clear(self):
+
+        '''
+        Remove all cached results.
+        '''
+
+        for key in list(self._index['entries']):
+            shutil.rmtree(os.path.join(self.path, key), ignore_errors=True)
+        self._index['entries'] = {}
+        self._save()
@@ -0,0 +1,4181 @@
+'''
+dmstudio.commandspec
+====================
+
+Declarative definitions of the Datamine commands available on ``dmcommands.init``. The methods are created from
+these definitions the first time they are used, on the class or on an instance, see ``dmcommands._commands``.
+
+Each command is a tuple of arguments in method signature order. An argument is a tuple of:
+
+* kind: '&' input or output file, '*' field, '@' parameter or '{' retrieval criteria
+* Datamine name of the argument, or the prefix of the numbered arguments for argument lists
+* python argument name, with the suffix '_i', '_o', '_f' or '_p'
+* default value, "required" for required arguments and "optional" for optional arguments without a default
+* for argument lists (e.g. keys_f => *KEY1, *KEY2, ...) the maximum number of arguments
+
+'''
+
+COMMANDS = {
+    'accmlt': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key', 'keys_f', ['optional'], 10),
+        ('@', 'allrecs', 'allrecs_p', 0),
+        ('@', 'unsorted', 'unsorted_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'adddd': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'addmod': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('@', 'tolernce', 'tolernce_p', 0.001),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'addtri': (
+        ('&', 'wiretr1', 'wiretr1_i', 'required'),
+        ('&', 'wirept1', 'wirept1_i', 'required'),
+        ('&', 'wiretr2', 'wiretr2_i', 'required'),
+        ('&', 'wirept2', 'wirept2_i', 'required'),
+        ('&', 'wiretrou', 'wiretrou_o', 'required'),
+        ('&', 'wireptou', 'wireptou_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'aed': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'defn', 'defn_i', 'optional'),
+        ('&', 'apphlp', 'apphlp_i', 'optional'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'alfnum': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'f', 'fields_f', ['required'], 5),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'anisoang': (
+        ('&', 'planstr', 'planstr_i', 'optional'),
+        ('&', 'sectstr', 'sectstr_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_i', 'optional'),
+        ('&', 'wirept', 'wirept_i', 'optional'),
+        ('&', 'points', 'points_o', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'tripts', 'tripts_p', 'optional'),
+        ('@', 'planmode', 'planmode_p', 'optional'),
+        ('@', 'sectmode', 'sectmode_p', 'optional'),
+        ('@', 'addsymb', 'addsymb_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'anova1': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'key', 'keys_f', ['required'], 10),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'append': (
+        ('&', 'in1', 'in1_i', 'optional'),
+        ('&', 'in2', 'in2_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('@', 'sequence', 'sequence_p', 0),
+        ('@', 'protodd', 'protodd_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'aptotrue': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'astran': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'xref', 'xref_i', 'required'),
+        ('*', 'sampleid', 'sampleid_f', 'optional'),
+        ('@', 'sprefix', 'sprefix_p', 2),
+        ('@', 'sdigits', 'sdigits_p', 6),
+        ('@', 'maxerrs', 'maxerrs_p', 'optional'),
+        ('@', 'update', 'update_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'attchk': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'attset': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'legend', 'legend_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'datafld', 'dataflds_f', ['optional'], 5),
+        ('*', 'attrib', 'attribs_f', ['optional'], 5),
+        ('@', 'mode', 'mode_p', 0),
+        ('@', 'inrange', 'inrange_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'autocr': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('@', 'sampdist', 'sampdist_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'backtr': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'refdist', 'refdist_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'normval', 'normval_f', 'required'),
+        ('*', 'origref', 'origref_f', 'required'),
+        ('*', 'normref', 'normref_f', 'required'),
+        ('*', 'backval', 'backval_f', 'optional'),
+        ('@', 'minnorm', 'minnorm_p', 'optional'),
+        ('@', 'maxnorm', 'maxnorm_p', 4),
+        ('@', 'minback', 'minback_p', 0),
+        ('@', 'maxback', 'maxback_p', 'optional'),
+        ('@', 'lotail', 'lotail_p', 1),
+        ('@', 'lopar', 'lopar_p', 1),
+        ('@', 'uptail', 'uptail_p', 1),
+        ('@', 'uppar', 'uppar_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'bhcount': (
+        ('&', 'modelin', 'modelin_i', 'required'),
+        ('&', 'sampin', 'sampin_i', 'required'),
+        ('&', 'modelout', 'modelout_o', 'required'),
+        ('*', 'key', 'key_f', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'blkper': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('@', 'direct', 'direct_p', 1),
+        ('@', 'startpos', 'startpos_p', 'optional'),
+        ('@', 'stepsize', 'stepsize_p', 'optional'),
+        ('@', 'numplane', 'numplane_p', 'optional'),
+        ('@', 'smooth', 'smooth_p', 0),
+        ('@', 'connect', 'connect_p', 1),
+        ('@', 'bradjust', 'bradjust_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'blktri': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'wiretr', 'wiretr_o', 'required'),
+        ('&', 'wirept', 'wirept_o', 'required'),
+        ('*', 'class', 'class_f', 'optional'),
+        ('*', 'modcol', 'modcol_f', 'optional'),
+        ('@', 'plane', 'plane_p', 0),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'zsubcell', 'zsubcell_p', 1),
+        ('@', 'order', 'order_p', 0),
+        ('@', 'surface', 'surface_p', 3),
+        ('@', 'colour', 'colour_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'canon': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'scores', 'scores_o', 'optional'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('@', 'nleft', 'nleft_p', 1),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'cdtran': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'protorot', 'protorot_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'newx', 'newx_f', 'required'),
+        ('*', 'newy', 'newy_f', 'required'),
+        ('*', 'newz', 'newz_f', 'required'),
+        ('@', 'angle1', 'angle1_p', 0),
+        ('@', 'angle2', 'angle2_p', 0),
+        ('@', 'angle3', 'angle3_p', 0),
+        ('@', 'rotaxis1', 'rotaxis1_p', 3),
+        ('@', 'rotaxis2', 'rotaxis2_p', 1),
+        ('@', 'rotaxis3', 'rotaxis3_p', 3),
+        ('@', 'x0', 'x0_p', 0),
+        ('@', 'y0', 'y0_p', 0),
+        ('@', 'z0', 'z0_p', 0),
+        ('@', 'xr0', 'xr0_p', 0),
+        ('@', 'yr0', 'yr0_p', 0),
+        ('@', 'zr0', 'zr0_p', 0),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'inverse', 'inverse_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'cellconf': (
+        ('&', 'statmod', 'statmod_i', 'required'),
+        ('&', 'cutoff', 'cutoff_i', 'optional'),
+        ('&', 'conf_tbl', 'conf_tbl_o', 'required'),
+        ('&', 'conf_plt', 'conf_plt_o', 'optional'),
+        ('@', 'cutint', 'cutint_p', 1),
+        ('@', 'cutmax', 'cutmax_p', 10),
+        ('@', 'plot_tbl', 'plot_tbl_p', 0),
+        ('@', 'display', 'display_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'chart': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'anno', 'anno_i', 'optional'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('&', 'plot', 'plot_o', 'optional'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'weight', 'weight_f', 'optional'),
+        ('*', 'key', 'keys_f', 'optional', 3),
+        ('@', 'charttyp', 'charttyp_p', 1),
+        ('@', 'histtyp', 'histtyp_p', 1),
+        ('@', 'binsize', 'binsize_p', 1),
+        ('@', 'binmin', 'binmin_p', 0),
+        ('@', 'binmax', 'binmax_p', 'optional'),
+        ('@', 'binmeth', 'binmeth_p', 1),
+        ('@', 'xtrans', 'xtrans_p', 1),
+        ('@', 'ytrans', 'ytrans_p', 1),
+        ('@', 'logmin', 'logmin_p', 0.01),
+        ('@', 'frametyp', 'frametyp_p', 2),
+        ('@', 'xfactor', 'xfactor_p', 1),
+        ('@', 'yfactor', 'yfactor_p', 1),
+        ('@', 'linetyp1', 'linetyp1_p', 1),
+        ('@', 'symbol1', 'symbol1_p', 92),
+        ('@', 'symsize1', 'symsize1_p', 3),
+        ('@', 'colour1', 'colour1_p', 12),
+        ('@', 'linetyp2', 'linetyp2_p', 0),
+        ('@', 'symbol2', 'symbol2_p', 0),
+        ('@', 'symsize2', 'symsize2_p', 3),
+        ('@', 'colour2', 'colour2_p', 0),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'colflag', 'colflag_p', 1),
+        ('@', 'legend', 'legend_p', 0),
+        ('@', 'legchsiz', 'legchsiz_p', 3),
+        ('@', 'tcharsz', 'tcharsz_p', 3),
+        ('@', 'tcolour', 'tcolour_p', 12),
+        ('@', 'xinc', 'xinc_p', 'optional'),
+        ('@', 'yinc', 'yinc_p', 'optional'),
+        ('@', 'ndx', 'ndx_p', 'optional'),
+        ('@', 'ndy', 'ndy_p', 'optional'),
+        ('@', 'igrid', 'igrid_p', 3),
+        ('@', 'fcharsz', 'fcharsz_p', 3),
+        ('@', 'fcolour', 'fcolour_p', 12),
+        ('@', 'xpaper', 'xpaper_p', 'optional'),
+        ('@', 'ypaper', 'ypaper_p', 'optional'),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('@', 'progress', 'progress_p', 1),
+        ('@', 'display', 'display_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'checkit': (
+    ),
+    'chktri': (
+    ),
+    'closepts': (
+        ('&', 'holes', 'holes_i', 'optional'),
+        ('&', 'points', 'points_i', 'optional'),
+        ('&', 'closhole', 'closhole_o', 'optional'),
+        ('&', 'closepts', 'closepts_o', 'optional'),
+        ('&', 'bhstr', 'bhstr_o', 'optional'),
+        ('&', 'ptsstr', 'ptsstr_o', 'optional'),
+        ('*', 'bhid', 'bhid_f', 'required'),
+        ('*', 'z', 'z1_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'z', 'z2_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'clustr': (
+        ('&', 'in', 'in_i', 'optional'),
+        ('&', 'matxin', 'matxin_i', 'optional'),
+        ('&', 'matxfile', 'matxfile_o', 'optional'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('@', 'mattype', 'mattype_p', 0),
+        ('@', 'ztran', 'ztran_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'cogtri': (
+        ('&', 'wtrin', 'wtrin_i', 'required'),
+        ('&', 'wptin', 'wptin_i', 'required'),
+        ('&', 'wtrout', 'wtrout_o', 'optional'),
+        ('&', 'wptout', 'wptout_o', 'optional'),
+        ('&', 'ptnout', 'ptnout_o', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'compbe': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'bhid', 'bhid_f', 'optional'),
+        ('*', 'from', 'from_f', 'optional'),
+        ('*', 'to', 'to_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('*', 'coreloss', 'coreloss_f', 'optional'),
+        ('*', 'corerec', 'corerec_f', 'optional'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'interval', 'interval_p', 'optional'),
+        ('@', 'mingap', 'mingap_p', 0.05),
+        ('@', 'maxgap', 'maxgap_p', 0),
+        ('@', 'elev', 'elev_p', 0),
+        ('@', 'mincomp', 'mincomp_p', 'optional'),
+        ('@', 'maxcomp', 'maxcomp_p', 'optional'),
+        ('@', 'loss', 'loss_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'compbr': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'bhid', 'bhid_f', 'optional'),
+        ('*', 'from', 'from_f', 'optional'),
+        ('*', 'to', 'to_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('*', 'coreloss', 'coreloss_f', 'optional'),
+        ('*', 'corerec', 'corerec_f', 'optional'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'interval', 'interval_p', 'optional'),
+        ('@', 'cutoff', 'cutoff_p', 'optional'),
+        ('@', 'mingap', 'mingap_p', 'optional'),
+        ('@', 'maxgap', 'maxgap_p', 0),
+        ('@', 'elev', 'elev_p', 0),
+        ('@', 'mincomp', 'mincomp_p', 'optional'),
+        ('@', 'maxcomp', 'maxcomp_p', 'optional'),
+        ('@', 'loss', 'loss_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'compdh': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'bhid', 'bhid_f', 'optional'),
+        ('*', 'from', 'from_f', 'optional'),
+        ('*', 'to', 'to_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('*', 'coreloss', 'coreloss_f', 'optional'),
+        ('*', 'corerec', 'corerec_f', 'optional'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'interval', 'interval_p', 'optional'),
+        ('@', 'mingap', 'mingap_p', 'optional'),
+        ('@', 'maxgap', 'maxgap_p', 0),
+        ('@', 'mincomp', 'mincomp_p', 'optional'),
+        ('@', 'loss', 'loss_p', 'optional'),
+        ('@', 'start', 'start_p', 0),
+        ('@', 'mode', 'mode_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'compse': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('*', 'owcode', 'owcode_f', 'optional'),
+        ('@', 'cutoff', 'cutoff_p', 0),
+        ('@', 'minore', 'minore_p', 'optional'),
+        ('@', 'minglen', 'minglen_p', 'optional'),
+        ('@', 'maxwaste', 'maxwaste_p', 0),
+        ('@', 'minasfr', 'minasfr_p', 'optional'),
+        ('@', 'dilute', 'dilute_p', 1),
+        ('@', 'narwaste', 'narwaste_p', 1),
+        ('@', 'anyore2', 'anyore2_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'comrev': (
+        ('&', 'composit', 'composit_i', 'required'),
+        ('&', 'tonfac', 'tonfac_i', 'required'),
+        ('&', 'outlines', 'outlines_i', 'required'),
+        ('&', 'compmast', 'compmast_i', 'required'),
+        ('&', 'outlmast', 'outlmast_o', 'required'),
+        ('@', 'nptsx', 'nptsx_p', 20),
+        ('@', 'nptsy', 'nptsy_p', 20),
+        ('@', 'altertf', 'altertf_p', 1),
+        ('@', 'alterpr', 'alterpr_p', 1),
+        ('@', 'altergr', 'altergr_p', 1),
+        ('@', 'benchinc', 'benchinc_p', 1),
+        ('@', 'coordtyp', 'coordtyp_p', 1),
+        ('@', 'loyorig', 'loyorig_p', 'optional'),
+        ('@', 'loxorig', 'loxorig_p', 'optional'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'comval': (
+        ('&', 'composit', 'composit_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'conpol': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'perimout', 'perimout_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'contou': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'field', 'field_f', 'required'),
+        ('@', 'vmin', 'vmin_p', 'optional'),
+        ('@', 'vmax', 'vmax_p', 'optional'),
+        ('@', 'cint', 'cint_p', 'optional'),
+        ('@', 'gridint', 'gridint_p', 'optional'),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'position', 'position_p', 'optional'),
+        ('@', 'top', 'top_p', 'optional'),
+        ('@', 'bottom', 'bottom_p', 'optional'),
+        ('@', 'hilight', 'hilight_p', 'optional'),
+        ('@', 'hi', 'hi_p', 'optional'),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'contst': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'field', 'field_f', 'required'),
+        ('@', 'vmin', 'vmin_p', 'optional'),
+        ('@', 'vmax', 'vmax_p', 'optional'),
+        ('@', 'cint', 'cint_p', 'optional'),
+        ('@', 'gridint', 'gridint_p', 'optional'),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'position', 'position_p', 'optional'),
+        ('@', 'top', 'top_p', 'optional'),
+        ('@', 'bottom', 'bottom_p', 'optional'),
+        ('@', 'smpass', 'smpass_p', 1),
+        ('@', 'smfactor', 'smfactor_p', 0.5),
+        ('@', 'smthresh', 'smthresh_p', 0),
+        ('@', 'optype', 'optype_p', 4),
+        ('@', 'hilight', 'hilight_p', 'optional'),
+        ('@', 'hicolour', 'hicolour_p', 2),
+        ('@', 'colour', 'colour_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'copy': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'copynr': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('@', 'base', 'base_p', 'optional'),
+        ('@', 'incrment', 'incrment_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'correl': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'count': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key', 'keys_f', ['required'], 10),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'cozone': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('*', 'rockcode', 'rockcode_f', 'required'),
+        ('@', 'czxorig', 'czxorig_p', 'optional'),
+        ('@', 'czyorig', 'czyorig_p', 'optional'),
+        ('@', 'czzorig', 'czzorig_p', 'optional'),
+        ('@', 'czmwid', 'czmwid_p', 'optional'),
+        ('@', 'czbhht', 'czbhht_p', 'optional'),
+        ('@', 'directn', 'directn_p', 'optional'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'crscor': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('@', 'sampdist', 'sampdist_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'csmodel': (
+        ('&', 'points', 'points_i', 'required'),
+        ('&', 'quantile', 'quantile_i', 'optional'),
+        ('&', 'cutoff', 'cutoff_i', 'optional'),
+        ('&', 'simmod', 'simmod_o', 'optional'),
+        ('&', 'statmod', 'statmod_o', 'optional'),
+        ('&', 'reserves', 'reserves_o', 'optional'),
+        ('&', 'plot', 'plot_o', 'optional'),
+        ('*', 'grade', 'grade_f', 'required'),
+        ('@', 'xpppc', 'xpppc_p', 0),
+        ('@', 'ypppc', 'ypppc_p', 0),
+        ('@', 'zpppc', 'zpppc_p', 0),
+        ('@', 'fullcell', 'fullcell_p', 1),
+        ('@', 'quantile', 'quantile_p', 2),
+        ('@', 'cutoff', 'cutoff_p', 'optional'),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'rescsv', 'rescsv_p', 0),
+        ('@', 'gplot', 'gplot_p', 0),
+        ('@', 'tplot', 'tplot_p', 0),
+        ('@', 'mplot', 'mplot_p', 0),
+        ('@', 'gtplot', 'gtplot_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'csowopt': (
+        ('&', 'statmod', 'statmod_i', 'required'),
+        ('&', 'reserves', 'reserves_o', 'required'),
+        ('&', 'oremod', 'oremod_o', 'optional'),
+        ('&', 'plot', 'plot_o', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'daily': (
+        ('&', 'composit', 'composit_i', 'required'),
+        ('&', 'loads', 'loads_i', 'required'),
+        ('@', 'bypad', 'bypad_p', 0),
+        ('@', 'year', 'year_p', 'optional'),
+        ('@', 'month', 'month_p', 'optional'),
+        ('@', 'day', 'day_p', 'optional'),
+        ('@', 'ticutoff', 'ticutoff_p', 'optional'),
+        ('@', 'chalprec', 'chalprec_p', 0.86),
+        ('@', 'cubanrec', 'cubanrec_p', 0.6),
+        ('@', 'bornrec', 'bornrec_p', 0.9),
+        ('@', 'chalcrec', 'chalcrec_p', 0.85),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'ddcopy': (
+    ),
+    'ddlist': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'decile': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'priout', 'priout_o', 'required'),
+        ('&', 'decout', 'decout_o', 'optional'),
+        ('&', 'splitout', 'splitout_o', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'declust': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('&', 'wtout', 'wtout_o', 'optional'),
+        ('&', 'wgts_tbl', 'wgts_tbl_o', 'optional'),
+        ('&', 'stat_tbl', 'stat_tbl_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'wtfield', 'wtfield_f', 'optional'),
+        ('@', 'method', 'method_p', 1),
+        ('@', 'xgrid', 'xgrid_p', 'optional'),
+        ('@', 'ygrid', 'ygrid_p', 'optional'),
+        ('@', 'zgrid', 'zgrid_p', 'optional'),
+        ('@', 'xorig', 'xorig_p', 0),
+        ('@', 'yorig', 'yorig_p', 0),
+        ('@', 'zorig', 'zorig_p', 0),
+        ('@', 'centre', 'centre_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'decode': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'dict', 'dict_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'code', 'code_f', 'required'),
+        ('*', 'text', 'text_f', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'delete': (
+        ('&', 'in', 'in_i', 'required'),
+        ('@', 'confirm', 'confirm_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'desurv': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'bhid', 'bhid_f', 'optional'),
+        ('*', 'xcollar', 'xcollar_f', 'optional'),
+        ('*', 'ycollar', 'ycollar_f', 'optional'),
+        ('*', 'zcollar', 'zcollar_f', 'optional'),
+        ('*', 'from', 'from_f', 'optional'),
+        ('*', 'to', 'to_f', 'optional'),
+        ('*', 'at', 'at_f', 'optional'),
+        ('*', 'brg', 'brg_f', 'optional'),
+        ('*', 'dip', 'dip_f', 'optional'),
+        ('@', 'survsmth', 'survsmth_p', 1),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'diffrn': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key', 'keys_f', ['required'], 10),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'dilute': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'bhid', 'bhid_f', 'required'),
+        ('*', 'from', 'from_f', 'required'),
+        ('*', 'to', 'to_f', 'required'),
+        ('*', 'seamid', 'seamid_f', 'required'),
+        ('@', 'dilup', 'dilup_p', 'optional'),
+        ('@', 'dildown', 'dildown_p', 'optional'),
+        ('@', 'thinnest', 'thinnest_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'dilutmod': (
+        ('&', 'modin', 'modin_i', 'required'),
+        ('&', 'modout1', 'modout1_o', 'required'),
+        ('&', 'modout2', 'modout2_o', 'optional'),
+        ('&', 'resource', 'resource_o', 'optional'),
+        ('*', 'rock', 'rock_f', 'required'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('*', 'grade', 'grades_f', ['required'], 10),
+        ('@', 'xwidth', 'xwidth_p', 1),
+        ('@', 'ywidth', 'ywidth_p', 1),
+        ('@', 'zwidth', 'zwidth_p', 1),
+        ('@', 'density', 'density_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'discan': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'centrds', 'centrds_o', 'optional'),
+        ('&', 'functs', 'functs_o', 'optional'),
+        ('&', 'scores', 'scores_o', 'optional'),
+        ('*', 'groupid', 'groupid_f', 'required'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('@', 'resum', 'resum_p', 0),
+        ('@', 'primat', 'primat_p', 0),
+        ('@', 'prisco', 'prisco_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'discla': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'infuncts', 'infuncts_i', 'required'),
+        ('&', 'incentrd', 'incentrd_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'groupid', 'groupid_f', 'required'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'displa': (
+        ('&', 'in', 'in_i', 'required'),
+        ('@', 'hardcopy', 'hardcopy_p', 0),
+        ('@', 'truesize', 'truesize_p', 0),
+        ('@', 'xoffset', 'xoffset_p', 0),
+        ('@', 'yoffset', 'yoffset_p', 0),
+        ('@', 'pause', 'pause_p', 'optional'),
+        ('@', 'scale', 'scale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'dmfd': (
+    ),
+    'dtmcut': (
+        ('&', 'wiretr1', 'wiretr1_i', 'required'),
+        ('&', 'wirept1', 'wirept1_i', 'required'),
+        ('&', 'wiretr2', 'wiretr2_i', 'required'),
+        ('&', 'wirept2', 'wirept2_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'cutmodou', 'cutmodou_o', 'required'),
+        ('&', 'results', 'results_o', 'required'),
+        ('*', 'density', 'density_f', 'required'),
+        ('*', 'cutfld', 'cutfld_f', 'required'),
+        ('*', 'attrib', 'attrib_f', 'optional'),
+        ('@', 'cutden', 'cutden_p', 1),
+        ('@', 'fillden', 'fillden_p', 1),
+        ('@', 'splits', 'splits_p', 0),
+        ('@', 'cutval', 'cutval_p', -1),
+        ('@', 'fillval', 'fillval_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'dtmmod': (
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'modelin', 'modelin_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'modelou', 'modelou_o', 'optional'),
+        ('&', 'cutmodou', 'cutmodou_o', 'required'),
+        ('&', 'results', 'results_o', 'required'),
+        ('*', 'density', 'density_f', 'required'),
+        ('*', 'cutfld', 'cutfld_f', 'required'),
+        ('*', 'attrib', 'attrib_f', 'optional'),
+        ('@', 'fillden', 'fillden_p', 1),
+        ('@', 'splits', 'splits_p', 0),
+        ('@', 'cutval', 'cutval_p', -1),
+        ('@', 'fillval', 'fillval_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'dxfout': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'layer', 'layer_f', 'optional'),
+        ('@', 'tolernce', 'tolernce_p', 0.001),
+        ('@', 'realwrld', 'realwrld_p', 0),
+        ('@', 'dm', 'dm_p', 0),
+        ('@', 'maxvert', 'maxvert_p', 'optional'),
+        ('@', 'layernam', 'layernam_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'ellipse': (
+        ('&', 'srcparm', 'srcparm_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_o', 'required'),
+        ('&', 'wirept', 'wirept_o', 'required'),
+        ('@', 'srefnum', 'srefnum_p', 'optional'),
+        ('@', 'sangle1', 'sangle1_p', 0),
+        ('@', 'sangle2', 'sangle2_p', 0),
+        ('@', 'sangle3', 'sangle3_p', 0),
+        ('@', 'saxis1', 'saxis1_p', 3),
+        ('@', 'saxis2', 'saxis2_p', 1),
+        ('@', 'saxis3', 'saxis3_p', 3),
+        ('@', 'sdist1', 'sdist1_p', 10),
+        ('@', 'sdist2', 'sdist2_p', 10),
+        ('@', 'sdist3', 'sdist3_p', 10),
+        ('@', 'xcentre', 'xcentre_p', 0),
+        ('@', 'ycentre', 'ycentre_p', 0),
+        ('@', 'zcentre', 'zcentre_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'englog': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'dict', 'dict_i', 'optional'),
+        ('&', 'remarks', 'remarks_i', 'optional'),
+        ('@', 'lhmargin', 'lhmargin_p', 1),
+        ('@', 'rhmargin', 'rhmargin_p', 79),
+        ('@', 'lines', 'lines_p', 0),
+        ('@', 'noff', 'noff_p', 0),
+        ('@', 'double', 'double_p', 0),
+        ('@', 'sysfile', 'sysfile_p', 0),
+        ('@', 'eng_marg', 'eng_marg_p', 0),
+        ('@', 'eng_leng', 'eng_leng_p', 79),
+        ('@', 'precdent', 'precdent_p', 0),
+        ('@', 'nocomma', 'nocomma_p', 0),
+        ('@', 'nonl', 'nonl_p', 0),
+        ('@', 'showcode', 'showcode_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'envseq': (
+        ('&', 'envmodel', 'envmodel_i', 'required'),
+        ('&', 'results', 'results_i', 'required'),
+        ('&', 'costs', 'costs_i', 'required'),
+        ('&', 'sequence', 'sequence_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'grade', 'grade_f', 'optional'),
+        ('*', 'value', 'value_f', 'optional'),
+        ('*', 'shapzone', 'shapzone_f', 'optional'),
+        ('*', 'envbest', 'envbest_f', 'required'),
+        ('*', 'envelope', 'envelope_f', 'required'),
+        ('*', 'envnum', 'envnum_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('@', 'hdgrade', 'hdgrade_p', 'optional'),
+        ('@', 'refz', 'refz_p', 'optional'),
+        ('@', 'refx', 'refx_p', 'optional'),
+        ('@', 'refy', 'refy_p', 'optional'),
+        ('@', 'seqopt', 'seqopt_p', 0),
+        ('@', 'distmeth', 'distmeth_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'estima': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'srcparm', 'srcparm_i', 'required'),
+        ('&', 'estparm', 'estparm_i', 'required'),
+        ('&', 'vmodparm', 'vmodparm_i', 'optional'),
+        ('&', 'string', 'string_i', 'optional'),
+        ('&', 'model', 'model_o', 'required'),
+        ('&', 'sampout', 'sampout_o', 'optional'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'z', 'z_f', 'optional'),
+        ('*', 'zone1_f', 'zone1_f_f', 'optional'),
+        ('*', 'zone2_f', 'zone2_f_f', 'optional'),
+        ('*', 'key', 'key_f', 'optional'),
+        ('*', 'length_f', 'length_f_f', 'optional'),
+        ('*', 'dens_f', 'dens_f_f', 'optional'),
+        ('*', 'section', 'section_f', 'optional'),
+        ('*', 'boundary', 'boundary_f', 'optional'),
+        ('*', 'wstag', 'wstag_f', 'optional'),
+        ('*', 'bstag', 'bstag_f', 'optional'),
+        ('*', 'tag', 'tag_f', 'optional'),
+        ('@', 'discmeth', 'discmeth_p', 1),
+        ('@', 'xpoints', 'xpoints_p', 1),
+        ('@', 'ypoints', 'ypoints_p', 1),
+        ('@', 'zpoints', 'zpoints_p', 1),
+        ('@', 'xdspace', 'xdspace_p', 'optional'),
+        ('@', 'ydspace', 'ydspace_p', 'optional'),
+        ('@', 'zdspace', 'zdspace_p', 'optional'),
+        ('@', 'parent', 'parent_p', 1),
+        ('@', 'dyankr', 'dyankr_p', 1),
+        ('@', 'mindisc', 'mindisc_p', 1),
+        ('@', 'copyval', 'copyval_p', 0),
+        ('@', 'fvaltype', 'fvaltype_p', 1),
+        ('@', 'fstep', 'fstep_p', 'optional'),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'zmin', 'zmin_p', 'optional'),
+        ('@', 'zmax', 'zmax_p', 'optional'),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'zsubcell', 'zsubcell_p', 1),
+        ('@', 'allwgts', 'allwgts_p', 0),
+        ('@', 'linkmode', 'linkmode_p', 3),
+        ('@', 'ucsamode', 'ucsamode_p', 2),
+        ('@', 'ucsbmode', 'ucsbmode_p', 3),
+        ('@', 'ucscmode', 'ucscmode_p', 2),
+        ('@', 'plane', 'plane_p', 1),
+        ('@', 'hangid', 'hangid_p', 'optional'),
+        ('@', 'footid', 'footid_p', 'optional'),
+        ('@', 'tolrnc', 'tolrnc_p', 0),
+        ('@', 'ucsalimt', 'ucsalimt_p', 1),
+        ('@', 'orgtag', 'orgtag_p', 'optional'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'estimate': (
+    ),
+    'expfld': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'start', 'start_f', 'required'),
+        ('*', 'end', 'end_f', 'required'),
+        ('*', 'newfield', 'newfield_f', 'required'),
+        ('@', 'incrment', 'incrment_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'expmmw': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'perimout', 'perimout_o', 'required'),
+        ('@', 'mmw', 'mmw_p', 'optional'),
+        ('@', 'pinc', 'pinc_p', 0.1),
+        ('@', 'mode', 'mode_p', 1),
+        ('@', 'nodiag', 'nodiag_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'expndmod': (
+        ('&', 'model', 'model_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'optional'),
+        ('&', 'wirept', 'wirept_i', 'optional'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'defvals', 'defvals_i', 'optional'),
+        ('&', 'modelout', 'modelout_o', 'required'),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'wiretype', 'wiretype_p', 2),
+        ('@', 'cellxmin', 'cellxmin_p', 2.5),
+        ('@', 'cellymin', 'cellymin_p', 2.5),
+        ('@', 'cellzmin', 'cellzmin_p', 2.5),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'zmin', 'zmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'zmax', 'zmax_p', 'optional'),
+        ('@', 'filvol', 'filvol_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'export': (
+    ),
+    'extend': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'extndf': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'factor': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'uscores', 'uscores_o', 'optional'),
+        ('&', 'rscores', 'rscores_o', 'optional'),
+        ('&', 'oscores', 'oscores_o', 'optional'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('@', 'maxit', 'maxit_p', 0),
+        ('@', 'eigenmin', 'eigenmin_p', 1),
+        ('@', 'numeigen', 'numeigen_p', 0),
+        ('@', 'promaxcf', 'promaxcf_p', 3),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'fdout': (
+        ('&', 'in', 'in_i', 'required'),
+        ('@', 'tolton', 'tolton_p', 0.5),
+        ('@', 'format', 'format_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'ffunc': (
+        ('&', 'vmodparm', 'vmodparm_i', 'required'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('@', 'vmodnum', 'vmodnum_p', 1),
+        ('@', 'log', 'log_p', 0),
+        ('@', 'ipoints', 'ipoints_p', 6),
+        ('@', 'jpoints', 'jpoints_p', 6),
+        ('@', 'kpoints', 'kpoints_p', 6),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'filcom': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'filexp': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'filtpo': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'optional'),
+        ('@', 'radius', 'radius_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'foreca': (
+        ('&', 'composit', 'composit_i', 'required'),
+        ('@', 'rconloti', 'rconloti_p', 'optional'),
+        ('@', 'rconhiti', 'rconhiti_p', 'optional'),
+        ('@', 'startmon', 'startmon_p', 'optional'),
+        ('@', 'startyr', 'startyr_p', 'optional'),
+        ('@', 'endmon', 'endmon_p', 'optional'),
+        ('@', 'endyr', 'endyr_p', 'optional'),
+        ('@', 'chalprec', 'chalprec_p', 0.86),
+        ('@', 'cubanrec', 'cubanrec_p', 0.6),
+        ('@', 'bornrec', 'bornrec_p', 0.9),
+        ('@', 'chalcrec', 'chalcrec_p', 0.85),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'format': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'repdef', 'repdef_i', 'optional'),
+        ('@', 'lhmargin', 'lhmargin_p', 1),
+        ('@', 'rhmargin', 'rhmargin_p', 79),
+        ('@', 'lines', 'lines_p', 20),
+        ('@', 'hdsep', 'hdsep_p', 3),
+        ('@', 'ftsep', 'ftsep_p', 3),
+        ('@', 'gutter', 'gutter_p', 1),
+        ('@', 'keybreak', 'keybreak_p', -1),
+        ('@', 'noff', 'noff_p', 0),
+        ('@', 'double', 'double_p', 0),
+        ('@', 'sysfile', 'sysfile_p', 0),
+        ('@', 'print', 'print_p', 1),
+        ('@', 'pause', 'pause_p', -1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'foskor': (
+        ('&', 'planning', 'planning_i', 'required'),
+        ('@', 'startmon', 'startmon_p', 'optional'),
+        ('@', 'startyr', 'startyr_p', 'optional'),
+        ('@', 'sixmonth', 'sixmonth_p', 0),
+        ('@', 'cutons', 'cutons_p', 'optional'),
+        ('@', 'p2o5tons', 'p2o5tons_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'fxout': (
+        ('&', 'in', 'in_i', 'required'),
+        ('@', 'tolton', 'tolton_p', 0.5),
+        ('@', 'format', 'format_p', 0),
+        ('@', 'element', 'element_p', 1),
+        ('@', 'zonefld', 'zonefld_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'gausan': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'polyno', 'polyno_o', 'optional'),
+        ('&', 'trans', 'trans_o', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'gausanam': (
+        ('&', 'samples', 'samples_i', 'required'),
+        ('&', 'graph', 'graph_o', 'optional'),
+        ('&', 'stats', 'stats_o', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'gentra': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'grade': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'grton': (
+        ('&', 'polyno', 'polyno_i', 'required'),
+        ('&', 'qtn', 'qtn_o', 'required'),
+        ('&', 'qtr', 'qtr_o', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'hisfit': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'modelou', 'modelou_o', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'histog': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('@', 'binsize', 'binsize_p', 'optional'),
+        ('@', 'minimum', 'minimum_p', 'optional'),
+        ('@', 'numbins', 'numbins_p', 'optional'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'holes3d': (
+        ('&', 'collar', 'collar_i', 'required'),
+        ('&', 'survey', 'survey_i', 'optional'),
+        ('&', 'sample', 'samples_i', ['required'], 5),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'holesmry', 'holesmry_o', 'optional'),
+        ('&', 'errors', 'errors_o', 'optional'),
+        ('*', 'bhid', 'bhid_f', 'optional'),
+        ('*', 'xcollar', 'xcollar_f', 'optional'),
+        ('*', 'ycollar', 'ycollar_f', 'optional'),
+        ('*', 'zcollar', 'zcollar_f', 'optional'),
+        ('*', 'from', 'from_f', 'optional'),
+        ('*', 'to', 'to_f', 'optional'),
+        ('*', 'at', 'at_f', 'optional'),
+        ('*', 'brg', 'brg_f', 'optional'),
+        ('*', 'dip', 'dip_f', 'optional'),
+        ('@', 'survsmth', 'survsmth_p', 1),
+        ('@', 'endpoint', 'endpoint_p', 0),
+        ('@', 'dipmeth', 'dipmeth_p', -1),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'holmer': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'bhid', 'bhid_f', 'required'),
+        ('*', 'from', 'from_f', 'required'),
+        ('*', 'to', 'to_f', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'igesin': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'igesout': (
+    ),
+    'ijkgen': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('@', 'psmodel', 'psmodel_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'indata': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'indest': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'srcparm', 'srcparm_i', 'required'),
+        ('&', 'estparm', 'estparm_i', 'required'),
+        ('&', 'vmodparm', 'vmodparm_i', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'inputw': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'ipdnpg': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'model', 'model_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'isohol': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'value', 'value_f', 'optional'),
+        ('*', 'bhid', 'bhid_f', 'optional'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'z', 'z_f', 'optional'),
+        ('*', 'length', 'length_f', 'optional'),
+        ('*', 'a0', 'a0_f', 'optional'),
+        ('*', 'b0', 'b0_f', 'optional'),
+        ('@', 'pxmin', 'pxmin_p', 'optional'),
+        ('@', 'pxmax', 'pxmax_p', 'optional'),
+        ('@', 'pymin', 'pymin_p', 'optional'),
+        ('@', 'pymax', 'pymax_p', 'optional'),
+        ('@', 'pzmin', 'pzmin_p', 'optional'),
+        ('@', 'pzmax', 'pzmax_p', 'optional'),
+        ('@', 'vertexag', 'vertexag_p', 'optional'),
+        ('@', 'rotate', 'rotate_p', 45),
+        ('@', 'elevate', 'elevate_p', 45),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'isomet': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'field', 'field_f', 'required'),
+        ('@', 'vmin', 'vmin_p', 'optional'),
+        ('@', 'vmax', 'vmax_p', 'optional'),
+        ('@', 'vertexag', 'vertexag_p', 'optional'),
+        ('@', 'gridint', 'gridint_p', 'optional'),
+        ('@', 'rotate', 'rotate_p', 45),
+        ('@', 'elevate', 'elevate_p', 45),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'position', 'position_p', 'optional'),
+        ('@', 'top', 'top_p', 'optional'),
+        ('@', 'bottom', 'bottom_p', 'optional'),
+        ('@', 'pxmin', 'pxmin_p', 'optional'),
+        ('@', 'pxmax', 'pxmax_p', 'optional'),
+        ('@', 'pymin', 'pymin_p', 'optional'),
+        ('@', 'pymax', 'pymax_p', 'optional'),
+        ('@', 'xinc', 'xinc_p', 'optional'),
+        ('@', 'yinc', 'yinc_p', 'optional'),
+        ('@', 'zinc', 'zinc_p', 'optional'),
+        ('@', 'ndx', 'ndx_p', 0),
+        ('@', 'ndy', 'ndy_p', 0),
+        ('@', 'ndz', 'ndz_p', 0),
+        ('@', 'colint', 'colint_p', 0),
+        ('@', 'colst', 'colst_p', 1),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'isoper': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'pxmin', 'pxmin_p', 'optional'),
+        ('@', 'pxmax', 'pxmax_p', 'optional'),
+        ('@', 'pymin', 'pymin_p', 'optional'),
+        ('@', 'pymax', 'pymax_p', 'optional'),
+        ('@', 'pzmin', 'pzmin_p', 'optional'),
+        ('@', 'pzmax', 'pzmax_p', 'optional'),
+        ('@', 'rotate', 'rotate_p', 45),
+        ('@', 'elevate', 'elevate_p', 45),
+        ('@', 'charsize', 'charsize_p', 4),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'isotri': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'pxmin', 'pxmin_p', 'optional'),
+        ('@', 'pxmax', 'pxmax_p', 'optional'),
+        ('@', 'pymin', 'pymin_p', 'optional'),
+        ('@', 'pymax', 'pymax_p', 'optional'),
+        ('@', 'pzmin', 'pzmin_p', 'optional'),
+        ('@', 'pzmax', 'pzmax_p', 'optional'),
+        ('@', 'rotate', 'rotate_p', 45),
+        ('@', 'elevate', 'elevate_p', 'optional'),
+        ('@', 'hidden', 'hidden_p', 0),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'join': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key', 'keys_f', ['optional'], 10),
+        ('@', 'subsetr', 'subsetr_p', 0),
+        ('@', 'subsetf', 'subsetf_p', 0),
+        ('@', 'cartjoin', 'cartjoin_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'layout': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'text', 'text_i', 'required'),
+        ('&', 'outlines', 'outlines_i', 'required'),
+        ('&', 'patterns', 'patterns_i', 'required'),
+        ('&', 'collars', 'collars_i', 'optional'),
+        ('&', 'holes', 'holes_i', 'optional'),
+        ('&', 'geol', 'geol_i', 'optional'),
+        ('@', 'coordmod', 'coordmod_p', 0),
+        ('@', 'coordtyp', 'coordtyp_p', 0),
+        ('@', 'loyorig', 'loyorig_p', 'optional'),
+        ('@', 'loxorig', 'loxorig_p', 'optional'),
+        ('@', 'haxiscol', 'haxiscol_p', 'optional'),
+        ('@', 'vaxiscol', 'vaxiscol_p', 10),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'dimenu', 'dimenu_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'link3d': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'wireptin', 'wireptin_i', 'required'),
+        ('&', 'wiretrin', 'wiretrin_i', 'required'),
+        ('&', 'section', 'section_i', 'optional'),
+        ('&', 'wireptou', 'wireptou_o', 'optional'),
+        ('&', 'wiretrou', 'wiretrou_o', 'optional'),
+        ('&', 'perimout', 'perimout_o', 'optional'),
+        ('*', 'attrib', 'attribs_f', ['optional'], 5),
+        ('@', 'maxpts', 'maxpts_p', 500),
+        ('@', 'copyper', 'copyper_p', 0),
+        ('@', 'copywf', 'copywf_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'linkpe': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'section', 'section_i', 'optional'),
+        ('&', 'wireptin', 'wireptin_i', 'optional'),
+        ('&', 'wiretrin', 'wiretrin_i', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'list': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'listc': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'listdr': (
+    ),
+    'lunicond': (
+        ('&', 'outmdoel', 'outmdoel_o', 'required'),
+    ),
+    'manova': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'key', 'keys_f', 'required', 10),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'mdtran': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'protorot', 'protorot_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('@', 'angle1', 'angle1_p', 0),
+        ('@', 'angle2', 'angle2_p', 0),
+        ('@', 'angle3', 'angle3_p', 0),
+        ('@', 'rotaxis1', 'rotaxis1_p', 3),
+        ('@', 'rotaxis2', 'rotaxis2_p', 1),
+        ('@', 'rotaxis3', 'rotaxis3_p', 3),
+        ('@', 'x0', 'x0_p', 0),
+        ('@', 'y0', 'y0_p', 0),
+        ('@', 'z0', 'z0_p', 0),
+        ('@', 'xr0', 'xr0_p', 0),
+        ('@', 'yr0', 'yr0_p', 0),
+        ('@', 'zr0', 'zr0_p', 0),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'zsubcell', 'zsubcell_p', 1),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'inverse', 'inverse_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'mgsort': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key', 'keys_f', ['required'], 10),
+        ('@', 'order', 'order_p', 1),
+        ('@', 'keysfrst', 'keysfrst_p', 1),
+        ('@', 'roworder', 'roworder_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'mikscell': (
+        ('&', 'modelin', 'modelin_i', 'required'),
+        ('&', 'modelout', 'modelout_o', 'required'),
+        ('*', 'grade', 'grade_f', 'required'),
+        ('*', 'f', 'fields_f', ['optional'], 10),
+        ('@', 'axis', 'axis_p', 3),
+        ('@', 'minvol', 'minvol_p', 0),
+        ('@', 'tolernce', 'tolernce_p', 0.0001),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'minewd': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'oreval', 'oreval_f', 'optional'),
+        ('@', 'minwid', 'minwid_p', 'optional'),
+        ('@', 'widdir', 'widdir_p', 'optional'),
+        ('@', 'oremin', 'oremin_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'minlay': (
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'section', 'section_i', 'optional'),
+        ('&', 'icon', 'icon_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'sectid', 'sectid_p', 'optional'),
+        ('@', 'nopos', 'nopos_p', 0),
+        ('@', 'asize', 'asize_p', 0),
+        ('@', 'scale', 'scale_p', 'optional'),
+        ('@', 'xorig', 'xorig_p', 'optional'),
+        ('@', 'yorig', 'yorig_p', 'optional'),
+        ('@', 'append', 'append_p', 1),
+        ('@', 'unit', 'unit_p', 0),
+        ('@', 'coortyp', 'coortyp_p', 0),
+        ('@', 'loyorig', 'loyorig_p', 0),
+        ('@', 'loxorig', 'loxorig_p', 0),
+        ('@', 'lozorig', 'lozorig_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'minper': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'shedres', 'shedres_i', 'required'),
+        ('&', 'stringin', 'stringin_i', 'required'),
+        ('&', 'perimout', 'perimout_o', 'required'),
+        ('*', 'perim', 'perim_f', 'required'),
+        ('@', 'mine', 'mine_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'minwid': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'interval', 'interval_o', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'density', 'density_f', 'required'),
+        ('@', 'cutoff', 'cutoff_p', 0),
+        ('@', 'minore', 'minore_p', 'optional'),
+        ('@', 'minwaste', 'minwaste_p', 0),
+        ('@', 'dilute', 'dilute_p', 1),
+        ('@', 'narwast1', 'narwast1_p', 1),
+        ('@', 'narwast2', 'narwast2_p', 0),
+        ('@', 'dilp', 'dilp_p', 0),
+        ('@', 'diln', 'diln_p', 0),
+        ('@', 'dilint', 'dilint_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'minzon': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'zonedef', 'zonedef_i', 'required'),
+        ('&', 'rules', 'rules_i', 'required'),
+        ('&', 'scratch', 'scratch_i', 'required'),
+        ('&', 'thresh', 'thresh_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'reserves', 'reserves_o', 'optional'),
+        ('*', 'priorty', 'priorties_f', ['optional'], 5),
+        ('*', 'print1', 'print1_f', 'optional'),
+        ('*', 'print2', 'print2_f', 'optional'),
+        ('*', 'print3', 'print3_f', 'optional'),
+        ('*', 'print4', 'print4_f', 'optional'),
+        ('*', 'print5', 'print5_f', 'optional'),
+        ('*', 'sliceno', 'sliceno_f', 'optional'),
+        ('*', 'slicewid', 'slicewid_f', 'optional'),
+        ('@', 'minadv', 'minadv_p', 'optional'),
+        ('@', 'zxorig', 'zxorig_p', 'optional'),
+        ('@', 'zyorig', 'zyorig_p', 'optional'),
+        ('@', 'zzorig', 'zzorig_p', 'optional'),
+        ('@', 'minwid', 'minwid_p', 0),
+        ('@', 'maxwid', 'maxwid_p', 0),
+        ('@', 'minbht', 'minbht_p', 'optional'),
+        ('@', 'directn', 'directn_p', 1),
+        ('@', 'incrment', 'incrment_p', 1),
+        ('@', 'exzone', 'exzone_p', 'optional'),
+        ('@', 'onlyrule', 'onlyrule_p', 0),
+        ('@', 'truevol', 'truevol_p', 0),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'slicefld', 'slicefld_p', 1),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'mod2blks': (
+        ('&', 'model', 'model_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'mod2xyz': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'f1', 'f1_f', 'required'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'modconf': (
+        ('&', 'simmod', 'simmod_i', 'required'),
+        ('&', 'conf_tbl', 'conf_tbl_o', 'required'),
+        ('&', 'conf_plt', 'conf_plt_o', 'optional'),
+        ('@', 'cutint', 'cutint_p', 1),
+        ('@', 'cutmax', 'cutmax_p', 10),
+        ('@', 'pcint', 'pcint_p', 5),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'plot_tbl', 'plot_tbl_p', 0),
+        ('@', 'display', 'display_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'modenv': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'shape', 'shape_i', 'optional'),
+        ('&', 'exclude', 'exclude_i', 'optional'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('&', 'envmodel', 'envmodel_o', 'optional'),
+        ('&', 'results', 'results_o', 'optional'),
+        ('*', 'value', 'value_f', 'optional'),
+        ('*', 'grade', 'grade_f', 'required'),
+        ('*', 'shapzone', 'shapzone_f', 'optional'),
+        ('*', 'envbest', 'envbest_f', 'optional'),
+        ('*', 'envelope', 'envelope_f', 'optional'),
+        ('*', 'envnum', 'envnum_f', 'optional'),
+        ('*', 'hdgrade', 'hdgrade_f', 'optional'),
+        ('*', 'mined', 'mined_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('@', 'cutoff', 'cutoff_p', 0),
+        ('@', 'hdgrade', 'hdgrade_p', 0),
+        ('@', 'defgrade', 'defgrade_p', 0),
+        ('@', 'defvalue', 'defvalue_p', 0),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'maxwaste', 'maxwaste_p', 1),
+        ('@', 'maxore', 'maxore_p', 0),
+        ('@', 'pdwvalue', 'pdwvalue_p', 0),
+        ('@', 'pdwgrade', 'pdwgrade_p', 0),
+        ('@', 'pdwaste', 'pdwaste_p', 0),
+        ('@', 'optwaste', 'optwaste_p', 0),
+        ('@', 'optimise', 'optimise_p', 2),
+        ('@', 'dilute', 'dilute_p', 1),
+        ('@', 'envtype', 'envtype_p', 1),
+        ('@', 'envnum', 'envnum_p', 1),
+        ('@', 'inmodel', 'inmodel_p', 0),
+        ('@', 'shapemth', 'shapemth_p', 0),
+        ('@', 'pdwonly', 'pdwonly_p', 0),
+        ('@', 'mmuincx', 'mmuincx_p', 1),
+        ('@', 'mmuincy', 'mmuincy_p', 1),
+        ('@', 'mmuincz', 'mmuincz_p', 1),
+        ('@', 'mmusizex', 'mmusizex_p', 0),
+        ('@', 'mmusizey', 'mmusizey_p', 0),
+        ('@', 'mmusizez', 'mmusizez_p', 0),
+        ('@', 'pdwsizex', 'pdwsizex_p', 0),
+        ('@', 'pdwsizey', 'pdwsizey_p', 0),
+        ('@', 'pdwsizez', 'pdwsizez_p', 0),
+        ('@', 'mmuslopn', 'mmuslopn_p', 0),
+        ('@', 'mmuslops', 'mmuslops_p', 0),
+        ('@', 'mmuslope', 'mmuslope_p', 0),
+        ('@', 'mmuslopw', 'mmuslopw_p', 0),
+        ('@', 'mmuslopi', 'mmuslopi_p', 0),
+        ('@', 'mmuminx', 'mmuminx_p', 'optional'),
+        ('@', 'mmuminy', 'mmuminy_p', 'optional'),
+        ('@', 'mmuminz', 'mmuminz_p', 'optional'),
+        ('@', 'mmumaxx', 'mmumaxx_p', 'optional'),
+        ('@', 'mmumaxy', 'mmumaxy_p', 'optional'),
+        ('@', 'mmumaxz', 'mmumaxz_p', 'optional'),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'zsubcell', 'zsubcell_p', 1),
+        ('@', 'envout', 'envout_p', 1),
+        ('@', 'xoverlap', 'xoverlap_p', 2),
+        ('@', 'calcenv', 'calcenv_p', 1),
+        ('@', 'progress', 'progress_p', 'optional'),
+        ('@', 'info', 'info_p', 2),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'modres': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'results', 'results_o', 'required'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'zvalue', 'zvalue_p', 0),
+        ('@', 'pairs', 'pairs_p', 0),
+        ('@', 'fullcell', 'fullcell_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'modsplit': (
+        ('&', 'modelin', 'modelin_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'modelout', 'modelout_o', 'required'),
+        ('&', 'fullmod', 'fullmod_o', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('*', 'addf1', 'addf1_f', 'optional'),
+        ('*', 'addf2', 'addf2_f', 'optional'),
+        ('*', 'addf3', 'addf3_f', 'optional'),
+        ('*', 'addf4', 'addf4_f', 'optional'),
+        ('*', 'addf5', 'addf5_f', 'optional'),
+        ('*', 'addf6', 'addf6_f', 'optional'),
+        ('*', 'addf7', 'addf7_f', 'optional'),
+        ('*', 'addf8', 'addf8_f', 'optional'),
+        ('*', 'addf9', 'addf9_f', 'optional'),
+        ('@', 'modltype', 'modltype_p', 1),
+        ('@', 'zone', 'zone_p', 'optional'),
+        ('@', 'maxdip', 'maxdip_p', 0),
+        ('@', 'splits', 'splits_p', 3),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'zsubcell', 'zsubcell_p', 1),
+        ('@', 'resol', 'resol_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'modtra': (
+        ('&', 'model', 'model_i', 'required'),
+        ('&', 'grid', 'grid_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'f1', 'f1_f', 'required'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'xg', 'xg_f', 'optional'),
+        ('*', 'yg', 'yg_f', 'optional'),
+        ('*', 'zg', 'zg_f', 'optional'),
+        ('@', 'plane', 'plane_p', 1),
+        ('@', 'xorig', 'xorig_p', 'optional'),
+        ('@', 'yorig', 'yorig_p', 'optional'),
+        ('@', 'zorig', 'zorig_p', 'optional'),
+        ('@', 'xspace', 'xspace_p', 'optional'),
+        ('@', 'yspace', 'yspace_p', 'optional'),
+        ('@', 'zspace', 'zspace_p', 'optional'),
+        ('@', 'numx', 'numx_p', 'optional'),
+        ('@', 'numy', 'numy_p', 'optional'),
+        ('@', 'numz', 'numz_p', 'optional'),
+        ('@', 'miss', 'miss_p', 'optional'),
+        ('@', 'print', 'print_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'modtri': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'wiretr', 'wiretr_o', 'required'),
+        ('&', 'wirept', 'wirept_o', 'required'),
+        ('@', 'origin', 'origin_p', 0),
+        ('@', 'pttol', 'pttol_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'monaco': (
+    ),
+    'nscore': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'refdist', 'refdist_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'trandist', 'trandist_o', 'optional'),
+        ('&', 'stat_tbl', 'stat_tbl_o', 'optional'),
+        ('*', 'grade', 'grade_f', 'required'),
+        ('*', 'dcwgt', 'dcwgt_f', 'optional'),
+        ('*', 'refgrade', 'refgrade_f', 'optional'),
+        ('*', 'refwgt', 'refwgt_f', 'optional'),
+        ('@', 'mingrade', 'mingrade_p', 0),
+        ('@', 'maxgrade', 'maxgrade_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'origin': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('&', 'wiretr', 'wiretr_o', 'optional'),
+        ('&', 'wirept', 'wirept_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('@', 'angle1', 'angle1_p', 0),
+        ('@', 'angle2', 'angle2_p', 0),
+        ('@', 'angle3', 'angle3_p', 0),
+        ('@', 'rotaxis1', 'rotaxis1_p', 3),
+        ('@', 'rotaxis2', 'rotaxis2_p', 1),
+        ('@', 'rotaxis3', 'rotaxis3_p', 3),
+        ('@', 'margin', 'margin_p', 10),
+        ('@', 'xinc', 'xinc_p', 10),
+        ('@', 'yinc', 'yinc_p', 10),
+        ('@', 'zinc', 'zinc_p', 10),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'panelest': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'vmodparm', 'vmodparm_i', 'optional'),
+        ('&', 'perim', 'perim_i', 'optional'),
+        ('&', 'disptin', 'disptin_i', 'optional'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('&', 'sampout', 'sampout_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'optional'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'panel', 'panel_f', 'optional'),
+        ('*', 'xpt', 'xpt_f', 'optional'),
+        ('*', 'ypt', 'ypt_f', 'optional'),
+        ('*', 'zpt', 'zpt_f', 'optional'),
+        ('@', 'minnum', 'minnum_p', 1),
+        ('@', 'maxnum', 'maxnum_p', 100),
+        ('@', 'inside', 'inside_p', 1),
+        ('@', 'xdspace', 'xdspace_p', 0),
+        ('@', 'ydspace', 'ydspace_p', 0),
+        ('@', 'zdspace', 'zdspace_p', 0),
+        ('@', 'mindisc', 'mindisc_p', 50),
+        ('@', 'dplus', 'dplus_p', 0),
+        ('@', 'dminus', 'dminus_p', 0),
+        ('@', 'imethod', 'imethod_p', 3),
+        ('@', 'vmodnum', 'vmodnum_p', 1),
+        ('@', 'log', 'log_p', 0),
+        ('@', 'power', 'power_p', 2),
+        ('@', 'total', 'total_p', 0),
+        ('@', 'vgonly', 'vgonly_p', 0),
+        ('@', 'anangle1', 'anangle1_p', 0),
+        ('@', 'anaxis1', 'anaxis1_p', 3),
+        ('@', 'anangle2', 'anangle2_p', 0),
+        ('@', 'anaxis2', 'anaxis2_p', 1),
+        ('@', 'anangle3', 'anangle3_p', 0),
+        ('@', 'anaxis3', 'anaxis3_p', 3),
+        ('@', 'andist1', 'andist1_p', 1),
+        ('@', 'andist2', 'andist2_p', 1),
+        ('@', 'andist3', 'andist3_p', 1),
+        ('@', 'print', 'print_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'panelk': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'panel', 'panel_f', 'required'),
+        ('@', 'nugget', 'nugget_p', 0),
+        ('@', 'var1', 'var1_p', 1),
+        ('@', 'range1', 'range1_p', 1),
+        ('@', 'range2', 'range2_p', 1),
+        ('@', 'vgangle1', 'vgangle1_p', 0),
+        ('@', 'search', 'search_p', 'optional'),
+        ('@', 'nmax', 'nmax_p', 50),
+        ('@', 'nsim', 'nsim_p', 20),
+        ('@', 'minsim', 'minsim_p', 'optional'),
+        ('@', 'vmethod', 'vmethod_p', 1),
+        ('@', 'vgram', 'vgram_p', 1),
+        ('@', 'print', 'print_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'pca': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'scores', 'scores_o', 'optional'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('@', 'matxtype', 'matxtype_p', 0),
+        ('@', 'eigenmin', 'eigenmin_p', 1),
+        ('@', 'numeigen', 'numeigen_p', 0),
+        ('@', 'maxvarpc', 'maxvarpc_p', 'optional'),
+        ('@', 'scnorm', 'scnorm_p', 0),
+        ('@', 'loadeign', 'loadeign_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'pdrive': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'penfile', 'penfile_i', 'optional'),
+        ('&', 'filter', 'filter_i', 'optional'),
+        ('@', 'plottype', 'plottype_p', 'optional'),
+        ('@', 'spool', 'spool_p', 1),
+        ('@', 'dfltfile', 'dfltfile_p', 2),
+        ('@', 'num.pens', 'num_pens_p', 'optional'),
+        ('@', 'hatchwid', 'hatchwid_p', 'optional'),
+        ('@', 'squeeze', 'squeeze_p', 'optional'),
+        ('@', 'angle', 'angle_p', 0),
+        ('@', 'scale', 'scale_p', 'optional'),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'xoffset', 'xoffset_p', 0),
+        ('@', 'yoffset', 'yoffset_p', 0),
+        ('@', 'pxend', 'pxend_p', 0),
+        ('@', 'pyend', 'pyend_p', 0),
+        ('@', 'pendmode', 'pendmode_p', 0),
+        ('@', 'raster', 'raster_p', 0),
+        ('@', 'fillopt', 'fillopt_p', 1),
+        ('@', 'trmode', 'trmode_p', 1),
+        ('@', 'emptycol', 'emptycol_p', 0),
+        ('@', 'edgeopt', 'edgeopt_p', 1),
+        ('@', 'edgecol', 'edgecol_p', 0),
+        ('@', 'charbgr', 'charbgr_p', 'optional'),
+        ('@', 'symbgr', 'symbgr_p', 'optional'),
+        ('@', 'fitpaper', 'fitpaper_p', 0),
+        ('@', 'shadepct', 'shadepct_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'perdtm': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'perfil': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'model', 'model_o', 'required'),
+        ('*', 'dplus', 'dplus_f', 'optional'),
+        ('*', 'dminus', 'dminus_f', 'optional'),
+        ('*', 'attrib1', 'attrib1_f', 'optional'),
+        ('*', 'attrib2', 'attrib2_f', 'optional'),
+        ('*', 'attrib3', 'attrib3_f', 'optional'),
+        ('*', 'attrib4', 'attrib4_f', 'optional'),
+        ('*', 'attrib5', 'attrib5_f', 'optional'),
+        ('@', 'mode', 'mode_p', 0),
+        ('@', 'dplus', 'dplus_p', 'optional'),
+        ('@', 'dminus', 'dminus_p', 'optional'),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'zone', 'zone_p', 0),
+        ('@', 'optimise', 'optimise_p', 2),
+        ('@', 'fullcell', 'fullcell_p', 0),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'zsubcell', 'zsubcell_p', 1),
+        ('@', 'pvalue', 'pvalue_p', 'optional'),
+        ('@', 'resol', 'resol_p', 0),
+        ('@', 'ovcheck', 'ovcheck_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'peropn': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'perimout', 'perimout_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'pertag': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'tagfile', 'tagfile_i', 'required'),
+        ('&', 'perimout', 'perimout_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'pertra': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'intersec', 'intersec_i', 'optional'),
+        ('&', 'perimout', 'perimout_o', 'optional'),
+        ('*', 'plane', 'plane_f', 'required'),
+        ('*', 'pvalue', 'pvalue_f', 'required'),
+        ('*', 'ptn', 'ptn_f', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'tag', 'tag_f', 'optional'),
+        ('@', 'direct', 'direct_p', 1),
+        ('@', 'startpos', 'startpos_p', 'optional'),
+        ('@', 'stepsize', 'stepsize_p', 'optional'),
+        ('@', 'numplane', 'numplane_p', 'optional'),
+        ('@', 'maxdist', 'maxdist_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'picfld': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('@', 'print', 'print_p', 0),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'sort', 'sort_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'picrec': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('@', 'append', 'append_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'pitmod': (
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'modelin', 'modelin_i', 'required'),
+        ('&', 'modelou', 'modelou_o', 'optional'),
+        ('&', 'results', 'results_o', 'required'),
+        ('*', 'f1', 'f1_f', 'required'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'key', 'key_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'resol', 'resol_p', 0),
+        ('@', 'zorig', 'zorig_p', 0),
+        ('@', 'bheight', 'bheight_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'pitres': (
+        ('&', 'results', 'results_i', 'required'),
+        ('&', 'model', 'model_i', 'optional'),
+        ('*', 'aux', 'aux_f', 'optional'),
+        ('*', 'aaux', 'aaux_f', 'optional'),
+        ('*', 'baux', 'baux_f', 'optional'),
+        ('*', 'grade', 'grade_f', 'optional'),
+        ('*', 'row', 'row_f', 'optional'),
+        ('@', 'position', 'position_p', 0),
+        ('@', 'tsquash', 'tsquash_p', 0),
+        ('@', 'gsquash', 'gsquash_p', 0),
+        ('@', 'squash', 'squash_p', 'optional'),
+        ('@', 'gunit', 'gunit_p', 'optional'),
+        ('@', 'munit', 'munit_p', 'optional'),
+        ('@', 'elemnt', 'elemnt_p', 'optional'),
+        ('@', 'tround', 'tround_p', 0),
+        ('@', 'gdec', 'gdec_p', 2),
+        ('@', 'mround', 'mround_p', 0),
+        ('@', 'sdec', 'sdec_p', 0),
+        ('@', 'lines', 'lines_p', 50),
+        ('@', 'width', 'width_p', 'optional'),
+        ('@', 'numtab', 'numtab_p', 'optional'),
+        ('@', 'volume', 'volume_p', 0),
+        ('@', 'tonnesa', 'tonnesa_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotan': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'charsz', 'charsz_f', 'optional'),
+        ('@', 'ndec', 'ndec_p', 'optional'),
+        ('@', 'xoffset', 'xoffset_p', 'optional'),
+        ('@', 'yoffset', 'yoffset_p', 'optional'),
+        ('@', 'angle', 'angle_p', 0),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 5),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotar': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'xfld', 'xfld_f', 'required'),
+        ('*', 'yfld', 'yfld_f', 'required'),
+        ('*', 'lenfld', 'lenfld_f', 'required'),
+        ('*', 'azifld', 'azifld_f', 'required'),
+        ('@', 'ascale', 'ascale_p', 'optional'),
+        ('@', 'drawhead', 'drawhead_p', 0),
+        ('@', 'position', 'position_p', 3),
+        ('@', 'headsize', 'headsize_p', 'optional'),
+        ('@', 'headangl', 'headangl_p', 90),
+        ('@', 'charsize', 'charsize_p', 4),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotcn': (
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'point', 'point_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_i', 'optional'),
+        ('&', 'wirept', 'wirept_i', 'optional'),
+        ('&', 'model', 'model_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('&', 'string', 'string_o', 'optional'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'z', 'z_f', 'optional'),
+        ('*', 'field', 'field_f', 'optional'),
+        ('*', 'seam', 'seam_f', 'optional'),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'position', 'position_p', 'optional'),
+        ('@', 'top', 'top_p', 'optional'),
+        ('@', 'bottom', 'bottom_p', 'optional'),
+        ('@', 'system', 'system_p', 2),
+        ('@', 'gridinc', 'gridinc_p', 'optional'),
+        ('@', 'cmin', 'cmin_p', 'optional'),
+        ('@', 'cmax', 'cmax_p', 'optional'),
+        ('@', 'cint', 'cint_p', 'optional'),
+        ('@', 'hilight', 'hilight_p', 'optional'),
+        ('@', 'hi', 'hi_p', 'optional'),
+        ('@', 'charsz', 'charsz_p', 3.5),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'ndp', 'ndp_p', 'optional'),
+        ('@', 'annotate', 'annotate_p', 100),
+        ('@', 'density', 'density_p', 0),
+        ('@', 'maxlink', 'maxlink_p', 'optional'),
+        ('@', 'extrap', 'extrap_p', 0),
+        ('@', 'gsmooth', 'gsmooth_p', 0),
+        ('@', 'power', 'power_p', 2),
+        ('@', 'radius', 'radius_p', 'optional'),
+        ('@', 'pvalst', 'pvalst_p', 1),
+        ('@', 'pvalinc', 'pvalinc_p', 1),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotcx': (
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'section', 'section_i', 'optional'),
+        ('&', 'bound', 'bound_i', 'optional'),
+        ('&', 'point', 'point_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_i', 'optional'),
+        ('&', 'wirept', 'wirept_i', 'optional'),
+        ('&', 'model', 'model_i', 'optional'),
+        ('&', 'contour', 'contour_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('&', 'string', 'string_o', 'optional'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'z', 'z_f', 'optional'),
+        ('*', 'field', 'field_f', 'optional'),
+        ('*', 'seam', 'seam_f', 'optional'),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'position', 'position_p', 'optional'),
+        ('@', 'top', 'top_p', 'optional'),
+        ('@', 'bottom', 'bottom_p', 'optional'),
+        ('@', 'type', 'type_p', 0),
+        ('@', 'log', 'log_p', 0),
+        ('@', 'freq', 'freq_p', 0),
+        ('@', 'system', 'system_p', 2),
+        ('@', 'section', 'section_p', 0),
+        ('@', 'dplus', 'dplus_p', 'optional'),
+        ('@', 'dminus', 'dminus_p', 'optional'),
+        ('@', 'xgorig', 'xgorig_p', 'optional'),
+        ('@', 'ygorig', 'ygorig_p', 'optional'),
+        ('@', 'zgorig', 'zgorig_p', 'optional'),
+        ('@', 'gridhinc', 'gridhinc_p', 'optional'),
+        ('@', 'gridvinc', 'gridvinc_p', 'optional'),
+        ('@', 'gridinc', 'gridinc_p', 'optional'),
+        ('@', 'nox', 'nox_p', 'optional'),
+        ('@', 'noy', 'noy_p', 'optional'),
+        ('@', 'cmin', 'cmin_p', 'optional'),
+        ('@', 'cmax', 'cmax_p', 'optional'),
+        ('@', 'cint', 'cint_p', 'optional'),
+        ('@', 'hilight', 'hilight_p', 'optional'),
+        ('@', 'hi', 'hi_p', 'optional'),
+        ('@', 'charsz', 'charsz_p', 3.5),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'ndp', 'ndp_p', 'optional'),
+        ('@', 'annotate', 'annotate_p', 100),
+        ('@', 'density', 'density_p', 0),
+        ('@', 'csmooth', 'csmooth_p', 0.1),
+        ('@', 'maxlink', 'maxlink_p', 'optional'),
+        ('@', 'cellsamp', 'cellsamp_p', 1),
+        ('@', 'extrap', 'extrap_p', 0),
+        ('@', 'gsmooth', 'gsmooth_p', 0),
+        ('@', 'power', 'power_p', 2),
+        ('@', 'radius', 'radius_p', 'optional'),
+        ('@', 'b', 'b_p', 'optional'),
+        ('@', 'bcode', 'bcode_p', 1001),
+        ('@', 'pvalst', 'pvalst_p', 1),
+        ('@', 'pvalinc', 'pvalinc_p', 1),
+        ('@', 'grcolr', 'grcolr_p', 'optional'),
+        ('@', 'xgridint', 'xgridint_p', 0),
+        ('@', 'ygridint', 'ygridint_p', 0),
+        ('@', 'zgridint', 'zgridint_p', 0),
+        ('@', 'xgridndp', 'xgridndp_p', 0),
+        ('@', 'ygridndp', 'ygridndp_p', 0),
+        ('@', 'zgridndp', 'zgridndp_p', 0),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('@', 'vertexag', 'vertexag_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'print', 'print_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotda': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'value', 'value_f', 'optional'),
+        ('@', 'vmax', 'vmax_p', 2.5),
+        ('@', 'symbol', 'symbol_p', 'optional'),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotfr': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'xinc', 'xinc_p', 'optional'),
+        ('@', 'yinc', 'yinc_p', 'optional'),
+        ('@', 'ndx', 'ndx_p', 'optional'),
+        ('@', 'ndy', 'ndy_p', 'optional'),
+        ('@', 'igrid', 'igrid_p', 0),
+        ('@', 'noxaxis', 'noxaxis_p', 'optional'),
+        ('@', 'noyaxis', 'noyaxis_p', 'optional'),
+        ('@', 'xgstart', 'xgstart_p', 'optional'),
+        ('@', 'ygstart', 'ygstart_p', 'optional'),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotft': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'xtype', 'xtype_p', 1),
+        ('@', 'ytype', 'ytype_p', 1),
+        ('@', 'ndx', 'ndx_p', 'optional'),
+        ('@', 'ndy', 'ndy_p', 'optional'),
+        ('@', 'igridx', 'igridx_p', 0),
+        ('@', 'igridy', 'igridy_p', 'optional'),
+        ('@', 'noxaxis', 'noxaxis_p', 0),
+        ('@', 'noyaxis', 'noyaxis_p', 0),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotfx': (
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'xinc', 'xinc_p', 'optional'),
+        ('@', 'yinc', 'yinc_p', 'optional'),
+        ('@', 'ibase', 'ibase_p', 1),
+        ('@', 'ndx', 'ndx_p', 0),
+        ('@', 'ndy', 'ndy_p', 0),
+        ('@', 'ticklx', 'ticklx_p', 0),
+        ('@', 'tickly', 'tickly_p', 0),
+        ('@', 'xgstart', 'xgstart_p', 'optional'),
+        ('@', 'ygstart', 'ygstart_p', 'optional'),
+        ('@', 'tblock', 'tblock_p', 0),
+        ('@', 'emptytb', 'emptytb_p', 0),
+        ('@', 'tunits', 'tunits_p', 1),
+        ('@', 'tscale', 'tscale_p', 'optional'),
+        ('@', 'lblock', 'lblock_p', 0),
+        ('@', 'tpos', 'tpos_p', 1),
+        ('@', 'lpos', 'lpos_p', 1),
+        ('@', 'xgid', 'xgid_p', 'optional'),
+        ('@', 'ygid', 'ygid_p', 'optional'),
+        ('@', 'drawnum', 'drawnum_p', 'optional'),
+        ('@', 'logo', 'logo_p', 0),
+        ('@', 'splan', 'splan_p', 0),
+        ('@', 'pldist', 'pldist_p', 'optional'),
+        ('@', 'prdist', 'prdist_p', 'optional'),
+        ('@', 'dminus', 'dminus_p', 'optional'),
+        ('@', 'dplus', 'dplus_p', 'optional'),
+        ('@', 'plx1', 'plx1_p', 'optional'),
+        ('@', 'plx2', 'plx2_p', 'optional'),
+        ('@', 'ply1', 'ply1_p', 'optional'),
+        ('@', 'ply2', 'ply2_p', 'optional'),
+        ('@', 'charsize', 'charsize_p', 2.5),
+        ('@', 'aspratio', 'aspratio_p', 'optional'),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotgr': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'angle', 'angle_p', 'optional'),
+        ('@', 'x0', 'x0_p', 'optional'),
+        ('@', 'y0', 'y0_p', 'optional'),
+        ('@', 'xr0', 'xr0_p', 'optional'),
+        ('@', 'yr0', 'yr0_p', 'optional'),
+        ('@', 'xstart', 'xstart_p', 'optional'),
+        ('@', 'xinc', 'xinc_p', 'optional'),
+        ('@', 'xend', 'xend_p', 'optional'),
+        ('@', 'ystart', 'ystart_p', 'optional'),
+        ('@', 'yinc', 'yinc_p', 'optional'),
+        ('@', 'yend', 'yend_p', 'optional'),
+        ('@', 'ndec', 'ndec_p', 'optional'),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'noannot', 'noannot_p', 0),
+        ('@', 'xoffset', 'xoffset_p', 'optional'),
+        ('@', 'yoffset', 'yoffset_p', 'optional'),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plothi': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x1', 'x1_f', 'required'),
+        ('*', 'x2', 'x2_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotli': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('@', 'linecode', 'linecode_p', 1),
+        ('@', 'close', 'close_p', 0),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 3),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotln': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x1', 'x1_f', 'required'),
+        ('*', 'y1', 'y1_f', 'required'),
+        ('*', 'x2', 'x2_f', 'required'),
+        ('*', 'y2', 'y2_f', 'required'),
+        ('@', 'linecode', 'linecode_p', 1),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 3),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotmx': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'section', 'section_i', 'optional'),
+        ('&', 'annfile', 'annfile_i', 'optional'),
+        ('&', 'legend', 'legend_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'modcol', 'modcol_f', 'optional'),
+        ('@', 'charsize', 'charsize_p', 2),
+        ('@', 'charsmin', 'charsmin_p', 'optional'),
+        ('@', 'aspratio', 'aspratio_p', 1),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'frame', 'frame_p', 1),
+        ('@', 'shrink', 'shrink_p', 0.5),
+        ('@', 'annotate', 'annotate_p', 0),
+        ('@', 'anncol', 'anncol_p', 'optional'),
+        ('@', 'annpos', 'annpos_p', 1),
+        ('@', 'box', 'box_p', 1),
+        ('@', 'boxcol', 'boxcol_p', 'optional'),
+        ('@', 'shade', 'shade_p', 0),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 0),
+        ('@', 'grcolr', 'grcolr_p', 'optional'),
+        ('@', 'xgridint', 'xgridint_p', 0),
+        ('@', 'ygridint', 'ygridint_p', 0),
+        ('@', 'zgridint', 'zgridint_p', 0),
+        ('@', 'xgridndp', 'xgridndp_p', 0),
+        ('@', 'ygridndp', 'ygridndp_p', 0),
+        ('@', 'zgridndp', 'zgridndp_p', 0),
+        ('@', 'iconsize', 'iconsize_p', 25),
+        ('@', 'iconcol1', 'iconcol1_p', 'optional'),
+        ('@', 'iconcol2', 'iconcol2_p', 'optional'),
+        ('@', 'title', 'title_p', 1),
+        ('@', 'titcol', 'titcol_p', 'optional'),
+        ('@', 'titchs', 'titchs_p', 2),
+        ('@', 'legend', 'legend_p', 1),
+        ('@', 'legcol', 'legcol_p', 'optional'),
+        ('@', 'legchs', 'legchs_p', 'optional'),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('@', 'vertexag', 'vertexag_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotpa': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'desc', 'desc_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'apvalue', 'apvalue_f', 'optional'),
+        ('*', 'aptn', 'aptn_f', 'optional'),
+        ('*', 'pcode', 'pcode_f', 'optional'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('@', 'linecode', 'linecode_p', 1),
+        ('@', 'noclose', 'noclose_p', 0),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 0),
+        ('@', 'annotate', 'annotate_p', 0),
+        ('@', 'ndp', 'ndp_p', 0),
+        ('@', 'ndp1', 'ndp1_p', 'optional'),
+        ('@', 'ndp2', 'ndp2_p', 'optional'),
+        ('@', 'ndp3', 'ndp3_p', 'optional'),
+        ('@', 'ndp4', 'ndp4_p', 'optional'),
+        ('@', 'ndp5', 'ndp5_p', 'optional'),
+        ('@', 'ptnannot', 'ptnannot_p', 0),
+        ('@', 'extdis', 'extdis_p', 4),
+        ('@', 'ptnsize', 'ptnsize_p', 2.5),
+        ('@', 'charsize', 'charsize_p', 4),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 14),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotpe': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'afield', 'afield_f', 'optional'),
+        ('*', 'sfield', 'sfield_f', 'optional'),
+        ('*', 'xp', 'xp_f', 'optional'),
+        ('*', 'yp', 'yp_f', 'optional'),
+        ('*', 'pcode', 'pcode_f', 'optional'),
+        ('*', 'symcode', 'symcode_f', 'optional'),
+        ('*', 'pfill', 'pfill_f', 'optional'),
+        ('@', 'linecode', 'linecode_p', 1),
+        ('@', 'noclose', 'noclose_p', 0),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 0),
+        ('@', 'annotate', 'annotate_p', 0),
+        ('@', 'axoffset', 'axoffset_p', 0),
+        ('@', 'ayoffset', 'ayoffset_p', 0),
+        ('@', 'angle', 'angle_p', 0),
+        ('@', 'ndp', 'ndp_p', 'optional'),
+        ('@', 'sylvalue', 'sylvalue_p', 'optional'),
+        ('@', 'sylscale', 'sylscale_p', 3),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('@', 'fillcode', 'fillcode_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotpi': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('@', 'explode', 'explode_p', 0),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotpx': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in2', 'in2_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'afield', 'afield_f', 'optional'),
+        ('*', 'dash', 'dash_f', 'optional'),
+        ('*', 'noanno', 'noanno_f', 'optional'),
+        ('*', 'auxanno', 'auxanno_f', 'optional'),
+        ('@', 'annotate', 'annotate_p', 0),
+        ('@', 'linecode', 'linecode_p', 1),
+        ('@', 'noclose', 'noclose_p', 0),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 0),
+        ('@', 'axoffset', 'axoffset_p', 0),
+        ('@', 'ayoffset', 'ayoffset_p', 0),
+        ('@', 'angle', 'angle_p', 0),
+        ('@', 'ndp', 'ndp_p', 'optional'),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'nointann', 'nointann_p', 1),
+        ('@', 'charsmin', 'charsmin_p', 'optional'),
+        ('@', 'interval', 'interval_p', 'optional'),
+        ('@', 'roadann', 'roadann_p', 0),
+        ('@', 'slopeann', 'slopeann_p', 1),
+        ('@', 'slopecol', 'slopecol_p', -1),
+        ('@', 'benchcol', 'benchcol_p', -1),
+        ('@', 'ffanncol', 'ffanncol_p', -1),
+        ('@', 'ffannsz', 'ffannsz_p', -1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotsi': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'icon', 'icon_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'layer', 'layer_f', 'optional'),
+        ('*', 'nan', 'nan_f', 'optional'),
+        ('*', 'field', 'field_f', 'optional'),
+        ('*', 'ndec', 'ndec_f', 'optional'),
+        ('*', 'charsize', 'charsize_f', 'optional'),
+        ('*', 'aspratio', 'aspratio_f', 'optional'),
+        ('*', 'xoffset', 'xoffset_f', 'optional'),
+        ('*', 'yoffset', 'yoffset_f', 'optional'),
+        ('*', 'angle', 'angle_f', 'optional'),
+        ('*', 'a', 'a_f', 'optional'),
+        ('*', 'symbol', 'symbol_f', 'optional'),
+        ('*', 'symsize', 'symsize_f', 'optional'),
+        ('*', 's', 's_f', 'optional'),
+        ('*', 'sfield', 'sfield_f', 'optional'),
+        ('*', 'scutmm', 'scutmm_f', 'optional'),
+        ('*', 'scutval', 'scutval_f', 'optional'),
+        ('*', 'ivalue', 'ivalue_f', 'optional'),
+        ('*', 'irotref', 'irotref_f', 'optional'),
+        ('*', 'iangle', 'iangle_f', 'optional'),
+        ('*', 'ixoffset', 'ixoffset_f', 'optional'),
+        ('*', 'iyoffset', 'iyoffset_f', 'optional'),
+        ('*', 'iscale', 'iscale_f', 'optional'),
+        ('*', 'iasprat', 'iasprat_f', 'optional'),
+        ('@', 'ndec', 'ndec_p', 'optional'),
+        ('@', 'charsize', 'charsize_p', 'optional'),
+        ('@', 'aspratio', 'aspratio_p', 'optional'),
+        ('@', 'xoffset', 'xoffset_p', 'optional'),
+        ('@', 'yoffset', 'yoffset_p', 'optional'),
+        ('@', 'angle', 'angle_p', 'optional'),
+        ('@', 'a', 'a_p', 'optional'),
+        ('@', 'symbol', 'symbol_p', 'optional'),
+        ('@', 'symsize', 'symsize_p', 'optional'),
+        ('@', 's', 's_p', 'optional'),
+        ('@', 'scutmm', 'scutmm_p', 'optional'),
+        ('@', 'scutval', 'scutval_p', 'optional'),
+        ('@', 'ivalue', 'ivalue_p', 'optional'),
+        ('@', 'irotref', 'irotref_p', 'optional'),
+        ('@', 'iangle', 'iangle_p', 'optional'),
+        ('@', 'ixoffset', 'ixoffset_p', 'optional'),
+        ('@', 'iyoffset', 'iyoffset_p', 'optional'),
+        ('@', 'iscale', 'iscale_p', 'optional'),
+        ('@', 'iasprat', 'iasprat_p', 'optional'),
+        ('@', 'layer', 'layer_p', 'optional'),
+        ('@', 'nan', 'nan_p', 'optional'),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotsk': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'length', 'length_f', 'required'),
+        ('*', 'a0', 'a0_f', 'required'),
+        ('*', 'b0', 'b0_f', 'required'),
+        ('*', 'bhid', 'bhid_f', 'required'),
+        ('*', 'from', 'from_f', 'required'),
+        ('*', 'to', 'to_f', 'required'),
+        ('@', 'x1', 'x1_p', 'optional'),
+        ('@', 'y1', 'y1_p', 'optional'),
+        ('@', 'x2', 'x2_p', 'optional'),
+        ('@', 'y2', 'y2_p', 'optional'),
+        ('@', 'distance', 'distance_p', 'optional'),
+        ('@', 'ndp', 'ndp_p', 'optional'),
+        ('@', 'angle', 'angle_p', 'optional'),
+        ('@', 'dhd', 'dhd_p', 0),
+        ('@', 'xoffset', 'xoffset_p', 0),
+        ('@', 'yoffset', 'yoffset_p', 0),
+        ('@', 'linecode', 'linecode_p', 1),
+        ('@', 'notick', 'notick_p', 0),
+        ('@', 'noannot', 'noannot_p', 0),
+        ('@', 'anbothol', 'anbothol_p', 0),
+        ('@', 'dtrwidth', 'dtrwidth_p', 0),
+        ('@', 'ppsymbol', 'ppsymbol_p', 92),
+        ('@', 'ppsymsiz', 'ppsymsiz_p', 0),
+        ('@', 'enexdhd', 'enexdhd_p', 0),
+        ('@', 'lincolfq', 'lincolfq_p', 14),
+        ('@', 'lincolch', 'lincolch_p', 14),
+        ('@', 'lincolcq', 'lincolcq_p', 14),
+        ('@', 'dtrtypfq', 'dtrtypfq_p', 4),
+        ('@', 'dtrtypch', 'dtrtypch_p', 1),
+        ('@', 'dtrtypcq', 'dtrtypcq_p', 3),
+        ('@', 'antickm', 'antickm_p', 1),
+        ('@', 'verbose', 'verbose_p', 0),
+        ('@', 'charsize', 'charsize_p', 4),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 14),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotsx': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in2', 'in2_i', 'optional'),
+        ('&', 'in3', 'in3_i', 'optional'),
+        ('&', 'annfile', 'annfile_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'sampcolr', 'sampcolr_f', 'optional'),
+        ('@', 'x1', 'x1_p', 'optional'),
+        ('@', 'y1', 'y1_p', 'optional'),
+        ('@', 'x2', 'x2_p', 'optional'),
+        ('@', 'y2', 'y2_p', 'optional'),
+        ('@', 'ndp', 'ndp_p', 'optional'),
+        ('@', 'distance', 'distance_p', 'optional'),
+        ('@', 'dminus', 'dminus_p', 'optional'),
+        ('@', 'dplus', 'dplus_p', 'optional'),
+        ('@', 'optmse', 'optmse_p', 0),
+        ('@', 'pltype', 'pltype_p', 1),
+        ('@', 'barann', 'barann_p', 0),
+        ('@', 'plview', 'plview_p', 0),
+        ('@', 'pldist', 'pldist_p', 'optional'),
+        ('@', 'blevel', 'blevel_p', 'optional'),
+        ('@', 'trace', 'trace_p', 1),
+        ('@', 'tiklen', 'tiklen_p', 1),
+        ('@', 'tiktyp', 'tiktyp_p', 1),
+        ('@', 'side', 'side_p', 1),
+        ('@', 'dhd', 'dhd_p', 0),
+        ('@', 'dhdist', 'dhdist_p', 0),
+        ('@', 'dhdoff', 'dhdoff_p', 0),
+        ('@', 'eoh', 'eoh_p', 0),
+        ('@', 'xoffset', 'xoffset_p', 0),
+        ('@', 'yoffset', 'yoffset_p', 0),
+        ('@', 'bhsize', 'bhsize_p', 'optional'),
+        ('@', 'bhcol', 'bhcol_p', 'optional'),
+        ('@', 'bhang', 'bhang_p', 'optional'),
+        ('@', 'bhpos', 'bhpos_p', 1),
+        ('@', 'trcol', 'trcol_p', -1),
+        ('@', 'tikcol', 'tikcol_p', -1),
+        ('@', 'anncol', 'anncol_p', -1),
+        ('@', 'barcol', 'barcol_p', -1),
+        ('@', 'filgap', 'filgap_p', 0),
+        ('@', 'gaplen', 'gaplen_p', 1),
+        ('@', 'fill', 'fill_p', 0),
+        ('@', 'charsize', 'charsize_p', 4),
+        ('@', 'charsmin', 'charsmin_p', 'optional'),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotti': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plottr': (
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'linecode', 'linecode_p', 1),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 5),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plottx': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'xstart', 'xstart_p', 'optional'),
+        ('@', 'ystart', 'ystart_p', 'optional'),
+        ('@', 'angle', 'angle_p', 0),
+        ('@', 'nobox', 'nobox_p', 0),
+        ('@', 'margin', 'margin_p', 3),
+        ('@', 'space', 'space_p', 'optional'),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotva': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'symcode', 'symcode_f', 'optional'),
+        ('@', 'angle', 'angle_p', 0),
+        ('@', 'symbol', 'symbol_p', 92),
+        ('@', 'symsize', 'symsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'plotws': (
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'section', 'section_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'linecode', 'linecode_p', 1001),
+        ('@', 'frame', 'frame_p', 0),
+        ('@', 'charsize', 'charsize_p', 4),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('@', 'vertexag', 'vertexag_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'pltabl': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'pltlay': (
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'icon', 'icon_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('@', 'asize', 'asize_p', 0),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('@', 'unit', 'unit_p', 0),
+        ('@', 'append', 'append_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'polreg': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('@', 'order', 'order_p', 1),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'polydc': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'srcparm', 'srcparm_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_i', 'optional'),
+        ('&', 'wirept', 'wirept_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'model', 'model_o', 'optional'),
+        ('&', 'polytr', 'polytr_o', 'optional'),
+        ('&', 'polypt', 'polypt_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'wtfield', 'wtfield_f', 'optional'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'compleng', 'compleng_p', 0),
+        ('@', 'xinc', 'xinc_p', 'optional'),
+        ('@', 'yinc', 'yinc_p', 'optional'),
+        ('@', 'zinc', 'zinc_p', 'optional'),
+        ('@', 'srefnum', 'srefnum_p', 'optional'),
+        ('@', 'radius', 'radius_p', 100),
+        ('@', 'maxgrdpt', 'maxgrdpt_p', 10),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'ppqqplot': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'ppout', 'ppout_o', 'optional'),
+        ('&', 'ppplot', 'ppplot_o', 'optional'),
+        ('&', 'qqout', 'qqout_o', 'optional'),
+        ('&', 'qqplot', 'qqplot_o', 'optional'),
+        ('*', 'value1', 'value1_f', 'required'),
+        ('*', 'value2', 'value2_f', 'required'),
+        ('*', 'weight1', 'weight1_f', 'optional'),
+        ('*', 'weight2', 'weight2_f', 'optional'),
+        ('*', 'key', 'key_f', 'optional'),
+        ('@', 'minimum1', 'minimum1_p', 0),
+        ('@', 'minimum2', 'minimum2_p', 0),
+        ('@', 'maximum1', 'maximum1_p', 'optional'),
+        ('@', 'maximum2', 'maximum2_p', 'optional'),
+        ('@', 'plottype', 'plottype_p', 1),
+        ('@', 'binsize', 'binsize_p', 1),
+        ('@', 'diagonal', 'diagonal_p', 1),
+        ('@', 'progress', 'progress_p', 1),
+        ('@', 'display', 'display_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'promod': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'remnants', 'remnants_o', 'optional'),
+        ('*', 'key1', 'key1_f', 'optional'),
+        ('*', 'key2', 'key2_f', 'optional'),
+        ('*', 'key3', 'key3_f', 'optional'),
+        ('*', 'key4', 'key4_f', 'optional'),
+        ('*', 'key5', 'key5_f', 'optional'),
+        ('*', 'key6', 'key6_f', 'optional'),
+        ('*', 'key7', 'key7_f', 'optional'),
+        ('*', 'key8', 'key8_f', 'optional'),
+        ('*', 'key9', 'key9_f', 'optional'),
+        ('*', 'key10', 'key10_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'xincmin', 'xincmin_p', 'optional'),
+        ('@', 'yincmin', 'yincmin_p', 'optional'),
+        ('@', 'zincmin', 'zincmin_p', 'optional'),
+        ('@', 'overlap', 'overlap_p', 0),
+        ('@', 'optimise', 'optimise_p', 2),
+        ('@', 'tol', 'tol_p', 0.001),
+        ('@', 'accuracy', 'accuracy_p', 0.001),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'proper': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'perimout', 'perimout_o', 'optional'),
+        ('@', 'mode', 'mode_p', 0),
+        ('@', 'area', 'area_p', 1),
+        ('@', 'close', 'close_p', 0),
+        ('@', 'clockwse', 'clockwse_p', 'optional'),
+        ('@', 'vplane', 'vplane_p', 1),
+        ('@', 'dmax', 'dmax_p', 'optional'),
+        ('@', 'tol', 'tol_p', 0),
+        ('@', 'reduce', 'reduce_p', 0),
+        ('@', 'extend', 'extend_p', 0),
+        ('@', 'cross', 'cross_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'qnlm': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'scores', 'scores_o', 'optional'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('@', 'convlim', 'convlim_p', 0.0001),
+        ('@', 'magic', 'magic_p', 0.35),
+        ('@', 'maxit', 'maxit_p', 100),
+        ('@', 'standard', 'standard_p', 0),
+        ('@', 'znorm', 'znorm_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'quantile': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'results', 'results_o', 'required'),
+        ('&', 'primary', 'primary_o', 'optional'),
+        ('&', 'print', 'print_o', 'optional'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'key', 'key_f', 'optional'),
+        ('*', 'weight', 'weight_f', 'optional'),
+        ('@', 'quantil1', 'quantil1_p', 10),
+        ('@', 'quantil2', 'quantil2_p', 0),
+        ('@', 'cutoff', 'cutoff_p', 0),
+        ('@', 'topcut', 'topcut_p', 0),
+        ('@', 'topgrade', 'topgrade_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'rank': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'rank', 'rank_f', 'required'),
+        ('*', 'cumprop', 'cumprop_f', 'required'),
+        ('*', 'phi', 'phi_f', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'reblock': (
+        ('&', 'modin', 'modin_i', 'required'),
+        ('&', 'modout', 'modout_o', 'required'),
+        ('*', 'density', 'density_f', 'required'),
+        ('*', 'fillvol', 'fillvol_f', 'optional'),
+        ('*', 'voidvol', 'voidvol_f', 'optional'),
+        ('*', 'addfld', 'addflds_f', ['optional'], 10),
+        ('*', 'domfld', 'domflds_f', ['optional'], 10),
+        ('*', 'vwfld', 'vwflds_f', ['optional'], 15),
+        ('*', 'minflds', 'minflds_f', ['optional'], 5),
+        ('*', 'maxfld', 'maxflds_f', ['optional'], 5),
+        ('@', 'xinc', 'xinc_p', 'optional'),
+        ('@', 'yinc', 'yinc_p', 'optional'),
+        ('@', 'zinc', 'zinc_p', 'optional'),
+        ('@', 'fullcell', 'fullcell_p', 0),
+        ('@', 'dbymass', 'dbymass_p', 0),
+        ('@', 'density', 'density_p', 1.0),
+        ('@', 'setabsnt', 'setabsnt_p', 0),
+        ('@', 'absgrade', 'absgrade_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'recblkst': (
+        ('&', 'modelin', 'modelin_i', 'required'),
+        ('&', 'blocks', 'blocks_i', 'required'),
+        ('&', 'prevtr', 'prevtr_i', 'required'),
+        ('&', 'prevpt', 'prevpt_i', 'required'),
+        ('&', 'minedtr', 'minedtr_i', 'required'),
+        ('&', 'minedpt', 'minedpt_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'modelout', 'modelout_o', 'required'),
+        ('&', 'blockres', 'blockres_o', 'required'),
+        ('*', 'blockid', 'blockid_f', 'required'),
+        ('*', 'dplus', 'dplus_f', 'optional'),
+        ('*', 'dminus', 'dminus_f', 'optional'),
+        ('*', 'key1', 'key1_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('*', 'grade1', 'grade1_f', 'optional'),
+        ('*', 'grade2', 'grade2_f', 'optional'),
+        ('*', 'grade3', 'grade3_f', 'optional'),
+        ('*', 'grade4', 'grade4_f', 'optional'),
+        ('*', 'grade5', 'grade5_f', 'optional'),
+        ('*', 'grade6', 'grade6_f', 'optional'),
+        ('*', 'grade7', 'grade7_f', 'optional'),
+        ('*', 'grade8', 'grade8_f', 'optional'),
+        ('*', 'grade9', 'grade9_f', 'optional'),
+        ('*', 'grade10', 'grade10_f', 'optional'),
+        ('@', 'dplus', 'dplus_p', 'optional'),
+        ('@', 'dminus', 'dminus_p', 'optional'),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 0),
+        ('@', 'zsubcell', 'zsubcell_p', 0),
+        ('@', 'splits', 'splits_p', 0),
+        ('@', 'factor', 'factor_p', 'optional'),
+        ('@', 'setabsnt', 'setabsnt_p', 0),
+        ('@', 'bench', 'bench_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'reccop': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'recmodel': (
+        ('&', 'model', 'model_i', 'required'),
+        ('&', 'results', 'results_o', 'required'),
+        ('*', 'planned', 'planned_f', 'required'),
+        ('*', 'mined', 'mined_f', 'required'),
+        ('*', 'key1', 'key1_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('*', 'grade1', 'grade1_f', 'optional'),
+        ('*', 'grade2', 'grade2_f', 'optional'),
+        ('*', 'grade3', 'grade3_f', 'optional'),
+        ('*', 'grade4', 'grade4_f', 'optional'),
+        ('*', 'grade5', 'grade5_f', 'optional'),
+        ('*', 'grade6', 'grade6_f', 'optional'),
+        ('*', 'grade7', 'grade7_f', 'optional'),
+        ('*', 'grade8', 'grade8_f', 'optional'),
+        ('*', 'grade9', 'grade9_f', 'optional'),
+        ('*', 'grade10', 'grade10_f', 'optional'),
+        ('@', 'value', 'value_p', 'optional'),
+        ('@', 'modltype', 'modltype_p', 1),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'setabsnt', 'setabsnt_p', 0),
+        ('@', 'bench', 'bench_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'recmodwf': (
+        ('&', 'model', 'model_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'modout', 'modout_o', 'optional'),
+        ('&', 'results', 'results_o', 'required'),
+        ('*', 'planned', 'planned_f', 'required'),
+        ('*', 'mined', 'mined_f', 'required'),
+        ('*', 'key1', 'key1_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('*', 'grade1', 'grade1_f', 'optional'),
+        ('*', 'grade2', 'grade2_f', 'optional'),
+        ('*', 'grade3', 'grade3_f', 'optional'),
+        ('*', 'grade4', 'grade4_f', 'optional'),
+        ('*', 'grade5', 'grade5_f', 'optional'),
+        ('*', 'grade6', 'grade6_f', 'optional'),
+        ('*', 'grade7', 'grade7_f', 'optional'),
+        ('*', 'grade8', 'grade8_f', 'optional'),
+        ('*', 'grade9', 'grade9_f', 'optional'),
+        ('*', 'grade10', 'grade10_f', 'optional'),
+        ('@', 'value', 'value_p', 'optional'),
+        ('@', 'modltype', 'modltype_p', 1),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'setabsnt', 'setabsnt_p', 0),
+        ('@', 'bench', 'bench_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'regmod': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('*', 'f11', 'f11_f', 'optional'),
+        ('*', 'f12', 'f12_f', 'optional'),
+        ('*', 'f13', 'f13_f', 'optional'),
+        ('*', 'f14', 'f14_f', 'optional'),
+        ('*', 'f15', 'f15_f', 'optional'),
+        ('*', 'f16', 'f16_f', 'optional'),
+        ('*', 'f17', 'f17_f', 'optional'),
+        ('*', 'f18', 'f18_f', 'optional'),
+        ('*', 'f19', 'f19_f', 'optional'),
+        ('*', 'f20', 'f20_f', 'optional'),
+        ('*', 'f21', 'f21_f', 'optional'),
+        ('*', 'f22', 'f22_f', 'optional'),
+        ('*', 'f23', 'f23_f', 'optional'),
+        ('*', 'f24', 'f24_f', 'optional'),
+        ('*', 'f25', 'f25_f', 'optional'),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'regmow': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'bltype', 'bltype_f', 'optional'),
+        ('*', 'f1', 'f1_f', 'required'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('@', 'airval', 'airval_p', 'optional'),
+        ('@', 'cutoff1', 'cutoff1_p', 'optional'),
+        ('@', 'restrict', 'restrict_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'rename': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'repork': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'key1', 'key1_f', 'optional'),
+        ('*', 'key2', 'key2_f', 'optional'),
+        ('*', 'key3', 'key3_f', 'optional'),
+        ('*', 'key4', 'key4_f', 'optional'),
+        ('*', 'key5', 'key5_f', 'optional'),
+        ('*', 'key6', 'key6_f', 'optional'),
+        ('*', 'key7', 'key7_f', 'optional'),
+        ('*', 'key8', 'key8_f', 'optional'),
+        ('*', 'key9', 'key9_f', 'optional'),
+        ('*', 'key10', 'key10_f', 'optional'),
+        ('*', 'key11', 'key11_f', 'optional'),
+        ('*', 'key12', 'key12_f', 'optional'),
+        ('*', 'key13', 'key13_f', 'optional'),
+        ('*', 'key14', 'key14_f', 'optional'),
+        ('*', 'key15', 'key15_f', 'optional'),
+        ('*', 'key16', 'key16_f', 'optional'),
+        ('*', 'key17', 'key17_f', 'optional'),
+        ('*', 'key18', 'key18_f', 'optional'),
+        ('*', 'key19', 'key19_f', 'optional'),
+        ('*', 'key20', 'key20_f', 'optional'),
+        ('*', 'key21', 'key21_f', 'optional'),
+        ('*', 'key22', 'key22_f', 'optional'),
+        ('*', 'key23', 'key23_f', 'optional'),
+        ('*', 'key24', 'key24_f', 'optional'),
+        ('*', 'key25', 'key25_f', 'optional'),
+        ('@', 'lines', 'lines_p', 'optional'),
+        ('@', 'noff', 'noff_p', 0),
+        ('@', 'prntcols', 'prntcols_p', 'optional'),
+        ('@', 'hedcentr', 'hedcentr_p', 0),
+        ('@', 'hedspace', 'hedspace_p', 'optional'),
+        ('@', 'compress', 'compress_p', 'optional'),
+        ('@', 'mindsply', 'mindsply_p', 0),
+        ('@', 'sysfile', 'sysfile_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'report': (
+        ('&', 'in', 'in_i', 'required'),
+        ('@', 'lines', 'lines_p', 'optional'),
+        ('@', 'noff', 'noff_p', 0),
+        ('@', 'sysfile', 'sysfile_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'rescat': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'model', 'model_o', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('@', 'radius', 'radius_p', 'optional'),
+        ('@', 'rescat', 'rescat_p', 1),
+        ('@', 'ellipse', 'ellipse_p', 0),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'zsubcell', 'zsubcell_p', 1),
+        ('@', 'print', 'print_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'restri': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key1', 'key1_f', 'required'),
+        ('*', 'key2', 'key2_f', 'optional'),
+        ('*', 'key3', 'key3_f', 'optional'),
+        ('*', 'key4', 'key4_f', 'optional'),
+        ('*', 'key5', 'key5_f', 'optional'),
+        ('*', 'key6', 'key6_f', 'optional'),
+        ('*', 'key7', 'key7_f', 'optional'),
+        ('*', 'key8', 'key8_f', 'optional'),
+        ('*', 'key9', 'key9_f', 'optional'),
+        ('*', 'key10', 'key10_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'rnlm': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'scores', 'scores_o', 'optional'),
+        ('*', 'sampid', 'sampid_f', 'required'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('@', 'convlim', 'convlim_p', 0.0001),
+        ('@', 'magic', 'magic_p', 0.35),
+        ('@', 'maxit', 'maxit_p', 100),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'selcop': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'f1', 'f1_f', 'required'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('*', 'f11', 'f11_f', 'optional'),
+        ('*', 'f12', 'f12_f', 'optional'),
+        ('*', 'f13', 'f13_f', 'optional'),
+        ('*', 'f14', 'f14_f', 'optional'),
+        ('*', 'f15', 'f15_f', 'optional'),
+        ('*', 'f16', 'f16_f', 'optional'),
+        ('*', 'f17', 'f17_f', 'optional'),
+        ('*', 'f18', 'f18_f', 'optional'),
+        ('*', 'f19', 'f19_f', 'optional'),
+        ('*', 'f20', 'f20_f', 'optional'),
+        ('*', 'f21', 'f21_f', 'optional'),
+        ('*', 'f22', 'f22_f', 'optional'),
+        ('*', 'f23', 'f23_f', 'optional'),
+        ('*', 'f24', 'f24_f', 'optional'),
+        ('*', 'f25', 'f25_f', 'optional'),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'seldel': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('*', 'f11', 'f11_f', 'optional'),
+        ('*', 'f12', 'f12_f', 'optional'),
+        ('*', 'f13', 'f13_f', 'optional'),
+        ('*', 'f14', 'f14_f', 'optional'),
+        ('*', 'f15', 'f15_f', 'optional'),
+        ('*', 'f16', 'f16_f', 'optional'),
+        ('*', 'f17', 'f17_f', 'optional'),
+        ('*', 'f18', 'f18_f', 'optional'),
+        ('*', 'f19', 'f19_f', 'optional'),
+        ('*', 'f20', 'f20_f', 'optional'),
+        ('*', 'f21', 'f21_f', 'optional'),
+        ('*', 'f22', 'f22_f', 'optional'),
+        ('*', 'f23', 'f23_f', 'optional'),
+        ('*', 'f24', 'f24_f', 'optional'),
+        ('*', 'f25', 'f25_f', 'optional'),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'selexy': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'perim', 'perim_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'attrib1', 'attrib1_f', 'optional'),
+        ('*', 'attrib2', 'attrib2_f', 'optional'),
+        ('*', 'attrib3', 'attrib3_f', 'optional'),
+        ('*', 'attrib4', 'attrib4_f', 'optional'),
+        ('@', 'outside', 'outside_p', 0),
+        ('@', 'perim', 'perim_p', 'optional'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'selper': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'dplus', 'dplus_f', 'optional'),
+        ('*', 'dminus', 'dminus_f', 'optional'),
+        ('*', 'attrib1', 'attrib1_f', 'optional'),
+        ('*', 'attrib2', 'attrib2_f', 'optional'),
+        ('*', 'attrib3', 'attrib3_f', 'optional'),
+        ('*', 'attrib4', 'attrib4_f', 'optional'),
+        ('*', 'attrib5', 'attrib5_f', 'optional'),
+        ('@', 'outside', 'outside_p', 0),
+        ('@', 'pvalue', 'pvalue_p', 'optional'),
+        ('@', 'clip', 'clip_p', 0),
+        ('@', 'dplus', 'dplus_p', 'optional'),
+        ('@', 'dminus', 'dminus_p', 'optional'),
+        ('@', 'checkrot', 'checkrot_p', 1),
+        ('@', 'ijksort', 'ijksort_p', 1),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'seltri': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('*', 'attrib1', 'attrib1_f', 'optional'),
+        ('*', 'attrib2', 'attrib2_f', 'optional'),
+        ('*', 'attrib3', 'attrib3_f', 'optional'),
+        ('*', 'attrib4', 'attrib4_f', 'optional'),
+        ('@', 'zone', 'zone_p', 'optional'),
+        ('@', 'select', 'select_p', 3),
+        ('@', 'toleranc', 'toleranc_p', 0.001),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'selwf': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('*', 'attrib1', 'attrib1_f', 'optional'),
+        ('*', 'attrib2', 'attrib2_f', 'optional'),
+        ('*', 'attrib3', 'attrib3_f', 'optional'),
+        ('*', 'attrib4', 'attrib4_f', 'optional'),
+        ('@', 'select', 'select_p', 3),
+        ('@', 'plane', 'plane_p', 'optional'),
+        ('@', 'exclude', 'exclude_p', 0),
+        ('@', 'toleranc', 'toleranc_p', 0.001),
+        ('@', 'checkrot', 'checkrot_p', 1),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'setenv': (
+    ),
+    'setval': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('@', 'multifld', 'multifld_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'sgsim': (
+        ('&', 'in', 'in_i', 'optional'),
+        ('&', 'vmodparm', 'vmodparm_i', 'required'),
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'refdist', 'refdist_i', 'optional'),
+        ('&', 'secfile', 'secfile_i', 'optional'),
+        ('&', 'points', 'points_o', 'required'),
+        ('&', 'model', 'model_o', 'optional'),
+        ('&', 'trandist', 'trandist_o', 'optional'),
+        ('&', 'stat_tbl', 'stat_tbl_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'grade', 'grade_f', 'required'),
+        ('*', 'dcwgt', 'dcwgt_f', 'optional'),
+        ('*', 'secfld1', 'secfld1_f', 'optional'),
+        ('*', 'secfld2', 'secfld2_f', 'optional'),
+        ('*', 'refgrade', 'refgrade_f', 'optional'),
+        ('*', 'refwgt', 'refwgt_f', 'optional'),
+        ('@', 'mingrade', 'mingrade_p', 0),
+        ('@', 'maxgrade', 'maxgrade_p', 'optional'),
+        ('@', 'trantype', 'trantype_p', 1),
+        ('@', 'minsimgr', 'minsimgr_p', 0),
+        ('@', 'maxsimgr', 'maxsimgr_p', 'optional'),
+        ('@', 'lotail', 'lotail_p', 1),
+        ('@', 'lopar', 'lopar_p', 1),
+        ('@', 'uptail', 'uptail_p', 1),
+        ('@', 'uppar', 'uppar_p', 1),
+        ('@', 'nsim', 'nsim_p', 1),
+        ('@', 'xpppc', 'xpppc_p', 1),
+        ('@', 'ypppc', 'ypppc_p', 1),
+        ('@', 'zpppc', 'zpppc_p', 1),
+        ('@', 'xmin', 'xmin_p', 1),
+        ('@', 'ymin', 'ymin_p', 1),
+        ('@', 'zmin', 'zmin_p', 1),
+        ('@', 'xsize', 'xsize_p', 1),
+        ('@', 'ysize', 'ysize_p', 1),
+        ('@', 'zsize', 'zsize_p', 1),
+        ('@', 'nx', 'nx_p', 10),
+        ('@', 'ny', 'ny_p', 10),
+        ('@', 'nz', 'nz_p', 10),
+        ('@', 'seed', 'seed_p', 'optional'),
+        ('@', 'mindatpt', 'mindatpt_p', 1),
+        ('@', 'maxdatpt', 'maxdatpt_p', 12),
+        ('@', 'maxsimpt', 'maxsimpt_p', 12),
+        ('@', 'sstrat', 'sstrat_p', 0),
+        ('@', 'multgrid', 'multgrid_p', 0),
+        ('@', 'maxperoc', 'maxperoc_p', 0),
+        ('@', 'sdist1', 'sdist1_p', 50),
+        ('@', 'sdist2', 'sdist2_p', 50),
+        ('@', 'sdist3', 'sdist3_p', 50),
+        ('@', 'sangle1', 'sangle1_p', 0),
+        ('@', 'sangle2', 'sangle2_p', 0),
+        ('@', 'sangle3', 'sangle3_p', 0),
+        ('@', 'ktype', 'ktype_p', 0),
+        ('@', 'vmodnum', 'vmodnum_p', 1),
+        ('@', 'corcoeff', 'corcoeff_p', 0),
+        ('@', 'varred', 'varred_p', 1),
+        ('@', 'rectgrid', 'rectgrid_p', 0),
+        ('@', 'dbglevel', 'dbglevel_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'slimod': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'sliper': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'intersec', 'intersec_o', 'optional'),
+        ('&', 'perimout', 'perimout_o', 'optional'),
+        ('@', 'mode', 'mode_p', 1),
+        ('@', 'startpos', 'startpos_p', 'optional'),
+        ('@', 'stepsize', 'stepsize_p', 'optional'),
+        ('@', 'numsteps', 'numsteps_p', 'optional'),
+        ('@', 'close', 'close_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'smuhis': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'vmodparm', 'vmodparm_i', 'optional'),
+        ('&', 'perim', 'perim_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'variance', 'variance_f', 'required'),
+        ('*', 'pcode', 'pcode_f', 'optional'),
+        ('@', 'dvmethod', 'dvmethod_p', 3),
+        ('@', 'vartype', 'vartype_p', 1),
+        ('@', 'smudist', 'smudist_p', 1),
+        ('@', 'disvar', 'disvar_p', 0),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'addcon', 'addcon_p', 0),
+        ('@', 'recovery', 'recovery_p', 1),
+        ('@', 'binsize', 'binsize_p', 1),
+        ('@', 'minimum', 'minimum_p', 0),
+        ('@', 'numbins', 'numbins_p', 50),
+        ('@', 'vmodnum', 'vmodnum_p', 1),
+        ('@', 'log', 'log_p', 0),
+        ('@', 'smuxinc', 'smuxinc_p', 1),
+        ('@', 'smuyinc', 'smuyinc_p', 1),
+        ('@', 'smuzinc', 'smuzinc_p', 1),
+        ('@', 'xstep', 'xstep_p', 1),
+        ('@', 'ystep', 'ystep_p', 1),
+        ('@', 'zstep', 'zstep_p', 1),
+        ('@', 'ipoints', 'ipoints_p', 6),
+        ('@', 'jpoints', 'jpoints_p', 6),
+        ('@', 'kpoints', 'kpoints_p', 6),
+        ('@', 'datamean', 'datamean_p', 'optional'),
+        ('@', 'infoeff', 'infoeff_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'smumod': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'vmodparm', 'vmodparm_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'variance', 'variance_f', 'required'),
+        ('*', 'frrec', 'frrec_f', 'required'),
+        ('*', 'valrec', 'valrec_f', 'required'),
+        ('@', 'cutoff', 'cutoff_p', 1),
+        ('@', 'dvmethod', 'dvmethod_p', 3),
+        ('@', 'vartype', 'vartype_p', 1),
+        ('@', 'smudist', 'smudist_p', 1),
+        ('@', 'disvar', 'disvar_p', 0),
+        ('@', 'addcon', 'addcon_p', 0),
+        ('@', 'vmodnum', 'vmodnum_p', 1),
+        ('@', 'log', 'log_p', 0),
+        ('@', 'smuxinc', 'smuxinc_p', 1),
+        ('@', 'smuyinc', 'smuyinc_p', 1),
+        ('@', 'smuzinc', 'smuzinc_p', 1),
+        ('@', 'xstep', 'xstep_p', 1),
+        ('@', 'ystep', 'ystep_p', 1),
+        ('@', 'zstep', 'zstep_p', 1),
+        ('@', 'ipoints', 'ipoints_p', 6),
+        ('@', 'jpoints', 'jpoints_p', 6),
+        ('@', 'kpoints', 'kpoints_p', 'optional'),
+        ('@', 'datamean', 'datamean_p', 'optional'),
+        ('@', 'infoeff', 'infoeff_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'sortx': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key1', 'key1_f', 'required'),
+        ('*', 'key2', 'key2_f', 'optional'),
+        ('*', 'key3', 'key3_f', 'optional'),
+        ('*', 'key4', 'key4_f', 'optional'),
+        ('*', 'key5', 'key5_f', 'optional'),
+        ('*', 'key6', 'key6_f', 'optional'),
+        ('*', 'key7', 'key7_f', 'optional'),
+        ('*', 'key8', 'key8_f', 'optional'),
+        ('*', 'key9', 'key9_f', 'optional'),
+        ('*', 'key10', 'key10_f', 'optional'),
+        ('@', 'order', 'order_p', 1),
+        ('@', 'keysfrst', 'keysfrst_p', 1),
+        ('@', 'roworder', 'roworder_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'splat': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'splico': (
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'bound', 'bound_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_i', 'optional'),
+        ('&', 'wirept', 'wirept_i', 'optional'),
+        ('&', 'model', 'model_i', 'optional'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('&', 'string', 'string_o', 'optional'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'field', 'field_f', 'optional'),
+        ('*', 'seam', 'seam_f', 'optional'),
+        ('@', 'cmin', 'cmin_p', 'optional'),
+        ('@', 'cmax', 'cmax_p', 'optional'),
+        ('@', 'ci', 'ci_p', 'optional'),
+        ('@', 'gridinc', 'gridinc_p', 'optional'),
+        ('@', 'plane', 'plane_p', 'optional'),
+        ('@', 'position', 'position_p', 'optional'),
+        ('@', 'top', 'top_p', 'optional'),
+        ('@', 'bottom', 'bottom_p', 'optional'),
+        ('@', 'hilight', 'hilight_p', 'optional'),
+        ('@', 'hi', 'hi_p', 'optional'),
+        ('@', 'charsize', 'charsize_p', 3.5),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'ndc', 'ndc_p', -1),
+        ('@', 'power', 'power_p', 2),
+        ('@', 'radius', 'radius_p', 0),
+        ('@', 'pvalst', 'pvalst_p', 1),
+        ('@', 'pvalinc', 'pvalinc_p', 1),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('@', 'append', 'append_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'split': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fnames', 'fnames_i', 'optional'),
+        ('*', 'key', 'key_f', 'required'),
+        ('@', 'ndp', 'ndp_p', 0),
+        ('@', 'maxfiles', 'maxfiles_p', 50),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'st1gx': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('@', 'binsize', 'binsize_p', 'optional'),
+        ('@', 'minimum', 'minimum_p', 'optional'),
+        ('@', 'sturgess', 'sturgess_p', 0),
+        ('@', 'logmode', 'logmode_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'statnp': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('@', 'plot', 'plot_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'stats': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('*', 'f1', 'f1_f', 'optional'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('*', 'f11', 'f11_f', 'optional'),
+        ('*', 'f12', 'f12_f', 'optional'),
+        ('*', 'f13', 'f13_f', 'optional'),
+        ('*', 'f14', 'f14_f', 'optional'),
+        ('*', 'f15', 'f15_f', 'optional'),
+        ('*', 'f16', 'f16_f', 'optional'),
+        ('*', 'f17', 'f17_f', 'optional'),
+        ('*', 'f18', 'f18_f', 'optional'),
+        ('*', 'f19', 'f19_f', 'optional'),
+        ('*', 'f20', 'f20_f', 'optional'),
+        ('*', 'fieldnam', 'fieldnam_f', 'optional'),
+        ('*', 'key1', 'key1_f', 'optional'),
+        ('*', 'key2', 'key2_f', 'optional'),
+        ('*', 'key3', 'key3_f', 'optional'),
+        ('*', 'key4', 'key4_f', 'optional'),
+        ('*', 'key5', 'key5_f', 'optional'),
+        ('*', 'key6', 'key6_f', 'optional'),
+        ('*', 'key7', 'key7_f', 'optional'),
+        ('*', 'key8', 'key8_f', 'optional'),
+        ('*', 'key9', 'key9_f', 'optional'),
+        ('*', 'key10', 'key10_f', 'optional'),
+        ('*', 'weight', 'weight_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'subjoi': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key1', 'key1_f', 'required'),
+        ('*', 'key2', 'key2_f', 'optional'),
+        ('*', 'key3', 'key3_f', 'optional'),
+        ('*', 'key4', 'key4_f', 'optional'),
+        ('*', 'key5', 'key5_f', 'optional'),
+        ('*', 'key6', 'key6_f', 'optional'),
+        ('*', 'key7', 'key7_f', 'optional'),
+        ('*', 'key8', 'key8_f', 'optional'),
+        ('*', 'key9', 'key9_f', 'optional'),
+        ('*', 'key10', 'key10_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'subwve': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key1', 'key1_f', 'required'),
+        ('*', 'key2', 'key2_f', 'optional'),
+        ('*', 'key3', 'key3_f', 'optional'),
+        ('*', 'key4', 'key4_f', 'optional'),
+        ('*', 'key5', 'key5_f', 'optional'),
+        ('*', 'key6', 'key6_f', 'optional'),
+        ('*', 'key7', 'key7_f', 'optional'),
+        ('*', 'key8', 'key8_f', 'optional'),
+        ('*', 'key9', 'key9_f', 'optional'),
+        ('*', 'key10', 'key10_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'supes2': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'pvalue', 'pvalue_f', 'optional'),
+        ('*', 'xp', 'xp_f', 'optional'),
+        ('*', 'yp', 'yp_f', 'optional'),
+        ('*', 'zp', 'zp_f', 'optional'),
+        ('*', 'strbrk', 'strbrk_f', 'optional'),
+        ('*', 'd0', 'd0_f', 'optional'),
+        ('*', 'd1', 'd1_f', 'optional'),
+        ('*', 'd2', 'd2_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'supest': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'xp', 'xp_f', 'optional'),
+        ('*', 'yp', 'yp_f', 'optional'),
+        ('*', 'zp', 'zp_f', 'optional'),
+        ('*', 'desc1', 'desc1_f', 'optional'),
+        ('*', 'desc2', 'desc2_f', 'optional'),
+        ('*', 'desc3', 'desc3_f', 'optional'),
+        ('@', 'strno', 'strno_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'supoob': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'ptn', 'ptn_f', 'optional'),
+        ('*', 'xp', 'xp_f', 'required'),
+        ('*', 'yp', 'yp_f', 'required'),
+        ('*', 'zp', 'zp_f', 'required'),
+        ('*', 'desc1', 'desc1_f', 'optional'),
+        ('*', 'desc2', 'desc2_f', 'optional'),
+        ('*', 'desc3', 'desc3_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'suppcorr': (
+        ('&', 'graph', 'graph_o', 'optional'),
+        ('&', 'stats', 'stats_o', 'optional'),
+        ('*', 'grade', 'grade_f', 'required'),
+        ('*', 'weight', 'weight_f', 'optional'),
+    ),
+    'surcal': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('@', 'calctype', 'calctype_p', 0),
+        ('@', 'angle', 'angle_p', 1),
+        ('@', 'recalc', 'recalc_p', 0),
+        ('@', 'weight', 'weight_p', 0),
+        ('@', 'adjust', 'adjust_p', 0),
+        ('@', 'ndec', 'ndec_p', 2),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'surfip': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'trend', 'trend_i', 'optional'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'model', 'model_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'upper', 'upper_f', 'required'),
+        ('*', 'lower', 'lower_f', 'required'),
+        ('*', 'label', 'label_f', 'required'),
+        ('@', 'radius', 'radius_p', 'optional'),
+        ('@', 'above', 'above_p', 'optional'),
+        ('@', 'within', 'within_p', 'optional'),
+        ('@', 'below', 'below_p', 'optional'),
+        ('@', 'power', 'power_p', 2),
+        ('@', 'minnop', 'minnop_p', 5),
+        ('@', 'maxstep', 'maxstep_p', 'optional'),
+        ('@', 'splits', 'splits_p', 3),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'surlog': (
+    ),
+    'surobs': (
+        ('&', 'header', 'header_i', 'required'),
+        ('&', 'observ', 'observ_i', 'required'),
+        ('&', 'control', 'control_i', 'required'),
+        ('&', 'tol', 'tol_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'error', 'error_o', 'optional'),
+        ('@', 'angle', 'angle_p', 1),
+        ('@', 'vadmean', 'vadmean_p', 1),
+        ('@', 'errtype', 'errtype_p', 1),
+        ('@', 'plane', 'plane_p', 'optional'),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'refract', 'refract_p', 'optional'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'surpoi': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'elev', 'elev_i', 'required'),
+        ('&', 'trend', 'trend_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'xin', 'xin_f', 'required'),
+        ('*', 'yin', 'yin_f', 'required'),
+        ('@', 'radius', 'radius_p', 'optional'),
+        ('@', 'power', 'power_p', 2),
+        ('@', 'minnop', 'minnop_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'surtac': (
+        ('&', 'control', 'control_i', 'required'),
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'attribut', 'attribut_i', 'required'),
+        ('&', 'pointou', 'pointou_o', 'required'),
+        ('&', 'segou', 'segou_o', 'required'),
+        ('*', 'stype', 'stype_f', 'optional'),
+        ('*', 'svalue', 'svalue_f', 'optional'),
+        ('*', 'station', 'station_f', 'optional'),
+        ('@', 'obtype', 'obtype_p', 1),
+        ('@', 'angle', 'angle_p', 1),
+        ('@', 'voffset', 'voffset_p', 1),
+        ('@', 'period', 'period_p', 'optional'),
+        ('@', 'pidstart', 'pidstart_p', 1),
+        ('@', 'pidincr', 'pidincr_p', 1),
+        ('@', 'pvstart', 'pvstart_p', 1),
+        ('@', 'pvincr', 'pvincr_p', 1),
+        ('@', 'plane', 'plane_p', 'optional'),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'rocheck', 'rocheck_p', 0),
+        ('@', 'update', 'update_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'surtri': (
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'string', 'string_i', 'optional'),
+        ('&', 'pointin', 'pointin_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_o', 'required'),
+        ('&', 'wirept', 'wirept_o', 'required'),
+        ('*', 'xpt', 'xpt_f', 'optional'),
+        ('*', 'ypt', 'ypt_f', 'optional'),
+        ('*', 'zpt', 'zpt_f', 'optional'),
+        ('@', 'surface', 'surface_p', 1),
+        ('@', 'boundary', 'boundary_p', 0),
+        ('@', 'system', 'system_p', 3),
+        ('@', 'dmax', 'dmax_p', 'optional'),
+        ('@', 'maxlink', 'maxlink_p', 'optional'),
+        ('@', 'tol', 'tol_p', 'optional'),
+        ('@', 'cog', 'cog_p', 0),
+        ('@', 'errtrace', 'errtrace_p', 0),
+        ('@', 'hbratio', 'hbratio_p', 0.05),
+        ('@', 'maxpts', 'maxpts_p', 'optional'),
+        ('@', 'check', 'check_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'survig': (
+        ('&', 'pointin', 'pointin_i', 'optional'),
+        ('&', 'segin', 'segin_i', 'optional'),
+        ('&', 'pointup', 'pointup_i', 'optional'),
+        ('&', 'segup', 'segup_i', 'optional'),
+        ('&', 'section', 'section_i', 'optional'),
+        ('&', 'profile', 'profile_i', 'optional'),
+        ('&', 'pointou', 'pointou_o', 'required'),
+        ('&', 'segou', 'segou_o', 'required'),
+        ('&', 'eval', 'eval_o', 'optional'),
+        ('@', 'period', 'period_p', 'optional'),
+        ('@', 'iprcol', 'iprcol_p', 5),
+        ('@', 'isccol', 'isccol_p', 'optional'),
+        ('@', 'addpoint', 'addpoint_p', 500),
+        ('@', 'coortyp', 'coortyp_p', 0),
+        ('@', 'loxorig', 'loxorig_p', 0),
+        ('@', 'loyorig', 'loyorig_p', 0),
+        ('@', 'lozorig', 'lozorig_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'survin': (
+        ('&', 'perimin', 'perimin_i', 'required'),
+        ('&', 'pointou', 'pointou_o', 'required'),
+        ('&', 'segou', 'segou_o', 'required'),
+        ('@', 'period', 'period_p', 'optional'),
+        ('@', 'tol', 'tol_p', 0.1),
+        ('@', 'ptype', 'ptype_p', 1),
+        ('@', 'pcode', 'pcode_p', 1001),
+        ('@', 'p', 'p_p', 1),
+        ('@', 'psymbol', 'psymbol_p', 92),
+        ('@', 'psymsze', 'psymsze_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'survou': (
+        ('&', 'pointin', 'pointin_i', 'required'),
+        ('&', 'segin', 'segin_i', 'required'),
+        ('&', 'perimou', 'perimou_o', 'required'),
+        ('&', 'pointou', 'pointou_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'swathplt': (
+        ('&', 'model', 'model_i', 'required'),
+        ('&', 'sample', 'sample_i', 'optional'),
+        ('&', 'swath1', 'swath1_o', 'required'),
+        ('&', 'swath2', 'swath2_o', 'required'),
+        ('&', 'swathstr', 'swathstr_o', 'optional'),
+        ('*', 'samplex', 'samplex_f', 'optional'),
+        ('*', 'sampley', 'sampley_f', 'optional'),
+        ('*', 'samplez', 'samplez_f', 'optional'),
+        ('*', 'grade1', 'grade1_f', 'required'),
+        ('*', 'dcweight', 'dcweight_f', 'optional'),
+        ('*', 'sgrade1', 'sgrade1_f', 'optional'),
+        ('*', 'sgrade2', 'sgrade2_f', 'optional'),
+        ('*', 'sgrade3', 'sgrade3_f', 'optional'),
+        ('*', 'sgrade4', 'sgrade4_f', 'optional'),
+        ('*', 'sgrade5', 'sgrade5_f', 'optional'),
+        ('*', 'sgrade6', 'sgrade6_f', 'optional'),
+        ('*', 'sgrade7', 'sgrade7_f', 'optional'),
+        ('*', 'sgrade8', 'sgrade8_f', 'optional'),
+        ('*', 'sgrade9', 'sgrade9_f', 'optional'),
+        ('*', 'sgrade10', 'sgrade10_f', 'optional'),
+        ('*', 'grade2', 'grade2_f', 'optional'),
+        ('*', 'grade3', 'grade3_f', 'optional'),
+        ('*', 'grade4', 'grade4_f', 'optional'),
+        ('*', 'grade5', 'grade5_f', 'optional'),
+        ('*', 'grade6', 'grade6_f', 'optional'),
+        ('*', 'grade7', 'grade7_f', 'optional'),
+        ('*', 'grade8', 'grade8_f', 'optional'),
+        ('*', 'grade9', 'grade9_f', 'optional'),
+        ('*', 'grade10', 'grade10_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'syspar': (
+    ),
+    'tabres': (
+        ('&', 'results', 'results_i', 'required'),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'tblin': (
+        ('&', 'exdef', 'exdef_i', 'required'),
+        ('&', 'filter', 'filter_i', 'optional'),
+        ('&', 'protodd', 'protodd_i', 'optional'),
+        ('&', 'fieldlst', 'fieldlst_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'error', 'error_o', 'optional'),
+        ('@', 'layout', 'layout_p', 1),
+        ('@', 'delim', 'delim_p', 'optional'),
+        ('@', 'fs', 'fs_p', 'optional'),
+        ('@', 'skiphd', 'skiphd_p', 0),
+        ('@', 'findpg', 'findpg_p', 0),
+        ('@', 'eod', 'eod_p', 'optional'),
+        ('@', 'trace', 'trace_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'tdin': (
+    ),
+    'tdout': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'terplt': (
+        ('&', 'in', 'in_i', 'required'),
+        ('*', 'f1', 'f1_f', 'required'),
+        ('*', 'f2', 'f2_f', 'required'),
+        ('*', 'f3', 'f3_f', 'required'),
+        ('@', 'plot', 'plot_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'tongrad': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'csvout', 'csvout_o', 'optional'),
+        ('&', 'tgcumtiv', 'tgcumtiv_o', 'optional'),
+        ('*', 'f', 'fields_f', ['optional'], 20),
+        ('*', 'key', 'keys_f', ['optional'], 5),
+        ('*', 'orefrac', 'orefrac_f', 'optional'),
+        ('*', 'density', 'density_f', 'optional'),
+        ('*', 'addf', 'addfs_f', ['optional'], 10),
+        ('@', 'factor', 'factor_p', 1),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'column', 'column_p', 0),
+        ('@', 'row', 'row_p', 0),
+        ('@', 'bench', 'bench_p', 0),
+        ('@', 'cogstep', 'cogstep_p', 0),
+        ('@', 'trename', 'trename_p', 0),
+        ('@', 'setabsnt', 'setabsnt_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'trend': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'value', 'value_f', 'required'),
+        ('@', 'order', 'order_p', 1),
+        ('@', 'print', 'print_p', 0),
+        ('@', 'select', 'select_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'tricon': (
+        ('&', 'in', 'in_i', 'optional'),
+        ('&', 'wirept', 'wirept_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_i', 'optional'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'plot', 'plot_o', 'required'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'value', 'value_f', 'optional'),
+        ('@', 'vmin', 'vmin_p', 'optional'),
+        ('@', 'vmax', 'vmax_p', 'optional'),
+        ('@', 'cint', 'cint_p', 'optional'),
+        ('@', 'dmax', 'dmax_p', 'optional'),
+        ('@', 'surface', 'surface_p', 1),
+        ('@', 'optimise', 'optimise_p', 0),
+        ('@', 'boundary', 'boundary_p', 'optional'),
+        ('@', 'dupelim', 'dupelim_p', 0),
+        ('@', 'tol', 'tol_p', 'optional'),
+        ('@', 'ndp', 'ndp_p', 0),
+        ('@', 'charsize', 'charsize_p', 3),
+        ('@', 'aspratio', 'aspratio_p', 0.9),
+        ('@', 'nan', 'nan_p', 1),
+        ('@', 'append', 'append_p', 0),
+        ('@', 'xmin', 'xmin_p', 'optional'),
+        ('@', 'xmax', 'xmax_p', 'optional'),
+        ('@', 'ymin', 'ymin_p', 'optional'),
+        ('@', 'ymax', 'ymax_p', 'optional'),
+        ('@', 'xscale', 'xscale_p', 'optional'),
+        ('@', 'yscale', 'yscale_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'trifil': (
+        ('&', 'proto', 'proto_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'model', 'model_o', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'modltype', 'modltype_p', 1),
+        ('@', 'zone', 'zone_p', 'optional'),
+        ('@', 'maxdip', 'maxdip_p', 0),
+        ('@', 'splits', 'splits_p', 3),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'xsubcell', 'xsubcell_p', 1),
+        ('@', 'ysubcell', 'ysubcell_p', 1),
+        ('@', 'zsubcell', 'zsubcell_p', 1),
+        ('@', 'pvalue', 'pvalue_p', 'optional'),
+        ('@', 'resol', 'resol_p', 0),
+        ('@', 'checkrot', 'checkrot_p', 0),
+        ('@', 'autosort', 'autosort_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'tripoi': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('@', 'keep', 'keep_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'trival': (
+        ('&', 'modeli', 'modeli_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'results', 'results_o', 'required'),
+        ('&', 'modelo', 'modelo_o', 'optional'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'density', 'density_p', 1),
+        ('@', 'fullcell', 'fullcell_p', 0),
+        ('@', 'mine', 'mine_p', 0),
+        ('@', 'plane', 'plane_p', 'XY'),
+        ('@', 'incrment', 'incrment_p', 0),
+        ('@', 'modltype', 'modltype_p', 0),
+        ('@', 'chkovlap', 'chkovlap_p', 0),
+        ('@', 'checkrot', 'checkrot_p', 0),
+        ('@', 'nosid', 'nosid_p', 0),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'trivol': (
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('&', 'out', 'out_o', 'optional'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'zbase', 'zbase_p', 'optional'),
+        ('@', 'nosid', 'nosid_p', 1),
+        ('@', 'dtm', 'dtm_p', 1),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'truethk': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'unfold': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'string', 'string_i', 'required'),
+        ('&', 'unitdef', 'unitdef_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'quads', 'quads_o', 'optional'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'z', 'z_f', 'optional'),
+        ('*', 'section', 'section_f', 'optional'),
+        ('*', 'boundary', 'boundary_f', 'optional'),
+        ('*', 'wstag', 'wstag_f', 'optional'),
+        ('*', 'bstag', 'bstag_f', 'optional'),
+        ('*', 'tag', 'tag_f', 'optional'),
+        ('*', 'unitname', 'unitname_f', 'optional'),
+        ('*', 'hangwall', 'hangwall_f', 'optional'),
+        ('*', 'footwall', 'footwall_f', 'optional'),
+        ('*', 'ucsa', 'ucsa_f', 'optional'),
+        ('*', 'ucsb', 'ucsb_f', 'optional'),
+        ('*', 'ucsc', 'ucsc_f', 'optional'),
+        ('@', 'linkmode', 'linkmode_p', 3),
+        ('@', 'ucsamode', 'ucsamode_p', 2),
+        ('@', 'ucsbmode', 'ucsbmode_p', 3),
+        ('@', 'ucscmode', 'ucscmode_p', 2),
+        ('@', 'plane', 'plane_p', 1),
+        ('@', 'hangid', 'hangid_p', 'optional'),
+        ('@', 'footid', 'footid_p', 'optional'),
+        ('@', 'unitid', 'unitid_p', 'optional'),
+        ('@', 'tolrnc', 'tolrnc_p', 0),
+        ('@', 'ucsalimt', 'ucsalimt_p', 1),
+        ('@', 'orgtag', 'orgtag_p', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'unifcond': (
+        ('&', 'ucmodel', 'ucmodel_o', 'required'),
+        ('*', 'grade', 'grade_f', 'required'),
+        ('*', 'weight', 'weight_f', 'optional'),
+        ('*', 'kriging', 'kriging_f', 'required'),
+        ('*', 'dispvar', 'dispvar_f', 'required'),
+        ('*', 'errcode', 'errcode_f', 'optional'),
+        ('@', 'vrefnum', 'vrefnum_p', 0),
+        ('@', 'discx', 'discx_p', 5),
+        ('@', 'discy', 'discy_p', 5),
+        ('@', 'discz', 'discz_p', 5),
+        ('@', 'normsill', 'normsill_p', 0),
+        ('@', 'classes', 'classes_p', 1),
+        ('@', 'cutmin', 'cutmin_p', 0),
+        ('@', 'cutint', 'cutint_p', 10),
+        ('@', 'cutnum', 'cutnum_p', 10),
+        ('@', 'numsmux', 'numsmux_p', 1),
+        ('@', 'numsmuy', 'numsmuy_p', 1),
+        ('@', 'numsmuz', 'numsmuz_p', 1),
+        ('@', 'gaout', 'gaout_p', 1),
+    ),
+    'unlink': (
+    ),
+    'valida': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'varfit': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'ave.dist', 'ave_dist_f', 'optional'),
+        ('*', 'vgram', 'vgram_f', 'optional'),
+        ('*', 'key', 'key_f', 'optional'),
+        ('*', 'azi', 'azi_f', 'optional'),
+        ('*', 'dip', 'dip_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'vcontour': (
+        ('&', 'in', 'in_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'ver': (
+    ),
+    'vgram': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'cutoff', 'cutoff_i', 'optional'),
+        ('&', 'out', 'out_o', 'required'),
+        ('&', 'pairsout', 'pairsout_o', 'optional'),
+        ('*', 'x', 'x_f', 'optional'),
+        ('*', 'y', 'y_f', 'optional'),
+        ('*', 'z', 'z_f', 'optional'),
+        ('*', 'f1', 'f1_f', 'required'),
+        ('*', 'f2', 'f2_f', 'optional'),
+        ('*', 'f3', 'f3_f', 'optional'),
+        ('*', 'f4', 'f4_f', 'optional'),
+        ('*', 'f5', 'f5_f', 'optional'),
+        ('*', 'f6', 'f6_f', 'optional'),
+        ('*', 'f7', 'f7_f', 'optional'),
+        ('*', 'f8', 'f8_f', 'optional'),
+        ('*', 'f9', 'f9_f', 'optional'),
+        ('*', 'f10', 'f10_f', 'optional'),
+        ('*', 'f11', 'f11_f', 'optional'),
+        ('*', 'f12', 'f12_f', 'optional'),
+        ('*', 'f13', 'f13_f', 'optional'),
+        ('*', 'f14', 'f14_f', 'optional'),
+        ('*', 'f15', 'f15_f', 'optional'),
+        ('*', 'f16', 'f16_f', 'optional'),
+        ('*', 'f17', 'f17_f', 'optional'),
+        ('*', 'f18', 'f18_f', 'optional'),
+        ('*', 'f19', 'f19_f', 'optional'),
+        ('*', 'f20', 'f20_f', 'optional'),
+        ('*', 'f21', 'f21_f', 'optional'),
+        ('*', 'f22', 'f22_f', 'optional'),
+        ('*', 'f23', 'f23_f', 'optional'),
+        ('*', 'key', 'key_f', 'optional'),
+        ('@', 'lag', 'lag_p', 'optional'),
+        ('@', 'lagtol', 'lagtol_p', 'optional'),
+        ('@', 'nlags', 'nlags_p', 25),
+        ('@', 'nsublag', 'nsublag_p', 0),
+        ('@', 'nlags1', 'nlags1_p', 0),
+        ('@', 'azi', 'azi_p', 0),
+        ('@', 'horang', 'horang_p', 90),
+        ('@', 'dip', 'dip_p', 0),
+        ('@', 'verang', 'verang_p', 90),
+        ('@', 'cylrad', 'cylrad_p', 0),
+        ('@', 'numhor', 'numhor_p', 1),
+        ('@', 'horinc', 'horinc_p', 0),
+        ('@', 'numver', 'numver_p', 1),
+        ('@', 'verinc', 'verinc_p', 0),
+        ('@', 'allkeys', 'allkeys_p', 0),
+        ('@', 'keymeth', 'keymeth_p', 1),
+        ('@', 'crossvar', 'crossvar_p', 0),
+        ('@', 'indstep', 'indstep_p', 0),
+        ('@', 'indmin', 'indmin_p', 0),
+        ('@', 'indnum', 'indnum_p', 0),
+        ('@', 'nested', 'nested_p', 0),
+        ('@', 'print', 'print_p', 1),
+        ('@', 'angle1', 'angle1_p', 0),
+        ('@', 'axis1', 'axis1_p', 3),
+        ('@', 'angle2', 'angle2_p', 0),
+        ('@', 'axis2', 'axis2_p', 1),
+        ('@', 'angle3', 'angle3_p', 0),
+        ('@', 'axis3', 'axis3_p', 3),
+        ('@', 'logcon', 'logcon_p', 0.001),
+        ('@', 'addcon', 'addcon_p', 0),
+        ('@', 'laymeth', 'laymeth_p', 0),
+        ('@', 'spacing', 'spacing_p', 100),
+        ('@', 'pause', 'pause_p', -1),
+        ('@', 'prompt', 'prompt_p', 20),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'weave': (
+        ('&', 'in1', 'in1_i', 'required'),
+        ('&', 'in2', 'in2_i', 'required'),
+        ('&', 'out', 'out_o', 'required'),
+        ('*', 'key1', 'key1_f', 'required'),
+        ('*', 'key2', 'key2_f', 'optional'),
+        ('*', 'key3', 'key3_f', 'optional'),
+        ('*', 'key4', 'key4_f', 'optional'),
+        ('*', 'key5', 'key5_f', 'optional'),
+        ('*', 'key6', 'key6_f', 'optional'),
+        ('*', 'key7', 'key7_f', 'optional'),
+        ('*', 'key8', 'key8_f', 'optional'),
+        ('*', 'key9', 'key9_f', 'optional'),
+        ('*', 'key10', 'key10_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'wedgevol': (
+        ('&', 'wiretr1', 'wiretr1_i', 'required'),
+        ('&', 'wirept1', 'wirept1_i', 'required'),
+        ('&', 'wiretr2', 'wiretr2_i', 'required'),
+        ('&', 'wirept2', 'wirept2_i', 'required'),
+        ('&', 'wiretr3', 'wiretr3_i', 'optional'),
+        ('&', 'wirept3', 'wirept3_i', 'optional'),
+        ('&', 'proto', 'proto_i', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'wfcode': (
+        ('&', 'points', 'points_i', 'required'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'perimin', 'perimin_i', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('*', 'attrib1', 'attrib1_f', 'optional'),
+        ('*', 'attrib2', 'attrib2_f', 'optional'),
+        ('*', 'attrib3', 'attrib3_f', 'optional'),
+        ('*', 'attrib4', 'attrib4_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'wfexpnd': (
+        ('&', 'intr', 'intr_i', 'required'),
+        ('&', 'inpt', 'inpt_i', 'required'),
+        ('&', 'outtr', 'outtr_o', 'required'),
+        ('&', 'outpt', 'outpt_o', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'wftrend': (
+        ('&', 'pointin', 'pointin_i', 'required'),
+        ('&', 'wiretr', 'wiretr_o', 'required'),
+        ('&', 'wirept', 'wirept_o', 'required'),
+        ('&', 'pointou', 'pointou_o', 'optional'),
+        ('*', 'xpt', 'xpt_f', 'required'),
+        ('*', 'ypt', 'ypt_f', 'required'),
+        ('*', 'zpt', 'zpt_f', 'required'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'wirefill': (
+        ('&', 'proto', 'proto_i', 'optional'),
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'model', 'model_o', 'required'),
+        ('*', 'zone', 'zone_f', 'optional'),
+        ('@', 'zcode', 'zcode_p', 1),
+        ('@', 'wiretype', 'wiretype_p', 1),
+        ('@', 'cellxmin', 'cellxmin_p', 2.5),
+        ('@', 'cellxmax', 'cellxmax_p', 10),
+        ('@', 'cellymin', 'cellymin_p', 2.5),
+        ('@', 'cellymax', 'cellymax_p', 10),
+        ('@', 'cellzmin', 'cellzmin_p', 2.5),
+        ('@', 'cellzmax', 'cellzmax_p', 10),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'wirepe': (
+        ('&', 'wiretr', 'wiretr_i', 'required'),
+        ('&', 'wirept', 'wirept_i', 'required'),
+        ('&', 'section', 'section_i', 'optional'),
+        ('&', 'perimout', 'perimout_o', 'required'),
+        ('*', 'attrib1', 'attrib1_f', 'optional'),
+        ('*', 'attrib2', 'attrib2_f', 'optional'),
+        ('*', 'attrib3', 'attrib3_f', 'optional'),
+        ('*', 'attrib4', 'attrib4_f', 'optional'),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+    'xvalid': (
+        ('&', 'in', 'in_i', 'required'),
+        ('&', 'srcparm', 'srcparm_i', 'required'),
+        ('&', 'estparm', 'estparm_i', 'required'),
+        ('&', 'vmodparm', 'vmodparm_i', 'optional'),
+        ('&', 'vgram', 'vgram_i', 'optional'),
+        ('&', 'xvsamps', 'xvsamps_o', 'optional'),
+        ('&', 'xvstats', 'xvstats_o', 'optional'),
+        ('&', 'sampout', 'sampout_o', 'optional'),
+        ('*', 'x', 'x_f', 'required'),
+        ('*', 'y', 'y_f', 'required'),
+        ('*', 'z', 'z_f', 'required'),
+        ('*', 'zone1_f', 'zone1_f_f', 'optional'),
+        ('*', 'zone2_f', 'zone2_f_f', 'optional'),
+        ('*', 'key', 'key_f', 'optional'),
+        ('*', 'length_f', 'length_f_f', 'optional'),
+        ('*', 'dens_f', 'dens_f_f', 'optional'),
+        ('@', 'sminfac', 'sminfac_p', 0.0001),
+        ('@', 'print', 'print_p', 0),
+        ('{', 'retrieval', 'retrieval', 'optional'),
+    ),
+}
@@ -0,0 +1,380 @@
+'''
+dmstudio.convert
+================
+
+Conversion between Datamine ``.dm`` files and the columnar Parquet and Arrow IPC formats. Columnar files are
+compressed, much smaller than CSV exports and can be read column by column by most analytics tools.
+
+The Datamine data dictionary is kept in the Arrow schema: every field carries its type, alphanumeric length,
+default and whether it is implicit, so that a ``.dm`` file converted to Parquet and back has the same fields.
+Implicit fields are written as constant columns, which compress to almost nothing. Absent values, blank for
+alphanumeric fields, become nulls.
+
+The conversions stream the data in chunks, so files of any size can be converted. Parquet files store min/max
+statistics per column for every row group, ``statistics`` combines them without reading the data. The conversions
+from ``.dm`` also return the statistics of the converted records.
+
+Requires ``pyarrow``, which is only imported when a conversion is used.
+
+Usage:
+------
+
+>>> from dmstudio import convert
+>>> convert.dm_to_parquet('model.dm', 'model.parquet')
+>>> convert.statistics('model.parquet')['AU']
+{'min': 0.0, 'max': 48.2, 'nulls': 1520}
+>>> convert.parquet_to_dm('model.parquet', 'model2.dm')
+
+'''
+
+import json
+
+import dmstudio.dmformat
+import dmstudio.dmio
+
+# key of the Datamine field definition in the metadata of an Arrow field
+FIELD_KEY = b'dmstudio'
+
+# key of the Datamine file precision in the metadata of an Arrow schema
+PRECISION_KEY = b'dmstudio.precision'
+
+
+def _pyarrow():
+
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required to convert between .dm files and Parquet or Arrow files")
+
+    return pyarrow;
+
+
+def arrow_schema(header):
+    '''
+    arrow_schema
+    ------------
+
+    Arrow schema of a ``.dm`` file, with the Datamine field definitions in the field metadata.
+
+    Parameters:
+    -----------
+
+    header: dict
+        data dictionary as returned by ``dmformat.read_header``
+
+    Returns:
+    --------
+
+    pyarrow.Schema
+    '''
+
+    pa = _pyarrow()
+
+    numeric = pa.float32() if header['precision'] == 'single' else pa.float64()
+    fields = []
+
+    for field in header['fields']:
+        definition = {'type': field['type'],
+                      'length': field['length'],
+                      'default': field['default'],
+                      'implicit': field['position'] is None}
+        fields.append(pa.field(field['name'], pa.string() if field['type'] == 'A' else numeric,
+                               metadata={FIELD_KEY: json.dumps(definition)}))
+
+    return pa.schema(fields, metadata={PRECISION_KEY: header['precision']});
+
+
+def dm_fields(schema):
+    '''
+    dm_fields
+    ---------
+
+    Datamine field definitions of an Arrow schema, for ``dmio.dm_writer``. Fields written by ``arrow_schema`` keep
+    their definition, other numeric fields become numeric fields and other fields alphanumeric fields with an
+    unknown length (None). Field names are upper case, 'column' holds the name of the Arrow field.
+
+    Parameters:
+    -----------
+
+    schema: pyarrow.Schema
+
+    Returns:
+    --------
+
+    list of dict
+        see ``dmformat.build_header``
+    '''
+
+    pa = _pyarrow()
+
+    fields = []
+    for field in schema:
+        metadata = field.metadata or {}
+        if FIELD_KEY in metadata:
+            definition = json.loads(metadata[FIELD_KEY])
+            fields.append({'name': field.name.upper(),
+                           'type': definition['type'],
+                           'length': definition['length'],
+                           'default': definition['default'],
+                           'implicit': definition['implicit'],
+                           'column': field.name})
+        elif pa.types.is_integer(field.type) or pa.types.is_floating(field.type) or pa.types.is_boolean(field.type):
+            fields.append({'name': field.name.upper(), 'type': 'N', 'length': 0, 'column': field.name})
+        else:
+            fields.append({'name': field.name.upper(), 'type': 'A', 'length': None, 'column': field.name})
+
+    return fields;
+
+
+def _combine(stats, name, low, high, nulls):
+
+    column = stats.setdefault(name, {'min': None, 'max': None, 'nulls': 0})
+    column['nulls'] += nulls
+    if low is not None:
+        column['min'] = low if column['min'] is None else min(column['min'], low)
+    if high is not None:
+        column['max'] = high if column['max'] is None else max(column['max'], high)
+
+
+def _batches(filename, schema, chunk_records, stats):
+
+    # record batches of a .dm file, updating the column statistics of the converted records. Blank alphanumeric
+    # values are absent in Datamine and become nulls like absent numeric values.
+    pa = _pyarrow()
+    import pyarrow.compute as pc
+
+    for chunk in dmstudio.dmio.iter_dm(filename, chunk_records=chunk_records):
+        batch = pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False)
+        columns = [pc.if_else(pc.equal(values, ''), pa.scalar(None, pa.string()), values)
+                   if pa.types.is_string(values.type) else values for values in batch.columns]
+        batch = pa.RecordBatch.from_arrays(columns, schema=schema)
+        for name, values in zip(schema.names, batch.columns):
+            extremes = pc.min_max(values)
+            _combine(stats, name, extremes['min'].as_py(), extremes['max'].as_py(), values.null_count)
+        yield batch
+
+
+def dm_to_parquet(dm_filename, parquet_filename, chunk_records=1 << 20, compression='zstd'):
+    '''
+    dm_to_parquet
+    -------------
+
+    Convert a ``.dm`` file to a Parquet file, one row group per chunk.
+
+    Parameters:
+    -----------
+
+    dm_filename: str
+        path of the ``.dm`` file
+    parquet_filename: str
+        path of the Parquet file
+    chunk_records: int
+        number of records converted at a time, also the row group size
+    compression: str
+        Parquet compression codec
+
+    Returns:
+    --------
+
+    dict
+        column statistics of the converted records, see ``statistics``
+    '''
+
+    pa = _pyarrow()
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema(dmstudio.dmformat.read_header(dm_filename))
+    stats = {}
+
+    with pq.ParquetWriter(parquet_filename, schema, compression=compression, write_statistics=True) as writer:
+        for batch in _batches(dm_filename, schema, chunk_records, stats):
+            writer.write_table(pa.Table.from_batches([batch], schema=schema))
+
+    return stats;
+
+
+def dm_to_arrow(dm_filename, arrow_filename, chunk_records=1 << 20, compression='zstd'):
+    '''
+    dm_to_arrow
+    -----------
+
+    Convert a ``.dm`` file to an Arrow IPC file, one record batch per chunk.
+
+    Parameters:
+    -----------
+
+    dm_filename: str
+        path of the ``.dm`` file
+    arrow_filename: str
+        path of the Arrow IPC file
+    chunk_records: int
+        number of records converted at a time
+    compression: str
+        buffer compression codec, 'zstd', 'lz4' or None
+
+    Returns:
+    --------
+
+    dict
+        column statistics of the converted records, see ``statistics``
+    '''
+
+    pa = _pyarrow()
+
+    schema = arrow_schema(dmstudio.dmformat.read_header(dm_filename))
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    stats = {}
+
+    with pa.ipc.new_file(arrow_filename, schema, options=options) as writer:
+        for batch in _batches(dm_filename, schema, chunk_records, stats):
+            writer.write_batch(batch)
+
+    return stats;
+
+
+def _alpha_lengths(fields, tables):
+
+    # alphanumeric fields without a definition get the length of their longest value, read in a first pass
+    import pyarrow.compute as pc
+
+    unknown = [field['name'] for field in fields if field['type'] == 'A' and field['length'] is None]
+    if not unknown:
+        return fields;
+
+    longest = dict.fromkeys(unknown, 1)
+    for table in tables([field['column'] for field in fields if field['name'] in longest]):
+        for column in table.schema.names:
+            length = pc.max(pc.utf8_length(table.column(column).cast('string'))).as_py()
+            longest[column.upper()] = max(longest[column.upper()], length or 1)
+
+    for field in fields:
+        if field['name'] in longest:
+            field['length'] = -(-longest[field['name']] // dmstudio.dmformat.CHARS_PER_WORD) * \
+                dmstudio.dmformat.CHARS_PER_WORD
+
+    return fields;
+
+
+def _precision(schema, precision):
+
+    if precision is not None:
+        return precision;
+
+    if schema.metadata and PRECISION_KEY in schema.metadata:
+        return schema.metadata[PRECISION_KEY].decode();
+
+    return 'extended';
+
+
+def parquet_to_dm(parquet_filename, dm_filename, precision=None, chunk_records=1 << 20):
+    '''
+    parquet_to_dm
+    -------------
+
+    Convert a Parquet file to a ``.dm`` file. Files written by ``dm_to_parquet`` keep their field definitions and
+    precision, for other files the definitions are derived from the column types and values.
+
+    Parameters:
+    -----------
+
+    parquet_filename: str
+        path of the Parquet file
+    dm_filename: str
+        path of the ``.dm`` file
+    precision: str
+        'single' or 'extended', by default the precision of the original ``.dm`` file or 'extended'
+    chunk_records: int
+        number of records converted at a time
+    '''
+
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    source = pq.ParquetFile(parquet_filename)
+    schema = source.schema_arrow
+
+    fields = _alpha_lengths(dm_fields(schema),
+                            lambda names: source.iter_batches(batch_size=chunk_records, columns=names))
+
+    with dmstudio.dmio.dm_writer(dm_filename, fields, _precision(schema, precision)) as writer:
+        for batch in source.iter_batches(batch_size=chunk_records):
+            writer.write(batch.to_pandas())
+
+
+def arrow_to_dm(arrow_filename, dm_filename, precision=None):
+    '''
+    arrow_to_dm
+    -----------
+
+    Convert an Arrow IPC file to a ``.dm`` file, one record batch at a time. See ``parquet_to_dm``.
+
+    Parameters:
+    -----------
+
+    arrow_filename: str
+        path of the Arrow IPC file
+    dm_filename: str
+        path of the ``.dm`` file
+    precision: str
+        'single' or 'extended', by default the precision of the original ``.dm`` file or 'extended'
+    '''
+
+    pa = _pyarrow()
+
+    with pa.memory_map(arrow_filename) as source:
+        reader = pa.ipc.open_file(source)
+        schema = reader.schema
+
+        def batches(names=None):
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                yield batch if names is None else batch.select(names)
+
+        fields = _alpha_lengths(dm_fields(schema), batches)
+
+        with dmstudio.dmio.dm_writer(dm_filename, fields, _precision(schema, precision)) as writer:
+            for batch in batches():
+                writer.write(batch.to_pandas())
+
+
+def statistics(parquet_filename):
+    '''
+    statistics
+    ----------
+
+    Per column statistics of a Parquet file, combined from the row group statistics in the file footer.
+
+    Parameters:
+    -----------
+
+    parquet_filename: str
+        path of the Parquet file
+
+    Returns:
+    --------
+
+    dict
+        column name to a dict with keys 'min', 'max' and 'nulls' (number of absent values). 'min' and 'max' are
+        None if the file has no statistics for the column.
+    '''
+
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    metadata = pq.ParquetFile(parquet_filename).metadata
+    result = {}
+
+    for i in range(metadata.num_columns):
+        name = metadata.schema.column(i).name
+        _combine(result, name, None, None, 0)
+
+        for group in range(metadata.num_row_groups):
+            column = metadata.row_group(group).column(i).statistics
+            if column is None:
+                continue
+            if column.has_min_max:
+                _combine(result, name, column.min, column.max, column.null_count or 0)
+            else:
+                _combine(result, name, None, None, column.null_count or 0)
+
+    return result;
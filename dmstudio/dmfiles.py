@@ -13,22 +13,19 @@ To do:
 
 '''
 import dmstudio.initialize
-
-# constant to avoid redundant COM connections which slows down processing
-
-OSCRIPTCON = None
+import dmstudio.backends
 
 class init(object):
 
-    def __init__(self, version=None):
+    def __init__(self, version=None, backend=None):
 
         '''
         commands.__init__
         ------------------
 
 
-        Commands initialization. After the commands class is initialized  for the first time the object will
-         be set to the datamine studio object. This property will avoid redundant initializaiton
+        Commands initialization. The datamine studio object is shared with all other command objects through
+        ``dmstudio.initialize.connect`` which avoids redundant COM initialization.
 
         Parameters:
         -----------
@@ -36,31 +33,55 @@ class init(object):
         version: str
             optional datamine studio versions ('Studio3', 'StudioRM', 'StudioEM') If no version given, the initializtion
             will try different versions starting with StudioRM then Studio3 and finally StudioEM.
+        backend: backend object
+            optional command backend from ``dmstudio.backends``. If no backend is given the default backend is
+            used, which executes the commands in Studio through COM. The COM connection is made when the first
+            command is executed.
 
         '''
-        self.oScript = OSCRIPTCON
         self.version = version
-        if self.oScript is None:
-            self.oScript = dmstudio.initialize.studio(self.version)
+        self._backend = backend
+
+    @property
+    def backend(self):
+
+        # the backend is resolved on first use so that creating a command object does not connect to Studio
+        if self._backend is None:
+            self._backend = dmstudio.backends.get_backend(self.version)
+
+        return self._backend;
+
+    @backend.setter
+    def backend(self, backend):
+
+        self._backend = backend
+
+    @property
+    def oScript(self):
+
+        return getattr(self.backend, 'oScript', None);
 
     def run_command(self, command):
         '''
         run_command
         -----------
 
-        Uses the studio Parsecommand method to execute a datamine script.
+        Executes a datamine command with the command backend, by default the studio Parsecommand method.
 
         Parameters:
         -----------
 
         command: str
             datamine command string to be parsed
+
+        Errors of the backend are reported with the failing command and raised again.
         '''
 
         try:
-            self.oScript.Parsecommand(command)
-        except:
-            print("Unexpected error:")
+            self.backend.run(command)
+        except Exception as e:
+            print("Error running '" + command + "': " + str(e))
+            raise
 
     def parse_infields_list(self, prefix, fields):
         '''
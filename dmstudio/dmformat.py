@@ -0,0 +1,393 @@
+'''
+dmstudio.dmformat
+=================
+
+Layout of Datamine binary ``.dm`` files and functions for reading their data dictionary (header) without Studio.
+
+File layout:
+------------
+
+A ``.dm`` file is a sequence of pages of 512 words. A word is 4 bytes in single precision files and 8 bytes in
+extended precision files. Numeric words are little endian IEEE floats (float32 or float64) and alphanumeric words
+hold 4 ASCII characters, padded with spaces to 8 bytes in extended precision files.
+
+The data dictionary starts on the first page:
+
+* words 1-2: file name, words 3-4: database name, words 5-20: description (text)
+* word 21: date, word 22: number of field descriptors, word 23: number of the last page,
+  word 24: number of records on the last page (numeric)
+* words 25 onward: one descriptor of 7 words per field word: name (2 words), type ('A' or 'N'), stored position
+  of the word in the record (0 for implicit fields), word number within the field, unused, default value
+
+Alphanumeric fields longer than 4 characters have one descriptor per word. Implicit fields are not stored in the
+records, their value is the default. Descriptors continue onto following pages when they do not fit on the first
+page. The records follow on the next page, ``512 // record_words`` records per page, each record being
+``record_words`` consecutive words. Absent numeric values are stored as ``ABSENT``.
+
+'''
+
+import os
+import struct
+
+# words per page
+PAGE_WORDS = 512
+
+# words at the start of the data dictionary before the field descriptors
+HEADER_WORDS = 24
+
+# words per field descriptor
+DESCRIPTOR_WORDS = 7
+
+# characters per alphanumeric word
+CHARS_PER_WORD = 4
+
+# numeric absent data value
+ABSENT = -1.0e30
+
+# bytes per word and struct format of a numeric word for each precision
+PRECISIONS = {'single': (4, '<f'), 'extended': (8, '<d')}
+
+
+def _text(word_bytes, word_size):
+
+    # alphanumeric words hold 4 characters, extended precision words are padded to 8 bytes
+    chars = b''.join(word_bytes[i:i + CHARS_PER_WORD] for i in range(0, len(word_bytes), word_size))
+
+    return chars.decode('latin-1');
+
+
+def _looks_like(data, precision):
+
+    word_size, fmt = PRECISIONS[precision]
+    if len(data) < (HEADER_WORDS + DESCRIPTOR_WORDS) * word_size:
+        return False;
+
+    nfields = struct.unpack_from(fmt, data, 21 * word_size)[0]
+    if not (0 < nfields < 100000 and nfields == int(nfields)):
+        return False;
+
+    ftype = data[(HEADER_WORDS + 2) * word_size:(HEADER_WORDS + 2) * word_size + 1]
+
+    return ftype in (b'A', b'N');
+
+
+def detect_precision(data):
+    '''
+    detect_precision
+    ----------------
+
+    Detect whether the start of a ``.dm`` file is single or extended precision.
+
+    Parameters:
+    -----------
+
+    data: bytes
+        at least the first page of the file
+
+    Returns:
+    --------
+
+    str
+        'single' or 'extended'
+    '''
+
+    for precision in ('single', 'extended'):
+        if _looks_like(data, precision):
+            return precision;
+
+    raise ValueError("Not a Datamine binary file")
+
+
+def parse_header(data):
+    '''
+    parse_header
+    ------------
+
+    Parse the data dictionary of a ``.dm`` file.
+
+    Parameters:
+    -----------
+
+    data: bytes
+        start of the file, at least all data dictionary pages
+
+    Returns:
+    --------
+
+    dict with keys:
+        name, database, description: text of the header
+        date: numeric date word
+        precision: 'single' or 'extended'
+        word_size: bytes per word
+        fields: list of dict with keys 'name', 'type' ('A' or 'N'), 'length' (characters for alphanumeric fields,
+            0 for numeric fields), 'position' (index of the first word in the record, None for implicit fields),
+            'words' (words per record) and 'default'
+        record_words: number of words per record
+        records_per_page: number of records per data page
+        header_pages: number of data dictionary pages
+        nrecords: number of records
+    '''
+
+    precision = detect_precision(data)
+    word_size, fmt = PRECISIONS[precision]
+
+    def number(word):
+        return struct.unpack_from(fmt, data, word * word_size)[0];
+
+    def text(first, count):
+        return _text(data[first * word_size:(first + count) * word_size], word_size);
+
+    ndescriptors = int(number(21))
+    last_page = int(number(22))
+    last_records = int(number(23))
+    header_pages = -(-(HEADER_WORDS + ndescriptors * DESCRIPTOR_WORDS) // PAGE_WORDS)
+
+    if len(data) < header_pages * PAGE_WORDS * word_size:
+        raise ValueError("Data dictionary is incomplete, read more pages")
+
+    fields = []
+    for i in range(ndescriptors):
+        word = HEADER_WORDS + i * DESCRIPTOR_WORDS
+        name = text(word, 2).strip()
+        ftype = text(word + 2, 1).strip()
+        position = int(number(word + 3))
+
+        if ftype == 'A':
+            default = text(word + 6, 1)
+        else:
+            default = number(word + 6)
+
+        # further words of an alphanumeric field
+        if fields and fields[-1]['name'] == name and ftype == 'A' and int(number(word + 4)) > 1:
+            fields[-1]['words'] += 1
+            fields[-1]['length'] += CHARS_PER_WORD
+            fields[-1]['default'] += default
+            continue
+
+        fields.append({'name': name,
+                       'type': ftype,
+                       'length': CHARS_PER_WORD if ftype == 'A' else 0,
+                       'position': position - 1 if position > 0 else None,
+                       'words': 1,
+                       'default': default})
+
+    for field in fields:
+        if field['type'] == 'A':
+            field['default'] = field['default'].rstrip()
+
+    record_words = sum(field['words'] for field in fields if field['position'] is not None)
+    records_per_page = PAGE_WORDS // record_words if record_words else 0
+    data_pages = last_page - header_pages
+    nrecords = (data_pages - 1) * records_per_page + last_records if data_pages > 0 else 0
+
+    return {'name': text(0, 2).strip(),
+            'database': text(2, 2).strip(),
+            'description': text(4, 16).strip(),
+            'date': number(20),
+            'precision': precision,
+            'word_size': word_size,
+            'fields': fields,
+            'record_words': record_words,
+            'records_per_page': records_per_page,
+            'header_pages': header_pages,
+            'nrecords': nrecords};
+
+
+def read_header(filename):
+    '''
+    read_header
+    -----------
+
+    Read the data dictionary of a ``.dm`` file. Only the data dictionary pages are read.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the ``.dm`` file
+
+    Returns:
+    --------
+
+    dict
+        see ``parse_header``
+    '''
+
+    with open(filename, 'rb') as f:
+        data = f.read(PAGE_WORDS * 8)
+        word_size, fmt = PRECISIONS[detect_precision(data)]
+        ndescriptors = int(struct.unpack_from(fmt, data, 21 * word_size)[0])
+        header_bytes = -(-(HEADER_WORDS + ndescriptors * DESCRIPTOR_WORDS) // PAGE_WORDS) * PAGE_WORDS * word_size
+        if header_bytes > len(data):
+            data += f.read(header_bytes - len(data))
+
+    return parse_header(data);
+
+
+def _pack_text(text, words, word_size):
+
+    text = text.encode('latin-1')[:words * CHARS_PER_WORD].ljust(words * CHARS_PER_WORD)
+
+    return b''.join(text[i:i + CHARS_PER_WORD].ljust(word_size) for i in range(0, len(text), CHARS_PER_WORD));
+
+
+def build_header(fields, precision='single', nrecords=0, name='', description='', date=0.):
+    '''
+    build_header
+    ------------
+
+    Build the data dictionary pages of a ``.dm`` file.
+
+    Parameters:
+    -----------
+
+    fields: list of dict
+        fields in file order with keys 'name', 'type' ('A' or 'N'), 'length' (characters of alphanumeric fields),
+        'implicit' (optional, True for implicit fields) and 'default' (optional)
+    precision: str
+        'single' or 'extended'
+    nrecords: int
+        number of records that follow the data dictionary
+    name: str
+        file name stored in the header
+    description: str
+        file description
+    date: float
+        date word
+
+    Returns:
+    --------
+
+    bytes
+        data dictionary padded to whole pages, see ``parse_header``
+    '''
+
+    word_size, fmt = PRECISIONS[precision]
+
+    def number(value):
+        return struct.pack(fmt, value);
+
+    descriptors = []
+    position = 1
+    for field in fields:
+        if len(field['name']) > 8:
+            raise ValueError("Field name " + field['name'] + " is longer than 8 characters")
+
+        ftype = field['type'].upper()
+        words = -(-int(field.get('length') or CHARS_PER_WORD) // CHARS_PER_WORD) if ftype == 'A' else 1
+        implicit = field.get('implicit', False)
+        default = field.get('default')
+
+        for word in range(words):
+            descriptor = _pack_text(field['name'].upper(), 2, word_size)
+            descriptor += _pack_text(ftype, 1, word_size)
+            descriptor += number(0 if implicit else position + word)
+            descriptor += number(word + 1)
+            descriptor += number(0)
+            if ftype == 'A':
+                descriptor += _pack_text((default or '')[word * CHARS_PER_WORD:], 1, word_size)
+            else:
+                descriptor += number(ABSENT if default is None else default)
+            descriptors.append(descriptor)
+
+        if not implicit:
+            position += words
+
+    record_words = position - 1
+    records_per_page = PAGE_WORDS // record_words if record_words else 0
+    header_pages = -(-(HEADER_WORDS + len(descriptors) * DESCRIPTOR_WORDS) // PAGE_WORDS)
+
+    if nrecords:
+        data_pages = -(-nrecords // records_per_page)
+        last_records = nrecords - (data_pages - 1) * records_per_page
+    else:
+        data_pages = 0
+        last_records = 0
+
+    data = _pack_text(name.upper(), 2, word_size) + _pack_text('', 2, word_size)
+    data += _pack_text(description, 16, word_size)
+    data += number(date) + number(len(descriptors)) + number(header_pages + data_pages) + number(last_records)
+    data += b''.join(descriptors)
+
+    return data.ljust(header_pages * PAGE_WORDS * word_size, b'\0');
+
+
+def record_count(filename):
+    '''
+    record_count
+    ------------
+
+    Number of records of a ``.dm`` file read from its data dictionary.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the ``.dm`` file
+
+    Returns:
+    --------
+
+    int
+    '''
+
+    return read_header(filename)['nrecords'];
+
+
+# file types recognised by file_type, with the fields that identify them, in the order they are tested
+FILE_TYPES = [('wireframe triangles', ['TRIANGLE', 'PID1', 'PID2', 'PID3']),
+              ('wireframe points', ['PID', 'XP', 'YP', 'ZP']),
+              ('strings', ['PVALUE', 'PTN', 'XP', 'YP', 'ZP']),
+              ('block model', ['XC', 'YC', 'ZC', 'XINC', 'YINC', 'ZINC', 'XMORIG', 'YMORIG', 'ZMORIG']),
+              ('drillholes', ['BHID', 'FROM', 'TO']),
+              ('points', ['XPT', 'YPT', 'ZPT'])]
+
+
+def file_type(names):
+    '''
+    file_type
+    ---------
+
+    Type of a Datamine file recognised from its field names.
+
+    Parameters:
+    -----------
+
+    names: list of str
+        field names of the file
+
+    Returns:
+    --------
+
+    str
+        one of the types in ``FILE_TYPES`` or 'table'
+    '''
+
+    names = set(name.upper() for name in names)
+    for ftype, required in FILE_TYPES:
+        if names.issuperset(required):
+            return ftype;
+
+    return 'table';
+
+
+def field_names(header):
+    '''
+    field_names
+    -----------
+
+    Names of the fields of a data dictionary returned by ``read_header``, in file order.
+    '''
+
+    return [field['name'] for field in header['fields']];
+
+
+def is_dm(filename):
+    '''
+    is_dm
+    -----
+
+    True if ``filename`` has the ``.dm`` extension.
+    '''
+
+    return os.path.splitext(filename)[1].lower() == '.dm';
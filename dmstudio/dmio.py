@@ -0,0 +1,958 @@
+'''
+dmstudio.dmio
+=============
+
+Read Datamine ``.dm`` files directly with NumPy, without Studio. The data pages are memory mapped, so opening a file
+only reads its data dictionary and the records are read from disk as they are accessed.
+
+Single and extended precision files are supported. Implicit fields (e.g. XMORIG, NX) are not stored in the records,
+their value is the default in the data dictionary. See ``dmstudio.dmformat`` for the file layout.
+
+Usage:
+------
+
+>>> from dmstudio import dmio
+>>> df = dmio.read_dm('model.dm', columns=['XC', 'YC', 'ZC', 'AU'], retrieval='AU>2.0')
+>>> dm = dmio.dm_file('model.dm')
+>>> dm.nrecords
+12500000
+>>> au = dm.column('AU')   # only the AU words are read
+
+'''
+
+import dmstudio.dmformat
+import dmstudio.retrieval
+
+
+def record_dtype(header):
+    '''
+    record_dtype
+    ------------
+
+    NumPy structured dtype of the stored fields of a record.
+
+    Alphanumeric fields are byte strings. In extended precision files each alphanumeric word is padded from 4 to 8
+    bytes, the padding is part of the raw value and removed by ``decode_alpha``.
+
+    Parameters:
+    -----------
+
+    header: dict
+        data dictionary as returned by ``dmformat.read_header``
+
+    Returns:
+    --------
+
+    numpy.dtype
+    '''
+
+    import numpy as np
+
+    word_size = header['word_size']
+    names, formats, offsets = [], [], []
+
+    for field in header['fields']:
+        if field['position'] is None:
+            continue
+        names.append(field['name'])
+        if field['type'] == 'A':
+            formats.append('S' + str(field['words'] * word_size))
+        else:
+            formats.append('<f' + str(word_size))
+        offsets.append(field['position'] * word_size)
+
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                     'itemsize': header['record_words'] * word_size});
+
+
+def is_absent(values):
+    '''
+    is_absent
+    ---------
+
+    Mask of the absent values of a numeric field. Allows for the rounding of ``dmformat.ABSENT`` to single precision.
+    '''
+
+    import numpy as np
+
+    return np.asarray(values) <= dmstudio.dmformat.ABSENT * 0.99999;
+
+
+def decode_alpha(values, word_size=4):
+    '''
+    decode_alpha
+    ------------
+
+    Convert the raw bytes of an alphanumeric field to an array of str with trailing spaces removed.
+
+    Parameters:
+    -----------
+
+    values: numpy.ndarray
+        byte string array as read from the file
+    word_size: int
+        bytes per word of the file, 8 for extended precision
+
+    Returns:
+    --------
+
+    numpy.ndarray
+    '''
+
+    import numpy as np
+
+    values = np.ascontiguousarray(values)
+    shape = values.shape
+    words = values.itemsize // word_size
+
+    # latin-1 bytes are the unicode code points, decode by widening the bytes and drop the padding of extended words
+    codes = values.view(np.uint8).reshape(-1, words, word_size)[:, :, :dmstudio.dmformat.CHARS_PER_WORD]
+    codes = codes.reshape(-1, words * dmstudio.dmformat.CHARS_PER_WORD).astype(np.uint32)
+
+    # trailing spaces become nulls, which are not part of numpy str values
+    trailing = np.logical_and.accumulate(((codes == 32) | (codes == 0))[:, ::-1], axis=1)[:, ::-1]
+    codes[trailing] = 0
+
+    return np.ascontiguousarray(codes).view('U' + str(codes.shape[1])).reshape(shape);
+
+
+class dm_file(object):
+
+    '''
+    dm_file
+    -------
+
+    Memory mapped Datamine ``.dm`` file.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the ``.dm`` file
+    mode: str
+        memory map mode, 'r' for read only or 'r+' to modify the records in place
+
+    Object Properties:
+    ------------------
+
+    dm_file.header: dict
+        data dictionary, see ``dmformat.parse_header``
+    dm_file.fields: list of str
+        names of all fields, stored and implicit, in file order
+    dm_file.nrecords: int
+        number of records
+    dm_file.dtype: numpy.dtype
+        record dtype, see ``record_dtype``
+    dm_file.page_dtype: numpy.dtype
+        dtype of a data page holding ``records_per_page`` records
+    dm_file.pages: numpy.ndarray
+        memory mapped records of shape (number of data pages, records per page). The records after ``nrecords`` on
+        the last page are not part of the file contents.
+    '''
+
+    def __init__(self, filename, mode='r'):
+
+        import numpy as np
+
+        self.filename = filename
+        self.header = dmstudio.dmformat.read_header(filename)
+        self.fields = dmstudio.dmformat.field_names(self.header)
+        self.nrecords = self.header['nrecords']
+        self.dtype = record_dtype(self.header)
+
+        word_size = self.header['word_size']
+        page_bytes = dmstudio.dmformat.PAGE_WORDS * word_size
+        records_per_page = self.header['records_per_page']
+        npages = -(-self.nrecords // records_per_page) if records_per_page else 0
+
+        self.page_dtype = np.dtype({'names': ['records'], 'formats': [(self.dtype, records_per_page)],
+                                    'itemsize': page_bytes})
+        self._offset = self.header['header_pages'] * page_bytes
+
+        if npages:
+            self._map = np.memmap(filename, dtype=self.page_dtype, mode=mode, offset=self._offset, shape=(npages,))
+            self.pages = self._map['records']
+        else:
+            self._map = None
+            self.pages = np.zeros((0, records_per_page), dtype=self.dtype)
+
+    def __enter__(self):
+
+        return self;
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+        return False;
+
+    def __len__(self):
+
+        return self.nrecords;
+
+    def close(self):
+
+        '''
+        Release the memory map. The file stays open until arrays returned by ``records`` are deleted as well.
+        '''
+
+        import numpy as np
+
+        self._map = None
+        self.pages = np.zeros((0, self.header['records_per_page']), dtype=self.dtype)
+
+    def field(self, name):
+
+        '''
+        Data dictionary entry of a field, see ``dmformat.parse_header``.
+        '''
+
+        for field in self.header['fields']:
+            if field['name'] == name.upper():
+                return field;
+
+        raise KeyError("Field " + name + " not in " + self.filename)
+
+    @property
+    def records(self):
+
+        '''
+        Stored records as a structured array. This is a view of the memory map when the records fill the data pages
+        exactly, otherwise the records are copied into memory.
+        '''
+
+        return self.pages.reshape(-1)[:self.nrecords];
+
+    def column(self, name, absent=float('nan'), decode=True):
+
+        '''
+        Values of one field. Only the words of this field are read from disk.
+
+        Parameters:
+        -----------
+
+        name: str
+            field name
+        absent: float
+            value replacing the absent data value of numeric fields, None to keep ``dmformat.ABSENT``
+        decode: bool
+            convert alphanumeric fields to str, otherwise the raw bytes are returned
+
+        Returns:
+        --------
+
+        numpy.ndarray
+        '''
+
+        field = self.field(name)
+        raw = None if field['position'] is None else self.pages[field['name']].reshape(-1)[:self.nrecords]
+
+        return self._values(field, raw, self.nrecords, absent, decode);
+
+    def _values(self, field, raw, count, absent, decode):
+
+        import numpy as np
+
+        if raw is None:
+            if field['type'] == 'A':
+                default = field['default'] if decode else field['default'].encode('latin-1')
+                return np.full(count, default);
+            values = np.full(count, field['default'], dtype='<f' + str(self.header['word_size']))
+        else:
+            if field['type'] == 'A':
+                return decode_alpha(raw, self.header['word_size']) if decode else np.array(raw);
+            values = np.array(raw)
+
+        if absent is not None:
+            values[is_absent(values)] = absent
+
+        return values;
+
+    def _validate(self, retrieval):
+
+        if retrieval is not None:
+            dmstudio.retrieval.validate(retrieval, {field['name']: field['type'] for field in self.header['fields']})
+
+    def _columns(self, columns, implicit):
+
+        if columns is None:
+            return [field['name'] for field in self.header['fields'] if implicit or field['position'] is not None];
+
+        return [self.field(name)['name'] for name in columns];
+
+    def to_frame(self, columns=None, implicit=True, absent=float('nan'), retrieval=None, chunk_records=65536):
+
+        '''
+        Read the file into a pandas DataFrame.
+
+        Parameters:
+        -----------
+
+        columns: list of str
+            optional names of the fields to read, by default all fields
+        implicit: bool
+            include implicit fields as constant columns when ``columns`` is not given
+        absent: float
+            value replacing the absent data value of numeric fields, None to keep ``dmformat.ABSENT``
+        retrieval: str
+            optional Datamine retrieval criteria, e.g. 'AU>2.0 AND ROCK="OX"'. The criteria are evaluated per chunk
+            of pages on the fields they reference and only the selected records of ``columns`` are decoded.
+        chunk_records: int
+            number of records per chunk when a retrieval is given
+
+        Returns:
+        --------
+
+        pandas.DataFrame
+        '''
+
+        import pandas as pd
+
+        columns = self._columns(columns, implicit)
+        self._validate(retrieval)
+
+        if retrieval is None or not self.nrecords:
+            return pd.DataFrame({name: self.column(name, absent=absent) for name in columns}, columns=columns);
+
+        frames = list(self._map_chunks(chunk_records, columns, True, absent, retrieval))
+
+        return pd.concat(frames, ignore_index=True);
+
+    def iter_chunks(self, chunk_records=65536, columns=None, as_frame=True, implicit=True, absent=float('nan'),
+                    prefetch=0, retrieval=None):
+
+        '''
+        Iterate over the records in chunks of whole pages. The pages are read from the file with ordinary reads, so
+        only the chunks being processed are held in memory.
+
+        Parameters:
+        -----------
+
+        chunk_records: int
+            number of records per chunk, rounded down to whole pages
+        columns: list of str
+            optional names of the fields to read, by default all fields
+        as_frame: bool
+            yield pandas DataFrames, otherwise structured arrays of the stored fields in ``columns``
+        implicit: bool
+            include implicit fields as constant columns when ``columns`` is not given
+        absent: float
+            value replacing the absent data value of numeric fields in DataFrames
+        prefetch: int
+            number of chunks read ahead on a background thread while the current chunk is processed
+        retrieval: str
+            optional Datamine retrieval criteria, each chunk only holds the selected records
+
+        Returns:
+        --------
+
+        iterator of pandas.DataFrame or numpy.ndarray
+        '''
+
+        self._validate(retrieval)
+        chunks = self._read_chunks(chunk_records, self._columns(columns, implicit), as_frame, absent, retrieval)
+
+        if prefetch > 0:
+            return _prefetch(chunks, prefetch);
+
+        return chunks;
+
+    def _read_chunks(self, chunk_records, columns, as_frame, absent, retrieval):
+
+        import numpy as np
+
+        records_per_page = self.header['records_per_page']
+        if not self.nrecords:
+            return
+
+        pages_per_chunk = max(1, chunk_records // records_per_page)
+        remaining = self.nrecords
+
+        with open(self.filename, 'rb') as f:
+            f.seek(self._offset)
+            while remaining > 0:
+                npages = min(pages_per_chunk, -(-remaining // records_per_page))
+                pages = np.fromfile(f, dtype=self.page_dtype, count=npages)
+                count = min(remaining, npages * records_per_page)
+                remaining -= count
+                records = pages['records'].reshape(-1)[:count]
+
+                yield self._select(lambda name: records[name], count, columns, as_frame, absent, retrieval)
+
+    def _map_chunks(self, chunk_records, columns, as_frame, absent, retrieval):
+
+        # only the words of the fields that are used are copied from the memory map
+        records_per_page = self.header['records_per_page']
+        pages_per_chunk = max(1, chunk_records // records_per_page)
+
+        for first in range(0, len(self.pages), pages_per_chunk):
+            pages = self.pages[first:first + pages_per_chunk]
+            count = min(self.nrecords - first * records_per_page, pages.size)
+
+            yield self._select(lambda name: pages[name].reshape(-1)[:count], count, columns, as_frame, absent,
+                               retrieval)
+
+    def _select(self, raw, count, columns, as_frame, absent, retrieval):
+
+        '''
+        Convert a chunk of records given by ``raw(name)``, the stored words of a field, keeping only the records
+        selected by the retrieval criteria. Internal function.
+        '''
+
+        import numpy as np
+        import pandas as pd
+
+        def stored(name):
+            return self.field(name)['position'] is not None;
+
+        selected = None
+        if retrieval is not None:
+            criteria = {name: self._values(self.field(name), raw(name) if stored(name) else None, count,
+                                           float('nan'), True)
+                        for name in dmstudio.retrieval.fields(retrieval) if name in self.fields}
+            selected = dmstudio.retrieval.mask(criteria, retrieval)
+            count = int(selected.sum())
+
+        def values(name):
+            data = raw(name)
+            return data if selected is None else data[selected];
+
+        if not as_frame:
+            names = [name for name in columns if stored(name)]
+            records = np.empty(count, dtype=[(name, self.dtype[name]) for name in names])
+            for name in names:
+                records[name] = values(name)
+            return records;
+
+        return pd.DataFrame({name: self._values(self.field(name), values(name) if stored(name) else None, count,
+                                                absent, True) for name in columns}, columns=columns);
+
+
+def read_dm(filename, columns=None, implicit=True, absent=float('nan'), retrieval=None):
+    '''
+    read_dm
+    -------
+
+    Read a Datamine ``.dm`` file into a pandas DataFrame. See ``dm_file.to_frame``.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the ``.dm`` file
+    columns: list of str
+        optional names of the fields to read, by default all fields
+    implicit: bool
+        include implicit fields as constant columns
+    absent: float
+        value replacing the absent data value of numeric fields
+    retrieval: str
+        optional Datamine retrieval criteria selecting the records to read
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+    '''
+
+    with dm_file(filename) as dm:
+        return dm.to_frame(columns=columns, implicit=implicit, absent=absent, retrieval=retrieval);
+
+
+def read_parallel(filename, columns=None, workers=None, implicit=True, absent=float('nan'), min_pages=256):
+    '''
+    read_parallel
+    -------------
+
+    Read a Datamine ``.dm`` file into a pandas DataFrame with a pool of processes. The data pages are split into
+    ranges and each worker copies the fields of its pages from the file directly into one shared memory buffer, so
+    there is no pickling or concatenation of partial results. The only copy in the calling process is the
+    conversion of the buffer to the DataFrame.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the ``.dm`` file
+    columns: list of str
+        optional names of the fields to read, by default all fields
+    workers: int
+        number of processes, by default the number of CPUs
+    implicit: bool
+        include implicit fields as constant columns when ``columns`` is not given
+    absent: float
+        value replacing the absent data value of numeric fields
+    min_pages: int
+        minimum number of pages per worker, smaller files are read in the calling process
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+
+    Usage:
+    ------
+
+    >>> df = dmio.read_parallel('model.dm', columns=['XC', 'YC', 'ZC', 'AU'], workers=16)
+
+    The calling script must be protected by ``if __name__ == '__main__':`` on Windows, where the worker processes
+    import the main module.
+    '''
+
+    import os
+    import concurrent.futures
+    import multiprocessing.shared_memory
+    import numpy as np
+
+    with dm_file(filename) as dm:
+        columns = dm._columns(columns, implicit)
+        npages = len(dm.pages)
+        stored = [name for name in columns if dm.field(name)['position'] is not None]
+        dtype = np.dtype([(name, dm.dtype[name]) for name in stored])
+
+    workers = min(workers or os.cpu_count() or 1, npages // max(min_pages, 1))
+    if workers <= 1 or not stored:
+        return read_dm(filename, columns=columns, absent=absent);
+
+    step = -(-npages // workers)
+    ranges = [(first, min(first + step, npages)) for first in range(0, npages, step)]
+
+    buffer = multiprocessing.shared_memory.SharedMemory(create=True, size=max(dm.nrecords * dtype.itemsize, 1))
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(_read_pages, filename, buffer.name, stored, first, last, absent)
+                       for first, last in ranges]
+            for future in futures:
+                future.result()
+
+        return _shared_frame(dm, buffer, dtype, columns, absent);
+    finally:
+        buffer.close()
+        buffer.unlink()
+
+
+def _read_pages(filename, buffer_name, names, first, last, absent):
+
+    '''
+    Copy the fields ``names`` of the pages ``first`` to ``last`` of a file into the shared buffer of
+    ``read_parallel``. Runs in a worker process. Internal function.
+    '''
+
+    import multiprocessing.shared_memory
+
+    buffer = multiprocessing.shared_memory.SharedMemory(name=buffer_name)
+    dm = dm_file(filename)
+    try:
+        _copy_pages(dm, buffer, names, first, last, absent)
+    finally:
+        dm.close()
+        buffer.close()
+
+
+def _copy_pages(dm, buffer, names, first, last, absent):
+
+    import numpy as np
+
+    dtype = np.dtype([(name, dm.dtype[name]) for name in names])
+    records = np.ndarray(dm.nrecords, dtype=dtype, buffer=buffer.buf)
+
+    records_per_page = dm.header['records_per_page']
+    start = first * records_per_page
+    stop = min(last * records_per_page, dm.nrecords)
+    pages = dm.pages[first:last]
+
+    for name in names:
+        target = records[name][start:stop]
+        target[...] = pages[name].reshape(-1)[:stop - start]
+        if absent is not None and dm.field(name)['type'] == 'N':
+            target[is_absent(target)] = absent
+
+
+def _shared_frame(dm, buffer, dtype, columns, absent):
+
+    # the DataFrame columns are copies, no view of the shared buffer outlives this function
+    import numpy as np
+    import pandas as pd
+
+    records = np.ndarray(dm.nrecords, dtype=dtype, buffer=buffer.buf)
+    data = {}
+
+    for name in columns:
+        field = dm.field(name)
+        if field['position'] is None:
+            data[name] = dm._values(field, None, dm.nrecords, absent, True)
+        elif field['type'] == 'A':
+            data[name] = decode_alpha(records[name], dm.header['word_size'])
+        else:
+            data[name] = np.array(records[name])
+
+    return pd.DataFrame(data, columns=columns);
+
+
+def iter_dm(filename, chunk_records=65536, columns=None, as_frame=True, implicit=True, absent=float('nan'),
+            prefetch=0, retrieval=None):
+    '''
+    iter_dm
+    -------
+
+    Iterate over the records of a Datamine ``.dm`` file in chunks with bounded memory, see ``dm_file.iter_chunks``.
+
+    Usage:
+    ------
+
+    >>> total = 0.
+    >>> for chunk in dmio.iter_dm('model.dm', columns=['AU', 'DENSITY'], prefetch=2):
+    ...     total += (chunk.AU * chunk.DENSITY).sum()
+    '''
+
+    dm = dm_file(filename)
+    dm.close()
+
+    return dm.iter_chunks(chunk_records, columns, as_frame, implicit, absent, prefetch, retrieval);
+
+
+def _prefetch(iterator, depth):
+
+    '''
+    Run ``iterator`` on a background thread, keeping at most ``depth`` items ahead of the consumer. Internal
+    function.
+    '''
+
+    import queue
+    import threading
+
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def produce():
+        try:
+            for item in iterator:
+                while not stop.is_set():
+                    try:
+                        items.put((item, None), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+            items.put((done, None))
+        except Exception as e:
+            items.put((done, e))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def read_records(filename):
+    '''
+    read_records
+    ------------
+
+    Read the stored records of a Datamine ``.dm`` file as a NumPy structured array, see ``dm_file.records``.
+    '''
+
+    return dm_file(filename).records;
+
+
+def encode_alpha(values, length, word_size=4):
+    '''
+    encode_alpha
+    ------------
+
+    Convert text values to the raw bytes of an alphanumeric field, the inverse of ``decode_alpha``.
+
+    Parameters:
+    -----------
+
+    values: array like
+        text values, missing values are written as blanks
+    length: int
+        field length in characters, a multiple of 4
+    word_size: int
+        bytes per word of the file, 8 for extended precision
+
+    Returns:
+    --------
+
+    numpy.ndarray
+    '''
+
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.dtype.kind != 'U':
+        values = np.array(['' if value is None or value != value else str(value) for value in values.ravel()],
+                          dtype=str).reshape(values.shape)
+
+    if values.size and np.char.str_len(values).max() > length:
+        too_long = values[np.char.str_len(values) > length][0]
+        raise ValueError("Value '" + too_long + "' is longer than the field length of " + str(length))
+
+    values = np.char.encode(values, 'latin-1').astype('S' + str(length))
+    values = np.char.ljust(values, length).astype('S' + str(length))
+
+    if word_size != dmstudio.dmformat.CHARS_PER_WORD:
+        words = values.view('S' + str(dmstudio.dmformat.CHARS_PER_WORD)).reshape(values.shape + (-1,))
+        words = np.char.ljust(words, word_size).astype('S' + str(word_size))
+        values = np.ascontiguousarray(words).view('S' + str(words.shape[-1] * word_size)).reshape(values.shape)
+
+    return values;
+
+
+def frame_fields(df, implicit=None):
+    '''
+    frame_fields
+    ------------
+
+    Field definitions for writing a DataFrame or structured array with ``dm_writer``.
+
+    Numeric columns become numeric fields and other columns alphanumeric fields with the length of the longest value
+    rounded up to whole words. Fields in ``special.CHAR8_FIELDS`` are at least 8 characters long. Columns that are
+    constant and listed in ``implicit`` become implicit fields.
+
+    Parameters:
+    -----------
+
+    df: pandas.DataFrame or numpy structured array
+        data to write
+    implicit: list of str
+        optional names of the fields that are implicit when constant, by default ``special.IMPLICIT_FIELDS``
+
+    Returns:
+    --------
+
+    list of dict
+        see ``dmformat.build_header``
+    '''
+
+    import numpy as np
+    import dmstudio.special
+
+    if implicit is None:
+        implicit = dmstudio.special.IMPLICIT_FIELDS
+
+    implicit = [name.upper() for name in implicit]
+    columns = df.dtype.names if isinstance(df, np.ndarray) else list(df.columns)
+    fields = []
+
+    for column in columns:
+        values = np.asarray(df[column])
+        name = str(column).upper()
+
+        if values.dtype.kind in 'biuf':
+            field = {'name': name, 'type': 'N', 'length': 0}
+            if name in implicit and len(values) and (values == values[0]).all():
+                field['implicit'] = True
+                field['default'] = float(values[0])
+        else:
+            if values.dtype.kind == 'S':
+                values = np.char.decode(values, 'latin-1')
+            lengths = [len(str(value)) for value in values if value is not None and value == value]
+            length = max(lengths + [1])
+            if name in dmstudio.special.CHAR8_FIELDS:
+                length = max(length, 8)
+            field = {'name': name, 'type': 'A', 'length': -(-length // 4) * 4}
+
+        fields.append(field)
+
+    return fields;
+
+
+class dm_writer(object):
+
+    '''
+    dm_writer
+    ---------
+
+    Write a ``.dm`` file chunk by chunk. Only one page of records is kept in memory between chunks, the data
+    dictionary is completed when the writer is closed.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the ``.dm`` file
+    fields: list of dict
+        field definitions, see ``dmformat.build_header`` and ``frame_fields``
+    precision: str
+        'single' or 'extended'
+    description: str
+        file description
+
+    Usage:
+    ------
+
+    >>> with dmio.dm_writer('model.dm', dmio.frame_fields(first_chunk)) as writer:
+    ...     for chunk in chunks:
+    ...         writer.write(chunk)
+    '''
+
+    def __init__(self, filename, fields, precision='single', description=''):
+
+        import os
+        import time
+        import numpy as np
+
+        self.filename = filename
+        self.fields = fields
+        self.precision = precision
+        self.description = description
+        self.nrecords = 0
+
+        self._name = os.path.splitext(os.path.basename(filename))[0][:8]
+        self._date = float(time.strftime('%y%m%d'))
+        self.header = dmstudio.dmformat.parse_header(self._header_bytes())
+        self.dtype = record_dtype(self.header)
+
+        page_bytes = dmstudio.dmformat.PAGE_WORDS * self.header['word_size']
+        self._page_dtype = np.dtype({'names': ['records'],
+                                     'formats': [(self.dtype, self.header['records_per_page'])],
+                                     'itemsize': page_bytes})
+        self._pending = np.zeros(0, dtype=self.dtype)
+
+        self._file = open(filename, 'wb')
+        self._file.write(self._header_bytes())
+
+    def _header_bytes(self):
+
+        return dmstudio.dmformat.build_header(self.fields, self.precision, self.nrecords, self._name,
+                                              self.description, self._date);
+
+    def __enter__(self):
+
+        return self;
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+        return False;
+
+    def records(self, data):
+
+        '''
+        Convert a DataFrame or structured array to records of the file, numeric NaN values become absent values.
+        '''
+
+        import numpy as np
+
+        columns = data.dtype.names if isinstance(data, np.ndarray) else list(data.columns)
+        columns = {str(column).upper(): column for column in columns}
+        records = np.zeros(len(data), dtype=self.dtype)
+        word_size = self.header['word_size']
+
+        for field in self.header['fields']:
+            if field['position'] is None:
+                continue
+            if field['name'] not in columns:
+                raise KeyError("Field " + field['name'] + " not in data")
+
+            values = np.asarray(data[columns[field['name']]])
+            if field['type'] == 'A':
+                if values.dtype.kind == 'S':
+                    values = np.char.decode(values, 'latin-1')
+                records[field['name']] = encode_alpha(values, field['length'], word_size)
+            else:
+                values = values.astype('f' + str(word_size))
+                values[np.isnan(values)] = dmstudio.dmformat.ABSENT
+                records[field['name']] = values
+
+        return records;
+
+    def _write_pages(self, records):
+
+        import numpy as np
+
+        records_per_page = self.header['records_per_page']
+        npages = -(-len(records) // records_per_page)
+        full = len(records) // records_per_page
+
+        # the records of a page are followed by unused words, fill whole pages and the last partial page separately
+        pages = np.zeros(npages, dtype=self._page_dtype)
+        pages['records'][:full] = records[:full * records_per_page].reshape(full, records_per_page)
+        if full < npages:
+            pages['records'][full, :len(records) - full * records_per_page] = records[full * records_per_page:]
+        self._file.write(pages.tobytes())
+
+    def write(self, data):
+
+        '''
+        Append a chunk of records.
+
+        Parameters:
+        -----------
+
+        data: pandas.DataFrame or numpy structured array
+            records with a column for each stored field
+        '''
+
+        import numpy as np
+
+        records = np.concatenate([self._pending, self.records(data)])
+        full = len(records) - len(records) % self.header['records_per_page']
+
+        self._write_pages(records[:full])
+        self._pending = records[full:]
+        self.nrecords += len(data)
+
+    def close(self):
+
+        '''
+        Write the last page and complete the data dictionary.
+        '''
+
+        if self._file is None:
+            return
+
+        if len(self._pending):
+            self._write_pages(self._pending)
+            self._pending = self._pending[:0]
+
+        self._file.seek(0)
+        self._file.write(self._header_bytes())
+        self._file.close()
+        self._file = None
+
+
+def write_dm(filename, data, fields=None, precision='single', chunk_records=1 << 20, description=''):
+    '''
+    write_dm
+    --------
+
+    Write a DataFrame or structured array to a ``.dm`` file.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the ``.dm`` file
+    data: pandas.DataFrame or numpy structured array
+        records to write
+    fields: list of dict
+        optional field definitions, by default ``frame_fields(data)``
+    precision: str
+        'single' or 'extended'
+    chunk_records: int
+        number of records converted at a time, limits the memory used for the conversion
+    description: str
+        file description
+    '''
+
+    if fields is None:
+        fields = frame_fields(data)
+
+    with dm_writer(filename, fields, precision, description) as writer:
+        for start in range(0, len(data), chunk_records):
+            writer.write(data[start:start + chunk_records])
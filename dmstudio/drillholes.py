@@ -0,0 +1,558 @@
+'''
+dmstudio.drillholes
+===================
+
+Drillhole processing without Studio. The functions work on whole drillhole tables at once: the holes are
+identified by integer codes and every step is a vectorised operation over all holes, so the run time does not
+depend on the number of holes.
+
+The tables are DataFrames or ``.dm`` file names and use the Datamine field conventions (BHID, XCOLLAR, YCOLLAR,
+ZCOLLAR, FROM, TO, AT, BRG, DIP). Field names can be changed with the ``*_f`` arguments, as in the commands of
+``dmcommands.init``.
+
+Usage:
+------
+
+>>> from dmstudio import drillholes
+>>> holes = drillholes.desurvey('assays', surveys='surveys', collars='collars')
+>>> holes[['BHID', 'FROM', 'TO', 'X', 'Y', 'Z']]
+
+'''
+
+import os
+
+import dmstudio.dmio
+
+# fields of a desurveyed drillhole file, in output order
+DESURVEY_FIELDS = ['BHID', 'FROM', 'TO', 'LENGTH', 'X', 'Y', 'Z', 'A0', 'B0']
+
+# end point fields written with endpoint_p=1
+ENDPOINT_FIELDS = ['XSTART', 'YSTART', 'ZSTART', 'XEND', 'YEND', 'ZEND']
+
+# desurveying methods
+METHODS = ['mincurv', 'tangent']
+
+
+def _table(data):
+
+    # DataFrame of a table given as a DataFrame or a .dm file name
+    if isinstance(data, str):
+        return dmstudio.dmio.read_dm(data if os.path.splitext(data)[1] else data + '.dm');
+
+    return data;
+
+
+def _directions(brg, dip):
+
+    # unit vectors (east, north, up) of bearings and dips in degrees, dips positive downwards
+    import numpy as np
+
+    brg = np.radians(brg)
+    dip = np.radians(dip)
+
+    return np.column_stack([np.cos(dip) * np.sin(brg), np.cos(dip) * np.cos(brg), -np.sin(dip)]);
+
+
+def _ratio(beta):
+
+    # ratio factor of minimum curvature, 2 / beta * tan(beta / 2), 1 for straight segments
+    import numpy as np
+
+    small = beta < 1e-7
+    safe = np.where(small, 1., beta)
+
+    return np.where(small, 1., 2. / safe * np.tan(safe / 2.));
+
+
+def _slerp(t1, t2, beta, f):
+
+    # direction at fraction f of the arc between unit vectors t1 and t2, beta being the angle between them
+    import numpy as np
+
+    small = beta < 1e-7
+    safe = np.where(small, 1., beta)
+    w1 = np.where(small, 1. - f, np.sin((1. - f) * safe) / np.sin(safe))[:, None]
+    w2 = np.where(small, f, np.sin(f * safe) / np.sin(safe))[:, None]
+    t = w1 * t1 + w2 * t2
+
+    return t / np.linalg.norm(t, axis=1)[:, None];
+
+
+class _stations(object):
+
+    '''
+    Survey stations of all holes sorted on hole code and depth, with their coordinates. Every hole has a station at
+    depth 0, holes without surveys are vertical.
+    '''
+
+    def __init__(self, codes, at, brg, dip, collars, method, depth):
+
+        import numpy as np
+
+        nholes = len(collars)
+        order = np.lexsort((at, codes))
+        codes, at, brg, dip = codes[order], at[order], brg[order], dip[order]
+
+        # a station at the collar for holes whose surveys start below it or which have no surveys
+        first = np.full(nholes, -1)
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.zeros(0, int)
+        first[codes[starts]] = starts
+        missing = np.flatnonzero(first < 0)
+        below = starts[at[starts] > 0]
+
+        codes = np.r_[codes, missing, codes[below]]
+        at = np.r_[at, np.zeros(len(missing)), np.zeros(len(below))]
+        brg = np.r_[brg, np.zeros(len(missing)), brg[below]]
+        dip = np.r_[dip, np.full(len(missing), 90.), dip[below]]
+
+        order = np.lexsort((at, codes))
+        self.codes, self.at = codes[order], at[order]
+        self.directions = _directions(brg[order], dip[order])
+        self.method = method
+
+        # segments between consecutive stations of a hole
+        n = len(self.codes)
+        self.next_valid = np.r_[self.codes[1:] == self.codes[:-1], False]
+        nxt = np.minimum(np.arange(n) + 1, n - 1)
+        self.md = np.where(self.next_valid, self.at[nxt] - self.at, 0.)
+        self.beta = np.arccos(np.clip(np.einsum('ij,ij->i', self.directions, self.directions[nxt]), -1., 1.))
+
+        if method == 'mincurv':
+            delta = (self.md * _ratio(self.beta) / 2.)[:, None] * (self.directions + self.directions[nxt])
+        else:
+            delta = self.md[:, None] * self.directions
+        delta[~self.next_valid] = 0.
+
+        # coordinates of the stations, cumulative sums of the segments restarted at every collar
+        total = np.vstack([np.zeros((1, 3)), np.cumsum(delta, axis=0)])
+        hole_start = np.flatnonzero(np.r_[True, self.codes[1:] != self.codes[:-1]])
+        start_of = np.repeat(hole_start, np.diff(np.r_[hole_start, n]))
+        self.positions = collars[self.codes] + total[:n] - total[start_of]
+
+        # stations and depths are searched by a single sorted key, the hole code times a span longer than any hole
+        self.span = max(float(np.max(self.at, initial=0.)), depth) + 1.
+        self.keys = self.codes * self.span + self.at
+
+    def key(self, codes, depths):
+
+        import numpy as np
+
+        return codes * self.span + np.clip(depths, 0., None);
+
+    def inside(self, codes, top, bottom):
+
+        '''
+        Number of stations strictly between depths ``top`` and ``bottom`` of each hole.
+        '''
+
+        import numpy as np
+
+        low = self.key(codes, top)
+        high = self.key(codes, bottom)
+
+        return np.searchsorted(self.keys, high, 'left') - np.searchsorted(self.keys, low, 'right');
+
+    def locate(self, codes, depths):
+
+        '''
+        Coordinates and unit direction vectors at downhole depths.
+        '''
+
+        import numpy as np
+
+        i = np.searchsorted(self.keys, self.key(codes, depths), 'right') - 1
+        depths = np.clip(depths, 0., None)
+        part = depths - self.at[i]
+        t1 = self.directions[i]
+
+        # below the last station the hole continues straight
+        valid = self.next_valid[i] & (self.md[i] > 0)
+        f = np.where(valid, part / np.where(valid, self.md[i], 1.), 0.)
+        t2 = self.directions[np.minimum(i + 1, len(self.codes) - 1)]
+
+        if self.method == 'mincurv':
+            beta = np.where(valid, self.beta[i], 0.)
+            direction = _slerp(t1, np.where(valid[:, None], t2, t1), beta, f)
+            delta = (part * _ratio(f * beta) / 2.)[:, None] * (t1 + direction)
+        else:
+            direction = t1
+            delta = part[:, None] * t1
+
+        return self.positions[i] + delta, direction;
+
+
+def _split(codes, top, bottom, rows, stations):
+
+    # halve samples that contain more than one survey station until none does (SURVSMTH=1)
+    import numpy as np
+
+    while True:
+        split = stations.inside(codes, top, bottom) > 1
+        if not split.any():
+            break
+        repeat = np.where(split, 2, 1)
+        index = np.repeat(np.arange(len(split)), repeat)
+        second = np.r_[False, index[1:] == index[:-1]]
+        first = split[index] & ~second
+        middle = ((top + bottom) / 2.)[index]
+        codes, rows, top, bottom = codes[index], rows[index], top[index], bottom[index]
+        top = np.where(second, middle, top)
+        bottom = np.where(first, middle, bottom)
+
+    return codes, top, bottom, rows;
+
+
+def desurvey(samples, surveys=None, collars=None, bhid_f='BHID', xcollar_f='XCOLLAR', ycollar_f='YCOLLAR',
+             zcollar_f='ZCOLLAR', from_f='FROM', to_f='TO', at_f='AT', brg_f='BRG', dip_f='DIP', method='mincurv',
+             survsmth_p=1, endpoint_p=0, dipmeth_p=1):
+    '''
+    desurvey
+    --------
+
+    Native equivalent of DESURV and HOLES3D. Computes the coordinates of the midpoint (and optionally the end
+    points) of every sample from the collar coordinates and the downhole surveys.
+
+    Holes are desurveyed by minimum curvature, the hole being a circular arc between survey stations, or by the
+    tangent method, the hole following the direction of the survey above. A hole continues straight below its last
+    survey. Holes without surveys are vertical and surveys starting below the collar are extended up to it.
+
+    Parameters:
+    -----------
+
+    samples: pandas.DataFrame or str
+        samples with fields BHID, FROM and TO, sorted on BHID and FROM. Holds the collar fields XCOLLAR, YCOLLAR
+        and ZCOLLAR when ``collars`` is not given, as the IN1 file of DESURV.
+    surveys: pandas.DataFrame or str
+        surveys with fields BHID, AT, BRG and DIP, in degrees
+    collars: pandas.DataFrame or str
+        collars with fields BHID, XCOLLAR, YCOLLAR and ZCOLLAR
+    bhid_f, xcollar_f, ycollar_f, zcollar_f, from_f, to_f, at_f, brg_f, dip_f: str
+        field names
+    method: str
+        'mincurv' or 'tangent'
+    survsmth_p: int
+        1 to split samples which contain more than one survey station, as SURVSMTH of DESURV
+    endpoint_p: int
+        1 to add the fields XSTART, YSTART, ZSTART, XEND, YEND and ZEND, as ENDPOINT of HOLES3D
+    dipmeth_p: int
+        1 if positive dips point downwards, -1 if they point upwards
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+        fields BHID, FROM, TO, LENGTH, X, Y, Z, A0 (bearing) and B0 (dip, with the sign convention of
+        ``dipmeth_p``) of every sample followed by the other fields of the samples. Samples of holes without a
+        collar have absent coordinates.
+
+    Usage:
+    ------
+
+    >>> holes = drillholes.desurvey(assays, surveys, collars, endpoint_p=1)
+    '''
+
+    import numpy as np
+    import pandas as pd
+
+    if method not in METHODS:
+        raise ValueError("Unknown desurvey method " + str(method) + ", expected one of " + ", ".join(METHODS))
+
+    samples = _table(samples)
+    surveys = _table(surveys)
+    collars = _table(collars) if collars is not None else samples.drop_duplicates(bhid_f)
+
+    # integer codes of the holes, shared by the three tables
+    ids = [collars[bhid_f], samples[bhid_f]] + ([surveys[bhid_f]] if surveys is not None else [])
+    codes, names = pd.factorize(pd.concat(ids, ignore_index=True))
+    collar_codes = codes[:len(collars)]
+    sample_codes = codes[len(collars):len(collars) + len(samples)]
+
+    xyz = np.full((len(names), 3), np.nan)
+    xyz[collar_codes] = collars[[xcollar_f, ycollar_f, zcollar_f]].to_numpy(float)
+
+    if surveys is not None:
+        survey_codes = codes[len(collars) + len(samples):]
+        at = surveys[at_f].to_numpy(float)
+        brg = surveys[brg_f].to_numpy(float)
+        dip = surveys[dip_f].to_numpy(float) * dipmeth_p
+        keep = ~(np.isnan(at) | np.isnan(brg) | np.isnan(dip))
+        survey_codes, at, brg, dip = survey_codes[keep], at[keep], brg[keep], dip[keep]
+    else:
+        survey_codes, at, brg, dip = np.zeros(0, int), np.zeros(0), np.zeros(0), np.zeros(0)
+
+    top = samples[from_f].to_numpy(float)
+    bottom = samples[to_f].to_numpy(float)
+    stations = _stations(survey_codes, at, brg, dip, xyz, method, float(np.nanmax(bottom, initial=0.)))
+
+    rows = np.arange(len(samples))
+    if survsmth_p:
+        sample_codes, top, bottom, rows = _split(sample_codes, top, bottom, rows, stations)
+
+    start, start_direction = stations.locate(sample_codes, top)
+    end, end_direction = stations.locate(sample_codes, bottom)
+    middle, direction = stations.locate(sample_codes, (top + bottom) / 2.)
+
+    # the sample is a straight line, its orientation is that of the chord unless it has no length
+    chord = end - start
+    norm = np.linalg.norm(chord, axis=1)
+    direction = np.where((norm > 0)[:, None], chord / np.where(norm > 0, norm, 1.)[:, None], direction)
+
+    out = pd.DataFrame({'BHID': samples[bhid_f].to_numpy()[rows],
+                        'FROM': top,
+                        'TO': bottom,
+                        'LENGTH': bottom - top,
+                        'X': middle[:, 0],
+                        'Y': middle[:, 1],
+                        'Z': middle[:, 2],
+                        'A0': np.degrees(np.arctan2(direction[:, 0], direction[:, 1])) % 360.,
+                        'B0': np.degrees(np.arcsin(np.clip(-direction[:, 2], -1., 1.))) * dipmeth_p})
+
+    used = set([bhid_f, from_f, to_f] + DESURVEY_FIELDS)
+    for column in samples.columns:
+        if column not in used:
+            out[column] = samples[column].to_numpy()[rows]
+
+    if endpoint_p:
+        for i, field in enumerate(ENDPOINT_FIELDS):
+            out[field] = (start if i < 3 else end)[:, i % 3]
+
+    return out;
+
+
+# fields of a composite file before the composited fields
+COMPOSITE_FIELDS = ['BHID', 'FROM', 'TO', 'LENGTH']
+
+
+class _profile(object):
+
+    '''
+    Cumulative sums of downhole rates over sorted, non-overlapping samples. ``integral`` gives the integral of each
+    rate between two depths of a hole, so the overlap of any interval with the samples needs no loop over samples.
+    '''
+
+    def __init__(self, codes, top, bottom, rates, span):
+
+        import numpy as np
+
+        self.span = span
+        self.keys = codes * span + top
+        self.top = top
+        self.length = bottom - top
+        self.rates = rates
+        self.total = np.vstack([np.zeros((1, rates.shape[1])), np.cumsum(rates * self.length[:, None], axis=0)])
+
+    def at(self, codes, depths):
+
+        import numpy as np
+
+        i = np.searchsorted(self.keys, codes * self.span + depths, 'right') - 1
+        inside = np.clip(depths - self.top[i], 0., self.length[i])
+
+        return self.total[i] + self.rates[i] * inside[:, None];
+
+    def integral(self, codes, top, bottom):
+
+        return self.at(codes, bottom) - self.at(codes, top);
+
+
+def _intervals(run_codes, run_top, run_bottom, origin, interval, mode):
+
+    # composite intervals of every run, MODE 0 on a fixed grid from the origin, MODE 1 of equal length
+    import numpy as np
+
+    length = run_bottom - run_top
+    if mode == 1:
+        count = np.where(length > 0, np.maximum(np.round(length / interval), 1), 0).astype(int)
+        step = np.where(count > 0, length / np.maximum(count, 1), 0.)
+        origin = run_top
+    else:
+        count = np.where(length > 0, np.ceil((run_bottom - origin) / interval - 1e-9), 0).astype(int)
+        step = np.full(len(length), float(interval))
+
+    run = np.repeat(np.arange(len(count)), count)
+    k = np.arange(len(run)) - np.repeat(np.cumsum(count) - count, count)
+    top = np.maximum(origin[run] + k * step[run], run_top[run])
+    bottom = np.minimum(origin[run] + (k + 1) * step[run], run_bottom[run])
+
+    return run, run_codes[run], top, bottom;
+
+
+def composite(samples, interval_p, bhid_f='BHID', from_f='FROM', to_f='TO', density_f='DENSITY',
+              coreloss_f='CORELOSS', corerec_f='COREREC', zone_f=None, mingap_p=None, maxgap_p=0, mincomp_p=None,
+              loss_p=0, start_p=0, mode_p=0, fields=None):
+    '''
+    composite
+    ---------
+
+    Native equivalent of COMPDH. Composites the samples of all holes at once to fixed downhole intervals, for one
+    or several interval lengths.
+
+    The composite grades are length weighted averages, or density weighted if the samples have the density field.
+    Absent values are left out of the average of their field. The overlap of each composite with the samples is
+    computed from cumulative sums of the samples, sorted on hole and depth, so there is no loop over samples or
+    holes and the sorting is shared by all interval lengths.
+
+    A new composite is started at the top of every hole, each time the zone changes and after gaps longer than
+    ``maxgap_p``. Gaps up to ``mingap_p`` are ignored, longer gaps count as missing samples.
+
+    Parameters:
+    -----------
+
+    samples: pandas.DataFrame or str
+        samples with fields BHID, FROM and TO
+    interval_p: float or list of float
+        composite length, or several lengths composited in one pass
+    bhid_f, from_f, to_f: str
+        field names
+    density_f: str
+        density field, composites are density weighted if the samples have this field
+    coreloss_f, corerec_f: str
+        percentage core loss or core recovery field, used if the samples have it, see ``loss_p``
+    zone_f: str
+        field whose changes start a new composite, copied to the composites
+    mingap_p: float
+        gaps up to this length are ignored, by default 0.05 interval
+    maxgap_p: float
+        gaps longer than this end the composite, 0 to never end a composite at a gap
+    mincomp_p: float
+        composites with less sampled length are rejected (MODE 0 only), by default 0.5 interval
+    loss_p: int
+        core loss treatment: <=0 loss is part of the sample, 1 loss has absent values, >=2 loss is a cavity of
+        zero density and grades
+    start_p: float
+        downhole distance of the first composite
+    mode_p: int
+        0 for composites of length ``interval_p``, 1 to adjust the length per run of samples so that every
+        sample is included in a composite
+    fields: list of str
+        numeric fields to composite, by default all numeric fields. Other fields take the value of the sample at
+        the middle of the composite.
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+        fields BHID, FROM, TO, LENGTH, the zone field and the composited fields. A dict of interval length to
+        DataFrame if ``interval_p`` is a list.
+
+    Usage:
+    ------
+
+    >>> comps = drillholes.composite('holes', 2.0, zone_f='DOMAIN')
+    >>> sensitivity = drillholes.composite(holes, [1.0, 2.0, 3.0, 5.0])
+    '''
+
+    import numpy as np
+    import pandas as pd
+
+    samples = _table(samples)
+    intervals = list(interval_p) if isinstance(interval_p, (list, tuple)) else [interval_p]
+    for interval in intervals:
+        if not interval > 0:
+            raise ValueError("Composite interval must be positive, not " + str(interval))
+
+    # sort on hole and depth, hole codes in order of first appearance
+    codes = pd.factorize(samples[bhid_f])[0]
+    top = samples[from_f].to_numpy(float)
+    order = np.lexsort((top, codes))
+    codes, top = codes[order], top[order]
+    bottom = samples[to_f].to_numpy(float)[order]
+    table = samples.iloc[order].reset_index(drop=True)
+
+    keys = [bhid_f, from_f, to_f] + ([zone_f] if zone_f else [])
+    if fields is None:
+        fields = [column for column in table.columns
+                  if column not in keys and pd.api.types.is_numeric_dtype(table[column])]
+    others = [column for column in table.columns if column not in keys and column not in fields]
+    values = table[fields].to_numpy(float) if fields else np.zeros((len(table), 0))
+
+    # weights per unit length, reduced by core loss
+    recovered = np.ones(len(table))
+    if coreloss_f in table.columns:
+        recovered = 1. - np.nan_to_num(table[coreloss_f].to_numpy(float)) / 100.
+    elif corerec_f in table.columns:
+        recovered = np.nan_to_num(table[corerec_f].to_numpy(float), nan=100.) / 100.
+    recovered = np.clip(recovered, 0., 1.) if loss_p >= 1 else np.ones(len(table))
+
+    density = table[density_f].to_numpy(float) if density_f in table.columns else None
+    weight = recovered if density is None else np.nan_to_num(density) * recovered
+    if density is not None and density_f in fields:
+        # the density itself is length weighted, over the cavity as well when the loss is a cavity
+        column = fields.index(density_f)
+    else:
+        column = None
+
+    present = ~np.isnan(values)
+    numerators = np.where(present, values, 0.) * weight[:, None]
+    denominators = present * weight[:, None]
+    if column is not None:
+        numerators[:, column] = np.nan_to_num(density) * recovered
+        denominators[:, column] = present[:, column] * (recovered if loss_p == 1 else 1.)
+
+    # runs of samples composited together: new hole, zone change or gap longer than MAXGAP
+    gap = top - np.r_[np.nan, bottom[:-1]]
+    new = np.r_[True, codes[1:] != codes[:-1]]
+    breaks = new.copy()
+    if zone_f:
+        zone = table[zone_f].to_numpy()
+        breaks[1:] |= zone[1:] != zone[:-1]
+    if maxgap_p and maxgap_p > 0:
+        breaks[1:] |= gap[1:] > maxgap_p
+
+    starts = np.flatnonzero(breaks)
+    ends = np.r_[starts[1:], len(table)] - 1
+    run_codes = codes[starts]
+    run_top = np.maximum(top[starts], start_p)
+    run_bottom = np.maximum(bottom[ends], run_top)
+
+    span = float(np.nanmax(np.r_[bottom, top, start_p + 0.])) + 1.
+    rates = np.column_stack([numerators, denominators])
+    profile = _profile(codes, top, bottom, rates, span)
+
+    results = {}
+    for interval in intervals:
+        mingap = mingap_p if mingap_p is not None and mingap_p > 0 else 0.05 * interval
+        mincomp = mincomp_p if mincomp_p is not None else 0.5 * interval
+
+        # sampled length, including the ignored gaps after each sample
+        following = np.r_[gap[1:], np.nan]
+        covered_bottom = np.where(~np.r_[breaks[1:], True] & (following <= mingap), bottom + np.nan_to_num(following),
+                                  bottom)
+        coverage = _profile(codes, top, covered_bottom, (recovered if loss_p == 1 else np.ones(len(table)))[:, None],
+                            span)
+
+        # the first run of a hole is on the grid from START, later runs start their own grid
+        origin = np.where(new[starts], start_p + np.floor((run_top - start_p) / interval) * interval, run_top)
+        run, comp_codes, comp_top, comp_bottom = _intervals(run_codes, run_top, run_bottom, origin, interval, mode_p)
+
+        sums = profile.integral(comp_codes, comp_top, comp_bottom)
+        sampled = coverage.integral(comp_codes, comp_top, comp_bottom)[:, 0]
+        keep = comp_bottom > comp_top
+        if mode_p != 1:
+            keep &= sampled >= mincomp - 1e-9
+
+        run, comp_codes, comp_top, comp_bottom, sums = run[keep], comp_codes[keep], comp_top[keep], \
+            comp_bottom[keep], sums[keep]
+        nfields = len(fields)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            grades = np.where(sums[:, nfields:] > 0, sums[:, :nfields] / sums[:, nfields:], np.nan)
+
+        first = starts[run]
+        out = pd.DataFrame({'BHID': table[bhid_f].to_numpy()[first],
+                            'FROM': comp_top,
+                            'TO': comp_bottom,
+                            'LENGTH': comp_bottom - comp_top})
+        if zone_f:
+            out[zone_f] = table[zone_f].to_numpy()[first]
+        for i, field in enumerate(fields):
+            if field not in out.columns:
+                out[field] = grades[:, i]
+        if others:
+            middle = np.searchsorted(profile.keys, comp_codes * span + (comp_top + comp_bottom) / 2., 'right') - 1
+            for field in others:
+                if field not in out.columns:
+                    out[field] = table[field].to_numpy()[np.maximum(middle, first)]
+
+        results[interval] = out
+
+    return results if isinstance(interval_p, (list, tuple)) else results[interval_p];
@@ -0,0 +1,834 @@
+'''
+dmstudio.estimation
+===================
+
+Block model grade estimation without Studio, as a native alternative to ESTIMA. The estimation is controlled by the
+same parameter tables: SRCPARM search volumes, ESTPARM estimation records and VMODPARM variogram models.
+
+For every estimation record the samples are transformed into the frame of the search ellipsoid and put in a
+KD-tree, so that the search of each block is a nearest neighbour query. The neighbours of a whole chunk of blocks
+are selected at once (dynamic search volumes, octants, MAXKEY) and their kriging systems are solved by a single
+batched LAPACK call. Chunks of blocks are estimated by a pool of processes.
+
+Supported estimation methods are nearest neighbour (IMETHOD=1), inverse power of distance (2), ordinary kriging (3)
+and simple kriging (4). ``indicator_estimate`` estimates the distribution of a grade at many cutoffs by multiple
+indicator kriging, for MIKSCELL. Requires ``scipy`` for the KD-tree.
+
+Usage:
+------
+
+>>> from dmstudio import estimation
+>>> model = estimation.estimate('proto', 'comps', 'srcparm', 'estparm', 'vmodparm', zone1_f='DOMAIN',
+...                             xpoints_p=4, ypoints_p=4, zpoints_p=2)
+>>> dmio.write_dm('model.dm', model)
+
+'''
+
+import os
+
+import dmstudio.dmformat
+import dmstudio.drillholes
+import dmstudio.variogram
+
+# estimation methods of the IMETHOD field of ESTPARM
+METHODS = {1: 'nearest neighbour', 2: 'inverse power of distance', 3: 'ordinary kriging', 4: 'simple kriging'}
+
+# dynamic search volumes of a SRCPARM record
+SEARCH_VOLUMES = 3
+
+# state of a worker process, set by _init_worker
+_state = {}
+
+
+def _value(record, name, default=None):
+
+    # field of a parameter record, default if the field is missing or absent; text is stripped
+    value = record.get(name, default)
+    if value is None or (isinstance(value, float) and value != value):
+        return default;
+    if isinstance(value, str):
+        value = value.strip()
+        return value if value else default;
+
+    return value;
+
+
+class search_volume(object):
+
+    '''
+    search_volume
+    -------------
+
+    Search volume of a SRCPARM record.
+
+    Parameters:
+    -----------
+
+    record: dict
+        SRCPARM record with the fields SMETHOD, SDIST1-3, SANGLE1-3, SAXIS1-3, MINNUM1-3, MAXNUM1-3, SVOLFAC2-3,
+        OCTMETH, MINOCT, MINPEROC, MAXPEROC and MAXKEY
+
+    Object Properties:
+    ------------------
+
+    search_volume.matrix: numpy.ndarray
+        matrix transforming coordinates to the search frame, in which the first search volume is the unit sphere
+        (SMETHOD=2) or cube (SMETHOD=1)
+    search_volume.volumes: list of tuple
+        (factor, minimum, maximum number of samples) of each dynamic search volume
+    '''
+
+    def __init__(self, record):
+
+        import numpy as np
+
+        self.shape = int(_value(record, 'SMETHOD', 2))
+        self.distances = [float(_value(record, 'SDIST' + str(n), 0.)) for n in (1, 2, 3)]
+        if not all(distance > 0 for distance in self.distances):
+            raise ValueError("Search volume distances SDIST1-3 must be positive")
+
+        frame = dmstudio.variogram.rotation([_value(record, 'SANGLE' + str(n), 0.) for n in (1, 2, 3)],
+                                            [_value(record, 'SAXIS' + str(n), axis) for n, axis in
+                                             zip((1, 2, 3), (3, 1, 3))])
+        self.matrix = np.diag(1. / np.array(self.distances)) @ frame
+
+        self.volumes = [(1., int(_value(record, 'MINNUM1', 1)), int(_value(record, 'MAXNUM1', 20)))]
+        for n in range(2, SEARCH_VOLUMES + 1):
+            factor = float(_value(record, 'SVOLFAC' + str(n), 0.))
+            if factor > 0:
+                self.volumes.append((factor, int(_value(record, 'MINNUM' + str(n), 1)),
+                                     int(_value(record, 'MAXNUM' + str(n), 20))))
+
+        self.octants = int(_value(record, 'OCTMETH', 0)) == 1
+        self.minoct = int(_value(record, 'MINOCT', 0))
+        self.minperoc = int(_value(record, 'MINPEROC', 0))
+        self.maxperoc = int(_value(record, 'MAXPEROC', 0))
+        self.maxkey = int(_value(record, 'MAXKEY', 0))
+
+    def candidates(self):
+
+        '''
+        Number of nearest samples from which the neighbours of a block are selected.
+        '''
+
+        count = max(maximum for factor, minimum, maximum in self.volumes)
+        if self.octants or self.maxkey:
+            count *= 4
+
+        return count;
+
+
+def read_search_volumes(srcparm):
+    '''
+    read_search_volumes
+    -------------------
+
+    Search volumes of a SRCPARM table.
+
+    Returns:
+    --------
+
+    dict
+        SREFNUM to ``search_volume``
+    '''
+
+    table = dmstudio.drillholes._table(srcparm)
+
+    return {int(_value(record, 'SREFNUM', 1)): search_volume(record) for record in table.to_dict('records')};
+
+
+def _rank(groups, selected):
+
+    # rank of every selected entry among the selected entries of the same group before it in its row
+    import numpy as np
+
+    groups = np.where(selected, groups, -1)
+    order = np.argsort(groups, axis=1, kind='stable')
+    ordered = np.take_along_axis(groups, order, axis=1)
+    position = np.broadcast_to(np.arange(groups.shape[1]), groups.shape)
+    new = np.ones(groups.shape, bool)
+    new[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    rank = np.empty(groups.shape, int)
+    np.put_along_axis(rank, order, position - np.maximum.accumulate(np.where(new, position, 0), axis=1), axis=1)
+
+    return rank;
+
+
+def neighbours(search, tree, reduced, keys, centres):
+    '''
+    neighbours
+    ----------
+
+    Samples used for the estimation of each block, selected with the rules of a search volume. The search volumes
+    are tried in order until one has enough samples (and filled octants).
+
+    Parameters:
+    -----------
+
+    search: search_volume
+    tree: scipy.spatial.cKDTree
+        tree of the sample coordinates in the search frame
+    reduced: numpy.ndarray
+        sample coordinates in the search frame
+    keys: numpy.ndarray
+        integer key of every sample for MAXKEY, or None
+    centres: numpy.ndarray
+        block centres, shape (n, 3)
+
+    Returns:
+    --------
+
+    tuple of numpy.ndarray
+        sample indices of shape (n, m) sorted on distance in the search frame with -1 for unused entries, and the
+        number of the search volume used per block (0 if the block is not estimated)
+    '''
+
+    import numpy as np
+
+    nblocks = len(centres)
+    k = min(search.candidates(), len(reduced))
+    if k == 0 or nblocks == 0:
+        return np.full((nblocks, 0), -1), np.zeros(nblocks, int);
+
+    u = centres @ search.matrix.T
+    largest = max(factor for factor, minimum, maximum in search.volumes)
+    distance, index = tree.query(u, k=k, distance_upper_bound=largest * (1. + 1e-9),
+                                 p=np.inf if search.shape == 1 else 2)
+    distance, index = distance.reshape(nblocks, k), index.reshape(nblocks, k)
+    found = index < len(reduced)
+    index = np.where(found, index, 0)
+
+    if search.octants:
+        offset = reduced[index] - u[:, None, :]
+        octant = (offset[..., 0] > 0) * 1 + (offset[..., 1] > 0) * 2 + (offset[..., 2] > 0) * 4
+
+    volume = np.zeros(nblocks, int)
+    selection = np.zeros((nblocks, k), bool)
+    for v, (factor, minimum, maximum) in enumerate(search.volumes):
+        selected = found & (distance <= factor * (1. + 1e-9))
+        if keys is not None and search.maxkey > 0:
+            selected &= _rank(keys[index], selected) < search.maxkey
+        if search.octants and search.maxperoc > 0:
+            selected &= _rank(octant, selected) < search.maxperoc
+        selected &= np.cumsum(selected, axis=1) <= maximum
+
+        enough = selected.sum(axis=1) >= max(minimum, 1)
+        if search.octants and search.minoct > 0:
+            filled = np.zeros(nblocks, int)
+            for o in range(8):
+                filled += ((octant == o) & selected).sum(axis=1) >= max(search.minperoc, 1)
+            enough &= filled >= search.minoct
+
+        use = enough & (volume == 0)
+        volume[use] = v + 1
+        selection[use] = selected[use]
+
+    # selected samples first, in order of distance
+    order = np.argsort(~selection, axis=1, kind='stable')
+    width = int(selection.sum(axis=1).max(initial=0))
+    index = np.take_along_axis(np.where(selection, index, -1), order, axis=1)[:, :width]
+
+    return index, volume;
+
+
+def discretisation(xpoints_p=1, ypoints_p=1, zpoints_p=1):
+    '''
+    discretisation
+    --------------
+
+    Offsets of the discretisation points of a block of unit size from its centre, XPOINTS x YPOINTS x ZPOINTS
+    points at the centres of equal sub-blocks.
+
+    Returns:
+    --------
+
+    numpy.ndarray
+        shape (XPOINTS * YPOINTS * ZPOINTS, 3)
+    '''
+
+    import numpy as np
+
+    axes = [(np.arange(int(n)) + 0.5) / int(n) - 0.5 for n in (xpoints_p, ypoints_p, zpoints_p)]
+
+    return np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, 3);
+
+
+def _solve(matrices, vectors):
+
+    # batched solution of linear systems, by least squares for batches with a singular system
+    import numpy as np
+
+    try:
+        return np.linalg.solve(matrices, vectors[..., None])[..., 0];
+    except np.linalg.LinAlgError:
+        return (np.linalg.pinv(matrices) @ vectors[..., None])[..., 0];
+
+
+def _covariances(model, points, centres, sizes, offsets):
+
+    # block variance, sample covariances and sample to block covariances of a chunk of blocks
+    import numpy as np
+
+    # block discretisation, the block to block covariance is shared by the blocks of one size
+    unique, inverse = np.unique(sizes, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    discs = offsets[None, :, :] * unique[:, None, :]
+    cbb = np.array([model.covariance(d[:, None, :] - d[None, :, :]).mean() for d in discs])[inverse]
+    disc = centres[:, None, :] + discs[inverse]
+
+    cov = model.covariance(points[:, :, None, :] - points[:, None, :, :])
+    rhs = model.covariance(points[:, :, None, :] - disc[:, None, :, :]).mean(axis=2)
+
+    return cbb, cov, rhs;
+
+
+def _system(cov, rhs, used, simple):
+
+    # kriging matrices and right hand sides, unused neighbours get a zero weight; ordinary kriging adds the
+    # unbiasedness row
+    import numpy as np
+
+    nblocks, m = used.shape
+    diagonal = np.arange(m)
+    a = np.where(used[:, :, None] & used[:, None, :], cov, 0.)
+    a[:, diagonal, diagonal] = np.where(used, a[:, diagonal, diagonal], 1.)
+    b = np.where(used, rhs, 0.)
+
+    if not simple:
+        border = np.concatenate([used * 1., np.zeros((nblocks, 1))], axis=1)
+        a = np.concatenate([a, used[:, None, :] * 1.], axis=1)
+        a = np.concatenate([a, border[:, :, None]], axis=2)
+        b = np.concatenate([b, np.ones((nblocks, 1))], axis=1)
+
+    return a, b;
+
+
+def _krige(model, xyz, values, index, centres, sizes, offsets, simple, mean, negative):
+
+    # kriging estimates and variances of a chunk of blocks with the neighbours ``index``
+    import numpy as np
+
+    used = index >= 0
+    safe = np.where(used, index, 0)
+    m = index.shape[1]
+    cbb, cov, rhs = _covariances(model, xyz[safe], centres, sizes, offsets)
+
+    for attempt in range(2 if negative else 1):
+        a, b = _system(cov, rhs, used, simple)
+        solution = _solve(a, b)
+        weights = np.where(used, solution[:, :m], 0.)
+        if attempt == 0 and negative and (weights < 0).any():
+            used = used & (weights >= 0)
+            continue
+        break
+
+    z = np.where(used, values[safe], 0.)
+    variance = cbb - np.sum(weights * b[:, :m], axis=1)
+    if simple:
+        estimate = mean + np.sum(weights * (z - np.where(used, mean[:, None], 0.)), axis=1)
+    else:
+        estimate = np.sum(weights * z, axis=1)
+        variance = variance - solution[:, m]
+
+    empty = ~used.any(axis=1)
+    estimate[empty] = np.nan
+    variance[empty] = np.nan
+
+    return estimate, variance, used.sum(axis=1);
+
+
+def _init_worker(state):
+
+    _state.clear()
+    _state.update(state)
+    _state['tree'] = dmstudio.variogram._kdtree()(state['reduced'])
+
+
+def _estimate_chunk(first, last):
+
+    # estimates of the blocks first to last of the current estimation record
+    import numpy as np
+
+    state = _state
+    centres = state['centres'][first:last]
+    xyz, values = state['xyz'], state['values']
+    index, volume = neighbours(state['search'], state['tree'], state['reduced'], state['keys'], centres)
+    nblocks = len(centres)
+    used = index >= 0
+    safe = np.where(used, index, 0)
+
+    estimate = np.full(nblocks, np.nan)
+    variance = np.full(nblocks, np.nan)
+    count = used.sum(axis=1)
+    nearest = np.full(nblocks, np.nan)
+    if index.shape[1]:
+        euclidean = np.where(used, np.linalg.norm(xyz[safe] - centres[:, None, :], axis=2), np.inf)
+        nearest = np.where(count > 0, euclidean.min(axis=1), np.nan)
+
+    method = state['method']
+    if method in (1, 2) and index.shape[1]:
+        # distances for NN and IPD, anisotropic in the frame of ``anisotropy`` scaled to its first axis
+        offset = xyz[safe] - centres[:, None, :]
+        if state['anisotropy'] is not None:
+            matrix, unit = state['anisotropy']
+            offset = offset @ matrix.T * unit
+        distance = np.where(used, np.linalg.norm(offset, axis=2), np.inf)
+        if method == 1:
+            closest = np.argmin(distance, axis=1)
+            estimate = np.where(count > 0, values[safe[np.arange(nblocks), closest]], np.nan)
+        else:
+            distance = distance + state['addcon']
+            exact = used & (distance <= 0)
+            with np.errstate(divide='ignore'):
+                weights = np.where(used, 1. / distance ** state['power'], 0.)
+            weights = np.where(exact.any(axis=1)[:, None], exact * 1., weights)
+            total = weights.sum(axis=1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                estimate = np.where(count > 0, (weights * np.where(used, values[safe], 0.)).sum(axis=1) / total,
+                                    np.nan)
+    elif method in (3, 4) and index.shape[1]:
+        if method == 4:
+            if state['local_mean'] is not None:
+                mean = state['local_mean'][first:last]
+            elif state['search_mean']:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    mean = np.where(used, values[safe], 0.).sum(axis=1) / count
+            else:
+                mean = np.full(nblocks, state['mean'])
+        else:
+            mean = None
+        estimate, variance, count = _krige(state['model'], xyz, values, index, centres, state['sizes'][first:last],
+                                           state['offsets'], method == 4, mean, state['negative'])
+        if state['capvar']:
+            variance = np.minimum(variance, state['model'].sill)
+
+    volume = np.where(count > 0, volume, 0)
+
+    return estimate, variance, count, volume, nearest;
+
+
+def _prototype(proto):
+
+    # DataFrame of the prototype model, all cells of the model extent if the prototype has no records, in the order
+    # of the Datamine IJK (Z fastest)
+    import numpy as np
+    import pandas as pd
+
+    if not isinstance(proto, str):
+        return proto;
+
+    filename = proto if os.path.splitext(proto)[1] else proto + '.dm'
+    model = dmstudio.drillholes._table(filename)
+    if len(model):
+        return model;
+
+    defaults = {field['name']: field['default'] for field in dmstudio.dmformat.read_header(filename)['fields']}
+    n = [int(defaults['N' + axis]) for axis in 'XYZ']
+    ix, iy, iz = [i.ravel() for i in np.meshgrid(*[np.arange(count) for count in n], indexing='ij')]
+
+    grid = pd.DataFrame({'IJK': (ix * n[1] + iy) * n[2] + iz})
+    for axis, i in zip('XYZ', (ix, iy, iz)):
+        grid[axis + 'C'] = defaults[axis + 'MORIG'] + (i + 0.5) * defaults[axis + 'INC']
+    for axis in 'XYZ':
+        grid[axis + 'INC'] = defaults[axis + 'INC']
+    for name in ('XMORIG', 'YMORIG', 'ZMORIG', 'NX', 'NY', 'NZ'):
+        grid[name] = defaults[name]
+
+    return grid;
+
+
+def estimate(proto, samples, srcparm, estparm, vmodparm=None, x_f='X', y_f='Y', z_f='Z', zone1_f=None,
+             zone2_f=None, key_f=None, xpoints_p=1, ypoints_p=1, zpoints_p=1, workers=None, chunk_blocks=4096):
+    '''
+    estimate
+    --------
+
+    Estimate the blocks of a prototype model from samples with the ESTIMA parameter tables. Each ESTPARM record
+    estimates VALUE_IN into VALUE_OU for the blocks and samples of its zone.
+
+    Parameters:
+    -----------
+
+    proto: pandas.DataFrame or str
+        prototype model with the fields XC, YC, ZC and XINC, YINC, ZINC. A ``.dm`` prototype without records is
+        filled with all the cells of the model.
+    samples: pandas.DataFrame or str
+        samples with the coordinate fields and the fields to estimate
+    srcparm: pandas.DataFrame or str
+        search volume table, see ``search_volume``
+    estparm: pandas.DataFrame or str
+        estimation table with the fields VALUE_IN, VALUE_OU, SREFNUM, IMETHOD, the zone fields, NUMSAM_F, SVOL_F,
+        VAR_F, MINDIS_F and the fields of the method: ANISO, ANANGLE1-3, ANDIST1-3, POWER and ADDCON for NN and IPD,
+        VREFNUM, KRIGNEGW and KRIGVARS for kriging and LOCALMNP and LOCALM_F for simple kriging
+    vmodparm: pandas.DataFrame or str
+        variogram model table, see ``variogram.read_models``
+    x_f, y_f, z_f: str
+        sample coordinate fields
+    zone1_f, zone2_f: str
+        zone fields of the samples, the model and ESTPARM
+    key_f: str
+        sample key field for MAXKEY, e.g. BHID
+    xpoints_p, ypoints_p, zpoints_p: int
+        block discretisation for kriging
+    workers: int
+        number of processes, by default the number of CPUs
+    chunk_blocks: int
+        number of blocks estimated at a time
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+        the prototype model with the estimated fields and the NUMSAM_F, SVOL_F, VAR_F and MINDIS_F fields that are
+        named in ESTPARM. Blocks without enough samples have absent estimates.
+
+    Usage:
+    ------
+
+    >>> model = estimation.estimate(proto, comps, srcparm, estparm, vmodparm, zone1_f='DOMAIN', xpoints_p=4,
+    ...                             ypoints_p=4, zpoints_p=2, workers=16)
+    '''
+
+    import concurrent.futures
+    import numpy as np
+    import pandas as pd
+
+    model = _prototype(proto).copy()
+    samples = dmstudio.drillholes._table(samples)
+    searches = read_search_volumes(srcparm)
+    records = dmstudio.drillholes._table(estparm).to_dict('records')
+    models = dmstudio.variogram.read_models(vmodparm) if vmodparm is not None else {}
+    offsets = discretisation(xpoints_p, ypoints_p, zpoints_p)
+
+    centres = model[['XC', 'YC', 'ZC']].to_numpy(float)
+    sizes = np.column_stack([model[name].to_numpy(float) if name in model.columns else np.zeros(len(model))
+                             for name in ('XINC', 'YINC', 'ZINC')])
+    xyz = np.column_stack([samples[x_f].to_numpy(float), samples[y_f].to_numpy(float),
+                           samples[z_f].to_numpy(float) if z_f in samples.columns else np.zeros(len(samples))])
+    keys = pd.factorize(samples[key_f])[0] if key_f else None
+
+    for record in records:
+        field = _value(record, 'VALUE_IN')
+        output = _value(record, 'VALUE_OU', field)
+        method = int(_value(record, 'IMETHOD', 3))
+        if method not in METHODS:
+            raise ValueError("Estimation method IMETHOD=" + str(method) + " is not supported, expected one of " +
+                             ", ".join(str(key) + "=" + name for key, name in METHODS.items()))
+        if int(_value(record, 'LOG', 0)):
+            raise ValueError("Lognormal kriging (LOG=1) is not supported")
+        search = searches[int(_value(record, 'SREFNUM', 1))]
+
+        # blocks and samples of the zone of the record
+        blocks = np.ones(len(model), bool)
+        chosen = ~np.isnan(xyz).any(axis=1) & samples[field].notna().to_numpy()
+        for zone in (zone1_f, zone2_f):
+            if zone and _value(record, zone) is not None:
+                blocks &= (model[zone] == record[zone]).to_numpy()
+                chosen &= (samples[zone] == record[zone]).to_numpy()
+        blocks = np.flatnonzero(blocks)
+        values = samples[field].to_numpy(float)[chosen]
+
+        anisotropy = None
+        aniso = int(_value(record, 'ANISO', 0))
+        if aniso == 1:
+            anisotropy = (search.matrix, search.distances[0])
+        elif aniso == 2:
+            distances = [float(_value(record, 'ANDIST' + str(n), 1.)) for n in (1, 2, 3)]
+            frame = dmstudio.variogram.rotation([_value(record, 'ANANGLE' + str(n), 0.) for n in (1, 2, 3)])
+            anisotropy = (np.diag(1. / np.array(distances)) @ frame, distances[0])
+
+        local_mean = None
+        if method == 4 and int(_value(record, 'LOCALMNP', 0)) == 1:
+            local_mean = model[_value(record, 'LOCALM_F')].to_numpy(float)[blocks]
+
+        state = {'xyz': xyz[chosen],
+                 'values': values,
+                 'reduced': xyz[chosen] @ search.matrix.T,
+                 'keys': keys[chosen] if keys is not None else None,
+                 'search': search,
+                 'centres': centres[blocks],
+                 'sizes': sizes[blocks],
+                 'offsets': offsets,
+                 'method': method,
+                 'anisotropy': anisotropy,
+                 'power': float(_value(record, 'POWER', 2.)),
+                 'addcon': float(_value(record, 'ADDCON', 0.)),
+                 'model': models.get(int(_value(record, 'VREFNUM', 1))) if method in (3, 4) else None,
+                 'negative': int(_value(record, 'KRIGNEGW', 0)) == 1,
+                 'capvar': int(_value(record, 'KRIGVARS', 0)) == 1,
+                 'local_mean': local_mean,
+                 'search_mean': method == 4 and int(_value(record, 'LOCALMNP', 0)) == 2,
+                 'mean': float(np.mean(values)) if len(values) else np.nan}
+        if method in (3, 4) and state['model'] is None:
+            raise ValueError("Variogram model VREFNUM=" + str(_value(record, 'VREFNUM', 1)) + " not in VMODPARM")
+
+        ranges = [(first, min(first + chunk_blocks, len(blocks))) for first in range(0, len(blocks), chunk_blocks)]
+        count = min(workers or os.cpu_count() or 1, len(ranges))
+        if count <= 1:
+            _init_worker(state)
+            try:
+                results = [_estimate_chunk(first, last) for first, last in ranges]
+            finally:
+                _state.clear()
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=count, initializer=_init_worker,
+                                                        initargs=(state,)) as pool:
+                results = list(pool.map(_estimate_chunk, *zip(*ranges)))
+
+        columns = [output] + [_value(record, name) for name in ('VAR_F', 'NUMSAM_F', 'SVOL_F', 'MINDIS_F')]
+        for c, name in enumerate(columns):
+            if name is None:
+                continue
+            if name not in model.columns:
+                model[name] = np.nan
+            if results:
+                model.loc[model.index[blocks], name] = np.concatenate([result[c] for result in results])
+
+    return model;
+
+
+def order_relations(cdf):
+    '''
+    order_relations
+    ---------------
+
+    Correct order relation deviations of estimated cumulative distributions: probabilities are limited to [0, 1]
+    and made non decreasing with the cutoff by averaging the upward and downward corrections.
+
+    Parameters:
+    -----------
+
+    cdf: numpy.ndarray
+        probabilities of being at or below each cutoff, shape (blocks, cutoffs) with the cutoffs increasing
+
+    Returns:
+    --------
+
+    numpy.ndarray
+    '''
+
+    import numpy as np
+
+    cdf = np.clip(cdf, 0., 1.)
+    upward = np.maximum.accumulate(cdf, axis=1)
+    downward = np.minimum.accumulate(cdf[:, ::-1], axis=1)[:, ::-1]
+
+    return (upward + downward) / 2.;
+
+
+def _indicator_chunk(first, last):
+
+    # cumulative distributions of the blocks first to last, one batched solve for all cutoffs
+    import numpy as np
+
+    state = _state
+    centres = state['centres'][first:last]
+    xyz, indicators = state['xyz'], state['indicators']
+    index, volume = neighbours(state['search'], state['tree'], state['reduced'], state['keys'], centres)
+    nblocks, m = index.shape
+    ncutoffs = indicators.shape[1]
+    cdf = np.full((nblocks, ncutoffs), np.nan)
+    used = index >= 0
+    if not m:
+        return cdf, used.sum(axis=1), volume;
+
+    safe = np.where(used, index, 0)
+    simple = state['simple']
+
+    # one kriging system per block and variogram model, the cutoffs sharing a model share its system
+    systems = []
+    for model in state['models']:
+        cbb, cov, rhs = _covariances(model, xyz[safe], centres, state['sizes'][first:last], state['offsets'])
+        systems.append(_system(cov, rhs, used, simple))
+    a = np.stack([a for a, b in systems], axis=1)
+    b = np.stack([b for a, b in systems], axis=1)
+    solution = _solve(a, b)
+
+    for c in range(ncutoffs):
+        weights = np.where(used, solution[:, state['model_of'][c], :m], 0.)
+        z = np.where(used, indicators[safe, c], 0.)
+        if simple:
+            mean = state['means'][c]
+            cdf[:, c] = mean + np.sum(weights * (z - used * mean), axis=1)
+        else:
+            cdf[:, c] = np.sum(weights * z, axis=1)
+
+    estimated = used.any(axis=1)
+    cdf[estimated] = order_relations(cdf[estimated])
+    cdf[~estimated] = np.nan
+
+    return cdf, used.sum(axis=1), np.where(estimated, volume, 0);
+
+
+def class_means(values, cutoffs):
+    '''
+    class_means
+    -----------
+
+    Mean sample value of each grade class: below the first cutoff, between successive cutoffs and above the last
+    cutoff. An empty class takes the middle of its cutoffs, or the cutoff for the first and last class.
+
+    Returns:
+    --------
+
+    numpy.ndarray
+        len(cutoffs) + 1 class means
+    '''
+
+    import numpy as np
+
+    values = np.asarray(values, float)
+    values = values[~np.isnan(values)]
+    cutoffs = np.asarray(cutoffs, float)
+    classes = np.searchsorted(cutoffs, values, 'left')
+    counts = np.bincount(classes, minlength=len(cutoffs) + 1)
+    sums = np.bincount(classes, weights=values, minlength=len(cutoffs) + 1)
+
+    bounds = np.r_[cutoffs[0], cutoffs, cutoffs[-1]]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, (bounds[:-1] + bounds[1:]) / 2.);
+
+
+def indicator_estimate(proto, samples, field, cutoffs, srcparm, vmodparm, vrefnums=None, srefnum=1, prefix=None,
+                       simple=False, x_f='X', y_f='Y', z_f='Z', key_f=None, xpoints_p=1, ypoints_p=1, zpoints_p=1,
+                       workers=None, chunk_blocks=4096):
+    '''
+    indicator_estimate
+    ------------------
+
+    Multiple indicator kriging of a grade at many cutoffs. The neighbours of each block are searched once for all
+    cutoffs and the kriging systems of all cutoffs are solved in one batched call. The estimated distributions are
+    corrected for order relations and summarised per cutoff as the proportion of the block above the cutoff and its
+    grade, from the class means of the samples, for conversion to grade range subcells by MIKSCELL.
+
+    Parameters:
+    -----------
+
+    proto: pandas.DataFrame or str
+        prototype model, see ``estimate``
+    samples: pandas.DataFrame or str
+        samples with the coordinate fields and ``field``
+    field: str
+        grade field
+    cutoffs: list of float
+        increasing cutoffs
+    srcparm: pandas.DataFrame or str
+        search volume table, see ``search_volume``
+    vmodparm: pandas.DataFrame or str
+        variogram model table of the indicator variograms
+    vrefnums: list of int
+        VREFNUM of the indicator variogram of each cutoff, by default model 1 for all cutoffs (median indicator
+        kriging)
+    srefnum: int
+        SREFNUM of the search volume
+    prefix: str
+        prefix of the output field names, by default the first 4 characters of ``field``
+    simple: bool
+        simple kriging with the sample proportions as indicator means, instead of ordinary kriging
+    x_f, y_f, z_f, key_f: str
+        sample coordinate and key fields, see ``estimate``
+    xpoints_p, ypoints_p, zpoints_p: int
+        block discretisation
+    workers: int
+        number of processes, by default the number of CPUs
+    chunk_blocks: int
+        number of blocks estimated at a time
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+        the prototype model with, for the n-th cutoff, the fields <prefix>Pnn (proportion above the cutoff) and
+        <prefix>Gnn (grade above the cutoff), the field <prefix>MIK (grade above a cutoff of zero, the mean of the
+        block distribution) and <prefix>NS (number of samples)
+
+    Usage:
+    ------
+
+    >>> model = estimation.indicator_estimate(proto, comps, 'AU', [0.3, 0.5, 1.0, 2.0, 5.0], srcparm, vmodparm,
+    ...                                       vrefnums=[1, 2, 3, 4, 5], xpoints_p=3, ypoints_p=3, zpoints_p=2)
+    >>> dmc.mikscell(modelin_i='mik', modelout_o='mikcells', grade_f='AUMIK', fields_f=['AUP01', 'AUG01'])
+    '''
+
+    import concurrent.futures
+    import numpy as np
+
+    cutoffs = np.asarray(cutoffs, float)
+    if len(cutoffs) == 0 or np.any(np.diff(cutoffs) <= 0):
+        raise ValueError("Indicator cutoffs must be given in increasing order")
+    if len(cutoffs) > 99:
+        raise ValueError("At most 99 indicator cutoffs are supported")
+
+    model = _prototype(proto).copy()
+    samples = dmstudio.drillholes._table(samples)
+    search = read_search_volumes(srcparm)[int(srefnum)]
+    models = dmstudio.variogram.read_models(vmodparm)
+    vrefnums = [1] * len(cutoffs) if vrefnums is None else [int(v) for v in vrefnums]
+    if len(vrefnums) != len(cutoffs):
+        raise ValueError("One VREFNUM per cutoff is required")
+    for v in vrefnums:
+        if v not in models:
+            raise ValueError("Variogram model VREFNUM=" + str(v) + " not in VMODPARM")
+    distinct = sorted(set(vrefnums))
+
+    xyz = np.column_stack([samples[x_f].to_numpy(float), samples[y_f].to_numpy(float),
+                           samples[z_f].to_numpy(float) if z_f in samples.columns else np.zeros(len(samples))])
+    values = samples[field].to_numpy(float)
+    chosen = ~np.isnan(xyz).any(axis=1) & ~np.isnan(values)
+    xyz, values = xyz[chosen], values[chosen]
+    indicators = (values[:, None] <= cutoffs[None, :]) * 1.
+    keys = None
+    if key_f:
+        import pandas as pd
+        keys = pd.factorize(samples[key_f])[0][chosen]
+
+    centres = model[['XC', 'YC', 'ZC']].to_numpy(float)
+    sizes = np.column_stack([model[name].to_numpy(float) if name in model.columns else np.zeros(len(model))
+                             for name in ('XINC', 'YINC', 'ZINC')])
+
+    state = {'xyz': xyz,
+             'indicators': indicators,
+             'reduced': xyz @ search.matrix.T,
+             'keys': keys,
+             'search': search,
+             'centres': centres,
+             'sizes': sizes,
+             'offsets': discretisation(xpoints_p, ypoints_p, zpoints_p),
+             'models': [models[v] for v in distinct],
+             'model_of': [distinct.index(v) for v in vrefnums],
+             'simple': bool(simple),
+             'means': indicators.mean(axis=0) if len(values) else np.zeros(len(cutoffs))}
+
+    ranges = [(first, min(first + chunk_blocks, len(model))) for first in range(0, len(model), chunk_blocks)]
+    count = min(workers or os.cpu_count() or 1, len(ranges))
+    if count <= 1:
+        _init_worker(state)
+        try:
+            results = [_indicator_chunk(first, last) for first, last in ranges]
+        finally:
+            _state.clear()
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=count, initializer=_init_worker,
+                                                    initargs=(state,)) as pool:
+            results = list(pool.map(_indicator_chunk, *zip(*ranges)))
+
+    ncutoffs = len(cutoffs)
+    cdf = np.concatenate([result[0] for result in results]) if results else np.zeros((0, ncutoffs))
+    nsamples = np.concatenate([result[1] for result in results]) if results else np.zeros(0)
+
+    # class probabilities and the grade above each cutoff from the class means
+    means = class_means(values, cutoffs)
+    probabilities = np.diff(np.concatenate([np.zeros((len(cdf), 1)), cdf, np.ones((len(cdf), 1))], axis=1), axis=1)
+    metal = np.cumsum((probabilities * means)[:, ::-1], axis=1)[:, ::-1]
+    above = 1. - cdf
+    prefix = prefix or str(field)[:4]
+
+    for c in range(ncutoffs):
+        number = '%02d' % (c + 1)
+        model[prefix + 'P' + number] = above[:, c]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            model[prefix + 'G' + number] = np.where(above[:, c] > 0, metal[:, c + 1] / above[:, c], np.nan)
+    model[prefix + 'MIK'] = metal[:, 0]
+    model[prefix + 'NS'] = nsamples
+
+    return model;
@@ -1,7 +1,5 @@
-import win32com.client
+import os
 import sys
-import glob
-import numpy as np
 
 def _scriptinit(dm_object):
     '''
@@ -22,14 +20,62 @@ def _scriptinit(dm_object):
     ActiveX connection
     '''
 
+    import win32com.client
+
     return win32com.client.Dispatch(dm_object);
 
+# COM ProgIDs for the supported Studio versions, in the order they are tried when no version is given
+PROGIDS = [('StudioRM', "Datamine.StudioRM.Application"),
+           ('Studio3', "Datamine.Studio.Application"),
+           ('StudioEM', "Datamine.StudioEM.Application"),
+           ('StudioRMPro', "Datamine.StudioRMPro.Application")]
+
+# registry of open Studio sessions keyed by version, shared by dmcommands, dmfiles and the other modules
+_SESSIONS = {}
+
+# version found when connecting without a version so that the ProgIDs are only probed once per process
+_DEFAULT_VERSION = None
+
+def _probe(version):
+    '''
+    _probe
+    ------
+
+    Dispatch the COM object for a Studio version. Internal function.
+
+    Parameters:
+    -----------
+
+    version: str
+        Datamine studio version, if not one of ``PROGIDS`` each version is tried in turn
+
+    Returns:
+    --------
+
+    tuple of the version connected to and the ActiveX connection
+    '''
+
+    progids = dict(PROGIDS)
+
+    if version in progids:
+        return version, _scriptinit(progids[version])
+
+    # no valid version given, will try to find a valid version
+    for name, progid in PROGIDS:
+        try:
+            return name, _scriptinit(progid)
+        except Exception:
+            continue
+
+    assert False, "No valid Studio version is active"
+
 def studio(version):
     '''
     studio
     ------
 
-    Datamine Studio Initialization. Versions Studio3, StudioRM, StudioEM and StudioRMPro supported
+    Datamine Studio Initialization. Versions Studio3, StudioRM, StudioEM and StudioRMPro supported. A new COM
+    connection is made on every call, use ``connect`` to share a single connection.
 
     Parameters:
     -----------
@@ -38,48 +84,129 @@ def studio(version):
         Datamine studio version, choose from: StudioRM, Studio3, StudioEM, StudioRMPro
 
     Tries to connect to studio RM first.
-    Need a better way to do this.
     '''
 
-    oScript = None
-
     _make_dmdir()
 
-    if version == 'StudioRM':
-        oScript = _scriptinit("Datamine.StudioRM.Application")
-    elif version == 'Studio3':
-        oScript = _scriptinit("Datamine.Studio.Application")
-    elif version == 'StudioEM':
-        oScript = _scriptinit("Datamine.StudioEM.Application")
-    elif version == 'StudioRMPro':
-        oScript = _scriptinit("Datamine.StudioRMPro.Application")
-    else:
-        # no version given, will try to find a valid version
-        try:
-            oScript = _scriptinit("Datamine.StudioRM.Application")
-        except:
-            try:
-                oScript = _scriptinit("Datamine.Studio.Application")
-            except:
-                try:
-                    oScript = _scriptinit("Datamine.StudioEM.Application")
-                except:
-                    try:
-                        oScript = _scriptinit("Datamine.StudioRMPro.Application")
-                    except:
-                        assert False, "No valid Studio version is active"
+    version, oScript = _probe(version)
 
     # print('Connected to Datamine: {}'.format(oScript))
 
     return oScript;
 
+def connect(version=None):
+    '''
+    connect
+    -------
+
+    Return the shared Studio connection for a version, connecting only if there is no live session for that
+    version yet. A session that fails the ``is_alive`` health check is closed and replaced.
+
+    Parameters:
+    -----------
+
+    version: str
+        optional Datamine studio version, choose from: StudioRM, Studio3, StudioEM, StudioRMPro. If no version is
+        given the version found by the first connection is reused.
+
+    Returns:
+    --------
+
+    ActiveX connection
+    '''
+
+    global _DEFAULT_VERSION
+
+    key = version if version is not None else _DEFAULT_VERSION
+
+    oScript = _SESSIONS.get(key)
+    if oScript is not None:
+        if is_alive(oScript):
+            return oScript
+        close(key)
+
+    _make_dmdir()
+
+    try:
+        key, oScript = _probe(key)
+    except Exception:
+        # the version found by an earlier probe is no longer available, probe all versions again
+        if version is not None or key is None:
+            raise
+        key, oScript = _probe(None)
+
+    _SESSIONS[key] = oScript
+    if version is None:
+        _DEFAULT_VERSION = key
+
+    return oScript;
+
+def is_alive(oScript):
+    '''
+    is_alive
+    --------
+
+    Health check for a Studio connection. The connection is considered alive if the active project can be queried.
+
+    Parameters:
+    -----------
+
+    oScript: ActiveX connection
+        Studio COM object returned by ``connect`` or ``studio``
+
+    Returns:
+    --------
+
+    bool
+    '''
+
+    try:
+        oScript.ActiveProject
+    except Exception:
+        return False
+
+    return True;
+
+def close(version=None):
+    '''
+    close
+    -----
+
+    Close the shared Studio session for a version. The next ``connect`` for the version makes a new connection.
+    The version found when connecting without a version is remembered.
+
+    Parameters:
+    -----------
+
+    version: str
+        optional Datamine studio version. If no version is given all sessions are closed.
+    '''
+
+    if version is None:
+        _SESSIONS.clear()
+    else:
+        _SESSIONS.pop(version, None)
+
+def sessions():
+    '''
+    sessions
+    --------
+
+    Returns:
+    --------
+
+    dict of the open Studio sessions keyed by version
+    '''
+
+    return dict(_SESSIONS);
+
 def dmFile():
 
     print("here")
     # assert oDmFile = _scriptinit("DmFile.DmTableADO"), "Could not initialize dmTableADO"
 
 
-def _make_dmdir():
+def _make_dmdir(path='.'):
     
     '''
     _make_dmdir
@@ -90,6 +217,9 @@ def _make_dmdir():
     
     The purpose of the local python file is to facilitate importing the filenames as variables which can be referenced directly in the
     scripts. 
+
+    The file list comes from the project index (see ``dmstudio.project``), which is updated incrementally. ``dmdir.py``
+    is only rewritten when its list of files changes.
     
     Usage:
     ------
@@ -106,33 +236,47 @@ def _make_dmdir():
     
     '''
 
-    dmdir_init = open('__init__.py', 'w')
-    dmdir_init.write("'''\n")
-    dmdir_init.write("Initialization file to enable importing of dmdir.py\n")
-    dmdir_init.write("'''\n")
-    dmdir_init.close()
+    import dmstudio.project
+
+    index = dmstudio.project.project_index(path)
+    index.update()
+
+    init_file = os.path.join(path, '__init__.py')
+    if not os.path.exists(init_file):
+        dmdir_init = open(init_file, 'w')
+        dmdir_init.write("'''\n")
+        dmdir_init.write("Initialization file to enable importing of dmdir.py\n")
+        dmdir_init.write("'''\n")
+        dmdir_init.close()
 
-    dmdir_f = open('dmdir.py', 'w')
-    dmdir_f.write("'''\n")
-    dmdir_f.write("List of datamine files in active datamine project directory\n")
-    dmdir_f.write("\n")
-    dmdir_f.write("This file will populate after initializing the script for the first time and will update after each command.\n")
-    dmdir_f.write("\n")
-    dmdir_f.write("Usage:\n")
-    dmdir_f.write("------\n")
-    dmdir_f.write("\n")
-    dmdir_f.write(">>import dmdir as f\n")
-    dmdir_f.write(">>print f._someDmFile_\n")
-    dmdir_f.write("someDmFile\n")
-    dmdir_f.write("\n")
-    dmdir_f.write("'''\n")
-    dmdir_f.write("\n")
+    lines = ["'''",
+             "List of datamine files in active datamine project directory",
+             "",
+             "This file will populate after initializing the script for the first time and will update after each command.",
+             "",
+             "Usage:",
+             "------",
+             "",
+             ">>import dmdir as f",
+             ">>print f._someDmFile_",
+             "someDmFile",
+             "",
+             "'''",
+             ""]
 
-    for infile in glob.glob("*.dm"):
-        outname = np.str.split(infile, '.')[0]
-        dmdir_f.write('_'+ outname + "_='" + outname + "'\n")
+    for outname in index.files():
+        lines.append('_'+ outname + "_='" + outname + "'")
 
-    dmdir_f.close()
+    text = "\n".join(lines) + "\n"
 
+    # only rewrite dmdir.py when the list of files changed
+    dmdir_file = os.path.join(path, 'dmdir.py')
+    if os.path.exists(dmdir_file):
+        with open(dmdir_file) as f:
+            if f.read() == text:
+                return index;
 
+    with open(dmdir_file, 'w') as f:
+        f.write(text)
 
+    return index;
@@ -0,0 +1,321 @@
+'''
+dmstudio.pipeline
+=================
+
+Make-style incremental execution of Datamine command sequences. Commands are recorded into a dependency graph, using
+the ``_i`` (input) and ``_o`` (output) file arguments of the ``dmcommands.init`` methods, and executed later. Steps
+whose command string, input files and output files are unchanged since the last execution are skipped.
+
+Input and output files are fingerprinted by size, modification time and content hash. The content hash is only
+recalculated when the size or modification time of a file changes. The fingerprints are stored in a JSON state file
+so that a rebuild in a new python session only reruns what is out of date.
+
+Steps without output files (e.g. DELETE) are always executed. Studio does not raise when a command fails, a step
+that does not rewrite all its output files is reported as failed and executed again by the next ``execute``.
+
+Usage:
+------
+
+>>> from dmstudio import dmcommands, pipeline
+>>> pipe = pipeline.pipeline('rebuild.json')
+>>> dmc = dmcommands.init(backend=pipe)
+>>> dmc.desurv(in1_i='assays', in2_i='surveys', out_o='holes')
+>>> dmc.compdh(in_i='holes', out_o='comps', interval_p=2)
+>>> pipe.execute()
+['run', 'run']
+>>> pipe.execute()
+['skipped', 'skipped']
+
+'''
+
+import hashlib
+import json
+import os
+
+import dmstudio.backends
+import dmstudio.batch
+
+
+def file_hash(filename, block_size=1 << 20):
+    '''
+    file_hash
+    ---------
+
+    SHA1 content hash of a file.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the file
+    block_size: int
+        number of bytes read at a time
+
+    Returns:
+    --------
+
+    str
+    '''
+
+    sha = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        block = f.read(block_size)
+        while block:
+            sha.update(block)
+            block = f.read(block_size)
+
+    return sha.hexdigest();
+
+
+class fingerprints(object):
+
+    '''
+    fingerprints
+    ------------
+
+    Content hashes of files, cached by path, size and modification time so that unchanged files are not re-read.
+
+    Parameters:
+    -----------
+
+    cache: dict
+        optional cache from a previous session, as returned by the ``cache`` property
+    '''
+
+    def __init__(self, cache=None):
+
+        self.cache = dict(cache or {})
+
+    def get(self, filename):
+
+        '''
+        Content hash of ``filename`` or None if the file does not exist.
+        '''
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None;
+
+        key = os.path.abspath(filename)
+        cached = self.cache.get(key)
+        if cached is not None and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime_ns:
+            return cached['hash'];
+
+        digest = file_hash(filename)
+        self.cache[key] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'hash': digest}
+
+        return digest;
+
+
+class pipeline(object):
+
+    '''
+    pipeline
+    --------
+
+    Command backend which records commands into a dependency graph instead of executing them. ``execute`` runs the
+    recorded steps in order, skipping the steps that are up to date.
+
+    Parameters:
+    -----------
+
+    state: str
+        JSON file holding the fingerprints of the previous execution
+    backend: backend object
+        optional backend executing the steps, by default the default backend from ``dmstudio.backends``
+    version: str
+        optional datamine studio version used when a COM backend is created
+
+    Object Properties:
+    ------------------
+
+    pipeline.steps: list of dict
+        recorded steps with keys 'command', 'inputs' and 'outputs' (file names)
+    '''
+
+    def __init__(self, state='dmpipeline.json', backend=None, version=None):
+
+        self.state_file = state
+        self.version = version
+        self._backend = backend
+        self.oScript = None
+        self.steps = []
+
+    @property
+    def backend(self):
+
+        # the executing backend is only created when it is needed so that recording does not connect to Studio
+        if self._backend is None:
+            self._backend = dmstudio.backends.get_backend(self.version)
+
+        return self._backend;
+
+    def run(self, command):
+
+        '''
+        Record a command as a step of the pipeline. Used by ``dmcommands.init.run_command``.
+        '''
+
+        import dmstudio.dmcommands
+
+        inputs, outputs = dmstudio.dmcommands.command_files(command)
+        self.steps.append({'command': command,
+                           'inputs': list(inputs.values()),
+                           'outputs': list(outputs.values())})
+
+    def clear(self):
+
+        self.steps = []
+
+    def filename(self, name):
+
+        if hasattr(self.backend, 'filename'):
+            return self.backend.filename(name);
+
+        return dmstudio.backends.dm_path(name);
+
+    def graph(self):
+
+        '''
+        Dependency graph of the recorded steps.
+
+        Returns:
+        --------
+
+        dict
+            step index to the set of indices of the steps producing its input files. The producer of a file is the
+            last step before the consumer which writes it.
+        '''
+
+        graph = {}
+        producers = {}
+
+        for i, step in enumerate(self.steps):
+            graph[i] = set(producers[name] for name in step['inputs'] if name in producers)
+            for name in step['outputs']:
+                producers[name] = i
+
+        return graph;
+
+    def downstream(self, name):
+
+        '''
+        Indices of the steps which depend directly or indirectly on a file.
+
+        Parameters:
+        -----------
+
+        name: str
+            datamine file name
+        '''
+
+        graph = self.graph()
+        affected = set()
+
+        for i, step in enumerate(self.steps):
+            if name in step['inputs'] or graph[i] & affected:
+                affected.add(i)
+
+        return sorted(affected);
+
+    def _load(self):
+
+        if os.path.exists(self.state_file):
+            with open(self.state_file) as f:
+                return json.load(f);
+
+        return {'files': {}, 'steps': {}};
+
+    def _save(self, state):
+
+        temp = self.state_file + '.tmp'
+        with open(temp, 'w') as f:
+            json.dump(state, f, indent=1)
+        os.replace(temp, self.state_file)
+
+    def _fingerprint(self, hashes, names):
+
+        return {name: hashes.get(self.filename(name)) for name in names};
+
+    def _key(self, step):
+
+        return hashlib.sha1(step['command'].encode('utf-8')).hexdigest();
+
+    def _is_current(self, state, hashes, step):
+
+        if not step['outputs']:
+            return False;
+
+        previous = state['steps'].get(self._key(step))
+        if previous is None:
+            return False;
+
+        outputs = self._fingerprint(hashes, step['outputs'])
+
+        return (previous['inputs'] == self._fingerprint(hashes, step['inputs']) and
+                previous['outputs'] == outputs and None not in outputs.values());
+
+    def outdated(self):
+
+        '''
+        Indices of the steps that ``execute`` would run, assuming each step that is run changes its outputs.
+        '''
+
+        state = self._load()
+        hashes = fingerprints(state['files'])
+        graph = self.graph()
+        stale = []
+
+        for i, step in enumerate(self.steps):
+            if graph[i] & set(stale) or not self._is_current(state, hashes, step):
+                stale.append(i)
+
+        return stale;
+
+    def execute(self, force=False):
+
+        '''
+        Execute the recorded steps in order, skipping steps that are up to date. The state file is updated after
+        every step so that an interrupted pipeline resumes from the failed step.
+
+        Parameters:
+        -----------
+
+        force: bool
+            execute every step
+
+        Returns:
+        --------
+
+        list of str
+            'run', 'skipped' or 'failed' for each step. Studio does not raise when a command fails, a step is
+            'failed' when not all its output files were rewritten; it is not recorded as current and runs again in
+            the next execution.
+        '''
+
+        state = self._load()
+        hashes = fingerprints(state['files'])
+        status = []
+
+        for step in self.steps:
+            if not force and self._is_current(state, hashes, step):
+                status.append('skipped')
+                continue
+
+            inputs = self._fingerprint(hashes, step['inputs'])
+            before = {name: dmstudio.batch._mtime(self.filename(name)) for name in step['outputs']}
+            self.backend.run(step['command'])
+
+            if all(dmstudio.batch._mtime(self.filename(name)) not in (None, before[name]) for name in step['outputs']):
+                state['steps'][self._key(step)] = {'command': step['command'],
+                                                   'inputs': inputs,
+                                                   'outputs': self._fingerprint(hashes, step['outputs'])}
+                status.append('run')
+            else:
+                state['steps'].pop(self._key(step), None)
+                status.append('failed')
+            state['files'] = hashes.cache
+            self._save(state)
+
+        return status;
@@ -0,0 +1,241 @@
+'''
+dmstudio.profiling
+==================
+
+Per-command latency instrumentation. The ``profiler`` backend wraps another backend and records for every command
+the wall time, the sizes and record counts of the input and output files and whether the command failed. The records
+can be aggregated per command into a report (count, total, p50, p95 and max time) and exported to CSV or JSON. Hooks
+receive every record as it is made, e.g. to forward them to a log or monitoring system.
+
+Usage:
+------
+
+>>> from dmstudio import dmcommands, profiling
+>>> dmc = dmcommands.init()
+>>> prof = profiling.profiler(dmc.backend)
+>>> dmc.backend = prof
+>>> dmc.copy(in_i='fake_model', out_o='fake_model_copy')
+>>> prof.report()
+[{'command': 'copy', 'count': 1, 'failures': 0, 'total': 0.52, 'p50': 0.52, 'p95': 0.52, 'max': 0.52, ...}]
+>>> prof.to_csv('profile.csv')
+
+'''
+
+import csv
+import json
+import os
+import time
+
+import dmstudio.backends
+import dmstudio.dmformat
+
+RECORD_FIELDS = ['command', 'start', 'elapsed', 'status', 'error', 'input_bytes', 'input_records', 'output_bytes',
+                 'output_records', 'command_string']
+
+REPORT_FIELDS = ['command', 'count', 'failures', 'total', 'mean', 'p50', 'p95', 'max', 'input_bytes',
+                 'output_bytes']
+
+
+def record_count(filename):
+    '''
+    record_count
+    ------------
+
+    Number of records in a file, or None if it can not be determined without reading the whole file.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the file
+
+    Returns:
+    --------
+
+    int or None
+    '''
+
+    extension = os.path.splitext(filename)[1].lower()
+
+    if extension == '.csv':
+        with open(filename) as f:
+            return max(sum(1 for line in f) - 1, 0);
+
+    if extension == '.dm':
+        try:
+            return dmstudio.dmformat.record_count(filename);
+        except (OSError, ValueError):
+            return None;
+
+    return None;
+
+
+def _percentile(values, q):
+
+    values = sorted(values)
+    if not values:
+        return None;
+
+    position = (len(values) - 1) * q / 100.
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+
+    return values[lower] + (values[upper] - values[lower]) * (position - lower);
+
+
+class profiler(object):
+
+    '''
+    profiler
+    --------
+
+    Command backend which times every command executed by another backend.
+
+    Parameters:
+    -----------
+
+    backend: backend object
+        optional backend executing the commands, by default the default backend
+    file_stats: bool
+        record the sizes and record counts of the input and output files
+
+    Object Properties:
+    ------------------
+
+    profiler.records: list of dict
+        one record per command with the keys in ``RECORD_FIELDS``. Sizes and record counts are totals over the
+        input or output files of the command.
+    '''
+
+    def __init__(self, backend=None, file_stats=True):
+
+        self.backend = dmstudio.backends.get_backend(backend=backend)
+        self.file_stats = file_stats
+        self.records = []
+        self.hooks = []
+
+        if hasattr(self.backend, 'filename'):
+            self.filename = self.backend.filename
+
+    @property
+    def oScript(self):
+
+        return getattr(self.backend, 'oScript', None);
+
+    def add_hook(self, hook):
+
+        '''
+        Register a function called with every record after the command has finished.
+        '''
+
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+
+        self.hooks.remove(hook)
+
+    def _file_stats(self, names):
+
+        filename = getattr(self, 'filename', dmstudio.backends.dm_path)
+        size = 0
+        records = 0
+
+        for name in names:
+            path = filename(name)
+            if not os.path.exists(path):
+                continue
+            size += os.path.getsize(path)
+            count = record_count(path)
+            records = None if records is None or count is None else records + count
+
+        return size, records;
+
+    def run(self, command):
+
+        import dmstudio.dmcommands
+
+        inputs, outputs = dmstudio.dmcommands.command_files(command)
+
+        record = {'command': dmstudio.backends.parse_command(command)['name'],
+                  'command_string': command,
+                  'start': time.time(),
+                  'status': 'ok',
+                  'error': None}
+
+        if self.file_stats:
+            record['input_bytes'], record['input_records'] = self._file_stats(inputs.values())
+
+        start = time.perf_counter()
+        try:
+            self.backend.run(command)
+        except Exception as e:
+            record['status'] = 'failed'
+            record['error'] = str(e)
+            raise
+        finally:
+            record['elapsed'] = time.perf_counter() - start
+
+            if self.file_stats:
+                record['output_bytes'], record['output_records'] = self._file_stats(outputs.values())
+
+            self.records.append(record)
+            for hook in self.hooks:
+                hook(record)
+
+    def clear(self):
+
+        self.records = []
+
+    def report(self):
+
+        '''
+        Aggregate the records per command.
+
+        Returns:
+        --------
+
+        list of dict
+            one dict per command with the keys in ``REPORT_FIELDS``, sorted by total time, slowest first
+        '''
+
+        groups = {}
+        for record in self.records:
+            groups.setdefault(record['command'], []).append(record)
+
+        report = []
+        for command, records in groups.items():
+            elapsed = [record['elapsed'] for record in records]
+            report.append({'command': command,
+                           'count': len(records),
+                           'failures': sum(record['status'] != 'ok' for record in records),
+                           'total': sum(elapsed),
+                           'mean': sum(elapsed) / len(elapsed),
+                           'p50': _percentile(elapsed, 50),
+                           'p95': _percentile(elapsed, 95),
+                           'max': max(elapsed),
+                           'input_bytes': sum(record.get('input_bytes') or 0 for record in records),
+                           'output_bytes': sum(record.get('output_bytes') or 0 for record in records)})
+
+        return sorted(report, key=lambda row: row['total'], reverse=True);
+
+    def to_csv(self, filename, records=False):
+
+        '''
+        Write the report, or the individual records if ``records`` is True, to a CSV file.
+        '''
+
+        rows, fields = (self.records, RECORD_FIELDS) if records else (self.report(), REPORT_FIELDS)
+
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def to_json(self, filename):
+
+        '''
+        Write the report and the individual records to a JSON file.
+        '''
+
+        with open(filename, 'w') as f:
+            json.dump({'report': self.report(), 'records': self.records}, f, indent=1)
@@ -0,0 +1,350 @@
+'''
+dmstudio.project
+================
+
+Persistent index of the ``.dm`` files in a Datamine project folder. For every file the index stores the size,
+modification time, record count and field list read from the data dictionary, so that scripts can look up field
+metadata without a round trip to Studio.
+
+The index is kept in a JSON file in the project folder. ``update`` only re-reads the data dictionary of files whose
+size or modification time changed since the last update, which keeps the update fast for projects with many files.
+The data dictionaries are read concurrently by a pool of threads. ``scan`` returns the same metadata for every file
+in a folder as a table, without keeping an index.
+
+Usage:
+------
+
+>>> from dmstudio import project
+>>> index = project.project_index('.')
+>>> index.update()
+{'added': ['assays', 'collars'], 'changed': [], 'removed': []}
+>>> index.with_field('AU')
+['assays']
+>>> index.changed_since(time.time() - 3600)
+[]
+>>> index.of_type('block model')
+['model']
+>>> project.scan('.')[['name', 'type', 'nrecords', 'nfields']]
+
+'''
+
+import json
+import os
+import struct
+import time
+
+import dmstudio.dmformat
+
+# file name of the index in the project folder
+INDEX_FILE = '.dmindex.json'
+
+# format version of the index file, an index of another version is rebuilt
+INDEX_VERSION = 2
+
+# columns of the table returned by scan
+SCAN_COLUMNS = ['name', 'file', 'type', 'precision', 'nrecords', 'nfields', 'fields', 'size', 'mtime', 'error']
+
+
+def read_info(filename):
+    '''
+    read_info
+    ---------
+
+    Metadata of a ``.dm`` file read from its data dictionary, without reading the records.
+
+    Parameters:
+    -----------
+
+    filename: str
+        path of the ``.dm`` file
+
+    Returns:
+    --------
+
+    dict with keys:
+        file: file name
+        size: size in bytes
+        mtime: modification time in nanoseconds
+        type: file type, see ``dmformat.file_type``
+        precision: 'single' or 'extended'
+        nrecords: number of records
+        fields: list of dict with keys 'name', 'type', 'length', 'default' and 'implicit'
+        error: message if the file or its data dictionary could not be read, the metadata is then None
+    '''
+
+    info = {'file': os.path.basename(filename),
+            'size': None,
+            'mtime': None,
+            'type': None,
+            'precision': None,
+            'nrecords': None,
+            'fields': [],
+            'error': None}
+
+    try:
+        stat = os.stat(filename)
+        info['size'] = stat.st_size
+        info['mtime'] = stat.st_mtime_ns
+        header = dmstudio.dmformat.read_header(filename)
+    except (OSError, ValueError, IndexError, struct.error) as e:
+        info['error'] = str(e) or e.__class__.__name__
+        return info;
+
+    info['type'] = dmstudio.dmformat.file_type(dmstudio.dmformat.field_names(header))
+    info['precision'] = header['precision']
+    info['nrecords'] = header['nrecords']
+    info['fields'] = [{'name': field['name'],
+                       'type': field['type'],
+                       'length': field['length'],
+                       'default': field['default'],
+                       'implicit': field['position'] is None} for field in header['fields']]
+
+    return info;
+
+
+def read_all(filenames, workers=None):
+    '''
+    read_all
+    --------
+
+    ``read_info`` of many files, read concurrently with a pool of threads. Only the data dictionary pages are read
+    so the scan is limited by file system latency, which the threads overlap.
+
+    Parameters:
+    -----------
+
+    filenames: list of str
+        paths of the ``.dm`` files
+    workers: int
+        number of threads, by default 32 or less for few files
+
+    Returns:
+    --------
+
+    list of dict
+        see ``read_info``, in the order of ``filenames``
+    '''
+
+    import concurrent.futures
+
+    if len(filenames) < 2 or workers == 1:
+        return [read_info(filename) for filename in filenames];
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers or min(32, len(filenames))) as pool:
+        return list(pool.map(read_info, filenames));
+
+
+def scan(path='.', workers=None):
+    '''
+    scan
+    ----
+
+    Table of the metadata of every ``.dm`` file in a folder, read concurrently from the data dictionaries.
+
+    Parameters:
+    -----------
+
+    path: str
+        folder to scan
+    workers: int
+        number of threads
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+        one row per file with the columns in ``SCAN_COLUMNS``. 'fields' holds the field definitions, see
+        ``read_info``.
+
+    Usage:
+    ------
+
+    >>> table = project.scan('.')
+    >>> table[table.type == 'block model'][['name', 'nrecords']]
+    '''
+
+    import pandas as pd
+
+    filenames = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if dmstudio.dmformat.is_dm(entry.name) and entry.is_file():
+                filenames.append(entry.path)
+
+    rows = []
+    for info in read_all(sorted(filenames), workers):
+        row = dict(info, name=os.path.splitext(info['file'])[0], nfields=len(info['fields']))
+        rows.append(row)
+
+    return pd.DataFrame(rows, columns=SCAN_COLUMNS);
+
+
+class project_index(object):
+
+    '''
+    project_index
+    -------------
+
+    Index of the ``.dm`` files in a project folder.
+
+    Parameters:
+    -----------
+
+    path: str
+        project folder
+    index_file: str
+        file name of the index, relative to ``path``
+    workers: int
+        number of threads reading the data dictionaries of new and changed files
+
+    Object Properties:
+    ------------------
+
+    project_index.entries: dict
+        file name without extension to the metadata of the file, see ``read_info``
+    project_index.updated: float
+        time of the last update
+    '''
+
+    def __init__(self, path='.', index_file=INDEX_FILE, workers=None):
+
+        self.path = path
+        self.index_file = os.path.join(path, index_file)
+        self.workers = workers
+        self.entries = {}
+        self.updated = None
+
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file) as f:
+                    state = json.load(f)
+                # an index of an older version or a corrupt index is rebuilt by the next update
+                if state.get('version') == INDEX_VERSION:
+                    self.entries = state['entries']
+                    self.updated = state['updated']
+            except (ValueError, KeyError):
+                self.entries = {}
+
+    def _scan(self):
+
+        files = {}
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if dmstudio.dmformat.is_dm(entry.name) and entry.is_file():
+                    files[os.path.splitext(entry.name)[0]] = entry
+
+        return files;
+
+    def update(self, save=True):
+
+        '''
+        Bring the index up to date with the project folder.
+
+        Parameters:
+        -----------
+
+        save: bool
+            write the index file if anything changed
+
+        Returns:
+        --------
+
+        dict
+            names of the files that were 'added', 'changed' and 'removed' since the last update
+        '''
+
+        files = self._scan()
+        changes = {'added': [], 'changed': [], 'removed': []}
+
+        for name in list(self.entries):
+            if name not in files:
+                del self.entries[name]
+                changes['removed'].append(name)
+
+        stale = []
+        for name, entry in files.items():
+            stat = entry.stat()
+            cached = self.entries.get(name)
+            if cached is not None and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime_ns:
+                continue
+            stale.append(entry.path)
+            changes['changed' if cached is not None else 'added'].append(name)
+
+        for info in read_all(stale, self.workers):
+            self.entries[os.path.splitext(info['file'])[0]] = info
+
+        self.updated = time.time()
+        for key in changes:
+            changes[key].sort()
+
+        if save and any(changes.values()):
+            self.save()
+
+        return changes;
+
+    def save(self):
+
+        temp = self.index_file + '.tmp'
+        with open(temp, 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'updated': self.updated, 'entries': self.entries}, f)
+        os.replace(temp, self.index_file)
+
+    def files(self):
+
+        '''
+        Sorted names of the indexed files, without extension.
+        '''
+
+        return sorted(self.entries);
+
+    def info(self, name):
+
+        '''
+        Index entry of a file, see ``entries``.
+        '''
+
+        return self.entries[os.path.splitext(os.path.basename(name))[0]];
+
+    def fields(self, name):
+
+        '''
+        Field names of a file.
+        '''
+
+        return [field['name'] for field in self.info(name)['fields']];
+
+    def with_field(self, *fields):
+
+        '''
+        Names of the files which have all the given fields.
+        '''
+
+        wanted = set(field.upper() for field in fields)
+
+        return self.query(lambda name, info: wanted <= set(field['name'] for field in info['fields']));
+
+    def of_type(self, ftype):
+
+        '''
+        Names of the files of a type, e.g. 'block model', see ``dmformat.file_type``.
+        '''
+
+        return self.query(lambda name, info: info['type'] == ftype);
+
+    def changed_since(self, timestamp):
+
+        '''
+        Names of the files modified after ``timestamp`` (seconds since the epoch, as returned by ``time.time``).
+        '''
+
+        limit = int(timestamp * 1e9)
+
+        return self.query(lambda name, info: (info['mtime'] or 0) > limit);
+
+    def query(self, predicate):
+
+        '''
+        Names of the files for which ``predicate(name, info)`` is true, ``info`` being the index entry of the file.
+        '''
+
+        return sorted(name for name, info in self.entries.items() if predicate(name, info));
@@ -0,0 +1,629 @@
+'''
+dmstudio.retrieval
+==================
+
+Parser and NumPy evaluator for Datamine retrieval criteria, the strings passed as ``retrieval`` to the
+``dmcommands.init`` methods. Criteria are evaluated over a batch of records given as a mapping of field name to
+array, such as a DataFrame or a dict of columns.
+
+Syntax:
+-------
+
+* comparisons of a field with a number, a quoted text, another field or ``-`` (absent):
+  ``AU>2.0``, ``ROCK="OX"``, ``AU>=CU``, ``AU=-``, ``AU<>-``. The operators are ``=``, ``<>``, ``<``, ``<=``,
+  ``>`` and ``>=``.
+* ranges, inclusive of both limits: ``ZONE=1,3`` selects 1 <= ZONE <= 3 and ``ZONE<>1,3`` the values outside
+* text matching with the wildcards ``*`` (any characters) and ``?`` (one character): ``BHID="DH1*"``.
+  Trailing spaces are ignored. An unquoted value is text when the field is alphanumeric and no field has that name.
+* ``NOT``, ``AND`` and ``OR`` in that order of precedence, and parentheses
+
+Field expressions, such as the right hand side of an EXTRA assignment, use the same parser with arithmetic
+(``+ - * / ^``), functions (``ABS``, ``LOG``, ``MAX``, ...) and comparisons combined with ``NOT``, ``AND`` and ``OR``;
+``evaluate`` computes them over a batch of records.
+
+Absent values (NaN or ``dmformat.ABSENT`` for numeric fields, blank for alphanumeric fields) are only selected by
+``=-``. Comparisons and ranges, including ``<>``, never select them, ``NOT`` inverts the selection as a whole.
+
+Usage:
+------
+
+>>> from dmstudio import retrieval
+>>> retrieval.validate('AU>2.0 AND (ROCK="OX" OR ZONE=1,3)')
+>>> retrieval.fields('AU>2.0 AND (ROCK="OX" OR ZONE=1,3)')
+['AU', 'ROCK', 'ZONE']
+>>> df[retrieval.mask(df, 'AU>2.0 AND ROCK="OX"')]
+
+'''
+
+import functools
+import re
+
+import dmstudio.dmformat
+
+_FUNCTIONS = {'ABS': 'abs', 'EXP': 'exp', 'LOG': 'log', 'LOG10': 'log10', 'SQRT': 'sqrt', 'SIN': 'sin',
+              'COS': 'cos', 'TAN': 'tan', 'INT': 'trunc', 'MIN': 'minimum', 'MAX': 'maximum'}
+
+_KEYWORDS = ['AND', 'OR', 'NOT']
+
+_TOKENS = re.compile(r"""
+    \s*(?:
+    (?P<string>"[^"]*"|'[^']*')|
+    (?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|
+    (?P<operator><=|>=|<>|=|<|>)|
+    (?P<punctuation>[(),])|
+    (?P<absent>-)|
+    (?P<name>[A-Za-z_][A-Za-z0-9_]*)|
+    (?P<error>\S)
+    )""", re.X)
+
+# tokens of field expressions: numbers are unsigned, + - * / ^ are arithmetic operators
+_EXPRESSION_TOKENS = re.compile(r"""
+    \s*(?:
+    (?P<string>"[^"]*"|'[^']*')|
+    (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|
+    (?P<operator><=|>=|<>|=|<|>)|
+    (?P<arithmetic>[-+*/^])|
+    (?P<punctuation>[(),])|
+    (?P<name>[A-Za-z_][A-Za-z0-9_]*)|
+    (?P<error>\S)
+    )""", re.X)
+
+
+def _tokenize(retrieval, pattern=_TOKENS, label='retrieval'):
+
+    tokens = []
+    for match in pattern.finditer(retrieval):
+        kind = match.lastgroup
+        if kind is None:
+            continue
+        text = match.group(kind)
+        position = match.start(kind) + 1
+        if kind == 'error':
+            raise ValueError("Invalid " + label + " '" + retrieval + "': unexpected '" + text + "' at position " +
+                             str(position))
+        if kind == 'name' and text.upper() in _KEYWORDS:
+            kind, text = 'keyword', text.upper()
+        tokens.append((kind, text, position))
+
+    return tokens;
+
+
+class _parser(object):
+
+    # recursive descent parser of retrieval criteria and field expressions, NOT binds tighter than AND which binds
+    # tighter than OR
+
+    def __init__(self, retrieval, pattern=_TOKENS, label='retrieval'):
+
+        self.retrieval = retrieval
+        self.label = label
+        self.tokens = _tokenize(retrieval, pattern, label)
+        self.i = 0
+
+    def error(self, expected):
+
+        if self.i < len(self.tokens):
+            found = "'" + self.tokens[self.i][1] + "' at position " + str(self.tokens[self.i][2])
+        else:
+            found = "end of " + self.label
+
+        return ValueError("Invalid " + self.label + " '" + self.retrieval + "': expected " + expected + ", found " +
+                          found);
+
+    def peek(self, kind, text=None):
+
+        if self.i < len(self.tokens):
+            token = self.tokens[self.i]
+            return token[0] == kind and (text is None or token[1] == text);
+
+        return False;
+
+    def take(self, kind, text=None, expected=None):
+
+        if not self.peek(kind, text):
+            raise self.error(expected or text or kind)
+        self.i += 1
+
+        return self.tokens[self.i - 1];
+
+    def parse(self):
+
+        if not self.tokens:
+            raise self.error("a comparison")
+
+        node = self.expression()
+        if self.i < len(self.tokens):
+            raise self.error("AND, OR or end of retrieval")
+
+        return node;
+
+    def expression(self):
+
+        nodes = [self.term()]
+        while self.peek('keyword', 'OR'):
+            self.i += 1
+            nodes.append(self.term())
+
+        return nodes[0] if len(nodes) == 1 else ('or', tuple(nodes));
+
+    def term(self):
+
+        nodes = [self.factor()]
+        while self.peek('keyword', 'AND'):
+            self.i += 1
+            nodes.append(self.factor())
+
+        return nodes[0] if len(nodes) == 1 else ('and', tuple(nodes));
+
+    def factor(self):
+
+        if self.peek('keyword', 'NOT'):
+            self.i += 1
+            return ('not', self.factor());
+
+        if self.peek('punctuation', '('):
+            self.i += 1
+            node = self.expression()
+            self.take('punctuation', ')')
+            return node;
+
+        name = self.take('name', expected="a field name")[1].upper()
+        operator = self.take('operator', expected="a comparison operator")[1]
+        values = [self.value()]
+
+        if self.peek('punctuation', ','):
+            if operator not in ('=', '<>'):
+                raise self.error("a single value after " + operator)
+            self.i += 1
+            values.append(self.value())
+            if values[0][0] == 'absent' or values[1][0] == 'absent':
+                raise self.error("range limits")
+        elif values[0][0] == 'absent' and operator not in ('=', '<>'):
+            raise self.error("= or <> before -")
+
+        return ('compare', name, operator, tuple(values));
+
+    def value(self):
+
+        for kind in ('number', 'string', 'name', 'absent'):
+            if self.peek(kind):
+                text = self.take(kind)[1]
+                if kind == 'number':
+                    return ('number', float(text));
+                if kind == 'string':
+                    return ('string', text[1:-1]);
+                if kind == 'name':
+                    return ('name', text.upper());
+                return ('absent', None);
+
+        raise self.error("a value")
+
+    # field expressions: comparisons of arithmetic expressions combined with NOT, AND and OR
+
+    def formula(self):
+
+        if not self.tokens:
+            raise self.error("an expression")
+
+        node = self.disjunction()
+        if self.i < len(self.tokens):
+            raise self.error("an operator or end of expression")
+
+        return node;
+
+    def disjunction(self):
+
+        nodes = [self.conjunction()]
+        while self.peek('keyword', 'OR'):
+            self.i += 1
+            nodes.append(self.conjunction())
+
+        return nodes[0] if len(nodes) == 1 else ('or', tuple(nodes));
+
+    def conjunction(self):
+
+        nodes = [self.negation()]
+        while self.peek('keyword', 'AND'):
+            self.i += 1
+            nodes.append(self.negation())
+
+        return nodes[0] if len(nodes) == 1 else ('and', tuple(nodes));
+
+    def negation(self):
+
+        if self.peek('keyword', 'NOT'):
+            self.i += 1
+            return ('not', self.negation());
+
+        node = self.sum()
+        if self.peek('operator'):
+            operator = self.take('operator')[1]
+            node = ('relation', operator, node, self.sum())
+
+        return node;
+
+    def sum(self):
+
+        node = self.product()
+        while self.peek('arithmetic', '+') or self.peek('arithmetic', '-'):
+            operator = self.take('arithmetic')[1]
+            node = ('arithmetic', operator, node, self.product())
+
+        return node;
+
+    def product(self):
+
+        node = self.signed()
+        while self.peek('arithmetic', '*') or self.peek('arithmetic', '/'):
+            operator = self.take('arithmetic')[1]
+            node = ('arithmetic', operator, node, self.signed())
+
+        return node;
+
+    def signed(self):
+
+        if self.peek('arithmetic', '-') or self.peek('arithmetic', '+'):
+            operator = self.take('arithmetic')[1]
+            node = self.signed()
+            return node if operator == '+' else ('negate', node);
+
+        node = self.operand()
+        if self.peek('arithmetic', '^'):
+            self.i += 1
+            node = ('arithmetic', '^', node, self.signed())
+
+        return node;
+
+    def operand(self):
+
+        if self.peek('number'):
+            return ('number', float(self.take('number')[1]));
+        if self.peek('string'):
+            return ('string', self.take('string')[1][1:-1]);
+        if self.peek('punctuation', '('):
+            self.i += 1
+            node = self.disjunction()
+            self.take('punctuation', ')')
+            return node;
+
+        name = self.take('name', expected="a value, field or function")[1].upper()
+        if not self.peek('punctuation', '('):
+            return ('field', name);
+        if name not in _FUNCTIONS:
+            self.i -= 1
+            raise self.error("a known function")
+
+        self.i += 1
+        arguments = [self.disjunction()]
+        while self.peek('punctuation', ','):
+            self.i += 1
+            arguments.append(self.disjunction())
+        self.take('punctuation', ')')
+
+        return ('call', name, tuple(arguments));
+
+
+@functools.lru_cache(maxsize=256)
+def parse(retrieval):
+    '''
+    parse
+    -----
+
+    Parse retrieval criteria into a syntax tree.
+
+    Parameters:
+    -----------
+
+    retrieval: str
+        Datamine retrieval criteria
+
+    Returns:
+    --------
+
+    tuple
+        ('or', nodes), ('and', nodes), ('not', node) or ('compare', field, operator, values) with values a tuple
+        of ('number', float), ('string', str), ('name', str) or ('absent', None)
+
+    Raises:
+    -------
+
+    ValueError
+        if the criteria are malformed, the message gives the position of the error
+    '''
+
+    return _parser(retrieval).parse();
+
+
+def _walk(node):
+
+    if node[0] == 'compare':
+        yield node
+    elif node[0] == 'not':
+        yield from _walk(node[1])
+    else:
+        for child in node[1]:
+            yield from _walk(child)
+
+
+def fields(retrieval):
+    '''
+    fields
+    ------
+
+    Names of the fields referenced by retrieval criteria, including unquoted values which may be field names.
+
+    Returns:
+    --------
+
+    list of str
+        upper case field names in order of first use
+    '''
+
+    names = []
+    for _, name, _, values in _walk(parse(retrieval)):
+        for candidate in [name] + [value[1] for value in values if value[0] == 'name']:
+            if candidate not in names:
+                names.append(candidate)
+
+    return names;
+
+
+def _is_numeric(kind):
+
+    return kind in 'biuf';
+
+
+def validate(retrieval, field_types=None):
+    '''
+    validate
+    --------
+
+    Check retrieval criteria before a command is sent to Studio.
+
+    Parameters:
+    -----------
+
+    retrieval: str
+        Datamine retrieval criteria
+    field_types: dict
+        optional field name to 'A' (alphanumeric) or 'N' (numeric) of the input file(s). If given, the fields must
+        exist and quoted text can only be compared with alphanumeric fields.
+
+    Raises:
+    -------
+
+    ValueError
+        if the criteria are malformed or do not match the fields
+    '''
+
+    tree = parse(retrieval)
+    if field_types is None:
+        return
+
+    field_types = {name.upper(): ftype for name, ftype in field_types.items()}
+    for _, name, operator, values in _walk(tree):
+        if name not in field_types:
+            raise ValueError("Invalid retrieval '" + retrieval + "': field " + name + " not found")
+        for kind, value in values:
+            if kind == 'string' and field_types[name] == 'N':
+                raise ValueError("Invalid retrieval '" + retrieval + "': numeric field " + name +
+                                 " compared with text")
+            if kind == 'name' and value not in field_types and field_types[name] == 'N':
+                raise ValueError("Invalid retrieval '" + retrieval + "': field " + value + " not found")
+
+
+def _column(columns, lookup, name):
+
+    import numpy as np
+
+    values = np.asarray(columns[lookup[name]])
+    if values.dtype.kind == 'S':
+        values = np.char.decode(values, 'latin-1')
+
+    if _is_numeric(values.dtype.kind):
+        values = values.astype(float)
+        absent = np.isnan(values) | (values <= dmstudio.dmformat.ABSENT * 0.99999)
+    else:
+        values = np.char.rstrip(values.astype(str))
+        absent = values == ''
+
+    return values, absent;
+
+
+def _compare(values, operator, other):
+
+    import operator as op
+
+    return {'=': op.eq, '<>': op.ne, '<': op.lt, '<=': op.le, '>': op.gt, '>=': op.ge}[operator](values, other);
+
+
+def _match(values, pattern):
+
+    import fnmatch
+    import numpy as np
+
+    pattern = pattern.rstrip()
+    if '*' not in pattern and '?' not in pattern:
+        return values == pattern;
+
+    regex = re.compile(fnmatch.translate(pattern))
+    unique, inverse = np.unique(values, return_inverse=True)
+
+    return np.array([regex.match(value) is not None for value in unique], dtype=bool)[inverse].reshape(values.shape);
+
+
+def _evaluate_node(node, columns, lookup, retrieval):
+
+    import numpy as np
+
+    if node[0] == 'or':
+        return functools.reduce(np.logical_or, [_evaluate_node(n, columns, lookup, retrieval)
+                                                for n in node[1]]);
+    if node[0] == 'and':
+        return functools.reduce(np.logical_and, [_evaluate_node(n, columns, lookup, retrieval)
+                                                 for n in node[1]]);
+    if node[0] == 'not':
+        return ~_evaluate_node(node[1], columns, lookup, retrieval);
+
+    _, name, operator, values = node
+    if name not in lookup:
+        raise KeyError("Field " + name + " not found")
+
+    data, absent = _column(columns, lookup, name)
+    numeric = _is_numeric(data.dtype.kind)
+
+    if values[0][0] == 'absent':
+        return absent if operator == '=' else ~absent;
+
+    limits = []
+    present = ~absent
+    for kind, value in values:
+        if kind == 'name' and value in lookup:
+            other, other_absent = _column(columns, lookup, value)
+            if _is_numeric(other.dtype.kind) != numeric:
+                raise ValueError("Invalid retrieval '" + retrieval + "': fields " + name + " and " + value +
+                                 " have different types")
+            limits.append(other)
+            present = present & ~other_absent
+        elif kind == 'name' and not numeric:
+            limits.append(value)
+        elif kind == 'name':
+            raise KeyError("Field " + value + " not found")
+        elif (kind == 'number') != numeric:
+            raise ValueError("Invalid retrieval '" + retrieval + "': field " + name + " compared with a value of" +
+                             " the wrong type")
+        elif kind == 'string':
+            limits.append(value.rstrip())
+        else:
+            limits.append(value)
+
+    if len(limits) == 2:
+        inside = (data >= limits[0]) & (data <= limits[1])
+        return present & (inside if operator == '=' else ~inside);
+
+    if not numeric and operator in ('=', '<>') and isinstance(limits[0], str):
+        matched = _match(data, limits[0])
+        return present & (matched if operator == '=' else ~matched);
+
+    return present & _compare(data, operator, limits[0]);
+
+
+def mask(columns, retrieval):
+    '''
+    mask
+    ----
+
+    Boolean mask of the records selected by retrieval criteria.
+
+    Parameters:
+    -----------
+
+    columns: DataFrame or dict of arrays
+        record batch, field names are matched case insensitively
+    retrieval: str
+        Datamine retrieval criteria
+
+    Returns:
+    --------
+
+    numpy.ndarray of bool
+    '''
+
+    import numpy as np
+
+    lookup = {str(column).upper(): column for column in columns}
+    first = next(iter(columns), None)
+    size = len(columns[first]) if first is not None else 0
+
+    selected = _evaluate_node(parse(retrieval), columns, lookup, retrieval)
+
+    return np.broadcast_to(np.asarray(selected, dtype=bool), (size,));
+
+
+@functools.lru_cache(maxsize=256)
+def parse_expression(expression):
+    '''
+    parse_expression
+    ----------------
+
+    Parse a Datamine field expression, e.g. the right hand side of an EXTRA assignment, into a syntax tree.
+
+    Returns:
+    --------
+
+    tuple
+        ('or', nodes), ('and', nodes), ('not', node), ('relation', operator, left, right),
+        ('arithmetic', operator, left, right), ('negate', node), ('call', function, arguments), ('field', name),
+        ('number', float) or ('string', str)
+
+    Raises:
+    -------
+
+    ValueError
+        if the expression is malformed, the message gives the position of the error
+    '''
+
+    return _parser(expression, _EXPRESSION_TOKENS, 'expression').formula();
+
+
+def _calculate(node, columns, lookup):
+
+    import operator as op
+    import numpy as np
+
+    kind = node[0]
+    if kind in ('number', 'string'):
+        return node[1];
+    if kind == 'field':
+        if node[1] not in lookup:
+            raise KeyError("Field " + node[1] + " not found")
+        return np.asarray(columns[lookup[node[1]]]);
+    if kind == 'negate':
+        return -_calculate(node[1], columns, lookup);
+    if kind == 'call':
+        return getattr(np, _FUNCTIONS[node[1]])(*[_calculate(n, columns, lookup) for n in node[2]]);
+    if kind == 'not':
+        return np.logical_not(_calculate(node[1], columns, lookup));
+    if kind in ('and', 'or'):
+        return functools.reduce(np.logical_and if kind == 'and' else np.logical_or,
+                                [_calculate(n, columns, lookup) for n in node[1]]);
+
+    left, right = _calculate(node[2], columns, lookup), _calculate(node[3], columns, lookup)
+    if kind == 'relation':
+        return _compare(left, node[1], right);
+
+    return {'+': op.add, '-': op.sub, '*': op.mul, '/': op.truediv, '^': op.pow}[node[1]](left, right);
+
+
+def evaluate(columns, expression):
+    '''
+    evaluate
+    --------
+
+    Evaluate a Datamine field expression, e.g. the right hand side of an EXTRA assignment: arithmetic with
+    + - * / ^, the functions ABS, EXP, LOG, LOG10, SQRT, SIN, COS, TAN, INT, MIN and MAX, comparisons and NOT, AND
+    and OR, see ``parse_expression``.
+
+    Parameters:
+    -----------
+
+    columns: DataFrame or dict of arrays
+        record batch, field names are matched case insensitively
+    expression: str
+        Datamine expression
+
+    Returns:
+    --------
+
+    numpy.ndarray or scalar
+
+    Usage:
+    ------
+
+    >>> retrieval.evaluate(df, 'AU>2 AND NOT CU<1')
+    >>> retrieval.evaluate(df, 'MAX(AU - 0.5, 0) * DENSITY ^ 2')
+    '''
+
+    lookup = {str(column).upper(): column for column in columns}
+
+    return _calculate(parse_expression(expression), columns, lookup);
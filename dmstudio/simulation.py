@@ -0,0 +1,606 @@
+'''
+dmstudio.simulation
+===================
+
+Sequential gaussian simulation without Studio, as a native alternative to SGSIM. The grid, search and kriging are
+controlled by the parameters of SGSIM and the variogram model by a VMODPARM table.
+
+The neighbours of a node do not change between realizations, only the order in which the nodes are visited does.
+The sample neighbours of all nodes are therefore searched once, with a KD-tree in the frame of the search ellipsoid,
+and the previously simulated nodes are found with a template of grid offsets sorted on covariance. For every
+realization the random path is drawn first, after which the neighbours and kriging systems of all nodes are
+solved in batches; only the final pass along the path, which draws the values, is sequential. Realizations are
+simulated by a pool of processes, each with its own seed derived from SEED and the realization number, so the
+realizations do not depend on the number of processes or on how they are split over calls.
+
+The samples must be normal scores (TRANTYPE=0 of SGSIM) and the simulated values are normal scores. Simple
+(KTYPE=0) and ordinary kriging (KTYPE=1) are supported. Requires ``scipy`` for the KD-tree.
+
+``postprocess`` summarises the realizations in one pass over the records: E-type, conditional variance,
+probabilities above cutoffs and percentiles such as P10, P50 and P90.
+
+Usage:
+------
+
+>>> from dmstudio import simulation
+>>> sims = simulation.sgsim('comps_ns', 'vmodparm', 'NSAU', proto='proto', xpppc_p=2, ypppc_p=2, zpppc_p=2,
+...                         nsim_p=200, seed_p=7215, sdist1_p=120, sdist2_p=120, sdist3_p=40, multgrid_p=3)
+>>> dmio.write_dm('sims.dm', sims)
+>>> simulation.postprocess('sims.dm', 'simstats.dm', cutoffs=[-0.5, 0., 0.5])
+
+'''
+
+import os
+import re
+
+import dmstudio.dmformat
+import dmstudio.dmio
+import dmstudio.drillholes
+import dmstudio.estimation
+import dmstudio.variogram
+
+# kriging types of the KTYPE parameter of SGSIM
+KTYPES = {0: 'simple kriging', 1: 'ordinary kriging'}
+
+# realization fields of SGSIM models, SIM1, SIM2, ...
+REALIZATION_PATTERN = r'SIM[0-9]+$'
+
+# state of a worker process, set by _init_worker
+_state = {}
+
+
+def _grid(proto, pppc, origin, size, number):
+
+    # simulated nodes: coordinates, integer grid indices, node spacing and the output fields of the nodes
+    import numpy as np
+    import pandas as pd
+
+    pppc = np.array([int(n) for n in pppc])
+
+    if proto is None:
+        size = np.array([float(s) for s in size])
+        index = np.stack(np.meshgrid(*[np.arange(int(n)) for n in number], indexing='ij'), axis=-1)
+        index = index.transpose(2, 1, 0, 3).reshape(-1, 3)
+        xyz = np.array([float(o) for o in origin]) + index * size
+        fields = pd.DataFrame({'XPT': xyz[:, 0], 'YPT': xyz[:, 1], 'ZPT': xyz[:, 2]})
+        return xyz, index, size, fields;
+
+    cells = dmstudio.estimation._prototype(proto)
+    missing = [name for name in ('IJK', 'XC', 'YC', 'ZC', 'XMORIG', 'YMORIG', 'ZMORIG', 'XINC', 'YINC', 'ZINC')
+               if name not in cells.columns]
+    if missing:
+        raise ValueError("Prototype model is missing the fields " + ", ".join(missing))
+
+    # parent cells holding at least one cell or subcell, from the cell centres, in IJK order (Z fastest)
+    parent = cells[['XINC', 'YINC', 'ZINC']].to_numpy(float).max(axis=0)
+    header = cells.iloc[0]
+    morig = np.array([float(header[axis + 'MORIG']) for axis in 'XYZ'])
+    centres = cells[['XC', 'YC', 'ZC']].to_numpy(float)
+    cell, first = np.unique(np.floor((centres - morig) / parent).astype(np.int64), axis=0, return_index=True)
+    ijk = cells['IJK'].to_numpy(np.int64)[first]
+
+    offsets = np.stack(np.meshgrid(*[np.arange(n) for n in pppc], indexing='ij'), axis=-1).reshape(-1, 3)
+    index = (cell[:, None, :] * pppc + offsets[None, :, :]).reshape(-1, 3)
+    size = parent / pppc
+    xyz = morig + (index + 0.5) * size
+
+    fields = pd.DataFrame({'IJK': np.repeat(ijk, len(offsets)),
+                           'XC': xyz[:, 0], 'YC': xyz[:, 1], 'ZC': xyz[:, 2],
+                           'XINC': size[0], 'YINC': size[1], 'ZINC': size[2]})
+    for name in ('XMORIG', 'YMORIG', 'ZMORIG', 'NX', 'NY', 'NZ'):
+        if name in cells.columns:
+            fields[name] = header[name]
+
+    return xyz, index, size, fields;
+
+
+def template(model, matrix, size):
+    '''
+    template
+    --------
+
+    Grid offsets of the nodes within the search ellipsoid, sorted on decreasing covariance and then on distance in
+    the search frame, the order in which previously simulated nodes are searched.
+
+    Parameters:
+    -----------
+
+    model: dmstudio.variogram.variogram_model
+    matrix: numpy.ndarray
+        matrix transforming coordinates to the search frame, in which the search ellipsoid is the unit sphere
+    size: numpy.ndarray
+        node spacing along X, Y and Z
+
+    Returns:
+    --------
+
+    numpy.ndarray
+        integer offsets of shape (n, 3), without the zero offset
+    '''
+
+    import numpy as np
+
+    # extent of the ellipsoid along the grid axes
+    extent = np.ceil(np.sqrt((np.linalg.inv(matrix) ** 2).sum(axis=1)) / size).astype(int)
+    axes = [np.arange(-e, e + 1) for e in extent]
+    offsets = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, 3)
+    h = offsets * size
+    distance = np.linalg.norm(h @ matrix.T, axis=1)
+    inside = (distance <= 1. + 1e-9) & offsets.any(axis=1)
+    offsets, h, distance = offsets[inside], h[inside], distance[inside]
+    order = np.lexsort((distance, -model.covariance(h)))
+
+    return offsets[order];
+
+
+def _init_worker(state):
+
+    _state.clear()
+    _state.update(state)
+
+
+def _path(rng, index, simulated, multgrid):
+
+    # random path over the nodes to simulate, the nodes of the coarser grids first with multiple grids
+    import numpy as np
+
+    key = rng.random(len(index))
+    if multgrid > 1:
+        level = np.zeros(len(index))
+        for g in range(1, multgrid):
+            level += (index % (1 << g) == 0).all(axis=1)
+        key = key - level
+    path = np.nonzero(simulated)[0]
+
+    return path[np.argsort(key[path], kind='stable')];
+
+
+def _previous(nodes, rank, position, lookup, deltas, maxsimpt):
+
+    # first maxsimpt nodes of the template visited before each node, the template is scanned in growing slices
+    # until every node has its neighbours
+    import numpy as np
+
+    near = np.full((len(nodes), maxsimpt), -1)
+    found = np.zeros(len(nodes), int)
+    active = np.arange(len(nodes))
+    start, width = 0, 4 * maxsimpt
+
+    while len(active) and start < len(deltas):
+        node = lookup[position[nodes[active]][:, None] + deltas[None, start:start + width]]
+        before = (node >= 0) & (rank[np.maximum(node, 0)] < rank[nodes[active]][:, None])
+        slot = found[active][:, None] + np.cumsum(before, axis=1) - 1
+        rows, columns = np.nonzero(before & (slot < maxsimpt))
+        near[active[rows], slot[rows, columns]] = node[rows, columns]
+        found[active] = np.minimum(found[active] + before.sum(axis=1), maxsimpt)
+        active = active[found[active] < maxsimpt]
+        start, width = start + width, 2 * width
+
+    return near;
+
+
+def _realization(simnum):
+
+    # one realization: random path, neighbours and kriging systems of all nodes, then the values along the path
+    import numpy as np
+
+    state = _state
+    xyz, index = state['xyz'], state['index']
+    model, simple = state['model'], state['simple']
+    data, values, known = state['data'], state['values'], state['known']
+    nnodes = len(xyz)
+
+    rng = np.random.default_rng([state['seed'], simnum])
+    path = _path(rng, index, state['simulated'], state['multgrid'])
+    rank = np.full(nnodes, np.iinfo(np.int64).max)
+    rank[path] = np.arange(len(path))
+    rank[known >= 0] = -1
+
+    result = np.full(nnodes, np.nan)
+    result[known >= 0] = values[known[known >= 0]]
+    weights = np.zeros((nnodes, state['maxdatpt'] + state['maxsimpt']))
+    previous = np.full((nnodes, state['maxsimpt']), -1)
+    mean = np.zeros(nnodes)
+    sigma = np.zeros(nnodes)
+    sill = model.sill
+
+    for first in range(0, len(path), state['chunk_nodes']):
+        nodes = path[first:first + state['chunk_nodes']]
+
+        near = _previous(nodes, rank, state['position'], state['lookup'], state['deltas'], state['maxsimpt'])
+        previous[nodes] = near
+
+        # kriging of the nodes from their samples and previously simulated nodes
+        samples = data[nodes]
+        used = np.concatenate([samples >= 0, near >= 0], axis=1)
+        points = np.concatenate([state['xyz_samples'][np.maximum(samples, 0)], xyz[np.maximum(near, 0)]], axis=1)
+        m = used.shape[1]
+        cov = model.covariance(points[:, :, None, :] - points[:, None, :, :])
+        rhs = model.covariance(points - xyz[nodes][:, None, :])
+        a, b = dmstudio.estimation._system(cov, rhs, used, simple)
+        empty = ~used.any(axis=1)
+        if not simple:
+            a[empty, m, m] = 1.
+        solution = dmstudio.estimation._solve(a, b)
+        w = np.where(used, solution[:, :m], 0.)
+        variance = sill - np.sum(w * b[:, :m], axis=1)
+        if not simple:
+            variance = variance - np.where(empty, 0., solution[:, m])
+        variance[empty] = sill
+
+        weights[nodes, :m] = w
+        mean[nodes] = np.sum(w[:, :samples.shape[1]] * np.where(samples >= 0, values[np.maximum(samples, 0)], 0.),
+                             axis=1)
+        sigma[nodes] = np.sqrt(np.maximum(variance, 0.))
+
+    # values along the path, the only sequential step
+    noise = rng.standard_normal(len(path))
+    offset = state['maxdatpt']
+    for position, p in enumerate(path.tolist()):
+        near = previous[p]
+        near = near[near >= 0]
+        result[p] = mean[p] + weights[p, offset:offset + len(near)] @ result[near] + sigma[p] * noise[position]
+
+    return result;
+
+
+def sgsim(samples, vmodparm, grade_f, proto=None, x_f='X', y_f='Y', z_f='Z', mingrade_p=None, maxgrade_p=None,
+          nsim_p=1, xpppc_p=1, ypppc_p=1, zpppc_p=1, xmin_p=1, ymin_p=1, zmin_p=1, xsize_p=1, ysize_p=1, zsize_p=1,
+          nx_p=10, ny_p=10, nz_p=10, seed_p=None, mindatpt_p=1, maxdatpt_p=12, maxsimpt_p=12, sstrat_p=0,
+          multgrid_p=0, maxperoc_p=0, sdist1_p=50, sdist2_p=50, sdist3_p=50, sangle1_p=0, sangle2_p=0, sangle3_p=0,
+          ktype_p=0, vmodnum_p=1, first=1, workers=None, chunk_nodes=2048):
+    '''
+    sgsim
+    -----
+
+    Sequential gaussian simulation of normal scores on a regular grid of points, with the parameters of SGSIM.
+
+    Parameters:
+    -----------
+
+    samples: pandas.DataFrame or str
+        samples with the coordinate fields and the normal scores ``grade_f``
+    vmodparm: pandas.DataFrame or str
+        variogram model table, the model of the normal scores has a sill of 1
+    grade_f: str
+        normal score field
+    proto: pandas.DataFrame or str
+        prototype model, the points are simulated in the parent cells holding a cell or subcell, or in all parent
+        cells if the prototype has no records. If not given the grid is defined by XMIN, XSIZE, NX etc.
+    x_f, y_f, z_f: str
+        sample coordinate fields
+    mingrade_p, maxgrade_p: float
+        samples outside these limits are ignored
+    nsim_p: int
+        number of realizations
+    xpppc_p, ypppc_p, zpppc_p: int
+        number of points per parent cell of the prototype
+    xmin_p, ymin_p, zmin_p, xsize_p, ysize_p, zsize_p, nx_p, ny_p, nz_p: float
+        first point, spacing and number of points of the grid without prototype
+    seed_p: int
+        random number seed; realization n is simulated with the seed (SEED, n)
+    mindatpt_p, maxdatpt_p: int
+        minimum and maximum number of samples, nodes with fewer samples are not simulated (SSTRAT=0)
+    maxsimpt_p: int
+        maximum number of previously simulated nodes
+    sstrat_p: int
+        0: samples and simulated nodes are searched separately, 1: samples are moved to the nearest node
+    multgrid_p: int
+        number of grids of a multiple grid simulation, 0 or 1 for a single grid
+    maxperoc_p: int
+        maximum number of samples per octant, 0 for no octant search
+    sdist1_p, sdist2_p, sdist3_p, sangle1_p, sangle2_p, sangle3_p: float
+        search ellipsoid, rotated around the Z, X and Y axes
+    ktype_p: int
+        0: simple kriging with a mean of zero, 1: ordinary kriging
+    vmodnum_p: int
+        VREFNUM of the variogram model
+    first: int
+        number of the first realization, to simulate a large number of realizations in several calls
+    workers: int
+        number of processes, by default the number of CPUs
+    chunk_nodes: int
+        number of nodes of which the kriging systems are solved at a time
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+        one record per point with the coordinates (IJK, XC, YC, ZC, XINC, YINC, ZINC and the model origin fields
+        with a prototype, XPT, YPT and ZPT without) and the fields SIM<n> of realizations n = first...
+
+    Usage:
+    ------
+
+    >>> sims = simulation.sgsim('comps_ns', 'vmodparm', 'NSAU', xmin_p=2.5, ymin_p=2.5, zmin_p=2.5, xsize_p=5,
+    ...                         ysize_p=5, zsize_p=5, nx_p=200, ny_p=200, nz_p=40, nsim_p=100, seed_p=12345)
+    '''
+
+    import concurrent.futures
+    import numpy as np
+    import pandas as pd
+
+    if int(ktype_p) not in KTYPES:
+        raise ValueError("KTYPE=" + str(ktype_p) + " is not supported, expected one of " +
+                         ", ".join(str(key) + "=" + name for key, name in KTYPES.items()))
+
+    model = dmstudio.variogram.read_models(vmodparm).get(int(vmodnum_p))
+    if model is None:
+        raise ValueError("Variogram model VREFNUM=" + str(vmodnum_p) + " not in VMODPARM")
+
+    xyz, index, size, output = _grid(proto, (xpppc_p, ypppc_p, zpppc_p), (xmin_p, ymin_p, zmin_p),
+                                     (xsize_p, ysize_p, zsize_p), (nx_p, ny_p, nz_p))
+    nnodes = len(xyz)
+    if nnodes == 0:
+        raise ValueError("The grid has no points to simulate")
+
+    samples = dmstudio.drillholes._table(samples)
+    points = np.column_stack([samples[x_f].to_numpy(float), samples[y_f].to_numpy(float),
+                              samples[z_f].to_numpy(float) if z_f in samples.columns else np.zeros(len(samples))])
+    values = samples[grade_f].to_numpy(float)
+    chosen = ~np.isnan(points).any(axis=1) & ~np.isnan(values)
+    if mingrade_p is not None:
+        chosen &= values >= mingrade_p
+    if maxgrade_p is not None:
+        chosen &= values <= maxgrade_p
+    points, values = points[chosen], values[chosen]
+
+    # search ellipsoid as a search volume of ESTIMA
+    octants = int(maxperoc_p) > 0
+    maxdatpt = 8 * int(maxperoc_p) if octants else int(maxdatpt_p)
+    record = {'SMETHOD': 2, 'SDIST1': sdist1_p, 'SDIST2': sdist2_p, 'SDIST3': sdist3_p,
+              'SANGLE1': sangle1_p, 'SANGLE2': sangle2_p, 'SANGLE3': sangle3_p, 'SAXIS1': 3, 'SAXIS2': 1, 'SAXIS3': 2,
+              'MINNUM1': mindatpt_p, 'MAXNUM1': maxdatpt, 'OCTMETH': int(octants), 'MAXPEROC': maxperoc_p}
+    search = dmstudio.estimation.search_volume(record)
+
+    # grid lookup from integer grid indices to nodes
+    low = index.min(axis=0)
+    lookup = np.full(tuple(index.max(axis=0) - low + 1), -1)
+    lookup[tuple((index - low).T)] = np.arange(nnodes)
+
+    simulated = np.ones(nnodes, bool)
+    known = np.full(nnodes, -1)
+    if int(sstrat_p) == 1:
+        # samples moved to the nearest node, the sample nearest to the node wins
+        data = np.full((nnodes, 0), -1)
+        cell = np.rint((points - xyz[0]) / size).astype(int) + index[0] - low
+        inside = ((cell >= 0) & (cell < lookup.shape)).all(axis=1)
+        node = np.where(inside, lookup[tuple(np.where(inside[:, None], cell, 0).T)], -1)
+        distance = np.where(node >= 0, np.linalg.norm(points - xyz[np.maximum(node, 0)], axis=1), np.inf)
+        for s in np.argsort(-distance, kind='stable'):
+            if node[s] >= 0:
+                known[node[s]] = s
+        simulated = known < 0
+        maxdatpt = 0
+    else:
+        reduced = points @ search.matrix.T
+        data = np.full((nnodes, maxdatpt), -1)
+        if len(points):
+            tree = dmstudio.variogram._kdtree()(reduced)
+            for start in range(0, nnodes, chunk_nodes):
+                found, volume = dmstudio.estimation.neighbours(search, tree, reduced, None,
+                                                               xyz[start:start + chunk_nodes])
+                data[start:start + chunk_nodes, :found.shape[1]] = found
+                simulated[start:start + chunk_nodes] = volume > 0
+        else:
+            simulated[:] = int(mindatpt_p) <= 0
+
+    if seed_p is None:
+        seed_p = np.random.SeedSequence().entropy
+
+    # the lookup padded by the template extent, so that nodes and template offsets are positions in the flat lookup
+    offsets = template(model, search.matrix, size)
+    pad = np.abs(offsets).max(axis=0) if len(offsets) else np.zeros(3, int)
+    padded = np.full(tuple(np.array(lookup.shape) + 2 * pad), -1)
+    padded[tuple(slice(p, p + n) for p, n in zip(pad, lookup.shape))] = lookup
+    position = np.ravel_multi_index(tuple((index - low + pad).T), padded.shape)
+    deltas = np.ravel_multi_index(tuple((offsets + pad).T), padded.shape) - np.ravel_multi_index(tuple(pad),
+                                                                                                  padded.shape)
+
+    state = {'xyz': xyz,
+             'index': index,
+             'xyz_samples': points if len(points) else np.zeros((1, 3)),
+             'values': values if len(values) else np.zeros(1),
+             'data': data,
+             'known': known,
+             'simulated': simulated,
+             'lookup': padded.ravel(),
+             'position': position,
+             'deltas': deltas,
+             'model': model,
+             'simple': int(ktype_p) == 0,
+             'seed': int(seed_p),
+             'multgrid': int(multgrid_p),
+             'maxdatpt': maxdatpt,
+             'maxsimpt': int(maxsimpt_p),
+             'chunk_nodes': int(chunk_nodes)}
+
+    simnums = list(range(int(first), int(first) + int(nsim_p)))
+    count = min(workers or os.cpu_count() or 1, len(simnums))
+    if count <= 1:
+        _init_worker(state)
+        try:
+            results = [_realization(simnum) for simnum in simnums]
+        finally:
+            _state.clear()
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=count, initializer=_init_worker,
+                                                    initargs=(state,)) as pool:
+            results = list(pool.map(_realization, simnums))
+
+    realizations = pd.DataFrame(np.column_stack(results), columns=['SIM' + str(simnum) for simnum in simnums])
+
+    return pd.concat([output, realizations], axis=1);
+
+
+def _writer_fields(header, names):
+
+    # field definitions of ``names`` in a .dm header, for dm_writer
+    fields = {field['name']: field for field in header['fields']}
+
+    return [{'name': name,
+             'type': fields[name]['type'],
+             'length': fields[name]['length'],
+             'default': fields[name]['default'],
+             'implicit': fields[name]['position'] is None} for name in names];
+
+
+def _percentiles(values, count, quantiles):
+
+    # percentiles of the rows of ``values`` without absent values, linear interpolation between order statistics
+    import numpy as np
+
+    ordered = np.sort(values, axis=1)
+    position = np.asarray(quantiles, float)[None, :] / 100. * np.maximum(count - 1, 0)[:, None]
+    low = np.floor(position).astype(int)
+    high = np.minimum(low + 1, np.maximum(count - 1, 0).astype(int)[:, None])
+    fraction = position - low
+    result = np.take_along_axis(ordered, low, axis=1) * (1. - fraction) + \
+        np.take_along_axis(ordered, high, axis=1) * fraction
+    result[count == 0] = np.nan
+
+    return result;
+
+
+def summary_fields(cutoffs=(), quantiles=(10, 50, 90), prefix=''):
+    '''
+    summary_fields
+    --------------
+
+    Names of the fields written by ``postprocess``.
+
+    Returns:
+    --------
+
+    list of str
+        <prefix>ETYPE (mean), <prefix>CONDVAR (conditional variance), <prefix>NREAL (number of realizations),
+        <prefix>PROBnn (probability above the n-th cutoff) and <prefix>Pq (q-th percentile, P10, P50, P90)
+    '''
+
+    names = [prefix + 'ETYPE', prefix + 'CONDVAR', prefix + 'NREAL']
+    names += [prefix + 'PROB%02d' % (c + 1) for c in range(len(cutoffs))]
+    names += [prefix + 'P' + ('%g' % q).replace('.', '_') for q in quantiles]
+
+    return names;
+
+
+def postprocess(realizations, output, fields=None, cutoffs=(), quantiles=(10, 50, 90), keep=None, prefix='',
+                precision=None, chunk_records=65536):
+    '''
+    postprocess
+    -----------
+
+    Summaries of simulated realizations per record in one pass: E-type, conditional variance, probabilities above
+    cutoffs and percentiles. The realizations are read in chunks of records, from one model with a field per
+    realization or from many models with the same records in the same order, and the summaries are written to one
+    output model. Mean and variance are accumulated over the realizations with Welford's online algorithm; the
+    percentiles need the values of all realizations of a record, so the memory used is bounded by the chunk size
+    times the number of realizations. Absent values are ignored.
+
+    Parameters:
+    -----------
+
+    realizations: str or list of str
+        ``.dm`` file, or files, with the realizations
+    output: str
+        path of the output ``.dm`` file
+    fields: list of str
+        realization fields of every file, by default the fields SIM1, SIM2, ... of each file
+    cutoffs: list of float
+        cutoffs of the probabilities
+    quantiles: list of float
+        percentiles
+    keep: list of str
+        fields of the first file copied to the output, by default all its fields that are not realizations
+    prefix: str
+        prefix of the summary field names, see ``summary_fields``
+    precision: str
+        'single' or 'extended', by default the precision of the first file
+    chunk_records: int
+        number of records summarised at a time
+
+    Returns:
+    --------
+
+    int
+        number of realizations
+
+    Usage:
+    ------
+
+    >>> simulation.postprocess('sims.dm', 'simstats.dm', cutoffs=[0.5, 1.0, 2.0], quantiles=[10, 50, 90])
+    >>> simulation.postprocess(['sims_%03d.dm' % n for n in range(1, 11)], 'simstats.dm', cutoffs=[1.0])
+    '''
+
+    import numpy as np
+    import pandas as pd
+
+    filenames = [realizations] if isinstance(realizations, str) else list(realizations)
+    filenames = [name if os.path.splitext(name)[1] else name + '.dm' for name in filenames]
+    headers = [dmstudio.dmformat.read_header(name) for name in filenames]
+    if len(set(header['nrecords'] for header in headers)) > 1:
+        raise ValueError("Realization files must have the same number of records")
+
+    columns = []
+    for filename, header in zip(filenames, headers):
+        names = [field['name'] for field in header['fields']]
+        if fields is None:
+            chosen = [name for name in names if re.match(REALIZATION_PATTERN, name)]
+        else:
+            chosen = [name.upper() for name in fields]
+            missing = [name for name in chosen if name not in names]
+            if missing:
+                raise ValueError("Fields " + ", ".join(missing) + " not in " + filename)
+        columns.append(chosen)
+    nreal = sum(len(chosen) for chosen in columns)
+    if nreal == 0:
+        raise ValueError("No realization fields found")
+
+    names = [field['name'] for field in headers[0]['fields']]
+    keep = [name for name in names if name not in columns[0]] if keep is None else [name.upper() for name in keep]
+    summaries = summary_fields(cutoffs, quantiles, prefix)
+    definitions = _writer_fields(headers[0], keep) + [{'name': name, 'type': 'N', 'length': 0} for name in summaries]
+    cutoffs = np.asarray(cutoffs, float)
+
+    readers = [dmstudio.dmio.iter_dm(filename, chunk_records=chunk_records,
+                                     columns=(keep if i == 0 else []) + columns[i])
+               for i, filename in enumerate(filenames)]
+
+    with dmstudio.dmio.dm_writer(output, definitions, precision or headers[0]['precision']) as writer:
+        for chunks in zip(*readers):
+            nrecords = len(chunks[0])
+            count = np.zeros(nrecords)
+            mean = np.zeros(nrecords)
+            m2 = np.zeros(nrecords)
+            above = np.zeros((nrecords, len(cutoffs)))
+            values = np.empty((nrecords, nreal)) if len(quantiles) else None
+
+            r = 0
+            for chunk, chosen in zip(chunks, columns):
+                for name in chosen:
+                    x = chunk[name].to_numpy(float)
+                    valid = ~np.isnan(x)
+                    count += valid
+                    delta = np.where(valid, x - mean, 0.)
+                    mean += delta / np.maximum(count, 1)
+                    m2 += delta * np.where(valid, x - mean, 0.)
+                    above += valid[:, None] & (x[:, None] > cutoffs[None, :])
+                    if values is not None:
+                        values[:, r] = x
+                    r += 1
+
+            result = pd.DataFrame({name: chunks[0][name].to_numpy() for name in keep})
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[summaries[0]] = np.where(count > 0, mean, np.nan)
+                result[summaries[1]] = np.where(count > 0, m2 / count, np.nan)
+                result[summaries[2]] = count
+                for c in range(len(cutoffs)):
+                    result[summaries[3 + c]] = np.where(count > 0, above[:, c] / count, np.nan)
+            if values is not None:
+                percentiles = _percentiles(values, count, quantiles)
+                for q in range(len(quantiles)):
+                    result[summaries[3 + len(cutoffs) + q]] = percentiles[:, q]
+
+            writer.write(result)
+
+    return nreal;
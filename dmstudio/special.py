@@ -11,7 +11,6 @@ and to facilitate more readable code.
 
 import dmstudio.dmfiles
 import dmstudio.dmcommands
-import pandas as pd
 
 # -----------------------------------------------------------------------------------#
 # Special fields
@@ -24,6 +23,7 @@ IMPLICIT_FIELDS = ['XMORIG', 'YMORIG', 'ZMORIG', 'NX', 'NY', 'NZ','X0','Y0','Z0'
 
 #------------------------------------------------------------------------------------#
 
+# command objects only connect to Studio when the first command is executed
 dmf = dmstudio.dmfiles.init()
 dmc = dmstudio.dmcommands.init()
 
@@ -47,6 +47,8 @@ class dmfile_def(object):
 
     def __init__(self, definition=None):
 
+        import pandas as pd
+
         columns = ['Field Name', 'Field Type', 'Length', 'Keep', 'Default']
 
         if definition is None:
@@ -61,6 +63,8 @@ class dmfile_def(object):
 
     def add_field(self, field_name, field_type, length='', keep='Y', default=''):
 
+        import pandas as pd
+
         data = {'Field Name': field_name, 'Field Type': field_type, 'Length': length, 'Keep': keep,
                 'Default': default}
 
@@ -71,6 +75,8 @@ class dmfile_def(object):
 
 def inpfil(csv=None, out_o=None, definition=None):
 
+    import pandas as pd
+
     if definition is None:
         definition = csv_to_definition(csv)
 
@@ -97,12 +103,16 @@ def inpfil(csv=None, out_o=None, definition=None):
 
 def csv_to_definition(csv):
 
+    import pandas as pd
+
     df = pd.read_csv(csv)
 
     return pd_to_definition(df);
 
 def pd_to_definition(df):
 
+    import pandas as pd
+
     field_names = []
     an = []
     length = []
@@ -1,15 +1,10 @@
 '''
 Coming soon
 '''
-from dmstudio import initialize
 from dmstudio import dmcommands
-import numpy as np
-try:
-    import pyrpa.io as io
-except:
-    print("pyrpa module not found, only available to SLR employees")
+from dmstudio import dmio
 
-oScript = initialize.studio(version=None)
+# command object only connects to Studio when the first command is executed
 dmc = dmcommands.init()
 
 def dxf_to_dm(dxf_i, out_o, zone_f=None, zone_p=None):
@@ -23,8 +18,9 @@ def dxf_to_dm(dxf_i, out_o, zone_f=None, zone_p=None):
     :return: returns a datamine tr and pt file
     '''
 
-    assert np.str.split(dxf_i, ".")[-1] == 'dxf', "Input file is not a dxf"
+    assert dxf_i.split(".")[-1] == 'dxf', "Input file is not a dxf"
 
+    oScript = dmc.oScript
     dmc.oScript.ActiveProject.Data.LoadFile(dxf_i)
     obj3d = oScript.ActiveProject.Data.LastObjectAdded
 
@@ -52,18 +48,23 @@ def display_ellipsoids(in_i="required", out_o="required",
                        x_f='XPT', y_f='YPT', z_f='ZPT', trdipdir_f='TRDIPDIR', trdip_d='TRDIP', plunge_f="optional",
                        sdist1_p=100., sdist2_p=50., sdist3_p=25.,
                        num_ellipsoids_p=10, plunge_p=-90, invert_range_p=[90, 270]):
-    try:
-        assert  in_i != "required", "in_i is required"
-        assert out_o != "required", "out_i is required"
-        df = io.read_datamine(in_i + ".dm")
-        choice = np.random.choice(df.index, num_ellipsoids_p)
-        df_choice = df.loc[choice, :].copy().reset_index(drop=True)
-        dm = dmcommands.init()
-
-        if plunge_f == "optional":
-            df['_PLUNGE'] = plunge_p
-            plunge_f = '_PLUNGE'
+    import numpy as np
 
+    assert  in_i != "required", "in_i is required"
+    assert out_o != "required", "out_i is required"
+
+    df = dmio.read_dm(in_i + ".dm")
+
+    if plunge_f == "optional":
+        df['_PLUNGE'] = plunge_p
+        plunge_f = '_PLUNGE'
+
+    choice = np.random.choice(df.index, num_ellipsoids_p)
+    df_choice = df.loc[choice, :].copy().reset_index(drop=True)
+    dm = dmcommands.init()
+
+    # submit the ellipsoid commands as one macro instead of one COM call per command
+    with dm.batch():
         for i in range(len(df_choice)):
 
             plunge = df_choice.loc[i, plunge_f]
@@ -109,6 +110,3 @@ def display_ellipsoids(in_i="required", out_o="required",
         dm.delete('_2pt')
         dm.delete('_3tr')
         dm.delete('_3pt')
-
-    except:
-        print("Display ellipsoids is only available to SLR employees as it requires a propietary module")
@@ -0,0 +1,402 @@
+'''
+dmstudio.transform
+==================
+
+Normal score transformation and back transformation without Studio, as a native alternative to NSCORE and BACKTR.
+
+The transformation table of a grade is built from the (declustering) weighted cumulative distribution of the
+samples or of a reference distribution: the samples of all domains are sorted once, on domain and grade, and equal
+grades of a domain share one normal score. Grades are transformed and normal scores back transformed by linear
+interpolation in the table of their domain, with the tail options of BACKTR beyond the ends of the table. Many
+grades, domains and fields (such as all the realizations of a simulation) are transformed in one call.
+
+Requires ``scipy`` for the normal distribution.
+
+Usage:
+------
+
+>>> from dmstudio import transform
+>>> samples, tables = transform.nscore('comps', ['AU', 'CU'], dcwgt_f='DCWGT', zone_f='DOMAIN')
+>>> sims = simulation.sgsim(samples[samples.DOMAIN == 1], 'vmodparm', 'NSAU', proto='proto', nsim_p=100)
+>>> sims['DOMAIN'] = 1
+>>> sims = transform.backtr(sims, tables['AU'], ['SIM' + str(n) for n in range(1, 101)], 'AU', zone_f='DOMAIN',
+...                         maxback_p=60., uptail_p=4, uppar_p=1.5)
+
+'''
+
+import dmstudio.drillholes
+
+# normal score field of transformation tables
+NORMAL_FIELD = 'TRANDATA'
+
+# tail options of BACKTR: LOTAIL 1-2 and UPTAIL 1, 2 and 4
+LOWER_TAILS = {1: 'linear', 2: 'power'}
+UPPER_TAILS = {1: 'linear', 2: 'power', 4: 'hyperbolic'}
+
+
+def _special():
+
+    try:
+        import scipy.special
+    except ImportError:
+        raise ImportError("scipy is required for the normal distribution of dmstudio.transform")
+
+    return scipy.special;
+
+
+def _groups(table, zone_f):
+
+    # integer domain of every record and the domain values, one domain without ``zone_f``; records with an
+    # absent domain get -1
+    import numpy as np
+    import pandas as pd
+
+    if zone_f is None:
+        return np.zeros(len(table), int), [None];
+
+    codes, zones = pd.factorize(table[zone_f])
+
+    return codes, list(zones);
+
+
+def table(values, weights=None, zones=None):
+    '''
+    table
+    -----
+
+    Normal score transformation tables of the grades of one or more domains, from a single sort. The cumulative
+    probability of a grade is the weight of the smaller grades plus half the weight of the grade, equal grades
+    are one entry.
+
+    Parameters:
+    -----------
+
+    values: numpy.ndarray
+        grades, absent grades are ignored
+    weights: numpy.ndarray
+        declustering weights, by default equal weights; samples with an absent or non positive weight are ignored
+    zones: numpy.ndarray
+        integer domain of every grade, by default one domain; grades with a negative (absent) domain are ignored
+
+    Returns:
+    --------
+
+    tuple of numpy.ndarray
+        domain, grade and normal score of every table entry, sorted on domain and grade
+    '''
+
+    import numpy as np
+
+    values = np.asarray(values, float)
+    weights = np.ones(len(values)) if weights is None else np.asarray(weights, float)
+    zones = np.zeros(len(values), int) if zones is None else np.asarray(zones)
+
+    chosen = ~np.isnan(values) & ~np.isnan(weights) & (weights > 0) & (zones >= 0)
+    values, weights, zones = values[chosen], weights[chosen], zones[chosen]
+    order = np.lexsort((values, zones))
+    values, weights, zones = values[order], weights[order], zones[order]
+
+    # runs of equal grades of a domain, the cumulative weight restarts in each domain
+    new = np.ones(len(values), bool)
+    new[1:] = (zones[1:] != zones[:-1]) | (values[1:] != values[:-1])
+    run = np.cumsum(new) - 1
+    start = np.ones(len(values), bool)
+    start[1:] = zones[1:] != zones[:-1]
+    cumulative = np.cumsum(weights)
+    before = np.maximum.accumulate(np.where(start, cumulative - weights, 0.))
+    cumulative -= before
+
+    end = np.ones(len(values), bool)
+    end[:-1] = new[1:]
+    run_weight = np.bincount(run, weights=weights)
+    _, inverse = np.unique(zones, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    total = np.bincount(inverse, weights=weights)
+    probability = (cumulative[end] - 0.5 * run_weight) / total[inverse[new]]
+
+    return zones[new], values[new], _special().ndtri(probability);
+
+
+def forward(values, zones, table_zones, table_values, table_scores):
+    '''
+    forward
+    -------
+
+    Normal scores of grades by linear interpolation in the transformation table of their domain. Grades beyond
+    the ends of the table get the first or last normal score, grades of a domain without table are absent.
+
+    Returns:
+    --------
+
+    numpy.ndarray
+    '''
+
+    import numpy as np
+
+    values = np.asarray(values, float)
+    result = np.full(values.shape, np.nan)
+
+    for zone in np.unique(table_zones):
+        records = zones == zone
+        entries = table_zones == zone
+        result[records] = np.interp(values[records], table_values[entries], table_scores[entries])
+    result[np.isnan(values)] = np.nan
+
+    return result;
+
+
+def _tail(low, high, ylow, yhigh, x, power):
+
+    # GSLIB powint: power interpolation between (low, ylow) and (high, yhigh)
+    import numpy as np
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fraction = np.clip((x - low) / (high - low), 0., 1.)
+
+    return ylow + (yhigh - ylow) * fraction ** power;
+
+
+def backward(scores, zones, table_zones, table_values, table_scores, minback_p=0., maxback_p=None, lotail_p=1,
+             lopar_p=1., uptail_p=1, uppar_p=1.):
+    '''
+    backward
+    --------
+
+    Back transformation of normal scores by linear interpolation in the transformation table of their domain, with
+    the tails of BACKTR beyond the ends of the table: linear or power interpolation of the cumulative probability
+    down to MINBACK, and linear or power interpolation up to MAXBACK or a hyperbolic tail above the table.
+
+    Parameters:
+    -----------
+
+    scores: numpy.ndarray
+        normal scores, any shape
+    zones: numpy.ndarray
+        integer domain of the scores, of the same shape or broadcast to it
+    table_zones, table_values, table_scores: numpy.ndarray
+        transformation tables, see ``table``
+    minback_p, maxback_p: float
+        limits of the back transformed values, by default MAXBACK is the largest grade of the table
+    lotail_p, lopar_p, uptail_p, uppar_p:
+        tail options, see ``LOWER_TAILS`` and ``UPPER_TAILS``
+
+    Returns:
+    --------
+
+    numpy.ndarray
+    '''
+
+    import numpy as np
+
+    if int(lotail_p) not in LOWER_TAILS or int(uptail_p) not in UPPER_TAILS:
+        raise ValueError("Tail options LOTAIL=" + str(lotail_p) + " or UPTAIL=" + str(uptail_p) + " not supported")
+
+    special = _special()
+    scores = np.asarray(scores, float)
+    result = np.full(scores.shape, np.nan)
+    minback = float(minback_p)
+
+    for zone in np.unique(table_zones):
+        records = (zones == zone) & ~np.isnan(scores)
+        entries = table_zones == zone
+        values, normal = table_values[entries], table_scores[entries]
+        maxback = values[-1] if maxback_p is None else float(maxback_p)
+        y = scores[records]
+        z = np.interp(y, normal, values)
+
+        # tails in terms of the cumulative probability
+        low, high = special.ndtr(normal[0]), special.ndtr(normal[-1])
+        below, above = np.nonzero(y < normal[0])[0], np.nonzero(y > normal[-1])[0]
+
+        power = 1. if int(lotail_p) == 1 else 1. / float(lopar_p)
+        z[below] = _tail(0., low, min(minback, values[0]), values[0], special.ndtr(y[below]), power)
+        probability = special.ndtr(y[above])
+        if int(uptail_p) == 4:
+            scale = values[-1] ** float(uppar_p) * (1. - high)
+            with np.errstate(divide='ignore'):
+                z[above] = (scale / (1. - probability)) ** (1. / float(uppar_p))
+        else:
+            power = 1. if int(uptail_p) == 1 else 1. / float(uppar_p)
+            z[above] = _tail(high, 1., values[-1], max(maxback, values[-1]), probability, power)
+
+        result[records] = np.clip(z, minback, maxback if maxback_p is not None else np.inf)
+
+    return result;
+
+
+def nscore(samples, grade_f, dcwgt_f=None, refdist=None, refgrade_f=None, refwgt_f=None, mingrade_p=0,
+           maxgrade_p=None, zone_f=None, nscore_f=None):
+    '''
+    nscore
+    ------
+
+    Normal score transformation of one or more grades, per domain, with the parameters of NSCORE.
+
+    Parameters:
+    -----------
+
+    samples: pandas.DataFrame or str
+        samples with the grade fields
+    grade_f: str or list of str
+        grade fields
+    dcwgt_f: str
+        declustering weight field of the samples
+    refdist: pandas.DataFrame or str
+        optional reference distribution defining the transformation, with the fields ``refgrade_f`` and
+        ``refwgt_f`` (and ``zone_f`` for tables per domain)
+    refgrade_f, refwgt_f: str or list of str
+        grade fields (one per grade) and weight field of the reference distribution
+    mingrade_p, maxgrade_p: float
+        grades outside these limits are ignored and get an absent normal score
+    zone_f: str
+        domain field, a table is built per domain
+    nscore_f: str or list of str
+        normal score fields, by default NSCORE for one grade and NS<grade> for several grades
+
+    Returns:
+    --------
+
+    tuple
+        the samples with the normal score fields, and a dict of grade field to its transformation table: a
+        DataFrame with ``zone_f``, the grade field and TRANDATA, sorted on domain and grade
+
+    Usage:
+    ------
+
+    >>> samples, tables = transform.nscore('comps', ['AU', 'CU'], dcwgt_f='DCWGT', zone_f='DOMAIN')
+    >>> tables['AU'].head()
+    '''
+
+    import numpy as np
+    import pandas as pd
+
+    grades = [grade_f] if isinstance(grade_f, str) else list(grade_f)
+    if nscore_f is None:
+        names = ['NSCORE'] if len(grades) == 1 else ['NS' + grade for grade in grades]
+    else:
+        names = [nscore_f] if isinstance(nscore_f, str) else list(nscore_f)
+    if len(names) != len(grades):
+        raise ValueError("One normal score field per grade is required")
+
+    samples = dmstudio.drillholes._table(samples).copy()
+    reference = samples if refdist is None else dmstudio.drillholes._table(refdist)
+    if refdist is None:
+        references, weight_f = grades, dcwgt_f
+    else:
+        references = grades if refgrade_f is None else ([refgrade_f] if isinstance(refgrade_f, str)
+                                                        else list(refgrade_f))
+        weight_f = refwgt_f
+    if len(references) != len(grades):
+        raise ValueError("One reference grade field per grade is required")
+
+    # domains of the reference distribution, samples of other or absent domains are not transformed
+    codes, zones = _groups(reference, zone_f)
+    if zone_f is None:
+        sample_codes = np.zeros(len(samples), int)
+    else:
+        lookup = {zone: code for code, zone in enumerate(zones)}
+        sample_codes = samples[zone_f].map(lookup).fillna(-1).to_numpy(int)
+    weights = None if weight_f is None else reference[weight_f].to_numpy(float)
+
+    def limit(values):
+        values = np.asarray(values, float).copy()
+        values[values < mingrade_p] = np.nan
+        if maxgrade_p is not None:
+            values[values > maxgrade_p] = np.nan
+        return values;
+
+    tables = {}
+    for grade, reference_grade, name in zip(grades, references, names):
+        table_zones, table_values, table_scores = table(limit(reference[reference_grade]), weights, codes)
+        samples[name] = forward(limit(samples[grade]), sample_codes, table_zones, table_values, table_scores)
+
+        result = pd.DataFrame({grade: table_values, NORMAL_FIELD: table_scores})
+        if zone_f is not None:
+            result.insert(0, zone_f, [zones[code] for code in table_zones])
+        tables[grade] = result
+
+    return samples, tables;
+
+
+def backtr(data, refdist, normval_f, origref_f, normref_f=NORMAL_FIELD, backval_f=None, zone_f=None,
+           minnorm_p=None, maxnorm_p=4, minback_p=0, maxback_p=None, lotail_p=1, lopar_p=1, uptail_p=1, uppar_p=1):
+    '''
+    backtr
+    ------
+
+    Back transformation of one or more normal score fields, per domain, with the parameters of BACKTR.
+
+    Parameters:
+    -----------
+
+    data: pandas.DataFrame or str
+        records with the normal score fields
+    refdist: pandas.DataFrame or str
+        transformation table with the fields ``origref_f`` and ``normref_f``, and ``zone_f`` for tables per
+        domain, see ``nscore``
+    normval_f: str or list of str
+        normal score fields, for example all the realizations of a simulation
+    origref_f, normref_f: str
+        grade and normal score fields of the transformation table
+    backval_f: str or list of str
+        back transformed fields, by default BACKVAL for one field and the normal score fields (replaced) for
+        several fields
+    zone_f: str
+        domain field of the records and the table
+    minnorm_p, maxnorm_p: float
+        normal scores outside these limits are not back transformed
+    minback_p, maxback_p: float
+        limits of the back transformed values
+    lotail_p, lopar_p, uptail_p, uppar_p:
+        tails beyond the ends of the table, see ``backward``
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+        the records with the back transformed fields
+
+    Usage:
+    ------
+
+    >>> sims = transform.backtr(sims, 'trandist', ['SIM1', 'SIM2', 'SIM3'], 'AU', maxback_p=60., uptail_p=4)
+    '''
+
+    import numpy as np
+
+    fields = [normval_f] if isinstance(normval_f, str) else list(normval_f)
+    if backval_f is None:
+        names = ['BACKVAL'] if len(fields) == 1 else fields
+    else:
+        names = [backval_f] if isinstance(backval_f, str) else list(backval_f)
+    if len(names) != len(fields):
+        raise ValueError("One back transformed field per normal score field is required")
+
+    data = dmstudio.drillholes._table(data)
+    reference = dmstudio.drillholes._table(refdist)
+    codes, zones = _groups(reference, zone_f)
+    order = np.lexsort((reference[normref_f].to_numpy(float), codes))
+    order = order[codes[order] >= 0]
+    table_zones = codes[order]
+    table_values = reference[origref_f].to_numpy(float)[order]
+    table_scores = reference[normref_f].to_numpy(float)[order]
+
+    if zone_f is None:
+        record_codes = np.zeros(len(data), int)
+    else:
+        lookup = {zone: code for code, zone in enumerate(zones)}
+        record_codes = data[zone_f].map(lookup).fillna(-1).to_numpy(int)
+
+    # all fields in one pass per domain
+    scores = np.column_stack([data[field].to_numpy(float) for field in fields])
+    if minnorm_p is not None:
+        scores[scores < minnorm_p] = np.nan
+    if maxnorm_p is not None:
+        scores[scores > maxnorm_p] = np.nan
+    values = backward(scores, record_codes[:, None], table_zones, table_values, table_scores, minback_p, maxback_p,
+                      lotail_p, lopar_p, uptail_p, uppar_p)
+
+    data = data.copy()
+    data[names] = values
+
+    return data;
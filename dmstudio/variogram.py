@@ -0,0 +1,478 @@
+'''
+dmstudio.variogram
+==================
+
+Experimental variograms without Studio, as a native alternative to VGRAM.
+
+The sample pairs within the maximum lag distance are found once with a KD-tree and binned in a single pass for all
+directions, fields, cross variograms and indicator cutoffs. The samples are split into chunks which are processed
+by a pool of processes, each returning the sums of its pairs. Many directions with small angular tolerances give a
+variogram map or fan at the cost of one pair search.
+
+Directions, tolerances and rotations follow the VGRAM parameters: azimuths are measured clockwise from the Y axis
+and dips downwards from the horizontal, in the frame rotated by ANGLE1-3 around AXIS1-3.
+
+Requires ``scipy`` for the KD-tree.
+
+Usage:
+------
+
+>>> from dmstudio import variogram
+>>> vg = variogram.experimental('comps', ['AU', 'CU'], lag_p=10, nlags_p=20, numhor_p=12, horinc_p=15,
+...                             horang_p=7.5, cutoffs={'AU': [0.5, 1.0, 2.0]})
+>>> vg[(vg.FIELD == 'AU') & vg.CUTOFF.isna()][['AZI', 'LAG', 'AVEDIST', 'NPAIRS', 'GAMMA']]
+
+'''
+
+import os
+
+import dmstudio.drillholes
+
+# fields of the experimental variogram table
+VARIOGRAM_FIELDS = ['VREFNUM', 'AZI', 'DIP', 'FIELD', 'FIELD2', 'CUTOFF', 'LAG', 'LAGDIST', 'AVEDIST', 'NPAIRS',
+                    'GAMMA', 'MEANHEAD', 'MEANTAIL']
+
+# sums accumulated per direction, lag and variogram: pairs, squared differences, distance, head and tail values
+_SUMS = 5
+
+# state of a worker process, set by _init_worker
+_state = {}
+
+
+def _kdtree():
+
+    try:
+        import scipy.spatial
+    except ImportError:
+        raise ImportError("scipy is required for the sample pair search of dmstudio.variogram")
+
+    return scipy.spatial.cKDTree;
+
+
+def rotation(angles=(0., 0., 0.), axes=(3, 1, 3)):
+    '''
+    rotation
+    --------
+
+    Matrix converting world coordinates to the coordinates of a frame rotated with the Datamine convention. Each
+    rotation is clockwise by its angle around its axis (1=X, 2=Y, 3=Z, 0 for none) of the already rotated frame,
+    when viewed along the axis from positive values towards the origin.
+
+    Parameters:
+    -----------
+
+    angles: tuple of float
+        ANGLE1, ANGLE2, ANGLE3 in degrees
+    axes: tuple of int
+        AXIS1, AXIS2, AXIS3
+
+    Returns:
+    --------
+
+    numpy.ndarray
+        3 x 3 matrix, rotated coordinates are ``matrix @ xyz``
+    '''
+
+    import numpy as np
+
+    matrix = np.eye(3)
+    for angle, axis in zip(angles, axes):
+        if not axis or not angle:
+            continue
+        a = np.radians(angle)
+        # the two coordinates rotated by a rotation around the axis, in cyclic order
+        i, j = {1: (1, 2), 2: (2, 0), 3: (0, 1)}[int(axis)]
+        step = np.eye(3)
+        step[i, i], step[i, j] = np.cos(a), -np.sin(a)
+        step[j, i], step[j, j] = np.sin(a), np.cos(a)
+        matrix = step @ matrix
+
+    return matrix;
+
+
+def fan(azi_p=0., dip_p=0., numhor_p=1, horinc_p=0., numver_p=1, verinc_p=0.):
+    '''
+    fan
+    ---
+
+    Azimuths and dips of the variograms of a VGRAM run: NUMHOR azimuths from AZI by HORINC, for each of NUMVER dips
+    from DIP by VERINC.
+
+    Returns:
+    --------
+
+    list of (azimuth, dip) tuples in degrees
+    '''
+
+    return [((azi_p + h * horinc_p) % 360., dip_p + v * verinc_p) for v in range(int(numver_p))
+            for h in range(int(numhor_p))];
+
+
+def _init_worker(state):
+
+    _state.clear()
+    _state.update(state)
+    _state['tree'] = _kdtree()(state['xyz'])
+
+
+def _bin_chunk(first, last):
+
+    # sums of the pairs (i, j), first <= i < last, i < j, for every direction, lag and variogram
+    import numpy as np
+
+    state = _state
+    xyz, values, tree = state['xyz'], state['values'], state['tree']
+    lag, nlags, lagtol = state['lag'], state['nlags'], state['lagtol']
+    variograms = state['variograms']
+    result = np.zeros((len(state['directions']), nlags, len(variograms), _SUMS))
+
+    chunk = _kdtree()(xyz[first:last])
+    pairs = chunk.sparse_distance_matrix(tree, state['maxdist'], output_type='ndarray')
+    i = pairs['i'] + first
+    j = pairs['j']
+    keep = i < j
+    if state['keys'] is not None:
+        keep &= state['keys'][i] == state['keys'][j]
+    i, j, dist = i[keep], j[keep], pairs['v'][keep]
+
+    k = np.rint(dist / lag).astype(int)
+    keep = (k >= 1) & (k <= nlags) & (np.abs(dist - k * lag) <= lagtol)
+    i, j, dist, k = i[keep], j[keep], dist[keep], k[keep] - 1
+    if not len(i):
+        return result;
+
+    # separation vectors in the rotated frame
+    h = (xyz[j] - xyz[i]) @ state['rotation'].T
+    horizontal = np.hypot(h[:, 0], h[:, 1])
+
+    heads = values[i]
+    tails = values[j]
+    diffs = tails - heads
+    first_column = [a for a, b in variograms]
+    second_column = [b for a, b in variograms]
+    products = diffs[:, first_column] * diffs[:, second_column]
+    valid = ~np.isnan(products)
+    products = np.where(valid, products, 0.)
+    head = np.where(valid, heads[:, first_column], 0.)
+    tail = np.where(valid, tails[:, second_column], 0.)
+    distance = valid * dist[:, None]
+
+    for d, (azi, dip, direction) in enumerate(state['directions']):
+        # pairs are unordered, the separation is taken in the half space of the direction
+        sign = np.where(h @ direction >= 0, 1., -1.)
+        selected = np.ones(len(h), bool)
+        if state['horang'] < 90.:
+            pair_azi = np.degrees(np.arctan2(sign * h[:, 0], sign * h[:, 1]))
+            offset = np.abs((pair_azi - azi + 180.) % 360. - 180.)
+            selected &= (offset <= state['horang']) | (horizontal < 1e-9 * dist)
+        if state['verang'] < 90.:
+            pair_dip = np.degrees(np.arcsin(np.clip(-sign * h[:, 2] / dist, -1., 1.)))
+            selected &= np.abs(pair_dip - dip) <= state['verang']
+        if state['cylrad'] > 0:
+            along = np.abs(h @ direction)
+            selected &= dist ** 2 - along ** 2 <= state['cylrad'] ** 2
+
+        index = np.flatnonzero(selected)
+        if not len(index):
+            continue
+        index = index[np.argsort(k[index], kind='stable')]
+        lags, starts = np.unique(k[index], return_index=True)
+        for s, block in enumerate((valid, products, distance, head, tail)):
+            result[d, lags, :, s] = np.add.reduceat(block[index].astype(float), starts, axis=0)
+
+    return result;
+
+
+def experimental(samples, fields, lag_p, nlags_p=25, lagtol_p=None, azi_p=0., horang_p=90., dip_p=0., verang_p=90.,
+                 cylrad_p=0., numhor_p=1, horinc_p=0., numver_p=1, verinc_p=0., angle1_p=0., axis1_p=3, angle2_p=0.,
+                 axis2_p=1, angle3_p=0., axis3_p=3, crossvar_p=0, indstep_p=0., indmin_p=0., indnum_p=0,
+                 cutoffs=None, x_f='X', y_f='Y', z_f='Z', key_f=None, directions=None, workers=None,
+                 chunk_samples=4096):
+    '''
+    experimental
+    ------------
+
+    Experimental semi-variograms of many directions, fields and indicator cutoffs from a single pair search. A pair
+    at distance ``d`` falls in lag ``k`` if ``|d - k * lag_p| <= lagtol_p``.
+
+    Parameters:
+    -----------
+
+    samples: pandas.DataFrame or str
+        samples with coordinate fields X, Y and optionally Z
+    fields: list of str
+        grade fields F1, F2, ...
+    lag_p, nlags_p, lagtol_p: float, int, float
+        lag distance, number of lags and lag tolerance (default half the lag)
+    azi_p, horang_p, dip_p, verang_p: float
+        azimuth and dip of the first variogram and their tolerances in degrees
+    cylrad_p: float
+        maximum distance of a pair from the variogram direction, 0 for no limit
+    numhor_p, horinc_p, numver_p, verinc_p: int, float
+        number of azimuths and dips and their increments, see ``fan``
+    angle1_p, axis1_p, angle2_p, axis2_p, angle3_p, axis3_p: float, int
+        rotation of the frame of the directions, see ``rotation``
+    crossvar_p: int
+        0 for variograms, 1 for cross variograms of all pairs of fields, 2 for both
+    indstep_p, indmin_p, indnum_p: float, float, int
+        indicator cutoffs INDMIN, INDMIN + INDSTEP, ... applied to every field, if INDSTEP > 0
+    cutoffs: dict
+        field name to a list of indicator cutoffs, in addition to the INDSTEP cutoffs. The indicator is 1 for
+        values at or below the cutoff.
+    x_f, y_f, z_f: str
+        coordinate fields
+    key_f: str
+        only pairs of samples with the same value of this field are used (KEYMETH=1)
+    directions: list of (azimuth, dip)
+        variogram directions, instead of the NUMHOR and NUMVER directions
+    workers: int
+        number of processes, by default the number of CPUs
+    chunk_samples: int
+        number of samples whose pairs are binned at a time
+
+    Returns:
+    --------
+
+    pandas.DataFrame
+        one record per direction (VREFNUM), variogram and lag with the fields in ``VARIOGRAM_FIELDS``. FIELD2
+        is the second field of a cross variogram, CUTOFF the indicator cutoff or absent, GAMMA the semi-variogram
+        and MEANHEAD and MEANTAIL the mean values of the pair ends.
+
+    Usage:
+    ------
+
+    >>> fan = variogram.experimental(comps, ['AU'], lag_p=5, nlags_p=30, numhor_p=36, horinc_p=10, horang_p=5)
+    '''
+
+    import concurrent.futures
+    import numpy as np
+    import pandas as pd
+
+    samples = dmstudio.drillholes._table(samples)
+    fields = [fields] if isinstance(fields, str) else list(fields)
+    lagtol = lagtol_p if lagtol_p is not None and 0 < lagtol_p <= lag_p / 2. else lag_p / 2.
+
+    xyz = np.column_stack([samples[x_f].to_numpy(float), samples[y_f].to_numpy(float),
+                           samples[z_f].to_numpy(float) if z_f in samples.columns else np.zeros(len(samples))])
+    located = ~np.isnan(xyz).any(axis=1)
+    samples, xyz = samples[located], xyz[located]
+
+    # value columns: the fields, then the indicators of each field and cutoff
+    columns = [(field, np.nan) for field in fields]
+    cutoffs = dict((field, list(values)) for field, values in (cutoffs or {}).items())
+    if indstep_p and indstep_p > 0:
+        for field in fields:
+            cutoffs.setdefault(field, [])
+            cutoffs[field] += [indmin_p + n * indstep_p for n in range(int(indnum_p))]
+    for field, values in cutoffs.items():
+        columns += [(field, float(cutoff)) for cutoff in sorted(set(values))]
+
+    values = np.empty((len(samples), len(columns)))
+    for c, (field, cutoff) in enumerate(columns):
+        data = samples[field].to_numpy(float)
+        values[:, c] = data if np.isnan(cutoff) else np.where(np.isnan(data), np.nan, (data <= cutoff) * 1.)
+
+    variograms = []
+    if crossvar_p in (0, 2):
+        variograms += [(c, c) for c in range(len(columns))]
+    if crossvar_p in (1, 2):
+        variograms += [(a, b) for a in range(len(fields)) for b in range(a + 1, len(fields))]
+
+    matrix = rotation((angle1_p, angle2_p, angle3_p), (axis1_p, axis2_p, axis3_p))
+    if directions is None:
+        directions = fan(azi_p, dip_p, numhor_p, horinc_p, numver_p, verinc_p)
+    unit = dmstudio.drillholes._directions(np.array([azi for azi, dip in directions], float),
+                                           np.array([dip for azi, dip in directions], float))
+
+    state = {'xyz': xyz,
+             'values': values,
+             'keys': samples[key_f].to_numpy() if key_f else None,
+             'lag': float(lag_p),
+             'nlags': int(nlags_p),
+             'lagtol': float(lagtol),
+             'maxdist': nlags_p * lag_p + lagtol,
+             'rotation': matrix,
+             'directions': [(azi, dip, unit[d]) for d, (azi, dip) in enumerate(directions)],
+             'horang': float(horang_p),
+             'verang': float(verang_p),
+             'cylrad': float(cylrad_p),
+             'variograms': variograms}
+
+    ranges = [(first, min(first + chunk_samples, len(xyz))) for first in range(0, len(xyz), chunk_samples)]
+    workers = min(workers or os.cpu_count() or 1, len(ranges))
+
+    if workers <= 1:
+        _init_worker(state)
+        try:
+            sums = sum((_bin_chunk(first, last) for first, last in ranges),
+                       np.zeros((len(directions), int(nlags_p), len(variograms), _SUMS)))
+        finally:
+            _state.clear()
+    else:
+        sums = np.zeros((len(directions), int(nlags_p), len(variograms), _SUMS))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                    initargs=(state,)) as pool:
+            for result in pool.map(_bin_chunk, *zip(*ranges)):
+                sums += result
+
+    # one record per direction, variogram and lag
+    ndir, nlags, nvar = sums.shape[:3]
+    d, k, v = [a.ravel() for a in np.meshgrid(np.arange(ndir), np.arange(nlags), np.arange(nvar), indexing='ij')]
+    flat = sums.reshape(-1, _SUMS)
+    npairs = flat[:, 0]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = flat / np.where(npairs > 0, npairs, np.nan)[:, None]
+
+    first = np.array([columns[a][0] for a, b in variograms], dtype=object)
+    second = np.array([columns[b][0] if b != a else '' for a, b in variograms], dtype=object)
+    cutoff = np.array([columns[a][1] for a, b in variograms])
+
+    table = pd.DataFrame({'VREFNUM': d + 1,
+                          'AZI': np.array([azi for azi, dip in directions], float)[d],
+                          'DIP': np.array([dip for azi, dip in directions], float)[d],
+                          'FIELD': first[v],
+                          'FIELD2': second[v],
+                          'CUTOFF': cutoff[v],
+                          'LAG': k + 1,
+                          'LAGDIST': (k + 1) * float(lag_p),
+                          'AVEDIST': mean[:, 2],
+                          'NPAIRS': npairs.astype(int),
+                          'GAMMA': mean[:, 1] / 2.,
+                          'MEANHEAD': mean[:, 3],
+                          'MEANTAIL': mean[:, 4]})
+
+    return table.sort_values(['FIELD', 'FIELD2', 'CUTOFF', 'VREFNUM', 'LAG'], kind='stable',
+                             na_position='first').reset_index(drop=True);
+
+
+# model types of the STn fields of a VMODPARM file
+MODEL_TYPES = {1: 'spherical', 3: 'exponential', 4: 'gaussian'}
+
+# structures per model in a VMODPARM file
+MAX_STRUCTURES = 9
+
+
+class variogram_model(object):
+
+    '''
+    variogram_model
+    ---------------
+
+    Nested variogram model of a VMODPARM record. Each structure has a type, three ranges along the axes of the
+    model frame (rotated by VANGLE1-3 around VAXIS1-3) and a variance. The exponential and gaussian models are
+    ``c * (1 - exp(-h / a))`` and ``c * (1 - exp(-(h / a) ** 2))``.
+
+    Parameters:
+    -----------
+
+    nugget: float
+        nugget variance
+    structures: list of tuple
+        (type, (range1, range2, range3), variance) per structure, type being a key of ``MODEL_TYPES``
+    angles, axes: tuple
+        rotation of the model frame, see ``rotation``
+
+    Object Properties:
+    ------------------
+
+    variogram_model.sill: float
+        total sill, the covariance at distance zero
+    variogram_model.matrices: list of numpy.ndarray
+        per structure, the matrix scaling a separation vector to its reduced distance
+    '''
+
+    def __init__(self, nugget=0., structures=(), angles=(0., 0., 0.), axes=(3, 1, 3)):
+
+        import numpy as np
+
+        self.nugget = float(nugget)
+        self.structures = []
+        self.matrices = []
+        frame = rotation(angles, axes)
+
+        for stype, ranges, variance in structures:
+            if int(stype) not in MODEL_TYPES:
+                raise ValueError("Variogram model type " + str(stype) + " is not supported, expected one of " +
+                                 ", ".join(str(key) + "=" + name for key, name in MODEL_TYPES.items()))
+            ranges = [float(r) if r and r > 0 else float(ranges[0]) for r in ranges]
+            self.structures.append((int(stype), ranges, float(variance)))
+            self.matrices.append(np.diag(1. / np.array(ranges)) @ frame)
+
+        self.sill = self.nugget + sum(variance for stype, ranges, variance in self.structures)
+
+    def variogram(self, h):
+
+        '''
+        Variogram values of separation vectors ``h`` (array of shape (..., 3)), zero at zero separation.
+        '''
+
+        import numpy as np
+
+        h = np.asarray(h, float)
+        distance = np.sqrt(np.einsum('...i,...i->...', h, h))
+        gamma = np.where(distance > 0, self.nugget, 0.)
+
+        for (stype, ranges, variance), matrix in zip(self.structures, self.matrices):
+            r = np.sqrt(np.einsum('...i,...i->...', h @ matrix.T, h @ matrix.T))
+            if stype == 1:
+                gamma = gamma + variance * np.where(r < 1., 1.5 * r - 0.5 * r ** 3, 1.)
+            elif stype == 3:
+                gamma = gamma + variance * (1. - np.exp(-r))
+            else:
+                gamma = gamma + variance * (1. - np.exp(-r ** 2))
+
+        return gamma;
+
+    def covariance(self, h):
+
+        '''
+        Covariance of separation vectors ``h``, the sill minus the variogram.
+        '''
+
+        return self.sill - self.variogram(h);
+
+
+def read_models(vmodparm):
+    '''
+    read_models
+    -----------
+
+    Variogram models of a VMODPARM table.
+
+    Parameters:
+    -----------
+
+    vmodparm: pandas.DataFrame or str
+        table with the fields VREFNUM, VANGLE1-3, VAXIS1-3, NUGGET and STn, STnPAR1-4 for structures n=1..9
+
+    Returns:
+    --------
+
+    dict
+        VREFNUM to ``variogram_model``
+    '''
+
+    import numpy as np
+
+    table = dmstudio.drillholes._table(vmodparm)
+    models = {}
+
+    for record in table.to_dict('records'):
+        def value(name, default=0.):
+            v = record.get(name, default)
+            return default if v is None or (isinstance(v, float) and np.isnan(v)) else v;
+
+        structures = []
+        for n in range(1, MAX_STRUCTURES + 1):
+            stype = value('ST' + str(n))
+            if not stype:
+                continue
+            structures.append((stype, [value('ST' + str(n) + 'PAR' + str(p)) for p in (1, 2, 3)],
+                               value('ST' + str(n) + 'PAR4')))
+
+        models[int(value('VREFNUM', 1))] = variogram_model(
+            value('NUGGET'), structures,
+            [value('VANGLE' + str(n)) for n in (1, 2, 3)],
+            [value('VAXIS' + str(n), default) for n, default in zip((1, 2, 3), (3, 1, 3))])
+
+    return models;
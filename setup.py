@@ -19,5 +19,5 @@ setup(name='dmstudio',
       license='MIT',
       packages=['dmstudio'],
       include_package_data=True,
-      package_data={'':['LICENCES.txt'], '':['README.md']},
+      package_data={'':['LICENCES.txt'], '':['README.md'], 'dmstudio':['commandhelp.txt']},
       zip_safe=False)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dmstudio import backends, batch, dmcommands, dmio
+
+
+@pytest.fixture
+def dmc(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    dmio.write_dm('samples.dm', pd.DataFrame({'AU': [1., 3., 5.], 'CU': [2., 0.5, 3.]}))
+
+    return dmcommands.init(backend=backends.emulator_backend('.'));
+
+
+def test_macro_round_trip():
+
+    commands = ["extra  &in=a &out=b{AU>2} 'AU2 = AU * 2' 'GO'",
+                "copy  &in=a &out=b @title='Grade, tonnage' @print=0"]
+    text = batch.macro_text(commands)
+
+    assert "AU2 = AU * 2\n" in text
+    assert [backends.parse_command(command) for command in batch.macro_commands(text)] == \
+        [backends.parse_command(command) for command in commands]
+
+
+def test_string_parameter_quoted():
+
+    command = dmcommands.build_command('copynr', {'in_i': 'a', 'out_o': 'b', 'base_p': 'a b'})
+
+    assert backends.parse_command(command)['params']['base'] == "'a b'"
+    assert batch.macro_commands(batch.macro_text([command])) == [command]
+
+
+def test_batch_extra_expression(dmc):
+
+    with dmc.batch() as b:
+        dmc.extra(in_i='samples', out_o='_1', expression='AU2 = AU * 2')
+        dmc.copy(in_i='_1', out_o='result')
+        dmc.delete(in_i='_1')
+
+    assert [step['status'] for step in b.steps] == ['ok', 'ok', 'ok']
+    np.testing.assert_allclose(dmio.read_dm('result.dm').AU2, [2., 6., 10.])
+
+
+def test_batch_error_status(dmc):
+
+    with pytest.raises(ValueError):
+        with dmc.batch() as b:
+            dmc.copy(in_i='samples', out_o='kept')
+            dmc.copy(in_i='samples', out_o='_1')
+            dmc.extra(in_i='_1', out_o='bad', expression='AU2=AU+*2')
+            dmc.delete(in_i='_1')
+
+    assert [step['status'] for step in b.steps] == ['ok', 'unknown', 'failed', 'unknown']
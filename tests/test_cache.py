@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from dmstudio import backends, cache, dmcommands
+
+
+class writer(object):
+
+    # backend writing the command string to its output files, or nothing when ``fail`` is set
+    def __init__(self, path, fail=False):
+
+        self.path = path
+        self.fail = fail
+        self.commands = []
+
+    def filename(self, name):
+
+        return backends.dm_path(name, self.path);
+
+    def run(self, command):
+
+        self.commands.append(command)
+        if not self.fail:
+            for name in dmcommands.command_files(command)[1].values():
+                with open(self.filename(name), 'w') as f:
+                    f.write(command)
+
+
+@pytest.fixture
+def comps(tmp_path):
+
+    with open(str(tmp_path / 'comps.dm'), 'w') as f:
+        f.write('comps')
+
+    return tmp_path;
+
+
+def test_cache_hit(comps):
+
+    backend = writer(str(comps))
+    dmc = dmcommands.init(backend=cache.result_cache(backend, path=str(comps / 'cache')))
+    dmc.stats(in_i='comps', out_o='st', f1_f='AU')
+    os.remove(str(comps / 'st.dm'))
+    dmc.stats(in_i='comps', out_o='st', f1_f='AU')
+
+    assert (dmc.backend.hits, dmc.backend.misses, len(backend.commands)) == (1, 1, 1)
+    assert os.path.exists(str(comps / 'st.dm'))
+
+
+def test_cache_failed_command(comps):
+
+    with open(str(comps / 'st.dm'), 'w') as f:
+        f.write('stale')
+
+    backend = writer(str(comps), fail=True)
+    dmc = dmcommands.init(backend=cache.result_cache(backend, path=str(comps / 'cache')))
+    dmc.stats(in_i='comps', out_o='st', f1_f='AU')
+    os.remove(str(comps / 'st.dm'))
+    dmc.stats(in_i='comps', out_o='st', f1_f='AU')
+
+    assert (dmc.backend.hits, dmc.backend.misses, dmc.backend.size) == (0, 2, 0)
+    assert not os.path.exists(str(comps / 'st.dm'))
+    assert [name for name in os.listdir(str(comps / 'cache')) if name != 'index.json'] == []
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dmstudio import convert, dmformat, dmio
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def model(tmp_path):
+
+    df = pd.DataFrame({'IJK': [0., 1., 2., 3., 4.], 'AU': [1.5, np.nan, 3.25, 0.5, np.nan],
+                       'ROCK': ['OXIDE-ZONE', '', 'FRESH', 'OX', ''], 'XMORIG': 100.})
+
+    return tmp_path, df;
+
+
+def fields(filename):
+
+    return [{key: field[key] for key in ('name', 'type', 'length', 'position', 'words', 'default')}
+            for field in dmformat.read_header(filename)['fields']];
+
+
+@pytest.mark.parametrize('precision', ['single', 'extended'])
+@pytest.mark.parametrize('columnar', ['parquet', 'arrow'])
+def test_round_trip(model, precision, columnar):
+
+    path, df = model
+    dmio.write_dm(str(path / 'model.dm'), df, precision=precision)
+
+    source, target = str(path / 'model.dm'), str(path / 'model2.dm')
+    if columnar == 'parquet':
+        convert.dm_to_parquet(source, str(path / 'model.parquet'), chunk_records=2)
+        convert.parquet_to_dm(str(path / 'model.parquet'), target)
+    else:
+        convert.dm_to_arrow(source, str(path / 'model.arrow'), chunk_records=2)
+        convert.arrow_to_dm(str(path / 'model.arrow'), target)
+
+    assert dmformat.read_header(target)['precision'] == precision
+    assert fields(target) == fields(source)
+    pd.testing.assert_frame_equal(dmio.read_dm(target), dmio.read_dm(source))
+
+
+def test_statistics_and_nulls(model):
+
+    path, df = model
+    dmio.write_dm(str(path / 'model.dm'), df)
+    converted = convert.dm_to_parquet(str(path / 'model.dm'), str(path / 'model.parquet'), chunk_records=2)
+    stats = convert.statistics(str(path / 'model.parquet'))
+
+    assert stats['AU'] == {'min': 0.5, 'max': 3.25, 'nulls': 2}
+    assert stats['IJK'] == {'min': 0., 'max': 4., 'nulls': 0}
+    assert stats['ROCK'] == {'min': 'FRESH', 'max': 'OXIDE-ZONE', 'nulls': 2}
+    assert converted == stats
+
+    import pyarrow.parquet as pq
+    assert pq.read_table(str(path / 'model.parquet')).column('ROCK').to_pylist() == \
+        ['OXIDE-ZONE', None, 'FRESH', 'OX', None]
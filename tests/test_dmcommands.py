@@ -0,0 +1,33 @@
+import inspect
+import pydoc
+
+import pytest
+
+from dmstudio import dmcommands, dmfiles
+
+
+def test_class_level_commands():
+
+    assert dmcommands.init.copy.__name__ == 'copy'
+    assert list(inspect.signature(dmcommands.init.desurv).parameters)[:4] == ['self', 'in1_i', 'in2_i', 'out_o']
+    assert 'selcop' in dir(dmcommands.init)
+    assert 'DESURV' in pydoc.render_doc(dmcommands.init)
+
+
+def test_unknown_command():
+
+    with pytest.raises(AttributeError):
+        dmcommands.init.nosuch
+    with pytest.raises(AttributeError):
+        dmcommands.init().nosuch
+
+
+def test_dmfiles_error_raised():
+
+    class failing(object):
+
+        def run(self, command):
+            raise RuntimeError("Studio error")
+
+    with pytest.raises(RuntimeError):
+        dmfiles.init(backend=failing()).run_command('inpfil &out=a')
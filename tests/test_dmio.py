@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dmstudio import dmformat, dmio
+
+
+@pytest.fixture
+def samples():
+
+    return pd.DataFrame({'BHID': ['DH0001-LONG', 'B', 'DH3', 'DH0004'], 'AU': [1.5, np.nan, 3.25, -2.],
+                         'FROM': [0., 1., 2., 3.], 'XMORIG': 100.});
+
+
+@pytest.fixture
+def model(tmp_path):
+
+    # several pages of records: 5 words per record, 102 records per page
+    count = 1000
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({'IJK': np.arange(count, dtype=float), 'AU': rng.uniform(0., 5., count).round(2),
+                       'CU': rng.uniform(0., 2., count).round(2), 'ROCK': rng.choice(['OX', 'FRESH'], count),
+                       'NX': 10.})
+    df.loc[::7, 'AU'] = np.nan
+    filename = str(tmp_path / 'model.dm')
+    dmio.write_dm(filename, df, precision='extended')
+
+    return filename, df;
+
+
+@pytest.mark.parametrize('precision', ['single', 'extended'])
+def test_round_trip(tmp_path, samples, precision):
+
+    filename = str(tmp_path / 'samples.dm')
+    dmio.write_dm(filename, samples, precision=precision)
+    header = dmformat.read_header(filename)
+    fields = {field['name']: field for field in header['fields']}
+
+    assert header['precision'] == precision
+    assert (fields['BHID']['type'], fields['BHID']['length'], fields['BHID']['words']) == ('A', 12, 3)
+    assert fields['XMORIG']['position'] is None and fields['XMORIG']['default'] == 100.
+    pd.testing.assert_frame_equal(dmio.read_dm(filename), samples, check_dtype=False)
+
+
+def test_absent_values(tmp_path, samples):
+
+    filename = str(tmp_path / 'samples.dm')
+    dmio.write_dm(filename, samples)
+
+    with dmio.dm_file(filename) as dm:
+        assert dm.column('AU', absent=None)[1] == np.float32(dmformat.ABSENT)
+        np.testing.assert_array_equal(dm.column('AU', absent=-99.), [1.5, -99., 3.25, -2.])
+    assert dmio.read_dm(filename, implicit=False).columns.tolist() == ['BHID', 'AU', 'FROM']
+
+
+def test_pages(model):
+
+    filename, df = model
+
+    with dmio.dm_file(filename) as dm:
+        assert len(dm.pages) == 10
+    pd.testing.assert_frame_equal(dmio.read_dm(filename), df, check_dtype=False)
+
+
+def test_chunks_and_parallel(model):
+
+    filename, df = model
+    full = dmio.read_dm(filename)
+    chunks = list(dmio.iter_dm(filename, chunk_records=150))
+
+    assert len(chunks) > 1 and max(len(chunk) for chunk in chunks) <= 150
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), full)
+    pd.testing.assert_frame_equal(dmio.read_parallel(filename, workers=2, min_pages=1), full)
+
+
+def test_push_down(model):
+
+    filename, df = model
+    full = dmio.read_dm(filename)
+    expected = full.loc[(full.AU > 2.) & (full.ROCK == 'OX'), ['IJK', 'AU']].reset_index(drop=True)
+
+    selected = dmio.read_dm(filename, columns=['IJK', 'AU'], retrieval="AU>2 AND ROCK='OX'")
+    chunks = dmio.iter_dm(filename, chunk_records=150, columns=['IJK', 'AU'], retrieval="AU>2 AND ROCK='OX'")
+
+    pd.testing.assert_frame_equal(selected, expected)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dmstudio import drillholes
+
+
+@pytest.fixture
+def collars():
+
+    return pd.DataFrame({'BHID': ['S', 'C'], 'XCOLLAR': [100., 0.], 'YCOLLAR': [200., 0.], 'ZCOLLAR': [50., 0.]});
+
+
+def test_desurvey_straight(collars):
+
+    surveys = pd.DataFrame({'BHID': ['S'], 'AT': [0.], 'BRG': [90.], 'DIP': [60.]})
+    samples = pd.DataFrame({'BHID': ['S', 'S'], 'FROM': [0., 10.], 'TO': [10., 20.], 'AU': [1., 2.]})
+
+    holes = drillholes.desurvey(samples, surveys, collars)
+
+    np.testing.assert_allclose(holes.X, [102.5, 107.5])
+    np.testing.assert_allclose(holes.Y, [200., 200.], atol=1e-9)
+    np.testing.assert_allclose(holes.Z, 50. - np.sin(np.radians(60.)) * np.array([5., 15.]))
+    np.testing.assert_allclose(holes.LENGTH, [10., 10.])
+    np.testing.assert_allclose(holes.AU, [1., 2.])
+
+
+def test_desurvey_minimum_curvature(collars):
+
+    # a quarter circle from vertical to horizontal north over 100 m, straight below the last survey
+    surveys = pd.DataFrame({'BHID': ['C', 'C'], 'AT': [0., 100.], 'BRG': [0., 0.], 'DIP': [90., 0.]})
+    samples = pd.DataFrame({'BHID': ['C', 'C', 'C'], 'FROM': [0., 50., 100.], 'TO': [50., 100., 110.]})
+
+    holes = drillholes.desurvey(samples, surveys, collars, endpoint_p=1)
+    radius = 200. / np.pi
+    angle = np.array([25., 75.]) / radius
+
+    np.testing.assert_allclose(holes.X, 0., atol=1e-9)
+    np.testing.assert_allclose(holes.Y, np.r_[radius * (1. - np.cos(angle)), radius + 5.])
+    np.testing.assert_allclose(holes.Z, np.r_[-radius * np.sin(angle), -radius])
+    np.testing.assert_allclose(holes.YEND, [radius * (1. - np.cos(np.pi / 4.)), radius, radius + 10.])
+    np.testing.assert_allclose(holes.ZEND, [-radius * np.sin(np.pi / 4.), -radius, -radius])
+
+
+@pytest.fixture
+def samples():
+
+    # hole A has a gap from 3 to 4 and ends within a composite, the last sample of hole B has an absent grade
+    return pd.DataFrame({'BHID': ['A', 'A', 'A', 'A', 'B', 'B'], 'FROM': [0., 1., 4., 5., 0., 2.],
+                         'TO': [1., 3., 5., 6.5, 2., 3.], 'AU': [1., 4., 2., 3., 5., np.nan],
+                         'CU': [1., 1., 1., 1., 2., 2.]});
+
+
+def test_composite(samples):
+
+    comps = drillholes.composite(samples, 2.)
+
+    assert comps.BHID.tolist() == ['A', 'A', 'A', 'B', 'B']
+    np.testing.assert_allclose(comps.FROM, [0., 2., 4., 0., 2.])
+    np.testing.assert_allclose(comps.TO, [2., 4., 6., 2., 3.])
+    np.testing.assert_allclose(comps.LENGTH, [2., 2., 2., 2., 1.])
+    np.testing.assert_allclose(comps.AU, [2.5, 4., 2.5, 5., np.nan])
+    np.testing.assert_allclose(comps.CU, [1., 1., 1., 2., 2.])
+
+
+def test_composite_adjusted(samples):
+
+    comps = drillholes.composite(samples, 2., mode_p=1)
+    a = comps[comps.BHID == 'A']
+
+    np.testing.assert_allclose(a.LENGTH, [6.5 / 3.] * 3)
+    np.testing.assert_allclose(a.AU, [(1. + 4. * 3.5 / 3.) / (6.5 / 3.), (4. * 2.5 / 3. + 2. / 3.) / (3.5 / 3.),
+                                      (2. * 2. / 3. + 3. * 1.5) / (6.5 / 3.)])
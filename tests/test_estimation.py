@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from dmstudio import dmio, estimation
+
+
+def test_empty_prototype_ijk(tmp_path):
+
+    header = pd.DataFrame({'IJK': [0.], 'XC': [0.], 'YC': [0.], 'ZC': [0.], 'XINC': [10.], 'YINC': [10.],
+                           'ZINC': [5.], 'XMORIG': [100.], 'YMORIG': [200.], 'ZMORIG': [0.], 'NX': [2.], 'NY': [3.],
+                           'NZ': [4.]})
+    implicit = [name for name in header.columns if name not in ('IJK', 'XC', 'YC', 'ZC')]
+    fields = dmio.frame_fields(header, implicit=implicit)
+    dmio.write_dm(str(tmp_path / 'proto.dm'), header.iloc[:0], fields)
+
+    model = estimation._prototype(str(tmp_path / 'proto.dm'))
+    ix = (model.XC - 100.) // 10.
+    iy = (model.YC - 200.) // 10.
+    iz = model.ZC // 5.
+
+    np.testing.assert_array_equal(model.IJK, np.arange(24))
+    np.testing.assert_array_equal(model.IJK, (ix * 3 + iy) * 4 + iz)
@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from dmstudio import backends, dmcommands, dmio, pipeline
+
+
+class idle(object):
+
+    # backend of which every command fails silently, as a failed command in Studio
+    def __init__(self, path):
+
+        self.path = path
+
+    def filename(self, name):
+
+        return backends.dm_path(name, self.path);
+
+    def run(self, command):
+
+        pass
+
+
+@pytest.fixture
+def folder(tmp_path):
+
+    dmio.write_dm(str(tmp_path / 'comps.dm'), pd.DataFrame({'AU': [1., 3., 5.]}))
+
+    return str(tmp_path);
+
+
+def test_execute_skips_current_steps(folder):
+
+    pipe = pipeline.pipeline(folder + '/state.json', backend=backends.emulator_backend(folder))
+    dmc = dmcommands.init(backend=pipe)
+    dmc.copy(in_i='comps', out_o='st', retrieval='AU>2')
+
+    assert pipe.execute() == ['run']
+    assert pipe.execute() == ['skipped']
+
+
+def test_execute_failed_step(folder):
+
+    dmio.write_dm(folder + '/st.dm', pd.DataFrame({'AU': [0.]}))
+    pipe = pipeline.pipeline(folder + '/state.json', backend=idle(folder))
+    dmc = dmcommands.init(backend=pipe)
+    dmc.copy(in_i='comps', out_o='st')
+
+    assert pipe.execute() == ['failed']
+    assert pipe.execute() == ['failed']
+    assert pipe.outdated() == [0]
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dmstudio import backends, dmcommands, dmio, retrieval
+
+
+@pytest.fixture
+def samples():
+
+    return pd.DataFrame({'AU': [1., 3., 5., 0.2], 'CU': [2., 0.5, 3., 0.1], 'ROCK': ['OX', 'FR', 'OX', 'FR']});
+
+
+def test_evaluate_arithmetic(samples):
+
+    np.testing.assert_allclose(retrieval.evaluate(samples, 'AU*2-1'), [1., 5., 9., -0.6])
+    np.testing.assert_allclose(retrieval.evaluate(samples, '-au^2 + MAX(CU - 1, 0)'), [0., -9., -23., -0.04])
+    assert retrieval.evaluate(samples, '2^3^2') == 512.
+
+
+def test_evaluate_logical(samples):
+
+    np.testing.assert_array_equal(retrieval.evaluate(samples, 'AU>2 AND CU>1'), [False, False, True, False])
+    np.testing.assert_array_equal(retrieval.evaluate(samples, 'AU>2 OR CU>1'), [True, True, True, False])
+    np.testing.assert_array_equal(retrieval.evaluate(samples, 'NOT AU>2'), [True, False, False, True])
+    np.testing.assert_array_equal(retrieval.evaluate(samples, 'NOT (AU>2 AND CU>1) OR ROCK="OX"'),
+                                  [True, True, True, True])
+    np.testing.assert_array_equal(retrieval.evaluate(samples, 'AU>2 AND NOT ROCK="FR" OR CU<0.2'),
+                                  [False, False, True, True])
+
+
+@pytest.mark.parametrize('expression', ['AU>', 'FOO(1)', 'AU+*2', ''])
+def test_evaluate_invalid(samples, expression):
+
+    with pytest.raises(ValueError):
+        retrieval.evaluate(samples, expression)
+
+
+def test_extra_logical(tmp_path, samples):
+
+    dmio.write_dm(str(tmp_path / 'samples.dm'), samples)
+    dmc = dmcommands.init(backend=backends.emulator_backend(str(tmp_path)))
+    dmc.extra(in_i='samples', out_o='flagged', expression=['BOTH=AU>2 AND CU>1', 'EITHER=AU>2 OR CU>1',
+                                                           'LOW=NOT AU>2', 'AU2=(AU+1)*2'])
+
+    flagged = dmio.read_dm(str(tmp_path / 'flagged.dm'))
+    np.testing.assert_array_equal(flagged.BOTH, [0., 0., 1., 0.])
+    np.testing.assert_array_equal(flagged.EITHER, [1., 1., 1., 0.])
+    np.testing.assert_array_equal(flagged.LOW, [1., 0., 0., 1.])
+    np.testing.assert_allclose(flagged.AU2, [4., 8., 12., 2.4], rtol=1e-6)
@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+from dmstudio import simulation
+
+
+def test_grid_parent_cells():
+
+    # parent cells 10 x 10 x 5 with NX=2, NY=2, NZ=3, cell (1, 0, 2) split in two subcells, IJK with Z fastest
+    cells = pd.DataFrame({'IJK': [2, 5, 8, 8], 'XC': [5., 5., 12.5, 17.5], 'YC': [5., 15., 5., 5.],
+                          'ZC': [12.5, 12.5, 12.5, 12.5], 'XINC': [10., 10., 5., 5.], 'YINC': 10., 'ZINC': 5.,
+                          'XMORIG': 0., 'YMORIG': 0., 'ZMORIG': 0., 'NX': 2, 'NY': 2, 'NZ': 3})
+
+    xyz, index, size, fields = simulation._grid(cells, (2, 1, 1), None, None, None)
+
+    np.testing.assert_array_equal(index, [[0, 0, 2], [1, 0, 2], [0, 1, 2], [1, 1, 2], [2, 0, 2], [3, 0, 2]])
+    np.testing.assert_array_equal(fields.IJK, [2, 2, 5, 5, 8, 8])
+    np.testing.assert_allclose(size, [5., 10., 5.])
+    np.testing.assert_allclose(xyz[:, 0], [2.5, 7.5, 2.5, 7.5, 12.5, 17.5])
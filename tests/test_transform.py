@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dmstudio import transform
+
+pytest.importorskip('scipy')
+
+
+@pytest.fixture
+def samples():
+
+    return pd.DataFrame({'AU': [1., 2., 3., 4., 10., 20., 30., 5.],
+                         'DOM': ['A', 'A', 'A', 'A', 'B', 'B', 'B', np.nan]});
+
+
+def test_nscore_absent_zone(samples):
+
+    result, tables = transform.nscore(samples, 'AU', zone_f='DOM')
+
+    assert list(tables['AU']['DOM']) == ['A'] * 4 + ['B'] * 3
+    np.testing.assert_allclose(tables['AU'].loc[tables['AU']['DOM'] == 'B', 'AU'], [10., 20., 30.])
+    assert np.isnan(result['NSCORE'].iloc[-1])
+    np.testing.assert_allclose(result['NSCORE'].iloc[4:7], [-0.967, 0., 0.967], atol=1e-3)
+
+
+def test_backtr_absent_zone(samples):
+
+    result, tables = transform.nscore(samples, 'AU', zone_f='DOM')
+    reference = pd.concat([tables['AU'], pd.DataFrame({'DOM': [np.nan], 'AU': [1000.], transform.NORMAL_FIELD: [0.]})])
+    back = transform.backtr(result, reference, 'NSCORE', 'AU', zone_f='DOM', maxback_p=100.)
+
+    np.testing.assert_allclose(back['BACKVAL'].iloc[:7], samples['AU'].iloc[:7])
+    assert np.isnan(back['BACKVAL'].iloc[-1])
+
+
+def test_table_negative_zone():
+
+    zones, values, scores = transform.table([1., 2., 3., 4.], zones=[0, 0, -1, -1])
+
+    np.testing.assert_array_equal(zones, [0, 0])
+    np.testing.assert_allclose(values, [1., 2.])
+    np.testing.assert_allclose(scores, [-0.674, 0.674], atol=1e-3)
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dmstudio import variogram
+
+pytest.importorskip('scipy')
+
+
+@pytest.fixture
+def samples():
+
+    rng = np.random.default_rng(5)
+    count = 200
+
+    return pd.DataFrame({'X': rng.uniform(0., 100., count), 'Y': rng.uniform(0., 100., count),
+                         'Z': rng.uniform(0., 20., count), 'AU': rng.lognormal(0., 1., count)});
+
+
+def brute_force(samples, lag, nlags, azi, dip, horang, verang, cylrad):
+
+    # pair counts, mean distances and semi-variograms by enumerating every pair
+    xyz = samples[['X', 'Y', 'Z']].to_numpy()
+    au = samples.AU.to_numpy()
+    unit = np.array([np.cos(np.radians(dip)) * np.sin(np.radians(azi)),
+                     np.cos(np.radians(dip)) * np.cos(np.radians(azi)), -np.sin(np.radians(dip))])
+    npairs, distance, squares = np.zeros(nlags), np.zeros(nlags), np.zeros(nlags)
+
+    for i in range(len(xyz)):
+        for j in range(i + 1, len(xyz)):
+            h = xyz[j] - xyz[i]
+            d = np.linalg.norm(h)
+            k = int(np.rint(d / lag))
+            if k < 1 or k > nlags or abs(d - k * lag) > lag / 2.:
+                continue
+            if h @ unit < 0:
+                h = -h
+            offset = abs((np.degrees(np.arctan2(h[0], h[1])) - azi + 180.) % 360. - 180.)
+            if horang < 90. and offset > horang and np.hypot(h[0], h[1]) >= 1e-9 * d:
+                continue
+            if verang < 90. and abs(np.degrees(np.arcsin(-h[2] / d)) - dip) > verang:
+                continue
+            if cylrad > 0 and d ** 2 - (h @ unit) ** 2 > cylrad ** 2:
+                continue
+            npairs[k - 1] += 1
+            distance[k - 1] += d
+            squares[k - 1] += (au[j] - au[i]) ** 2
+
+    with np.errstate(invalid='ignore'):
+        return npairs, distance / npairs, squares / npairs / 2.;
+
+
+def test_lags(samples):
+
+    result = variogram.experimental(samples, ['AU'], lag_p=10., nlags_p=6, workers=1)
+    npairs, distance, gamma = brute_force(samples, 10., 6, 0., 0., 90., 90., 0.)
+
+    np.testing.assert_array_equal(result.NPAIRS, npairs)
+    np.testing.assert_allclose(result.AVEDIST, distance)
+    np.testing.assert_allclose(result.GAMMA, gamma)
+
+
+@pytest.mark.parametrize('horang, verang, cylrad', [(22.5, 90., 0.), (22.5, 15., 0.), (45., 90., 5.)])
+def test_fan_tolerances(samples, horang, verang, cylrad):
+
+    directions = variogram.fan(azi_p=30., dip_p=10., numhor_p=4, horinc_p=45.)
+    result = variogram.experimental(samples, ['AU'], lag_p=10., nlags_p=6, horang_p=horang, verang_p=verang,
+                                    cylrad_p=cylrad, directions=directions, workers=1, chunk_samples=64)
+
+    for number, (azi, dip) in enumerate(directions, 1):
+        direction = result[result.VREFNUM == number]
+        npairs, distance, gamma = brute_force(samples, 10., 6, azi, dip, horang, verang, cylrad)
+        np.testing.assert_array_equal(direction.NPAIRS, npairs)
+        np.testing.assert_allclose(direction.AVEDIST, distance)
+        np.testing.assert_allclose(direction.GAMMA, gamma)
+
+
+def test_workers(samples):
+
+    arguments = dict(lag_p=10., nlags_p=6, numhor_p=4, horinc_p=45., horang_p=22.5, chunk_samples=64,
+                     cutoffs={'AU': [1.]})
+
+    pd.testing.assert_frame_equal(variogram.experimental(samples, ['AU'], workers=1, **arguments),
+                                  variogram.experimental(samples, ['AU'], workers=3, **arguments), check_exact=True)